@@ -11,24 +11,26 @@ Provides comprehensive REST API endpoints for the Camera Intelligence Stack:
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import List, Optional
+
 from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.camera_network import (
+    CameraJurisdiction,
+    CameraStatus,
+    CameraType,
+    VideoWallLayout,
     get_camera_registry,
-    get_ingestion_engine,
+    get_frame_hub,
     get_health_monitor,
+    get_ingestion_engine,
+    get_io_scheduler,
     get_streaming_adapter,
     get_video_wall_manager,
-    CameraType,
-    CameraJurisdiction,
-    CameraStatus,
-    VideoWallLayout,
 )
 
-
 router = APIRouter(prefix="/cameras", tags=["camera-network"])
 
 
@@ -204,6 +206,32 @@ async def get_nearby_cameras(
     }
 
 
+@router.get("/nearest")
+async def get_nearest_cameras(
+    lat: float = Query(..., description="Latitude"),
+    lng: float = Query(..., description="Longitude"),
+    k: int = Query(5, ge=1, le=100, description="Number of cameras"),
+    max_radius: float | None = Query(None, description="Search radius limit in km"),
+):
+    """
+    Get the cameras nearest to a point (e.g. a gunshot detection).
+    """
+    engine = get_ingestion_engine()
+
+    if engine._registry.count() == 0:
+        engine.ingest_all()
+
+    cameras = engine.get_cameras_nearest(lat, lng, k, max_radius)
+
+    return {
+        "cameras": cameras,
+        "total": len(cameras),
+        "center": {"lat": lat, "lng": lng},
+        "k": k,
+        "max_radius_km": max_radius,
+    }
+
+
 @router.get("/health")
 async def get_camera_health():
     """
@@ -418,6 +446,37 @@ async def clear_video_wall(session_id: str = Query(...)):
     return {"message": "Video wall cleared"}
 
 
+@router.get("/video-wall/{session_id}/slots/{position}/stream")
+async def get_video_wall_slot_stream(
+    session_id: str,
+    position: int,
+    refresh_interval: float = Query(2.0, ge=1.0, le=10.0),
+):
+    """
+    Get MJPEG stream for a video wall slot.
+
+    Slots showing the same camera share one upstream fetcher with every
+    other viewer of that camera.
+    """
+    manager = get_video_wall_manager()
+    slot = manager.get_slot(session_id, position)
+
+    if not slot or slot.is_empty or not slot.camera_id:
+        raise HTTPException(status_code=404, detail="Video wall slot is empty")
+
+    adapter = get_streaming_adapter()
+    stream_url = slot.stream_url
+    if not stream_url:
+        camera = get_ingestion_engine().get_camera(slot.camera_id)
+        stream_url = camera.get("stream_url", "") if camera else ""
+    adapter.register_camera(camera_id=slot.camera_id, stream_url=stream_url)
+
+    return StreamingResponse(
+        adapter.generate_mjpeg_stream(slot.camera_id, refresh_interval),
+        media_type="multipart/x-mixed-replace; boundary=frame",
+    )
+
+
 @router.post("/video-wall/layout")
 async def change_video_wall_layout(
     session_id: str = Query(...),
@@ -588,6 +647,18 @@ async def get_camera_snapshot(camera_id: str):
 # Statistics Endpoints
 # ============================================================================
 
+@router.get("/stats/streaming")
+async def get_streaming_stats():
+    """
+    Get shared stream metrics: active camera feeds, viewers, upstream
+    fetches and camera I/O scheduler load.
+    """
+    return {
+        **get_frame_hub().get_stats(),
+        "io_scheduler": get_io_scheduler().get_stats(),
+    }
+
+
 @router.get("/stats/summary")
 async def get_camera_stats():
     """
@@ -5,8 +5,10 @@ This module provides:
 - WebSocket endpoint for real-time events
 - Event management endpoints
 - Subscription management
+- Cross-worker fan-out of broadcasts via the broadcast bus
 """
 
+from collections.abc import Callable, Iterable
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
@@ -23,6 +25,7 @@ from app.schemas.events import (
     EventType,
 )
 from app.services.auth.auth_service import get_auth_service
+from app.services.events.broadcast_bus import get_broadcast_bus
 from app.services.events.event_processor import EventProcessor, get_event_processor
 from app.services.events.websocket_manager import WebSocketManager, get_websocket_manager
 
@@ -311,10 +314,6 @@ async def broadcast_case_update(
         update_type: Type of update (entity_correlation, incident_linked, etc.)
         data: Update data to send
     """
-    if case_id not in _case_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "case_id": case_id,
@@ -322,16 +321,7 @@ async def broadcast_case_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_case_subscriptions[case_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "case_broadcast_failed",
-                case_id=case_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.case", message)
 
 
 def get_case_subscribers(case_id: str) -> set[str]:
@@ -827,7 +817,6 @@ async def broadcast_officer_location(
     location_data: dict,
 ) -> None:
     """Broadcast officer location update to subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "location_update",
         "badge": badge,
@@ -835,21 +824,7 @@ async def broadcast_officer_location(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    # Send to badge-specific subscribers
-    if badge in _officer_location_subscriptions:
-        for client_id in list(_officer_location_subscriptions[badge]):
-            try:
-                await ws_manager.send_to_client(client_id, message)
-            except Exception as e:
-                logger.warning("officer_location_broadcast_failed", client_id=client_id, error=str(e))
-
-    # Send to all-officers subscribers
-    if "all" in _officer_location_subscriptions:
-        for client_id in list(_officer_location_subscriptions["all"]):
-            try:
-                await ws_manager.send_to_client(client_id, message)
-            except Exception as e:
-                logger.warning("officer_location_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_location", message)
 
 
 async def broadcast_threat_alert(
@@ -857,7 +832,6 @@ async def broadcast_threat_alert(
     threat_data: dict,
 ) -> None:
     """Broadcast threat alert to subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "threat_alert",
         "badge": badge,
@@ -865,11 +839,7 @@ async def broadcast_threat_alert(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_officer_threat_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("threat_alert_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_threat", message)
 
 
 async def broadcast_ambush_warning(
@@ -877,7 +847,6 @@ async def broadcast_ambush_warning(
     ambush_data: dict,
 ) -> None:
     """Broadcast ambush warning to subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "ambush_warning",
         "badge": badge,
@@ -885,11 +854,7 @@ async def broadcast_ambush_warning(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_officer_ambush_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("ambush_warning_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_ambush", message)
 
 
 async def broadcast_perimeter_update(
@@ -897,10 +862,6 @@ async def broadcast_perimeter_update(
     perimeter_data: dict,
 ) -> None:
     """Broadcast perimeter update to subscribers."""
-    if incident_id not in _officer_perimeter_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": "perimeter_update",
         "incident_id": incident_id,
@@ -908,11 +869,7 @@ async def broadcast_perimeter_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_officer_perimeter_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("perimeter_update_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_perimeter", message)
 
 
 async def broadcast_safety_score_update(
@@ -920,7 +877,6 @@ async def broadcast_safety_score_update(
     score_data: dict,
 ) -> None:
     """Broadcast safety score update to subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "safety_score_update",
         "badge": badge,
@@ -928,11 +884,7 @@ async def broadcast_safety_score_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_officer_safety_score_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("safety_score_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_safety_score", message)
 
 
 async def broadcast_officer_down(
@@ -940,7 +892,6 @@ async def broadcast_officer_down(
     emergency_data: dict,
 ) -> None:
     """Broadcast officer down alert to all subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "officer_down",
         "badge": badge,
@@ -949,11 +900,7 @@ async def broadcast_officer_down(
         "priority": "critical",
     }
 
-    for client_id in list(_officer_down_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("officer_down_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_down", message)
 
 
 async def broadcast_officer_sos(
@@ -961,7 +908,6 @@ async def broadcast_officer_sos(
     sos_data: dict,
 ) -> None:
     """Broadcast SOS alert to all subscribers."""
-    ws_manager = get_websocket_manager()
     message = {
         "type": "officer_sos",
         "badge": badge,
@@ -970,11 +916,7 @@ async def broadcast_officer_sos(
         "priority": "critical",
     }
 
-    for client_id in list(_officer_down_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning("officer_sos_broadcast_failed", client_id=client_id, error=str(e))
+    await _publish("realtime.officer_down", message)
 
 
 # Subscription info functions
@@ -1274,10 +1216,6 @@ async def broadcast_tactical_alert(
         data: Alert data to send
         severity: Alert severity (low, medium, high, critical)
     """
-    if not _tactical_alert_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": alert_type,
         "severity": severity,
@@ -1285,15 +1223,7 @@ async def broadcast_tactical_alert(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_tactical_alert_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "tactical_alert_broadcast_failed",
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.tactical_alert", message)
 
 
 async def broadcast_zone_update(
@@ -1309,7 +1239,6 @@ async def broadcast_zone_update(
         update_type: Type of update
         data: Update data to send
     """
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "zone_id": zone_id,
@@ -1317,31 +1246,7 @@ async def broadcast_zone_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    # Broadcast to zone-specific subscribers
-    if zone_id in _tactical_zone_subscriptions:
-        for client_id in list(_tactical_zone_subscriptions[zone_id]):
-            try:
-                await ws_manager.send_to_client(client_id, message)
-            except Exception as e:
-                logger.warning(
-                    "zone_update_broadcast_failed",
-                    zone_id=zone_id,
-                    client_id=client_id,
-                    error=str(e),
-                )
-
-    # Broadcast to all-zones subscribers
-    if "__all__" in _tactical_zone_subscriptions:
-        for client_id in list(_tactical_zone_subscriptions["__all__"]):
-            try:
-                await ws_manager.send_to_client(client_id, message)
-            except Exception as e:
-                logger.warning(
-                    "zone_update_broadcast_failed",
-                    zone_id=zone_id,
-                    client_id=client_id,
-                    error=str(e),
-                )
+    await _publish("realtime.tactical_zone", message)
 
 
 async def broadcast_prediction_update(
@@ -1355,25 +1260,13 @@ async def broadcast_prediction_update(
         prediction_type: Type of prediction update
         data: Prediction data to send
     """
-    if not _tactical_prediction_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": prediction_type,
         "data": data,
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_tactical_prediction_subscriptions):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "prediction_update_broadcast_failed",
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.tactical_prediction", message)
 
 
 def get_tactical_alert_subscribers() -> set[str]:
@@ -1928,10 +1821,6 @@ async def broadcast_incident_update(
         update_type: Type of update
         data: Update data to send
     """
-    if incident_id not in _incident_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -1939,16 +1828,7 @@ async def broadcast_incident_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_incident_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "incident_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_incident", message)
 
 
 async def broadcast_ics_update(
@@ -1964,10 +1844,6 @@ async def broadcast_ics_update(
         update_type: Type of update (ics_role_assigned, ics_role_updated, etc.)
         data: Update data to send
     """
-    if incident_id not in _ics_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -1975,16 +1851,7 @@ async def broadcast_ics_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_ics_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "ics_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_ics", message)
 
 
 async def broadcast_strategy_map_update(
@@ -2000,10 +1867,6 @@ async def broadcast_strategy_map_update(
         update_type: Type of update
         data: Update data to send
     """
-    if incident_id not in _strategy_map_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -2011,16 +1874,7 @@ async def broadcast_strategy_map_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_strategy_map_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "strategy_map_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_strategy_map", message)
 
 
 async def broadcast_resource_update(
@@ -2036,10 +1890,6 @@ async def broadcast_resource_update(
         update_type: Type of update (resource_assigned, resource_released, etc.)
         data: Update data to send
     """
-    if incident_id not in _resources_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -2047,16 +1897,7 @@ async def broadcast_resource_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_resources_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "resource_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_resources", message)
 
 
 async def broadcast_timeline_update(
@@ -2072,10 +1913,6 @@ async def broadcast_timeline_update(
         update_type: Type of update (timeline_event, critical_event, etc.)
         data: Update data to send
     """
-    if incident_id not in _timeline_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -2083,16 +1920,7 @@ async def broadcast_timeline_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_timeline_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "timeline_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_timeline", message)
 
 
 async def broadcast_briefing_update(
@@ -2108,10 +1936,6 @@ async def broadcast_briefing_update(
         update_type: Type of update (note_added, briefing_generated, etc.)
         data: Update data to send
     """
-    if incident_id not in _briefing_subscriptions:
-        return
-
-    ws_manager = get_websocket_manager()
     message = {
         "type": update_type,
         "incident_id": incident_id,
@@ -2119,16 +1943,7 @@ async def broadcast_briefing_update(
         "timestamp": __import__("datetime").datetime.utcnow().isoformat(),
     }
 
-    for client_id in list(_briefing_subscriptions[incident_id]):
-        try:
-            await ws_manager.send_to_client(client_id, message)
-        except Exception as e:
-            logger.warning(
-                "briefing_update_broadcast_failed",
-                incident_id=incident_id,
-                client_id=client_id,
-                error=str(e),
-            )
+    await _publish("realtime.command_briefing", message)
 
 
 # ============================================================================
@@ -2176,3 +1991,111 @@ def get_all_command_subscribed_incidents() -> list[str]:
     all_incidents.update(_timeline_subscriptions.keys())
     all_incidents.update(_briefing_subscriptions.keys())
     return list(all_incidents)
+
+
+# ============================================================================
+# Cross-Worker Fan-Out
+# ============================================================================
+#
+# Broadcast functions publish to the broadcast bus. Every worker delivers
+# each message to the clients subscribed on that worker, using the
+# subscription maps above.
+
+
+async def _publish(channel: str, message: dict) -> None:
+    """Publish a broadcast message to all workers."""
+    await get_broadcast_bus().publish(channel, message)
+
+
+def _local_fan_out(
+    subscribers: Callable[[dict], Iterable[str]],
+    failure_event: str,
+) -> Callable[[dict], object]:
+    """Build a bus handler that sends a message to this worker's subscribers."""
+
+    async def deliver(message: dict) -> None:
+        ws_manager = get_websocket_manager()
+        for client_id in list(subscribers(message)):
+            try:
+                await ws_manager.send_to_client(client_id, message)
+            except Exception as e:
+                logger.warning(failure_event, client_id=client_id, error=str(e))
+
+    return deliver
+
+
+def _keyed_subscribers(
+    subscriptions: dict[str, set[str]], key: str, all_key: str | None = None
+) -> Callable[[dict], set[str]]:
+    """Subscribers for a message's key, plus subscribers to all keys."""
+
+    def subscribers(message: dict) -> set[str]:
+        client_ids = set(subscriptions.get(message.get(key), ()))
+        if all_key is not None:
+            client_ids |= subscriptions.get(all_key, set())
+        return client_ids
+
+    return subscribers
+
+
+_FAN_OUT_ROUTES: dict[str, tuple[Callable[[dict], Iterable[str]], str]] = {
+    "realtime.case": (
+        _keyed_subscribers(_case_subscriptions, "case_id"), "case_broadcast_failed"
+    ),
+    "realtime.officer_location": (
+        _keyed_subscribers(_officer_location_subscriptions, "badge", "all"),
+        "officer_location_broadcast_failed",
+    ),
+    "realtime.officer_threat": (
+        lambda _: _officer_threat_subscriptions, "threat_alert_broadcast_failed"
+    ),
+    "realtime.officer_ambush": (
+        lambda _: _officer_ambush_subscriptions, "ambush_warning_broadcast_failed"
+    ),
+    "realtime.officer_perimeter": (
+        _keyed_subscribers(_officer_perimeter_subscriptions, "incident_id"),
+        "perimeter_update_broadcast_failed",
+    ),
+    "realtime.officer_safety_score": (
+        lambda _: _officer_safety_score_subscriptions, "safety_score_broadcast_failed"
+    ),
+    "realtime.officer_down": (
+        lambda _: _officer_down_subscriptions, "officer_down_broadcast_failed"
+    ),
+    "realtime.tactical_alert": (
+        lambda _: _tactical_alert_subscriptions, "tactical_alert_broadcast_failed"
+    ),
+    "realtime.tactical_zone": (
+        _keyed_subscribers(_tactical_zone_subscriptions, "zone_id", "__all__"),
+        "zone_update_broadcast_failed",
+    ),
+    "realtime.tactical_prediction": (
+        lambda _: _tactical_prediction_subscriptions, "prediction_update_broadcast_failed"
+    ),
+    "realtime.command_incident": (
+        _keyed_subscribers(_incident_subscriptions, "incident_id"),
+        "incident_update_broadcast_failed",
+    ),
+    "realtime.command_ics": (
+        _keyed_subscribers(_ics_subscriptions, "incident_id"), "ics_update_broadcast_failed"
+    ),
+    "realtime.command_strategy_map": (
+        _keyed_subscribers(_strategy_map_subscriptions, "incident_id"),
+        "strategy_map_update_broadcast_failed",
+    ),
+    "realtime.command_resources": (
+        _keyed_subscribers(_resources_subscriptions, "incident_id"),
+        "resource_update_broadcast_failed",
+    ),
+    "realtime.command_timeline": (
+        _keyed_subscribers(_timeline_subscriptions, "incident_id"),
+        "timeline_update_broadcast_failed",
+    ),
+    "realtime.command_briefing": (
+        _keyed_subscribers(_briefing_subscriptions, "incident_id"),
+        "briefing_update_broadcast_failed",
+    ),
+}
+
+for _channel, (_subscribers, _failure_event) in _FAN_OUT_ROUTES.items():
+    get_broadcast_bus().subscribe(_channel, _local_fan_out(_subscribers, _failure_event))
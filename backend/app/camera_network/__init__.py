@@ -3,53 +3,62 @@ Camera Network Module for G3TI RTCC-UIP Platform.
 
 Complete Camera Intelligence Stack including:
 - Camera Registry (CRUD operations)
+- Camera Spatial Index (radius and k-nearest queries)
 - FDOT Traffic Camera Integration
 - RBPD Internal Mock Camera Network
 - Camera Ingestion Engine
 - Camera Health Monitor
 - Streaming Adapter (MJPEG, RTSP, Snapshot)
+- Frame Hub (shared upstream fetchers for MJPEG viewers)
+- Camera I/O Scheduler (bounded, prioritized upstream requests)
 - Video Wall Manager
 """
 
+from .camera_health_monitor import (
+    CameraHealthMonitor,
+    HealthStatus,
+    get_health_monitor,
+)
+from .camera_ingestion_engine import (
+    CameraIngestionEngine,
+    get_ingestion_engine,
+)
 from .camera_registry import (
-    CameraRegistry,
     Camera,
-    CameraType,
     CameraJurisdiction,
+    CameraRegistry,
     CameraStatus,
+    CameraType,
     get_camera_registry,
 )
-
 from .fdot_scraper import (
     FDOTScraper,
     get_fdot_scraper,
 )
-
+from .frame_hub import (
+    FrameHub,
+    get_frame_hub,
+)
+from .io_scheduler import (
+    CameraIOScheduler,
+    IOPriority,
+    get_io_scheduler,
+)
 from .rbpd_mock_loader import (
-    load_rbpd_mock_cameras,
     get_rbpd_camera_count,
+    load_rbpd_mock_cameras,
 )
-
-from .camera_ingestion_engine import (
-    CameraIngestionEngine,
-    get_ingestion_engine,
-)
-
-from .camera_health_monitor import (
-    CameraHealthMonitor,
-    HealthStatus,
-    get_health_monitor,
+from .spatial_index import (
+    CameraSpatialIndex,
 )
-
 from .streaming_adapter import (
     StreamingAdapter,
     StreamType,
     get_streaming_adapter,
 )
-
 from .video_wall_manager import (
-    VideoWallManager,
     VideoWallLayout,
+    VideoWallManager,
     get_video_wall_manager,
 )
 
@@ -61,6 +70,8 @@ __all__ = [
     "CameraJurisdiction",
     "CameraStatus",
     "get_camera_registry",
+    # Spatial Index
+    "CameraSpatialIndex",
     # FDOT Scraper
     "FDOTScraper",
     "get_fdot_scraper",
@@ -74,6 +85,13 @@ __all__ = [
     "CameraHealthMonitor",
     "HealthStatus",
     "get_health_monitor",
+    # Frame Hub
+    "FrameHub",
+    "get_frame_hub",
+    # Camera I/O Scheduler
+    "CameraIOScheduler",
+    "IOPriority",
+    "get_io_scheduler",
     # Streaming Adapter
     "StreamingAdapter",
     "StreamType",
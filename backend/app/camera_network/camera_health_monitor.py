@@ -2,7 +2,9 @@
 Camera Health Monitor for G3TI RTCC-UIP Platform.
 
 Monitors camera health status by pinging snapshot URLs and RTSP endpoints.
-Broadcasts health updates via WebSocket every 30 seconds.
+Broadcasts health updates via WebSocket every 30 seconds. Checks run
+through the camera I/O scheduler, so a sweep is bounded by its
+concurrency and per-host limits and video wall cameras are checked first.
 
 Health Classification:
 - GREEN (online): Camera responding normally
@@ -22,6 +24,9 @@ try:
 except ImportError:
     httpx = None
 
+from .io_scheduler import IOPriority, get_io_scheduler
+from .video_wall_manager import get_video_wall_manager
+
 
 class HealthStatus(str, Enum):
     """Camera health status enumeration."""
@@ -87,6 +92,7 @@ class CameraHealthMonitor:
         self,
         camera_id: str,
         url: str,
+        priority: IOPriority = IOPriority.NORMAL,
     ) -> HealthCheckResult:
         """
         Check health of a single camera.
@@ -94,6 +100,7 @@ class CameraHealthMonitor:
         Args:
             camera_id: Camera identifier.
             url: URL to check (snapshot or stream URL).
+            priority: Scheduling priority of the check.
             
         Returns:
             HealthCheckResult with status and timing.
@@ -117,33 +124,40 @@ class CameraHealthMonitor:
             return result
         
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.head(url)
-                
-                elapsed_ms = (time.time() - start_time) * 1000
-                
-                if response.status_code == 200:
-                    if elapsed_ms > self._degraded_threshold_ms:
-                        status = HealthStatus.YELLOW
-                    else:
-                        status = HealthStatus.GREEN
-                    
-                    result = HealthCheckResult(
-                        camera_id=camera_id,
-                        status=status,
-                        response_time_ms=elapsed_ms,
-                        last_check=datetime.utcnow(),
-                        consecutive_failures=0,
-                    )
+            scheduler = get_io_scheduler()
+
+            async def head(client, timeout: float):
+                # Time the request itself, not the wait for a scheduler slot
+                started = time.time()
+                response = await client.head(url, timeout=timeout)
+                return response, (time.time() - started) * 1000
+
+            response, elapsed_ms = await scheduler.submit(
+                url, head, priority, max_timeout=self._timeout
+            )
+
+            if response.status_code == 200:
+                if elapsed_ms > self._degraded_threshold_ms:
+                    status = HealthStatus.YELLOW
                 else:
-                    result = HealthCheckResult(
-                        camera_id=camera_id,
-                        status=HealthStatus.RED,
-                        response_time_ms=elapsed_ms,
-                        last_check=datetime.utcnow(),
-                        error_message=f"HTTP {response.status_code}",
-                        consecutive_failures=consecutive_failures + 1,
-                    )
+                    status = HealthStatus.GREEN
+
+                result = HealthCheckResult(
+                    camera_id=camera_id,
+                    status=status,
+                    response_time_ms=elapsed_ms,
+                    last_check=datetime.utcnow(),
+                    consecutive_failures=0,
+                )
+            else:
+                result = HealthCheckResult(
+                    camera_id=camera_id,
+                    status=HealthStatus.RED,
+                    response_time_ms=elapsed_ms,
+                    last_check=datetime.utcnow(),
+                    error_message=f"HTTP {response.status_code}",
+                    consecutive_failures=consecutive_failures + 1,
+                )
         except asyncio.TimeoutError:
             result = HealthCheckResult(
                 camera_id=camera_id,
@@ -173,17 +187,22 @@ class CameraHealthMonitor:
         """
         Check health of all cameras.
         
+        Checks are queued on the camera I/O scheduler, which bounds how
+        many run at once; cameras on the active video wall go first.
+
         Args:
             cameras: List of camera dictionaries.
             
         Returns:
             List of health check results.
         """
+        wall_cameras = get_video_wall_manager().get_active_camera_ids()
         tasks = []
         for cam in cameras:
             camera_id = cam.get("id", "")
             url = cam.get("stream_url") or cam.get("snapshot_url", "")
-            tasks.append(self.check_camera_health(camera_id, url))
+            priority = IOPriority.HIGH if camera_id in wall_cameras else IOPriority.NORMAL
+            tasks.append(self.check_camera_health(camera_id, url, priority))
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
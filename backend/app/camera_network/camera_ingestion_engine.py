@@ -285,6 +285,16 @@ class CameraIngestionEngine:
         """Get cameras within radius of a point."""
         return self._registry.list_nearby(lat, lng, radius_km)
     
+    def get_cameras_nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 5,
+        max_radius_km: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the k cameras nearest to a point."""
+        return self._registry.list_nearest(lat, lng, k, max_radius_km)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get ingestion statistics."""
         registry_stats = self._registry.get_stats()
@@ -6,11 +6,12 @@ Stores camera metadata including location, stream URLs, type, jurisdiction, and
 """
 
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
 from enum import Enum
-import math
+from typing import Any, Dict, List, Optional
+
+from .spatial_index import CameraSpatialIndex, haversine_km
 
 
 class CameraType(str, Enum):
@@ -172,6 +173,7 @@ class CameraRegistry:
             return
         
         self._cameras: Dict[str, Camera] = {}
+        self._spatial_index = CameraSpatialIndex()
         self._initialized = True
     
     # ========================================================================
@@ -191,6 +193,7 @@ class CameraRegistry:
         camera.created_at = datetime.utcnow()
         camera.updated_at = datetime.utcnow()
         self._cameras[camera.id] = camera
+        self._spatial_index.insert(camera.id, camera.latitude, camera.longitude)
         return camera
     
     def add_camera_from_dict(self, data: Dict[str, Any]) -> Camera:
@@ -243,6 +246,9 @@ class CameraRegistry:
                         continue
                 setattr(camera, key, value)
         
+        if "latitude" in updates or "longitude" in updates:
+            self._spatial_index.insert(camera.id, camera.latitude, camera.longitude)
+
         camera.updated_at = datetime.utcnow()
         return camera
     
@@ -258,6 +264,7 @@ class CameraRegistry:
         """
         if camera_id in self._cameras:
             del self._cameras[camera_id]
+            self._spatial_index.remove(camera_id)
             return True
         return False
     
@@ -336,18 +343,69 @@ class CameraRegistry:
         Returns:
             List of cameras within radius, sorted by distance.
         """
-        results = []
-        
-        for camera in self._cameras.values():
-            distance = self._haversine_distance(
-                lat, lng, camera.latitude, camera.longitude
-            )
-            if distance <= radius_km:
-                cam_dict = camera.to_dict()
-                cam_dict["distance_km"] = round(distance, 2)
-                results.append(cam_dict)
+        return [
+            self._with_distance(camera, distance)
+            for camera, distance in self.find_nearby(lat, lng, radius_km)
+        ]
+
+    def list_nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 5,
+        max_radius_km: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the k cameras nearest to a point.
         
-        return sorted(results, key=lambda x: x["distance_km"])
+        Args:
+            lat: Latitude of center point.
+            lng: Longitude of center point.
+            k: Maximum number of cameras to return.
+            max_radius_km: Optional search radius limit in kilometers.
+
+        Returns:
+            List of up to k cameras, sorted by distance.
+        """
+        return [
+            self._with_distance(camera, distance)
+            for camera, distance in self.find_nearest(lat, lng, k, max_radius_km)
+        ]
+
+    def find_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float = 5.0,
+    ) -> list[tuple[Camera, float]]:
+        """
+        Get (camera, distance_km) pairs within radius of a point, sorted by distance.
+        """
+        return [
+            (self._cameras[camera_id], distance)
+            for camera_id, distance in self._spatial_index.within(lat, lng, radius_km)
+        ]
+
+    def find_nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int = 5,
+        max_radius_km: float | None = None,
+    ) -> list[tuple[Camera, float]]:
+        """
+        Get (camera, distance_km) pairs for the k cameras nearest to a point.
+        """
+        return [
+            (self._cameras[camera_id], distance)
+            for camera_id, distance in self._spatial_index.nearest(lat, lng, k, max_radius_km)
+        ]
+
+    @staticmethod
+    def _with_distance(camera: Camera, distance: float) -> dict[str, Any]:
+        cam_dict = camera.to_dict()
+        cam_dict["distance_km"] = round(distance, 2)
+        return cam_dict
     
     # ========================================================================
     # Statistics
@@ -388,6 +446,7 @@ class CameraRegistry:
             "online_count": by_status.get("online", 0),
             "offline_count": by_status.get("offline", 0),
             "degraded_count": by_status.get("degraded", 0),
+            "spatial_index": self._spatial_index.get_stats(),
         }
     
     # ========================================================================
@@ -402,24 +461,12 @@ class CameraRegistry:
         lon2: float,
     ) -> float:
         """Calculate distance between two GPS coordinates in kilometers."""
-        R = 6371  # Earth's radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-        
-        a = (
-            math.sin(delta_lat / 2) ** 2 +
-            math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return haversine_km(lat1, lon1, lat2, lon2)
     
     def clear(self):
         """Clear all cameras from registry."""
         self._cameras.clear()
+        self._spatial_index.clear()
     
     def count(self) -> int:
         """Get total camera count."""
@@ -16,6 +16,7 @@ try:
 except ImportError:
     httpx = None
 
+from .frame_hub import get_frame_hub
 
 # SmartTraffic.org public API (no API key required)
 SMARTTRAFFIC_API_URL = "https://api.smartraffic.org/public/cameras"
@@ -520,24 +521,13 @@ async def generate_mjpeg_stream(
 ) -> AsyncGenerator[bytes, None]:
     """
     Generate an MJPEG pseudo-stream for a camera.
-    Yields JPEG frames at the specified interval.
+    Yields JPEG frames at the specified interval; all viewers of a
+    camera share one snapshot fetcher through the frame hub.
     """
     scraper = get_fdot_scraper()
     
-    while True:
-        try:
-            snapshot = await scraper.get_snapshot(camera_id)
-            if snapshot:
-                yield b"--frame\r\n"
-                yield b"Content-Type: image/jpeg\r\n"
-                yield f"Content-Length: {len(snapshot)}\r\n".encode()
-                yield b"\r\n"
-                yield snapshot
-                yield b"\r\n"
-            
-            await asyncio.sleep(refresh_interval)
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            print(f"[FDOT] MJPEG stream error: {e}")
-            await asyncio.sleep(refresh_interval)
+    async with get_frame_hub().watch(
+        f"fdot:{camera_id}", lambda: scraper.get_snapshot(camera_id), refresh_interval
+    ) as frames:
+        async for frame in frames:
+            yield frame
@@ -0,0 +1,235 @@
+"""
+Frame Hub for G3TI RTCC-UIP Platform.
+
+Shares one upstream fetcher per camera among all MJPEG viewers:
+- Single fetch loop per camera, started by the first viewer and
+  stopped when the last one leaves
+- Latest-frame buffer that every viewer reads (frames are encoded as
+  MJPEG parts once and the same bytes are yielded to all viewers)
+- Fetch and viewer metrics
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SnapshotFetcher = Callable[[], Awaitable[bytes | None]]
+
+
+def encode_mjpeg_part(image: bytes) -> bytes:
+    """Wrap a JPEG image as a multipart MJPEG frame."""
+    return (
+        b"--frame\r\n"
+        b"Content-Type: image/jpeg\r\n"
+        b"Content-Length: " + str(len(image)).encode() + b"\r\n"
+        b"\r\n" + image + b"\r\n"
+    )
+
+
+@dataclass
+class Frame:
+    """A fetched camera frame."""
+    sequence: int
+    image: bytes
+    part: bytes  # Encoded MJPEG part shared by all viewers
+    fetched_at: float
+
+
+class CameraFeed:
+    """Fetch loop and latest frame for one camera."""
+
+    def __init__(self, key: str, fetch: SnapshotFetcher):
+        """
+        Initialize a feed.
+
+        Args:
+            key: Camera key.
+            fetch: Coroutine function returning the latest image bytes.
+        """
+        self.key = key
+        self.fetch = fetch
+        self.frame: Frame | None = None
+        self.viewers: list[FrameViewer] = []
+        self.task: asyncio.Task | None = None
+        self.fetches = 0
+        self.fetch_errors = 0
+        self.frames_served = 0
+        self.last_fetch_ms: float | None = None
+        self._updated = asyncio.Event()
+
+    @property
+    def refresh_interval(self) -> float:
+        """Fetch as often as the most demanding viewer asks."""
+        return min(viewer.refresh_interval for viewer in self.viewers)
+
+    def publish(self, image: bytes):
+        """Replace the latest frame and wake waiting viewers."""
+        sequence = self.frame.sequence + 1 if self.frame else 1
+        self.frame = Frame(sequence, image, encode_mjpeg_part(image), time.monotonic())
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    async def wait_newer(self, sequence: int) -> Frame:
+        """Wait for a frame newer than the given sequence."""
+        while self.frame is None or self.frame.sequence <= sequence:
+            await self._updated.wait()
+        return self.frame
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get feed metrics."""
+        return {
+            "camera_key": self.key,
+            "viewers": len(self.viewers),
+            "refresh_interval": self.refresh_interval if self.viewers else None,
+            "fetches": self.fetches,
+            "fetch_errors": self.fetch_errors,
+            "frames_served": self.frames_served,
+            "last_fetch_ms": self.last_fetch_ms,
+            "frame_age_seconds": (
+                round(time.monotonic() - self.frame.fetched_at, 3) if self.frame else None
+            ),
+        }
+
+
+class FrameViewer:
+    """One viewer's paced iterator over a feed's frames."""
+
+    def __init__(self, feed: CameraFeed, refresh_interval: float):
+        self.feed = feed
+        self.refresh_interval = refresh_interval
+        self._sequence = 0
+        self._next_due = 0.0
+
+    def __aiter__(self) -> "FrameViewer":
+        return self
+
+    async def __anext__(self) -> bytes:
+        wait = self._next_due - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        frame = await self.feed.wait_newer(self._sequence)
+        self._sequence = frame.sequence
+        self._next_due = time.monotonic() + self.refresh_interval
+        self.feed.frames_served += 1
+        return frame.part
+
+
+class FrameHub:
+    """
+    Shares camera fetchers among MJPEG viewers.
+
+    Viewers of the same camera key read one latest-frame buffer, so the
+    upstream is polled once per interval regardless of viewer count.
+    """
+
+    def __init__(self):
+        """Initialize the frame hub."""
+        self._feeds: dict[str, CameraFeed] = {}
+        self.upstream_fetches = 0
+
+    @asynccontextmanager
+    async def watch(
+        self,
+        key: str,
+        fetch: SnapshotFetcher,
+        refresh_interval: float = 2.0,
+    ) -> AsyncIterator[FrameViewer]:
+        """
+        Watch a camera's frames.
+
+        The fetcher of the first viewer is used for the camera until its
+        last viewer leaves.
+
+        Args:
+            key: Camera key shared by all viewers of the same feed.
+            fetch: Coroutine function returning the latest image bytes.
+            refresh_interval: Seconds between frames for this viewer.
+
+        Yields:
+            Async iterator of encoded MJPEG parts.
+        """
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = CameraFeed(key, fetch)
+            self._feeds[key] = feed
+        viewer = FrameViewer(feed, refresh_interval)
+        feed.viewers.append(viewer)
+        if feed.task is None:
+            feed.task = asyncio.create_task(self._run(feed))
+
+        try:
+            yield viewer
+        finally:
+            feed.viewers.remove(viewer)
+            if not feed.viewers:
+                feed.task.cancel()
+                if self._feeds.get(key) is feed:
+                    del self._feeds[key]
+
+    async def _run(self, feed: CameraFeed):
+        """Fetch frames for a feed until it is cancelled."""
+        while True:
+            started = time.monotonic()
+            try:
+                image = await feed.fetch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("frame_fetch_error", camera_key=feed.key, error=str(e))
+                image = None
+
+            feed.fetches += 1
+            self.upstream_fetches += 1
+            feed.last_fetch_ms = round((time.monotonic() - started) * 1000, 2)
+            if image:
+                feed.publish(image)
+            else:
+                feed.fetch_errors += 1
+
+            await asyncio.sleep(max(0.0, feed.refresh_interval - (time.monotonic() - started)))
+
+    def viewer_count(self, key: str) -> int:
+        """Get the number of viewers of a camera."""
+        feed = self._feeds.get(key)
+        return len(feed.viewers) if feed else 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hub metrics."""
+        feeds = [feed.get_stats() for feed in self._feeds.values()]
+        return {
+            "active_feeds": len(feeds),
+            "viewers": sum(f["viewers"] for f in feeds),
+            "upstream_fetches": self.upstream_fetches,
+            "feeds": feeds,
+        }
+
+    async def close(self):
+        """Stop all fetchers."""
+        for feed in self._feeds.values():
+            if feed.task:
+                feed.task.cancel()
+        self._feeds.clear()
+
+
+# Singleton accessor
+_hub_instance: FrameHub | None = None
+
+
+def get_frame_hub() -> FrameHub:
+    """
+    Get the frame hub singleton.
+
+    Returns:
+        FrameHub instance.
+    """
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = FrameHub()
+    return _hub_instance
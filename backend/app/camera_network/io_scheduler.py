@@ -0,0 +1,314 @@
+"""
+Camera I/O Scheduler for G3TI RTCC-UIP Platform.
+
+Runs upstream camera requests (health checks, snapshots, thumbnails)
+through one shared, bounded pipeline:
+- Pooled HTTP client shared by all camera subsystems
+- Global concurrency limit
+- Per-host concurrency and request-rate limits
+- Adaptive per-host timeouts from observed response times
+- Priority ordering (cameras on the active video wall go first)
+"""
+
+import asyncio
+import bisect
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+CameraRequest = Callable[[Any, float], Awaitable[T]]
+
+# Adaptive timeout bounds, in seconds
+MIN_TIMEOUT = 1.0
+MAX_TIMEOUT = 10.0
+INITIAL_TIMEOUT = 5.0
+
+_TIMEOUT_ERRORS = (asyncio.TimeoutError,) + ((httpx.TimeoutException,) if httpx else ())
+
+
+class IOPriority(IntEnum):
+    """Request priority (lower runs first)."""
+    HIGH = 0  # Cameras being watched (video wall, live streams)
+    NORMAL = 1
+
+
+@dataclass
+class _Job:
+    """A queued camera request."""
+    priority: int
+    sequence: int
+    request: Callable[[Any, float], Awaitable[Any]]
+    max_timeout: float
+    future: asyncio.Future
+
+    @property
+    def order(self) -> tuple:
+        return (self.priority, self.sequence)
+
+
+class HostState:
+    """Limits and response-time estimate for one camera host."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.active = 0
+        self.pending: list[_Job] = []  # Sorted by (priority, sequence)
+        self.next_start = 0.0
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.backoff = 1.0
+        self.completed = 0
+        self.timeouts = 0
+
+    @property
+    def timeout(self) -> float:
+        """Timeout from smoothed response time, widened after timeouts."""
+        if self.srtt is None:
+            base = INITIAL_TIMEOUT
+        else:
+            base = self.srtt + 4 * self.rttvar
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, base) * self.backoff)
+
+    def observe(self, elapsed: float):
+        """Fold a successful response time into the estimate."""
+        if self.srtt is None:
+            self.srtt = elapsed
+            self.rttvar = elapsed / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - elapsed)
+            self.srtt = 0.875 * self.srtt + 0.125 * elapsed
+        self.backoff = 1.0
+        self.completed += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "host": self.host,
+            "active": self.active,
+            "queued": len(self.pending),
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "timeout_seconds": round(self.timeout, 3),
+            "smoothed_response_ms": round(self.srtt * 1000, 2) if self.srtt is not None else None,
+        }
+
+
+class CameraIOScheduler:
+    """
+    Shared scheduler for upstream camera requests.
+
+    Requests are queued per host and started in priority order whenever
+    the global limit, the host's concurrency limit and the host's request
+    rate all allow it.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        per_host_concurrency: int = 6,
+        per_host_rate: float = 20.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Requests in flight across all hosts.
+            per_host_concurrency: Requests in flight per host.
+            per_host_rate: Requests started per second per host.
+        """
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self._hosts: dict[str, HostState] = {}
+        self._sequence = itertools.count()
+        self._active = 0
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._http_client: Any | None = None
+        self.completed = 0
+        self.failed = 0
+
+    async def get_http_client(self) -> Any | None:
+        """Get the pooled HTTP client for camera requests."""
+        if httpx is None:
+            return None
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._http_client
+
+    def configure(
+        self,
+        max_concurrency: int | None = None,
+        per_host_concurrency: int | None = None,
+        per_host_rate: float | None = None,
+    ):
+        """Change scheduler limits; queued requests use the new limits."""
+        if max_concurrency is not None:
+            self.max_concurrency = max(1, max_concurrency)
+        if per_host_concurrency is not None:
+            self.per_host_concurrency = max(1, per_host_concurrency)
+        if per_host_rate is not None:
+            self.per_host_rate = max(0.1, per_host_rate)
+        self._pump()
+
+    async def submit(
+        self,
+        url: str,
+        request: CameraRequest,
+        priority: IOPriority = IOPriority.NORMAL,
+        max_timeout: float = MAX_TIMEOUT,
+    ) -> T:
+        """
+        Run a camera request when limits allow.
+
+        Args:
+            url: Camera URL (its host selects the per-host limits).
+            request: Coroutine function called with (http_client, timeout).
+            priority: Request priority.
+            max_timeout: Upper bound on the adaptive timeout, in seconds.
+
+        Returns:
+            The request's result.
+
+        Raises:
+            asyncio.TimeoutError: If the request exceeds its timeout.
+        """
+        host = urlsplit(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(host)
+
+        job = _Job(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            request=request,
+            max_timeout=max_timeout,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(state.pending, job, key=lambda j: j.order)
+        self._pump()
+        return await job.future
+
+    def _pump(self):
+        """Start queued requests while limits allow."""
+        now = time.monotonic()
+        earliest_wait: float | None = None
+
+        while self._active < self.max_concurrency:
+            best: HostState | None = None
+            for state in self._hosts.values():
+                if not state.pending or state.active >= self.per_host_concurrency:
+                    continue
+                if state.next_start > now:
+                    wait = state.next_start - now
+                    earliest_wait = wait if earliest_wait is None else min(earliest_wait, wait)
+                    continue
+                if best is None or state.pending[0].order < best.pending[0].order:
+                    best = state
+            if best is None:
+                break
+            job = best.pending.pop(0)
+            if job.future.cancelled():
+                continue
+            best.active += 1
+            best.next_start = now + 1.0 / self.per_host_rate
+            self._active += 1
+            asyncio.get_running_loop().create_task(self._run(best, job))
+
+        if earliest_wait is not None and self._wakeup is None:
+            self._wakeup = asyncio.get_running_loop().call_later(earliest_wait, self._on_wakeup)
+
+    def _on_wakeup(self):
+        self._wakeup = None
+        self._pump()
+
+    async def _run(self, state: HostState, job: _Job):
+        """Run one request and record its outcome."""
+        timeout = min(state.timeout, job.max_timeout)
+        started = time.monotonic()
+        try:
+            client = await self.get_http_client()
+            result = await asyncio.wait_for(job.request(client, timeout), timeout)
+        except _TIMEOUT_ERRORS:
+            # Widen this host's timeout until a request succeeds again
+            state.timeouts += 1
+            state.backoff = min(state.backoff * 2, MAX_TIMEOUT / MIN_TIMEOUT)
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(
+                    TimeoutError(f"Camera request timed out after {timeout:.1f}s")
+                )
+        except Exception as e:
+            self.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            state.observe(time.monotonic() - started)
+            self.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            state.active -= 1
+            self._active -= 1
+            self._pump()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler metrics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "per_host_concurrency": self.per_host_concurrency,
+            "per_host_rate": self.per_host_rate,
+            "active": self._active,
+            "queued": sum(len(s.pending) for s in self._hosts.values()),
+            "completed": self.completed,
+            "failed": self.failed,
+            "hosts": [s.to_dict() for s in self._hosts.values()],
+        }
+
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+# Singleton accessor
+_scheduler_instance: CameraIOScheduler | None = None
+
+
+def get_io_scheduler() -> CameraIOScheduler:
+    """
+    Get the camera I/O scheduler singleton.
+
+    Returns:
+        CameraIOScheduler instance.
+    """
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = CameraIOScheduler(
+            max_concurrency=settings.camera_io_max_concurrency,
+            per_host_concurrency=settings.camera_io_per_host_concurrency,
+            per_host_rate=settings.camera_io_per_host_rate,
+        )
+    return _scheduler_instance
@@ -0,0 +1,242 @@
+"""
+Camera Spatial Index for G3TI RTCC-UIP Platform.
+
+Grid index over camera coordinates for location queries:
+- Radius queries that only visit grid cells overlapping the search area
+- K-nearest queries that search outward ring by ring
+- Incremental updates as cameras are added, moved or removed
+"""
+
+import heapq
+import math
+from collections.abc import Iterable
+
+EARTH_RADIUS_KM = 6371.0
+
+# Kilometers per degree of latitude (and of longitude at the equator)
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+# Default cell size, in degrees (~1.1 km of latitude)
+DEFAULT_CELL_SIZE = 0.01
+
+Cell = tuple[int, int]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two GPS coordinates in kilometers."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = (
+        math.sin(delta_lat / 2) ** 2 +
+        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+    )
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+class CameraSpatialIndex:
+    """
+    Uniform lat/lng grid of camera IDs.
+
+    Queries visit only the cells that can hold a match and compute exact
+    haversine distances for the cameras in them. When a query would visit
+    more cells than are occupied, it scans the occupied cells instead.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialize the index.
+
+        Args:
+            cell_size: Grid cell size in degrees.
+        """
+        self.cell_size = cell_size
+        self._cells: dict[Cell, set[str]] = {}
+        self._points: dict[str, tuple[float, float, Cell]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell(self, lat: float, lng: float) -> Cell:
+        return (math.floor(lat / self.cell_size), math.floor(lng / self.cell_size))
+
+    def insert(self, item_id: str, lat: float, lng: float):
+        """Add an item, or move it if already indexed."""
+        self.remove(item_id)
+        cell = self._cell(lat, lng)
+        self._points[item_id] = (lat, lng, cell)
+        self._cells.setdefault(cell, set()).add(item_id)
+
+    def remove(self, item_id: str) -> bool:
+        """Remove an item; returns False if it was not indexed."""
+        point = self._points.pop(item_id, None)
+        if point is None:
+            return False
+        members = self._cells[point[2]]
+        members.discard(item_id)
+        if not members:
+            del self._cells[point[2]]
+        return True
+
+    def clear(self):
+        """Remove all items."""
+        self._cells.clear()
+        self._points.clear()
+
+    def _distances(self, lat: float, lng: float, cells: Iterable[Cell]) -> Iterable[tuple[float, str]]:
+        for cell in cells:
+            for item_id in self._cells.get(cell, ()):
+                p_lat, p_lng, _ = self._points[item_id]
+                yield haversine_km(lat, lng, p_lat, p_lng), item_id
+
+    def within(self, lat: float, lng: float, radius_km: float) -> list[tuple[str, float]]:
+        """
+        Find items within a radius.
+
+        Args:
+            lat: Latitude of center point.
+            lng: Longitude of center point.
+            radius_km: Search radius in kilometers.
+
+        Returns:
+            (item_id, distance_km) pairs sorted by distance.
+        """
+        if radius_km < 0 or not self._points:
+            return []
+
+        lat_span = radius_km / KM_PER_DEGREE
+        # Longitude half-width of the search cap (unbounded if it covers a pole)
+        sin_radius = math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi / 2))
+        cos_lat = math.cos(math.radians(lat))
+        if sin_radius >= cos_lat:
+            lng_span = None
+        else:
+            lng_span = math.degrees(math.asin(sin_radius / cos_lat))
+
+        cells: Iterable[Cell]
+        if lng_span is None or lng - lng_span < -180 or lng + lng_span > 180:
+            cells = list(self._cells)
+        else:
+            south, west = self._cell(lat - lat_span, lng - lng_span)
+            north, east = self._cell(lat + lat_span, lng + lng_span)
+            if (north - south + 1) * (east - west + 1) > len(self._cells):
+                cells = list(self._cells)
+            else:
+                cells = [(y, x) for y in range(south, north + 1) for x in range(west, east + 1)]
+
+        matches = [
+            (item_id, distance)
+            for distance, item_id in self._distances(lat, lng, cells)
+            if distance <= radius_km
+        ]
+        matches.sort(key=lambda m: (m[1], m[0]))
+        return matches
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        k: int,
+        max_radius_km: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the k nearest items.
+
+        Args:
+            lat: Latitude of center point.
+            lng: Longitude of center point.
+            k: Maximum number of items to return.
+            max_radius_km: Optional search radius limit in kilometers.
+
+        Returns:
+            Up to k (item_id, distance_km) pairs sorted by distance.
+        """
+        if k <= 0 or not self._points:
+            return []
+
+        center_y, center_x = self._cell(lat, lng)
+        # Max-heap of the best k so far, as (-distance, item_id)
+        best: list[tuple[float, str]] = []
+        seen = 0
+        visited_cells = 0
+        ring = 0
+
+        def offer(candidates: Iterable[tuple[float, str]]):
+            for distance, item_id in candidates:
+                if max_radius_km is not None and distance > max_radius_km:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, item_id))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, item_id))
+
+        while seen < len(self._points):
+            ring_cells = self._ring(center_y, center_x, ring)
+            visited_cells += len(ring_cells)
+            if visited_cells > len(self._cells):
+                # Sparse grid: cheaper to finish with a scan of occupied cells
+                best.clear()
+                offer(self._distances(lat, lng, self._cells))
+                break
+
+            occupied = [cell for cell in ring_cells if cell in self._cells]
+            seen += sum(len(self._cells[cell]) for cell in occupied)
+            offer(self._distances(lat, lng, occupied))
+
+            # Everything outside the searched block is at least this far away
+            covered_km = self._covered_km(lat, lng, center_y, center_x, ring)
+            if len(best) == k and -best[0][0] <= covered_km:
+                break
+            if max_radius_km is not None and covered_km >= max_radius_km:
+                break
+            ring += 1
+
+        return sorted(((item_id, -neg) for neg, item_id in best), key=lambda m: (m[1], m[0]))
+
+    @staticmethod
+    def _ring(center_y: int, center_x: int, ring: int) -> list[Cell]:
+        """Cells at Chebyshev distance `ring` from the center cell."""
+        if ring == 0:
+            return [(center_y, center_x)]
+        cells = []
+        for x in range(center_x - ring, center_x + ring + 1):
+            cells.append((center_y - ring, x))
+            cells.append((center_y + ring, x))
+        for y in range(center_y - ring + 1, center_y + ring):
+            cells.append((y, center_x - ring))
+            cells.append((y, center_x + ring))
+        return cells
+
+    def _covered_km(self, lat: float, lng: float, center_y: int, center_x: int, ring: int) -> float:
+        """Lower bound on the distance to any point outside the searched block."""
+        south = (center_y - ring) * self.cell_size
+        north = (center_y + ring + 1) * self.cell_size
+        west = (center_x - ring) * self.cell_size
+        east = (center_x + ring + 1) * self.cell_size
+        if west < -180 or east > 180:
+            return 0.0
+
+        bounds = []
+        if south > -90:
+            bounds.append((lat - south) * KM_PER_DEGREE)
+        if north < 90:
+            bounds.append((north - lat) * KM_PER_DEGREE)
+        # Distance to the meridian great circles bounding the block
+        cos_lat = math.cos(math.radians(lat))
+        for delta in (lng - west, east - lng):
+            sin_delta = math.sin(math.radians(min(delta, 90.0)))
+            bounds.append(EARTH_RADIUS_KM * math.asin(min(1.0, cos_lat * sin_delta)))
+        return min(bounds)
+
+    def get_stats(self) -> dict[str, float]:
+        """Get index metrics."""
+        return {
+            "items": len(self._points),
+            "occupied_cells": len(self._cells),
+            "cell_size_degrees": self.cell_size,
+            "max_cell_items": max((len(c) for c in self._cells.values()), default=0),
+        }
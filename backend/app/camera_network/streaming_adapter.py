@@ -6,20 +6,27 @@ Supports multiple streaming formats:
 - Snapshot: Timed snapshot refresh
 - RTSP: Real-Time Streaming Protocol (placeholder for WebRTC shim)
 - HTTP: HTTP-based video streams
+
+MJPEG viewers of the same camera share one upstream fetcher via the
+frame hub, and all upstream requests go through the camera I/O scheduler.
 """
 
 import asyncio
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from datetime import datetime
-from typing import AsyncGenerator, Dict, Any, Optional, List
 from enum import Enum
-import time
+from typing import Any, Dict, List, Optional
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+from .frame_hub import get_frame_hub
+from .io_scheduler import IOPriority, get_io_scheduler
+from .video_wall_manager import get_video_wall_manager
+
 
 class StreamType(str, Enum):
     """Supported stream types."""
@@ -135,12 +142,17 @@ class StreamingAdapter:
         else:
             return StreamType.SNAPSHOT
     
-    async def get_snapshot(self, camera_id: str) -> Optional[bytes]:
+    async def get_snapshot(
+        self,
+        camera_id: str,
+        priority: IOPriority = IOPriority.NORMAL,
+    ) -> bytes | None:
         """
         Get a single snapshot from a camera.
         
         Args:
             camera_id: Camera identifier.
+            priority: Scheduling priority of the upstream request.
             
         Returns:
             JPEG image bytes or None.
@@ -156,14 +168,18 @@ class StreamingAdapter:
         if httpx is None:
             return await self._get_placeholder_image()
         
+        url = config.stream_url
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(config.stream_url)
-                
-                if response.status_code == 200:
-                    return response.content
-                else:
-                    return await self._get_placeholder_image()
+            response = await get_io_scheduler().submit(
+                url,
+                lambda client, timeout: client.get(url, timeout=timeout),
+                priority,
+            )
+
+            if response.status_code == 200:
+                return response.content
+            else:
+                return await self._get_placeholder_image()
         except Exception as e:
             print(f"[STREAM] Snapshot error for {camera_id}: {e}")
             return await self._get_placeholder_image()
@@ -176,6 +192,9 @@ class StreamingAdapter:
         """
         Generate MJPEG stream from snapshots.
         
+        All viewers of a camera share one snapshot fetcher through the
+        frame hub.
+
         Args:
             camera_id: Camera identifier.
             refresh_interval: Seconds between frames.
@@ -184,25 +203,24 @@ class StreamingAdapter:
             MJPEG frame bytes.
         """
         self._active_streams[camera_id] = True
+        hub = get_frame_hub()
+        key = self._feed_key(camera_id)
         
         try:
-            while self._active_streams.get(camera_id, False):
-                # Get snapshot
-                image_data = await self.get_snapshot(camera_id)
-                
-                if image_data:
-                    # Format as MJPEG frame
-                    frame = (
-                        b"--frame\r\n"
-                        b"Content-Type: image/jpeg\r\n"
-                        b"Content-Length: " + str(len(image_data)).encode() + b"\r\n"
-                        b"\r\n" + image_data + b"\r\n"
-                    )
+            async with hub.watch(
+                key, lambda: self.get_snapshot(camera_id, IOPriority.HIGH), refresh_interval
+            ) as frames:
+                async for frame in frames:
+                    if not self._active_streams.get(camera_id, False):
+                        break
                     yield frame
-                
-                await asyncio.sleep(refresh_interval)
         finally:
-            self._active_streams[camera_id] = False
+            # Other viewers keep the stream active
+            self._active_streams[camera_id] = hub.viewer_count(key) > 0
+
+    def _feed_key(self, camera_id: str) -> str:
+        """Get the frame hub key for a camera."""
+        return f"stream:{camera_id}"
     
     def stop_stream(self, camera_id: str):
         """Stop an active stream."""
@@ -246,28 +264,32 @@ class StreamingAdapter:
         """
         Refresh thumbnails for multiple cameras.
         
+        Fetches run concurrently within the camera I/O scheduler's limits;
+        cameras on the active video wall are fetched first.
+
         Args:
             camera_ids: List of camera IDs.
             
         Returns:
             Dictionary of camera_id -> success status.
         """
-        results = {}
+        wall_cameras = get_video_wall_manager().get_active_camera_ids()
         
-        for camera_id in camera_ids:
+        async def refresh(camera_id: str) -> bool:
+            priority = IOPriority.HIGH if camera_id in wall_cameras else IOPriority.NORMAL
             try:
-                thumbnail = await self.get_snapshot(camera_id)
+                thumbnail = await self.get_snapshot(camera_id, priority)
                 if thumbnail:
                     self._thumbnail_cache[camera_id] = thumbnail
                     self._thumbnail_timestamps[camera_id] = datetime.utcnow()
-                    results[camera_id] = True
-                else:
-                    results[camera_id] = False
+                    return True
+                return False
             except Exception as e:
                 print(f"[STREAM] Thumbnail refresh error for {camera_id}: {e}")
-                results[camera_id] = False
+                return False
         
-        return results
+        refreshed = await asyncio.gather(*(refresh(camera_id) for camera_id in camera_ids))
+        return dict(zip(camera_ids, refreshed, strict=True))
     
     async def _get_placeholder_image(self) -> bytes:
         """
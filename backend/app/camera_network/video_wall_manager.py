@@ -8,8 +8,8 @@ Supports 2x2, 3x3, and 4x4 layouts with drag-and-drop functionality.
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
 from enum import Enum
+from typing import Any, Dict, List, Optional
 
 
 class VideoWallLayout(str, Enum):
@@ -479,6 +479,32 @@ class VideoWallManager:
         
         return session.to_dict()
     
+    def get_slot(self, session_id: str, position: int) -> VideoWallSlot | None:
+        """
+        Get a video wall slot.
+
+        Args:
+            session_id: Session identifier.
+            position: Slot position (0-indexed).
+
+        Returns:
+            The slot, or None if the session or position does not exist.
+        """
+        session = self._sessions.get(session_id)
+        if not session or position < 0 or position >= len(session.slots):
+            return None
+
+        return session.slots[position]
+
+    def get_active_camera_ids(self) -> set[str]:
+        """Get the IDs of cameras shown on any video wall session."""
+        return {
+            slot.camera_id
+            for session in self._sessions.values()
+            for slot in session.slots
+            if not slot.is_empty and slot.camera_id
+        }
+
     def get_available_layouts(self) -> List[Dict[str, Any]]:
         """Get list of available layouts."""
         return [
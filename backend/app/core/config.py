@@ -131,6 +131,24 @@ class Settings(BaseSettings):
     ws_max_connections: int = Field(
         default=1000, description="Maximum concurrent WebSocket connections"
     )
+    ws_outbound_queue_size: int = Field(
+        default=256, description="Messages queued per WebSocket client before dropping"
+    )
+    ws_broadcast_backend: str = Field(
+        default="local",
+        description="WebSocket broadcast fan-out: 'local' (this worker) or 'redis' (all workers)",
+    )
+
+    # Camera I/O Settings
+    camera_io_max_concurrency: int = Field(
+        default=32, description="Concurrent upstream camera requests (health checks, snapshots)"
+    )
+    camera_io_per_host_concurrency: int = Field(
+        default=6, description="Concurrent upstream requests per camera host"
+    )
+    camera_io_per_host_rate: float = Field(
+        default=20.0, description="Upstream requests started per second per camera host"
+    )
 
     # Audit Logging Settings
     audit_log_enabled: bool = Field(default=True, description="Enable CJIS-compliant audit logging")
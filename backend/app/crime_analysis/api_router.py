@@ -129,13 +129,12 @@ def generate_demo_crime_data() -> list[dict]:
 async def get_crimes_today():
     """Get all crimes from today."""
     ingestor = get_crime_ingestor()
-    all_records = ingestor.get_all_records()
     
     today = datetime.utcnow().date()
-    today_records = [
-        r for r in all_records
-        if r.datetime_utc.date() == today
-    ]
+    day_start = datetime.combine(today, datetime.min.time())
+    today_records = ingestor.query_records(
+        day_start, day_start + timedelta(days=1) - timedelta(microseconds=1)
+    )
     
     return CrimeListResponse(
         crimes=today_records,
@@ -158,12 +157,7 @@ async def get_crimes_range(
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     
     ingestor = get_crime_ingestor()
-    all_records = ingestor.get_all_records()
-    
-    filtered_records = [
-        r for r in all_records
-        if start_date <= r.datetime_utc <= end_date
-    ]
+    filtered_records = ingestor.query_records(start_date, end_date)
     
     return CrimeListResponse(
         crimes=filtered_records,
@@ -322,30 +316,33 @@ async def generate_demo_data():
 @router.get("/stats")
 async def get_crime_stats():
     """Get overall crime statistics."""
-    ingestor = get_crime_ingestor()
-    all_records = ingestor.get_all_records()
+    store = get_crime_ingestor().store
     
     now = datetime.utcnow()
     today = now.date()
+    day_start = datetime.combine(today, datetime.min.time())
     week_ago = now - timedelta(days=7)
     month_ago = now - timedelta(days=30)
     
-    today_count = sum(1 for r in all_records if r.datetime_utc.date() == today)
-    week_count = sum(1 for r in all_records if r.datetime_utc >= week_ago)
-    month_count = sum(1 for r in all_records if r.datetime_utc >= month_ago)
+    today_count = store.count(
+        start=day_start, end=day_start + timedelta(days=1) - timedelta(microseconds=1)
+    )
+    week_count = store.count(start=week_ago)
+    month_count = store.count(start=month_ago)
     
-    violent_count = sum(1 for r in all_records if r.type == CrimeType.VIOLENT)
-    property_count = sum(1 for r in all_records if r.type == CrimeType.PROPERTY)
+    violent_count = store.count(crime_types=[CrimeType.VIOLENT])
+    property_count = store.count(crime_types=[CrimeType.PROPERTY])
+    total_records = len(store)
     
     return {
-        "total_records": len(all_records),
+        "total_records": total_records,
         "today": today_count,
         "last_7_days": week_count,
         "last_30_days": month_count,
         "by_type": {
             "violent": violent_count,
             "property": property_count,
-            "other": len(all_records) - violent_count - property_count,
+            "other": total_records - violent_count - property_count,
         },
         "generated_at": now.isoformat(),
     }
@@ -371,12 +371,9 @@ class CrimeForecastEngine:
         lookback_days: int = 30,
     ) -> ForecastResult:
         """Generate complete crime forecast."""
-        # Get historical records
-        all_records = self.ingestor.get_all_records()
-        
-        # Filter to lookback period
+        # Get historical records in the lookback period
         cutoff = datetime.utcnow() - timedelta(days=lookback_days)
-        records = [r for r in all_records if r.datetime_utc >= cutoff]
+        records = self.ingestor.query_records(start=cutoff)
         
         # Calculate averages
         hourly_averages = self._calculate_hourly_averages(records)
@@ -5,19 +5,25 @@ Generates:
 - Kernel Density Heatmaps for map visualization
 - Hotspot clustering with HDBSCAN algorithm
 - Supports multiple time ranges (24h, 7d, 30d, custom)
+- Caches results per query and data version for repeated refreshes
 """
 
-import math
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import Optional
+
+import numpy as np
 from pydantic import BaseModel
-from enum import Enum
 
 from app.crime_analysis.crime_ingest import (
-    NormalizedCrimeRecord,
     CrimeType,
+    NormalizedCrimeRecord,
     get_crime_ingestor,
 )
+from app.tactical_engine.kde import GridKDE
+from app.utils.spatial_clustering import METERS_PER_DEGREE, dbscan
 
 
 class TimeRange(str, Enum):
@@ -70,8 +76,18 @@ class CrimeHeatmapEngine:
     # Minimum cluster size for HDBSCAN
     MIN_CLUSTER_SIZE = 3
     
-    # Distance threshold for clustering (in degrees, ~200m)
-    CLUSTER_EPSILON = 0.002
+    # Distance threshold for clustering (in meters)
+    CLUSTER_EPSILON_METERS = 200.0
+
+    # Density below this is dropped from the heatmap to reduce noise
+    DENSITY_THRESHOLD = 0.01
+
+    # Maximum intensity reported for a heatmap point
+    MAX_INTENSITY = 10.0
+
+    # Cached results kept, and how long results for rolling windows stay valid
+    MAX_CACHED_RESULTS = 32
+    CACHE_TTL_SECONDS = 60.0
     
     # Crime type weights for intensity calculation
     CRIME_WEIGHTS = {
@@ -85,15 +101,15 @@ class CrimeHeatmapEngine:
     
     def __init__(self):
         self.ingestor = get_crime_ingestor()
+        self._cache: OrderedDict[tuple, tuple[float, HeatmapResult]] = OrderedDict()
     
-    def _filter_by_time_range(
+    def _time_window(
         self,
-        records: list[NormalizedCrimeRecord],
         time_range: TimeRange,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[list[NormalizedCrimeRecord], datetime, datetime]:
-        """Filter records by time range."""
+    ) -> tuple[datetime, datetime]:
+        """Resolve a time range to start and end datetimes."""
         now = datetime.utcnow()
         
         if time_range == TimeRange.HOURS_24:
@@ -112,34 +128,7 @@ class CrimeHeatmapEngine:
             start = now - timedelta(days=7)
             end = now
         
-        filtered = [
-            r for r in records
-            if start <= r.datetime_utc <= end
-        ]
-        
-        return filtered, start, end
-    
-    def _filter_by_crime_type(
-        self,
-        records: list[NormalizedCrimeRecord],
-        crime_types: Optional[list[CrimeType]] = None,
-    ) -> list[NormalizedCrimeRecord]:
-        """Filter records by crime type."""
-        if not crime_types:
-            return records
-        return [r for r in records if r.type in crime_types]
-    
-    def _gaussian_kernel(self, distance: float, bandwidth: float) -> float:
-        """Calculate Gaussian kernel value."""
-        return math.exp(-(distance ** 2) / (2 * bandwidth ** 2))
-    
-    def _calculate_distance(
-        self,
-        lat1: float, lng1: float,
-        lat2: float, lng2: float
-    ) -> float:
-        """Calculate Euclidean distance in degrees."""
-        return math.sqrt((lat2 - lat1) ** 2 + (lng2 - lng1) ** 2)
+        return start, end
     
     def _kernel_density_estimation(
         self,
@@ -147,119 +136,101 @@ class CrimeHeatmapEngine:
         bounds: dict,
         bandwidth: float = None,
     ) -> list[HeatmapPoint]:
-        """Perform kernel density estimation."""
+        """
+        Perform kernel density estimation.
+
+        Densities are evaluated at the center of each grid cell. Records are
+        converted to coordinate and weight arrays and accumulated with the
+        separable grid KDE, which bounds memory by chunking records.
+        """
         if not records:
             return []
         
         bandwidth = bandwidth or self.DEFAULT_BANDWIDTH
         
-        # Create grid
+        coords = np.array([(r.latitude, r.longitude) for r in records], dtype=float)
+        weights = np.array([self.CRIME_WEIGHTS.get(r.type, 1.0) for r in records])
+
+        # Grid of cell centers
         lat_step = (bounds["north"] - bounds["south"]) / self.GRID_SIZE
         lng_step = (bounds["east"] - bounds["west"]) / self.GRID_SIZE
+        centers = {
+            "min_lat": bounds["south"] + 0.5 * lat_step,
+            "max_lat": bounds["north"] - 0.5 * lat_step,
+            "min_lon": bounds["west"] + 0.5 * lng_step,
+            "max_lon": bounds["east"] - 0.5 * lng_step,
+        }
+        kde = GridKDE(centers, self.GRID_SIZE, bandwidth).fit(coords, weights)
+        density = kde.density(normalize=False)
         
-        points = []
-        
-        for i in range(self.GRID_SIZE):
-            for j in range(self.GRID_SIZE):
-                grid_lat = bounds["south"] + (i + 0.5) * lat_step
-                grid_lng = bounds["west"] + (j + 0.5) * lng_step
-                
-                # Calculate density at this grid point
-                density = 0.0
-                for record in records:
-                    distance = self._calculate_distance(
-                        grid_lat, grid_lng,
-                        record.latitude, record.longitude
-                    )
-                    weight = self.CRIME_WEIGHTS.get(record.type, 1.0)
-                    density += weight * self._gaussian_kernel(distance, bandwidth)
-                
-                if density > 0.01:  # Threshold to reduce noise
-                    points.append(HeatmapPoint(
-                        latitude=grid_lat,
-                        longitude=grid_lng,
-                        intensity=min(density, 10.0),  # Cap intensity
-                        weight=density,
-                    ))
-        
-        return points
+        rows, cols = np.nonzero(density > self.DENSITY_THRESHOLD)
+        values = density[rows, cols]
+        return [
+            HeatmapPoint(
+                latitude=lat,
+                longitude=lng,
+                intensity=min(value, self.MAX_INTENSITY),
+                weight=value,
+            )
+            for lat, lng, value in zip(
+                kde.lat_range[rows].tolist(),
+                kde.lon_range[cols].tolist(),
+                values.tolist(),
+                strict=True,
+            )
+        ]
     
     def _simple_clustering(
         self,
         records: list[NormalizedCrimeRecord],
         epsilon: float = None,
         min_samples: int = None,
+        epsilon_meters: float = None,
     ) -> list[HotspotCluster]:
-        """Simple distance-based clustering (HDBSCAN-like)."""
+        """
+        DBSCAN hotspot clustering with a geodesic epsilon.
+
+        ``epsilon`` is the legacy radius in degrees; ``epsilon_meters``
+        takes precedence when both are given.
+        """
         if not records:
             return []
         
-        epsilon = epsilon or self.CLUSTER_EPSILON
+        if epsilon_meters is None:
+            epsilon_meters = (
+                epsilon * METERS_PER_DEGREE if epsilon else self.CLUSTER_EPSILON_METERS
+            )
         min_samples = min_samples or self.MIN_CLUSTER_SIZE
         
-        # Track which records have been assigned to clusters
-        assigned = [False] * len(records)
-        clusters = []
-        cluster_id = 0
+        points = np.array([[r.latitude, r.longitude] for r in records])
+        result = dbscan(points, eps_meters=epsilon_meters, min_samples=min_samples)
         
-        for i, record in enumerate(records):
-            if assigned[i]:
-                continue
+        clusters = []
+        for cluster_id, members in enumerate(result.groups()):
+            cluster_records = [records[idx] for idx in members]
+
+            # Get crime types and top crimes
+            crime_types = list({r.type.value for r in cluster_records})
+            crime_counts = {}
+            for r in cluster_records:
+                key = r.subcategory
+                crime_counts[key] = crime_counts.get(key, 0) + 1
+            top_crimes = sorted(crime_counts.keys(), key=lambda x: crime_counts[x], reverse=True)[:5]
             
-            # Find all neighbors within epsilon
-            neighbors = [i]
-            for j, other in enumerate(records):
-                if i != j and not assigned[j]:
-                    distance = self._calculate_distance(
-                        record.latitude, record.longitude,
-                        other.latitude, other.longitude
-                    )
-                    if distance <= epsilon:
-                        neighbors.append(j)
+            # Calculate severity score
+            severity = sum(self.CRIME_WEIGHTS.get(r.type, 1.0) for r in cluster_records)
+            severity_score = min(severity / len(cluster_records) * 2, 5.0)
             
-            # Only create cluster if we have enough points
-            if len(neighbors) >= min_samples:
-                # Mark all neighbors as assigned
-                for idx in neighbors:
-                    assigned[idx] = True
-                
-                # Calculate cluster properties
-                cluster_records = [records[idx] for idx in neighbors]
-                center_lat = sum(r.latitude for r in cluster_records) / len(cluster_records)
-                center_lng = sum(r.longitude for r in cluster_records) / len(cluster_records)
-                
-                # Calculate radius (max distance from center)
-                max_dist = 0
-                for r in cluster_records:
-                    dist = self._calculate_distance(center_lat, center_lng, r.latitude, r.longitude)
-                    max_dist = max(max_dist, dist)
-                
-                # Convert degrees to meters (approximate)
-                radius_meters = max_dist * 111000  # 1 degree ≈ 111km
-                
-                # Get crime types and top crimes
-                crime_types = list(set(r.type.value for r in cluster_records))
-                crime_counts = {}
-                for r in cluster_records:
-                    key = r.subcategory
-                    crime_counts[key] = crime_counts.get(key, 0) + 1
-                top_crimes = sorted(crime_counts.keys(), key=lambda x: crime_counts[x], reverse=True)[:5]
-                
-                # Calculate severity score
-                severity = sum(self.CRIME_WEIGHTS.get(r.type, 1.0) for r in cluster_records)
-                severity_score = min(severity / len(cluster_records) * 2, 5.0)
-                
-                clusters.append(HotspotCluster(
-                    cluster_id=cluster_id,
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=max(radius_meters, 100),  # Minimum 100m radius
-                    incident_count=len(cluster_records),
-                    crime_types=crime_types,
-                    severity_score=round(severity_score, 2),
-                    top_crimes=top_crimes,
-                ))
-                cluster_id += 1
+            clusters.append(HotspotCluster(
+                cluster_id=cluster_id,
+                center_lat=float(result.centroids[cluster_id, 0]),
+                center_lng=float(result.centroids[cluster_id, 1]),
+                radius_meters=max(float(result.radii_meters[cluster_id]), 100),  # Minimum 100m radius
+                incident_count=len(cluster_records),
+                crime_types=crime_types,
+                severity_score=round(severity_score, 2),
+                top_crimes=top_crimes,
+            ))
         
         return clusters
     
@@ -286,6 +257,45 @@ class CrimeHeatmapEngine:
             "west": min(lngs) - padding,
         }
     
+    def _cache_key(
+        self,
+        time_range: TimeRange,
+        crime_types: list[CrimeType] | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> tuple:
+        """Build the result cache key for a query at the current data version."""
+        if time_range != TimeRange.CUSTOM:
+            start_date = end_date = None
+        types = tuple(sorted({CrimeType(t).value for t in crime_types})) if crime_types else None
+        return (time_range, start_date, end_date, types, self.ingestor.get_version())
+
+    def _get_cached(self, key: tuple) -> HeatmapResult | None:
+        """Get a cached result if it is still valid."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        # Rolling windows move with the clock, so their results expire
+        time_range, start_date, end_date = key[:3]
+        rolling = time_range != TimeRange.CUSTOM or start_date is None or end_date is None
+        if rolling and time.monotonic() - cached_at > self.CACHE_TTL_SECONDS:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _store_cached(self, key: tuple, result: HeatmapResult):
+        """Cache a result, evicting the least recently used entries."""
+        self._cache[key] = (time.monotonic(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.MAX_CACHED_RESULTS:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached heatmap results."""
+        self._cache.clear()
+
     def generate_heatmap(
         self,
         time_range: TimeRange = TimeRange.DAYS_7,
@@ -293,17 +303,21 @@ class CrimeHeatmapEngine:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> HeatmapResult:
-        """Generate complete heatmap analysis."""
-        # Get all records
-        all_records = self.ingestor.get_all_records()
+        """
+        Generate complete heatmap analysis.
         
-        # Filter by time range
-        filtered_records, start, end = self._filter_by_time_range(
-            all_records, time_range, start_date, end_date
-        )
+        Results are cached per (time range, crime types, data version), so
+        repeated refreshes are served without recomputation until records
+        change or a rolling window's cache entry expires.
+        """
+        key = self._cache_key(time_range, crime_types, start_date, end_date)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
         
-        # Filter by crime type
-        filtered_records = self._filter_by_crime_type(filtered_records, crime_types)
+        # Get records in the time range and of the requested types
+        start, end = self._time_window(time_range, start_date, end_date)
+        filtered_records = self.ingestor.query_records(start, end, crime_types)
         
         # Calculate bounds
         bounds = self._calculate_bounds(filtered_records)
@@ -314,7 +328,7 @@ class CrimeHeatmapEngine:
         # Identify hotspots
         hotspots = self._simple_clustering(filtered_records)
         
-        return HeatmapResult(
+        result = HeatmapResult(
             points=points,
             hotspots=hotspots,
             time_range=time_range.value,
@@ -323,6 +337,8 @@ class CrimeHeatmapEngine:
             total_incidents=len(filtered_records),
             bounds=bounds,
         )
+        self._store_cached(key, result)
+        return result
 
 
 # Global engine instance
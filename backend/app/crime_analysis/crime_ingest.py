@@ -11,12 +11,15 @@ Normalizes all data to a standard schema.
 """
 
 import csv
-import json
 import io
+import json
 from datetime import datetime
+from enum import Enum
 from typing import Optional
+
 from pydantic import BaseModel, Field
-from enum import Enum
+
+from app.crime_analysis.crime_store import CrimeRecordStore
 
 
 class CrimeType(str, Enum):
@@ -128,9 +131,14 @@ class CrimeDataIngestor:
     }
     
     def __init__(self):
-        self.records: list[NormalizedCrimeRecord] = []
+        self.store = CrimeRecordStore(CrimeType)
         self._record_counter = 0
     
+    @property
+    def records(self) -> list[NormalizedCrimeRecord]:
+        """All ingested records, in ingestion order."""
+        return self.store.records()
+
     def _generate_id(self) -> str:
         """Generate unique record ID."""
         self._record_counter += 1
@@ -252,7 +260,7 @@ class CrimeDataIngestor:
         for row in reader:
             record = self._normalize_record(row, source)
             records.append(record)
-            self.records.append(record)
+        self.store.extend(records)
         return records
     
     def ingest_json(self, json_content: str, source: str = "json_upload") -> list[NormalizedCrimeRecord]:
@@ -267,7 +275,7 @@ class CrimeDataIngestor:
         for item in data:
             record = self._normalize_record(item, source)
             records.append(record)
-            self.records.append(record)
+        self.store.extend(records)
         return records
     
     def ingest_nibrs(self, data: list[dict]) -> list[NormalizedCrimeRecord]:
@@ -277,7 +285,7 @@ class CrimeDataIngestor:
         for item in data:
             record = self._normalize_record(item, "fbi_nibrs", mapping)
             records.append(record)
-            self.records.append(record)
+        self.store.extend(records)
         return records
     
     def ingest_pbso(self, data: list[dict]) -> list[NormalizedCrimeRecord]:
@@ -287,7 +295,7 @@ class CrimeDataIngestor:
         for item in data:
             record = self._normalize_record(item, "pbso", mapping)
             records.append(record)
-            self.records.append(record)
+        self.store.extend(records)
         return records
     
     def ingest_riviera_beach(self, data: list[dict]) -> list[NormalizedCrimeRecord]:
@@ -297,16 +305,35 @@ class CrimeDataIngestor:
         for item in data:
             record = self._normalize_record(item, "riviera_beach", mapping)
             records.append(record)
-            self.records.append(record)
+        self.store.extend(records)
         return records
     
     def get_all_records(self) -> list[NormalizedCrimeRecord]:
         """Get all ingested records."""
-        return self.records
+        return self.store.records()
+
+    def query_records(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        crime_types: list[CrimeType] | None = None,
+        sectors: list[str] | None = None,
+    ) -> list[NormalizedCrimeRecord]:
+        """
+        Get records matching the filters, in ingestion order.
+
+        Filtering runs on the store's columns; only matching records are
+        returned. Times are inclusive on both ends.
+        """
+        return self.store.records(self.store.select(start, end, crime_types, sectors))
+
+    def get_version(self) -> int:
+        """Get the data version, which changes whenever records change."""
+        return self.store.version
     
     def clear_records(self):
         """Clear all records."""
-        self.records = []
+        self.store.clear()
         self._record_counter = 0
 
 
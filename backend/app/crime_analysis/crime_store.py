@@ -0,0 +1,243 @@
+"""
+Columnar Crime Record Store.
+
+Keeps ingested records alongside NumPy columns so analyzers can filter
+without scanning model objects:
+- Timestamp, latitude/longitude, type and sector code columns
+- Sorted time index for range queries
+- Per-type and per-sector bitmaps
+- Read-only column views for analyzers that work on arrays
+
+Models are only materialized for the rows a query selects.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.crime_analysis.crime_ingest import NormalizedCrimeRecord
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_timestamp(value: datetime) -> int:
+    """Convert a datetime to UTC epoch microseconds (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+@dataclass
+class CrimeColumns:
+    """Column arrays for a set of crime records."""
+
+    timestamps: np.ndarray  # UTC epoch microseconds
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    type_codes: np.ndarray  # Index into the store's crime types
+    sector_codes: np.ndarray  # Index into sector_names
+    sector_names: list[str]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class CrimeRecordStore:
+    """Append-only columnar store of normalized crime records."""
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, crime_types: Iterable[Enum]):
+        """
+        Initialize an empty store.
+
+        Args:
+            crime_types: Crime type members, in type-code order
+        """
+        self.crime_types = list(crime_types)
+        # Accept both members and their string values
+        self._type_codes_by_key = {t: i for i, t in enumerate(self.crime_types)}
+        self._type_codes_by_key.update({t.value: i for i, t in enumerate(self.crime_types)})
+
+        self._records: list[NormalizedCrimeRecord] = []
+        self._sector_codes: dict[str, int] = {}
+        self._sector_names: list[str] = []
+        self._allocate(self.INITIAL_CAPACITY)
+        self._time_order = np.empty(0, dtype=np.int64)
+        self._sorted_times = np.empty(0, dtype=np.int64)
+        self._bitmaps: dict[tuple[str, int], np.ndarray] = {}
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _allocate(self, capacity: int):
+        """Allocate empty columns with the given capacity."""
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._latitudes = np.empty(capacity, dtype=np.float64)
+        self._longitudes = np.empty(capacity, dtype=np.float64)
+        self._type_codes = np.empty(capacity, dtype=np.int8)
+        self._sector_col = np.empty(capacity, dtype=np.int32)
+
+    def _grow(self, needed: int):
+        """Grow columns geometrically to hold at least ``needed`` rows."""
+        capacity = len(self._timestamps)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        size = len(self._records)
+        old = (
+            self._timestamps, self._latitudes, self._longitudes,
+            self._type_codes, self._sector_col,
+        )
+        self._allocate(capacity)
+        new = (
+            self._timestamps, self._latitudes, self._longitudes,
+            self._type_codes, self._sector_col,
+        )
+        for src, dst in zip(old, new, strict=True):
+            dst[:size] = src[:size]
+
+    def _sector_code(self, sector: str) -> int:
+        """Get the code for a sector, assigning one on first sight."""
+        code = self._sector_codes.get(sector)
+        if code is None:
+            code = len(self._sector_names)
+            self._sector_codes[sector] = code
+            self._sector_names.append(sector)
+        return code
+
+    def extend(self, records: Iterable["NormalizedCrimeRecord"]):
+        """Append records and index them."""
+        records = list(records)
+        if not records:
+            return
+
+        start = len(self._records)
+        end = start + len(records)
+        self._grow(end)
+
+        self._timestamps[start:end] = [to_timestamp(r.datetime_utc) for r in records]
+        self._latitudes[start:end] = [r.latitude for r in records]
+        self._longitudes[start:end] = [r.longitude for r in records]
+        self._type_codes[start:end] = [self._type_codes_by_key[r.type] for r in records]
+        self._sector_col[start:end] = [self._sector_code(r.sector) for r in records]
+        self._records.extend(records)
+
+        # Merge the new rows into the time index
+        new_times = self._timestamps[start:end]
+        new_order = np.argsort(new_times, kind="stable")
+        new_sorted = new_times[new_order]
+        positions = np.searchsorted(self._sorted_times, new_sorted, side="right")
+        self._time_order = np.insert(self._time_order, positions, new_order + start)
+        self._sorted_times = np.insert(self._sorted_times, positions, new_sorted)
+
+        self._bitmaps.clear()
+        self.version += 1
+
+    def clear(self):
+        """Remove all records."""
+        self._records = []
+        self._sector_codes = {}
+        self._sector_names = []
+        self._allocate(self.INITIAL_CAPACITY)
+        self._time_order = np.empty(0, dtype=np.int64)
+        self._sorted_times = np.empty(0, dtype=np.int64)
+        self._bitmaps.clear()
+        self.version += 1
+
+    def _bitmap(self, kind: str, code: int) -> np.ndarray:
+        """Get the membership bitmap for a type or sector code."""
+        key = (kind, code)
+        bitmap = self._bitmaps.get(key)
+        if bitmap is None:
+            column = self._type_codes if kind == "type" else self._sector_col
+            bitmap = column[:len(self._records)] == code
+            self._bitmaps[key] = bitmap
+        return bitmap
+
+    def _union(self, kind: str, codes: list[int]) -> np.ndarray:
+        """OR together the bitmaps for several codes."""
+        mask = np.zeros(len(self._records), dtype=bool)
+        for code in codes:
+            mask |= self._bitmap(kind, code)
+        return mask
+
+    def select(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        crime_types: list | None = None,
+        sectors: list[str] | None = None,
+    ) -> np.ndarray:
+        """
+        Select rows matching all given filters.
+
+        Args:
+            start: Earliest record time (inclusive)
+            end: Latest record time (inclusive)
+            crime_types: Crime types to keep (all if empty)
+            sectors: Sectors to keep (all if empty)
+
+        Returns:
+            Row indices in ingestion order
+        """
+        size = len(self._records)
+        lo = 0 if start is None else int(
+            np.searchsorted(self._sorted_times, to_timestamp(start), side="left")
+        )
+        hi = size if end is None else int(
+            np.searchsorted(self._sorted_times, to_timestamp(end), side="right")
+        )
+        if lo == 0 and hi == size:
+            rows = np.arange(size)
+        else:
+            rows = np.sort(self._time_order[lo:max(lo, hi)])
+
+        if crime_types:
+            codes = {self._type_codes_by_key[t] for t in crime_types if t in self._type_codes_by_key}
+            rows = rows[self._union("type", sorted(codes))[rows]]
+        if sectors:
+            codes = [self._sector_codes[s] for s in set(sectors) if s in self._sector_codes]
+            rows = rows[self._union("sector", sorted(codes))[rows]]
+        return rows
+
+    def count(self, **filters) -> int:
+        """Count rows matching the filters accepted by select()."""
+        return len(self.select(**filters))
+
+    def records(self, rows: np.ndarray | None = None) -> list["NormalizedCrimeRecord"]:
+        """Get record models, for all rows or the given row indices."""
+        if rows is None:
+            return self._records
+        return [self._records[i] for i in rows.tolist()]
+
+    def columns(self, rows: np.ndarray | None = None) -> CrimeColumns:
+        """
+        Get column arrays, for all rows or the given row indices.
+
+        Without rows, the arrays are read-only views of the store's
+        columns and are only valid until the next append or clear.
+        """
+        size = len(self._records)
+        arrays = [
+            self._timestamps[:size], self._latitudes[:size], self._longitudes[:size],
+            self._type_codes[:size], self._sector_col[:size],
+        ]
+        if rows is None:
+            arrays = [a.view() for a in arrays]
+            for array in arrays:
+                array.flags.writeable = False
+        else:
+            arrays = [a[rows] for a in arrays]
+        return CrimeColumns(*arrays, sector_names=list(self._sector_names))
+
+    def sectors(self) -> list[str]:
+        """Get all sectors seen, in order of first appearance."""
+        return list(self._sector_names)
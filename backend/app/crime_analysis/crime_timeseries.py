@@ -278,18 +278,12 @@ class CrimeTimeseriesAnalyzer:
         end_date: Optional[datetime] = None,
     ) -> TimeseriesResult:
         """Perform complete time series analysis."""
-        # Get all records
-        all_records = self.ingestor.get_all_records()
-        
         # Determine date range
         end = end_date or datetime.utcnow()
         start = start_date or (end - timedelta(days=days))
         
-        # Filter records
-        filtered_records = [
-            r for r in all_records
-            if start <= r.datetime_utc <= end
-        ]
+        # Get records in range
+        filtered_records = self.ingestor.query_records(start, end)
         
         # Generate aggregations
         hourly_data = self._aggregate_hourly(filtered_records, start, end)
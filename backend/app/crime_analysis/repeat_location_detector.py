@@ -8,16 +8,19 @@ Identifies:
 - Produces ranked lists
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
+
+import numpy as np
 from pydantic import BaseModel
-from collections import defaultdict
 
 from app.crime_analysis.crime_ingest import (
-    NormalizedCrimeRecord,
     CrimeType,
+    NormalizedCrimeRecord,
     get_crime_ingestor,
 )
+from app.utils.spatial_clustering import METERS_PER_DEGREE, dbscan
 
 
 class RepeatLocation(BaseModel):
@@ -68,6 +71,9 @@ class RepeatLocationDetector:
     # Minimum incidents to be considered a repeat location
     MIN_REPEAT_COUNT = 2
     
+    # Distance threshold for clustering nearby locations (in meters)
+    CLUSTER_EPSILON_METERS = 330.0
+
     # Business indicators in addresses
     BUSINESS_INDICATORS = [
         "plaza", "mall", "store", "shop", "market", "gas station",
@@ -194,62 +200,48 @@ class RepeatLocationDetector:
     def _cluster_locations(
         self,
         locations: list[RepeatLocation],
-        epsilon: float = 0.003,  # ~330m
+        epsilon: float = None,
+        epsilon_meters: float = None,
     ) -> list[LocationCluster]:
-        """Cluster nearby repeat locations."""
+        """
+        Cluster nearby repeat locations.
+
+        Locations chained within ``epsilon_meters`` of each other form a
+        cluster. ``epsilon`` is the legacy radius in degrees; when neither
+        is given CLUSTER_EPSILON_METERS is used.
+        """
         if not locations:
             return []
         
-        clusters = []
-        assigned = [False] * len(locations)
-        cluster_id = 0
+        if epsilon_meters is None:
+            epsilon_meters = (
+                epsilon * METERS_PER_DEGREE if epsilon else self.CLUSTER_EPSILON_METERS
+            )
         
-        for i, loc in enumerate(locations):
-            if assigned[i]:
-                continue
+        points = np.array([[l.latitude, l.longitude] for l in locations])
+        result = dbscan(points, eps_meters=epsilon_meters, min_samples=2)
+
+        clusters = []
+        for cluster_id, members in enumerate(result.groups()):
+            cluster_locs = [locations[idx] for idx in members]
             
-            # Find nearby locations
-            cluster_locs = [loc]
-            assigned[i] = True
+            # Get top location
+            top_loc = max(cluster_locs, key=lambda l: l.incident_count)
             
-            for j, other in enumerate(locations):
-                if i != j and not assigned[j]:
-                    dist = ((loc.latitude - other.latitude) ** 2 + 
-                           (loc.longitude - other.longitude) ** 2) ** 0.5
-                    if dist <= epsilon:
-                        cluster_locs.append(other)
-                        assigned[j] = True
+            # Get sector
+            sectors = [l.sector for l in cluster_locs]
+            sector = max(set(sectors), key=sectors.count)
             
-            if len(cluster_locs) >= 2:
-                # Calculate cluster center
-                center_lat = sum(l.latitude for l in cluster_locs) / len(cluster_locs)
-                center_lng = sum(l.longitude for l in cluster_locs) / len(cluster_locs)
-                
-                # Calculate radius
-                max_dist = max(
-                    ((l.latitude - center_lat) ** 2 + (l.longitude - center_lng) ** 2) ** 0.5
-                    for l in cluster_locs
-                )
-                radius_meters = max_dist * 111000  # Approximate conversion
-                
-                # Get top location
-                top_loc = max(cluster_locs, key=lambda l: l.incident_count)
-                
-                # Get sector
-                sectors = [l.sector for l in cluster_locs]
-                sector = max(set(sectors), key=sectors.count)
-                
-                clusters.append(LocationCluster(
-                    cluster_id=f"cluster-{cluster_id}",
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=max(radius_meters, 100),
-                    total_incidents=sum(l.incident_count for l in cluster_locs),
-                    location_count=len(cluster_locs),
-                    top_location=top_loc,
-                    sector=sector,
-                ))
-                cluster_id += 1
+            clusters.append(LocationCluster(
+                cluster_id=f"cluster-{cluster_id}",
+                center_lat=float(result.centroids[cluster_id, 0]),
+                center_lng=float(result.centroids[cluster_id, 1]),
+                radius_meters=max(float(result.radii_meters[cluster_id]), 100),
+                total_incidents=sum(l.incident_count for l in cluster_locs),
+                location_count=len(cluster_locs),
+                top_location=top_loc,
+                sector=sector,
+            ))
         
         return clusters
     
@@ -261,12 +253,9 @@ class RepeatLocationDetector:
         """Detect repeat locations in crime data."""
         min_incidents = min_incidents or self.MIN_REPEAT_COUNT
         
-        # Get all records
-        all_records = self.ingestor.get_all_records()
-        
-        # Filter by time
+        # Get records in the time window
         cutoff = datetime.utcnow() - timedelta(days=days)
-        records = [r for r in all_records if r.datetime_utc >= cutoff]
+        records = self.ingestor.query_records(start=cutoff)
         
         # Group by location
         location_groups = self._group_by_location(records)
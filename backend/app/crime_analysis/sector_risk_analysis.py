@@ -191,15 +191,9 @@ class SectorRiskAnalyzer:
         days: int = 30,
     ) -> SectorRiskScore:
         """Analyze risk for a specific sector."""
-        # Get all records
-        all_records = self.ingestor.get_all_records()
-        
-        # Filter by sector and time
+        # Get the sector's records in the time window
         cutoff = datetime.utcnow() - timedelta(days=days)
-        records = [
-            r for r in all_records
-            if r.sector == sector and r.datetime_utc >= cutoff
-        ]
+        records = self.ingestor.query_records(start=cutoff, sectors=[sector])
         
         # Calculate risk factors
         violent_count = self._count_violent_crimes(records)
@@ -267,11 +261,8 @@ class SectorRiskAnalyzer:
     
     def analyze_all_sectors(self, days: int = 30) -> SectorComparisonResult:
         """Analyze and compare all sectors."""
-        # Get all records
-        all_records = self.ingestor.get_all_records()
-        
         # Get unique sectors
-        sectors = set(r.sector for r in all_records)
+        sectors = self.ingestor.store.sectors()
         
         # Analyze each sector
         sector_scores = []
@@ -15,6 +15,12 @@ The data lake integrates with:
 - Redis for caching aggregations
 """
 
+from .aggregations import (
+    ElasticsearchAggregationEngine,
+    IncidentAggregationEngine,
+    IncidentBreakdown,
+    InMemoryAggregationEngine,
+)
 from .models import (
     CrimeDataPartition,
     DataLakeConfig,
@@ -33,7 +39,11 @@ __all__ = [
     "DataLakeRepository",
     "DataLakeService",
     "DataRetentionPolicy",
+    "ElasticsearchAggregationEngine",
     "HistoricalAggregate",
+    "IncidentAggregationEngine",
+    "IncidentBreakdown",
+    "InMemoryAggregationEngine",
     "IncidentRecord",
     "OffenderProfile",
     "PartitionMetadata",
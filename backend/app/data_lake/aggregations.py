@@ -0,0 +1,374 @@
+"""
+Incident Aggregation Engine for G3TI RTCC-UIP.
+
+This module computes incident breakdowns for historical aggregates and
+multi-year heatmaps without hydrating every matching document:
+- Elasticsearch engine pushing breakdowns down as terms, date_histogram
+  and paged composite aggregations
+- In-memory engine producing identical results from incident records,
+  used when no cluster is available and in tests
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from .models import CrimeCategory, IncidentRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IncidentBreakdown:
+    """Counts of incidents matching a filter, broken down by dimension."""
+
+    total: int = 0
+    arrests: int = 0
+    by_category: dict[str, int] = field(default_factory=dict)
+    by_type: dict[str, int] = field(default_factory=dict)
+    by_severity: dict[str, int] = field(default_factory=dict)
+    by_hour: dict[int, int] = field(default_factory=lambda: dict.fromkeys(range(24), 0))
+    by_weekday: dict[int, int] = field(default_factory=lambda: dict.fromkeys(range(7), 0))
+    h3_counts: dict[str, int] = field(default_factory=dict)
+
+    def top_hotspots(self, limit: int = 20) -> list[tuple[str, int]]:
+        """Return the busiest H3 cells, ties broken by index."""
+        return sorted(self.h3_counts.items(), key=lambda x: (-x[1], x[0]))[:limit]
+
+
+@dataclass
+class CellStats:
+    """Incident count and centroid for a single H3 cell."""
+
+    count: int
+    latitude: float
+    longitude: float
+
+
+@dataclass
+class YearlyCellBreakdown:
+    """Per-year H3 cell statistics and incident totals."""
+
+    totals: dict[int, int] = field(default_factory=dict)
+    cells: dict[int, dict[str, CellStats]] = field(default_factory=dict)
+
+
+def _period_bounds(start_year: int, end_year: int) -> tuple[datetime, datetime]:
+    """Return inclusive datetime bounds covering whole calendar years."""
+    return datetime(start_year, 1, 1), datetime(end_year + 1, 1, 1) - timedelta(seconds=1)
+
+
+class IncidentAggregationEngine(ABC):
+    """
+    Base interface for incident aggregation engines.
+
+    Implementations must return identical results for the same data so
+    the service layer can switch between them transparently.
+    """
+
+    @abstractmethod
+    async def breakdown(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+        beat: str | None = None,
+    ) -> IncidentBreakdown:
+        """Compute the full dimensional breakdown for a time period."""
+        pass
+
+    @abstractmethod
+    async def yearly_cells(
+        self,
+        start_year: int,
+        end_year: int,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+    ) -> YearlyCellBreakdown:
+        """Compute H3 cell counts and centroids for each year in a range."""
+        pass
+
+
+class InMemoryAggregationEngine(IncidentAggregationEngine):
+    """
+    Pure-Python aggregation over a list of incident records.
+
+    Applies the same filters as the Elasticsearch incident query (inclusive
+    date range, category, jurisdiction and beat terms).
+    """
+
+    def __init__(self, incidents: list[IncidentRecord] | None = None):
+        """
+        Initialize the in-memory engine.
+
+        Args:
+            incidents: Incident records to aggregate over
+        """
+        self.incidents: list[IncidentRecord] = list(incidents or [])
+
+    def add_incidents(self, incidents: list[IncidentRecord]) -> None:
+        """Add incident records to the in-memory dataset."""
+        self.incidents.extend(incidents)
+
+    def _filter(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        jurisdiction: str | None,
+        crime_category: CrimeCategory | None,
+        beat: str | None,
+    ) -> list[IncidentRecord]:
+        return [
+            incident
+            for incident in self.incidents
+            if start_date <= incident.timestamp <= end_date
+            and (not jurisdiction or incident.jurisdiction == jurisdiction)
+            and (not crime_category or incident.crime_category == crime_category)
+            and (not beat or incident.beat == beat)
+        ]
+
+    async def breakdown(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+        beat: str | None = None,
+    ) -> IncidentBreakdown:
+        """Compute the full dimensional breakdown for a time period."""
+        result = IncidentBreakdown()
+
+        for incident in self._filter(start_date, end_date, jurisdiction, crime_category, beat):
+            result.total += 1
+
+            cat = incident.crime_category.value
+            result.by_category[cat] = result.by_category.get(cat, 0) + 1
+            result.by_type[incident.crime_type] = result.by_type.get(incident.crime_type, 0) + 1
+            sev = incident.severity.value
+            result.by_severity[sev] = result.by_severity.get(sev, 0) + 1
+
+            result.by_hour[incident.timestamp.hour] += 1
+            result.by_weekday[incident.timestamp.weekday()] += 1
+
+            if incident.location.h3_index:
+                h3 = incident.location.h3_index
+                result.h3_counts[h3] = result.h3_counts.get(h3, 0) + 1
+
+            if incident.arrest_made:
+                result.arrests += 1
+
+        return result
+
+    async def yearly_cells(
+        self,
+        start_year: int,
+        end_year: int,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+    ) -> YearlyCellBreakdown:
+        """Compute H3 cell counts and centroids for each year in a range."""
+        start_date, end_date = _period_bounds(start_year, end_year)
+        result = YearlyCellBreakdown()
+        sums: dict[int, dict[str, list[float]]] = {}
+
+        for incident in self._filter(start_date, end_date, jurisdiction, crime_category, None):
+            year = incident.timestamp.year
+            result.totals[year] = result.totals.get(year, 0) + 1
+
+            h3 = incident.location.h3_index
+            if not h3:
+                continue
+            acc = sums.setdefault(year, {}).setdefault(h3, [0, 0.0, 0.0])
+            acc[0] += 1
+            acc[1] += incident.location.latitude
+            acc[2] += incident.location.longitude
+
+        for year, cells in sums.items():
+            result.cells[year] = {
+                h3: CellStats(count=int(n), latitude=lat / n, longitude=lon / n)
+                for h3, (n, lat, lon) in cells.items()
+            }
+
+        return result
+
+
+class ElasticsearchAggregationEngine(IncidentAggregationEngine):
+    """
+    Aggregation engine that pushes breakdowns down to Elasticsearch.
+
+    Low-cardinality dimensions use terms aggregations, hour and weekday use
+    scripted terms, yearly totals use a date_histogram, and high-cardinality
+    dimensions (crime type, H3 cell) are paged with composite aggregations
+    so no bucket is silently truncated.
+    """
+
+    HOUR_SCRIPT = "doc['timestamp'].value.getHour()"
+    WEEKDAY_SCRIPT = "doc['timestamp'].value.getDayOfWeekEnum().getValue() - 1"
+
+    def __init__(self, repository: Any, page_size: int = 1000):
+        """
+        Initialize the Elasticsearch engine.
+
+        Args:
+            repository: DataLakeRepository providing the ES client and query builder
+            page_size: Buckets per composite aggregation page
+        """
+        self.repository = repository
+        self.page_size = page_size
+
+    async def _search_aggs(
+        self,
+        query: dict[str, Any],
+        aggs: dict[str, Any],
+    ) -> tuple[dict[str, Any], int]:
+        result = await self.repository.es.search(
+            index=self.repository.INCIDENTS_INDEX,
+            query=query,
+            size=0,
+            aggs=aggs,
+            track_total_hits=True,
+        )
+        total = result.get("hits", {}).get("total", {}).get("value", 0)
+        return result.get("aggregations", {}), total
+
+    async def _composite_pages(
+        self,
+        query: dict[str, Any],
+        sources: list[dict[str, Any]],
+        sub_aggs: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Collect every bucket of a composite aggregation by paging on after_key."""
+        buckets: list[dict[str, Any]] = []
+        after: dict[str, Any] | None = None
+
+        while True:
+            composite: dict[str, Any] = {"size": self.page_size, "sources": sources}
+            if after:
+                composite["after"] = after
+            agg: dict[str, Any] = {"composite": composite}
+            if sub_aggs:
+                agg["aggs"] = sub_aggs
+
+            aggregations, _ = await self._search_aggs(query, {"pages": agg})
+            page = aggregations.get("pages", {})
+            page_buckets = page.get("buckets", [])
+            buckets.extend(page_buckets)
+
+            after = page.get("after_key")
+            if not page_buckets or not after or len(page_buckets) < self.page_size:
+                return buckets
+
+    @staticmethod
+    def _terms(aggregations: dict[str, Any], name: str) -> dict[Any, int]:
+        return {
+            b["key"]: b["doc_count"]
+            for b in aggregations.get(name, {}).get("buckets", [])
+        }
+
+    async def breakdown(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+        beat: str | None = None,
+    ) -> IncidentBreakdown:
+        """Compute the full dimensional breakdown for a time period."""
+        query = self.repository.build_incident_query(
+            start_date=start_date,
+            end_date=end_date,
+            crime_category=crime_category,
+            jurisdiction=jurisdiction,
+            beat=beat,
+        )
+
+        aggregations, total = await self._search_aggs(
+            query,
+            {
+                "by_category": {"terms": {"field": "crime_category", "size": 50}},
+                "by_severity": {"terms": {"field": "severity", "size": 10}},
+                "by_hour": {"terms": {"script": {"source": self.HOUR_SCRIPT}, "size": 24}},
+                "by_weekday": {"terms": {"script": {"source": self.WEEKDAY_SCRIPT}, "size": 7}},
+                "arrests": {"filter": {"term": {"arrest_made": True}}},
+            },
+        )
+
+        result = IncidentBreakdown(total=total)
+        result.arrests = aggregations.get("arrests", {}).get("doc_count", 0)
+        result.by_category = self._terms(aggregations, "by_category")
+        result.by_severity = self._terms(aggregations, "by_severity")
+        for hour, count in self._terms(aggregations, "by_hour").items():
+            result.by_hour[int(hour)] = count
+        for day, count in self._terms(aggregations, "by_weekday").items():
+            result.by_weekday[int(day)] = count
+
+        for bucket in await self._composite_pages(
+            query, [{"crime_type": {"terms": {"field": "crime_type"}}}]
+        ):
+            result.by_type[bucket["key"]["crime_type"]] = bucket["doc_count"]
+
+        for bucket in await self._composite_pages(
+            query, [{"h3": {"terms": {"field": "location.h3_index"}}}]
+        ):
+            result.h3_counts[bucket["key"]["h3"]] = bucket["doc_count"]
+
+        return result
+
+    async def yearly_cells(
+        self,
+        start_year: int,
+        end_year: int,
+        jurisdiction: str,
+        crime_category: CrimeCategory | None = None,
+    ) -> YearlyCellBreakdown:
+        """Compute H3 cell counts and centroids for each year in a range."""
+        start_date, end_date = _period_bounds(start_year, end_year)
+        query = self.repository.build_incident_query(
+            start_date=start_date,
+            end_date=end_date,
+            crime_category=crime_category,
+            jurisdiction=jurisdiction,
+        )
+
+        aggregations, _ = await self._search_aggs(
+            query,
+            {
+                "by_year": {
+                    "date_histogram": {"field": "timestamp", "calendar_interval": "year"}
+                }
+            },
+        )
+
+        result = YearlyCellBreakdown()
+        for bucket in aggregations.get("by_year", {}).get("buckets", []):
+            if bucket["doc_count"]:
+                result.totals[self._bucket_year(bucket["key"])] = bucket["doc_count"]
+
+        buckets = await self._composite_pages(
+            query,
+            [
+                {"year": {"date_histogram": {"field": "timestamp", "calendar_interval": "year"}}},
+                {"h3": {"terms": {"field": "location.h3_index"}}},
+            ],
+            sub_aggs={
+                "lat": {"avg": {"field": "location.latitude"}},
+                "lon": {"avg": {"field": "location.longitude"}},
+            },
+        )
+        for bucket in buckets:
+            year = self._bucket_year(bucket["key"]["year"])
+            result.cells.setdefault(year, {})[bucket["key"]["h3"]] = CellStats(
+                count=bucket["doc_count"],
+                latitude=bucket.get("lat", {}).get("value") or 0.0,
+                longitude=bucket.get("lon", {}).get("value") or 0.0,
+            )
+
+        return result
+
+    @staticmethod
+    def _bucket_year(key: Any) -> int:
+        """Convert a date_histogram bucket key (epoch millis) to a year."""
+        return datetime.utcfromtimestamp(int(key) / 1000).year
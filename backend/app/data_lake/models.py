@@ -383,6 +383,17 @@ class DataLakeConfig(DataLakeBaseModel):
     query_timeout_seconds: int = Field(default=300, description="Query timeout")
     max_concurrent_queries: int = Field(default=10, description="Max concurrent queries")
     cache_ttl_seconds: int = Field(default=3600, description="Cache TTL")
+    bulk_batch_size: int = Field(
+        default=1000, ge=1, description="Records per batch for bulk ingestion"
+    )
+
+    # Spatial index settings
+    h3_resolution: int = Field(
+        default=10, ge=6, le=10, description="Cell resolution stored on incidents"
+    )
+    hotspot_resolution: int = Field(
+        default=8, ge=6, le=10, description="Cell resolution for aggregate hotspots"
+    )
 
     # Quality settings
     validation_enabled: bool = Field(default=True, description="Enable data validation")
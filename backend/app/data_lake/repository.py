@@ -139,18 +139,36 @@ class DataLakeRepository:
                 result = await self.es.bulk(operations=operations)
                 await self._invalidate_stats_cache()
 
+                failed_ids = self._bulk_failed_ids(result)
+
                 return {
                     "total": len(incidents),
-                    "successful": len(incidents) - result.get("errors", 0),
-                    "failed": result.get("errors", 0),
+                    "successful": len(incidents) - len(failed_ids),
+                    "failed": len(failed_ids),
+                    "failed_ids": failed_ids,
                 }
 
-            return {"total": 0, "successful": 0, "failed": 0}
+            return {"total": 0, "successful": 0, "failed": 0, "failed_ids": {}}
 
         except Exception as e:
             logger.error(f"Bulk incident storage failed: {e}")
             raise
 
+    @staticmethod
+    def _bulk_failed_ids(result: dict[str, Any]) -> dict[str, str]:
+        """Extract per-document errors from an Elasticsearch bulk response."""
+        if not result.get("errors"):
+            return {}
+
+        failed: dict[str, str] = {}
+        for item in result.get("items", []):
+            action = item.get("index") or item.get("create") or item.get("update") or {}
+            error = action.get("error")
+            if error:
+                reason = error.get("reason", str(error)) if isinstance(error, dict) else str(error)
+                failed[action.get("_id", "")] = reason
+        return failed
+
     async def get_incident(self, incident_id: str) -> IncidentRecord | None:
         """
         Retrieve an incident record by ID.
@@ -198,54 +216,14 @@ class DataLakeRepository:
             Tuple of (incidents list, total count)
         """
         try:
-            must_clauses: list[dict[str, Any]] = []
-            filter_clauses: list[dict[str, Any]] = []
-
-            # Date range
-            if start_date or end_date:
-                date_range: dict[str, Any] = {}
-                if start_date:
-                    date_range["gte"] = start_date.isoformat()
-                if end_date:
-                    date_range["lte"] = end_date.isoformat()
-                must_clauses.append({"range": {"timestamp": date_range}})
-
-            # Category filter
-            if crime_category:
-                filter_clauses.append({"term": {"crime_category": crime_category.value}})
-
-            # Jurisdiction filter
-            if jurisdiction:
-                filter_clauses.append({"term": {"jurisdiction": jurisdiction}})
-
-            # Beat filter
-            if beat:
-                filter_clauses.append({"term": {"beat": beat}})
-
-            # Geographic bounds
-            if bounds:
-                filter_clauses.append({
-                    "geo_bounding_box": {
-                        "location": {
-                            "top_left": {
-                                "lat": bounds["max_lat"],
-                                "lon": bounds["min_lon"],
-                            },
-                            "bottom_right": {
-                                "lat": bounds["min_lat"],
-                                "lon": bounds["max_lon"],
-                            },
-                        }
-                    }
-                })
-
-            query: dict[str, Any] = {"bool": {}}
-            if must_clauses:
-                query["bool"]["must"] = must_clauses
-            if filter_clauses:
-                query["bool"]["filter"] = filter_clauses
-            if not must_clauses and not filter_clauses:
-                query = {"match_all": {}}
+            query = self.build_incident_query(
+                start_date=start_date,
+                end_date=end_date,
+                crime_category=crime_category,
+                jurisdiction=jurisdiction,
+                beat=beat,
+                bounds=bounds,
+            )
 
             result = await self.es.search(
                 index=self.INCIDENTS_INDEX,
@@ -265,6 +243,83 @@ class DataLakeRepository:
             logger.error(f"Incident query failed: {e}")
             return [], 0
 
+    def build_incident_query(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        crime_category: CrimeCategory | None = None,
+        jurisdiction: str | None = None,
+        beat: str | None = None,
+        bounds: dict[str, float] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the Elasticsearch query for incident filters.
+
+        Shared by document queries and server-side aggregations so both
+        select exactly the same incidents.
+
+        Args:
+            start_date: Start date filter
+            end_date: End date filter
+            crime_category: Crime category filter
+            jurisdiction: Jurisdiction filter
+            beat: Beat/zone filter
+            bounds: Geographic bounds {min_lat, max_lat, min_lon, max_lon}
+
+        Returns:
+            Elasticsearch query DSL
+        """
+        must_clauses: list[dict[str, Any]] = []
+        filter_clauses: list[dict[str, Any]] = []
+
+        # Date range
+        if start_date or end_date:
+            date_range: dict[str, Any] = {}
+            if start_date:
+                date_range["gte"] = start_date.isoformat()
+            if end_date:
+                date_range["lte"] = end_date.isoformat()
+            must_clauses.append({"range": {"timestamp": date_range}})
+
+        # Category filter
+        if crime_category:
+            filter_clauses.append({"term": {"crime_category": crime_category.value}})
+
+        # Jurisdiction filter
+        if jurisdiction:
+            filter_clauses.append({"term": {"jurisdiction": jurisdiction}})
+
+        # Beat filter
+        if beat:
+            filter_clauses.append({"term": {"beat": beat}})
+
+        # Geographic bounds
+        if bounds:
+            filter_clauses.append({
+                "geo_bounding_box": {
+                    "location": {
+                        "top_left": {
+                            "lat": bounds["max_lat"],
+                            "lon": bounds["min_lon"],
+                        },
+                        "bottom_right": {
+                            "lat": bounds["min_lat"],
+                            "lon": bounds["max_lon"],
+                        },
+                    }
+                }
+            })
+
+        query: dict[str, Any] = {"bool": {}}
+        if must_clauses:
+            query["bool"]["must"] = must_clauses
+        if filter_clauses:
+            query["bool"]["filter"] = filter_clauses
+        if not must_clauses and not filter_clauses:
+            query = {"match_all": {}}
+
+        return query
+
     async def get_incidents_by_partition(
         self,
         partition_key: str,
@@ -832,6 +887,38 @@ class DataLakeRepository:
             logger.error(f"Failed to store lineage record: {e}")
             raise
 
+    async def store_lineage_records_bulk(self, lineages: list[DataLineageRecord]) -> int:
+        """
+        Store multiple data lineage records in bulk.
+
+        Args:
+            lineages: Lineage records
+
+        Returns:
+            Number of records stored
+        """
+        if not lineages:
+            return 0
+
+        try:
+            operations: list[dict[str, Any]] = []
+            for lineage in lineages:
+                doc = lineage.model_dump()
+                doc["source_timestamp"] = doc["source_timestamp"].isoformat()
+                doc["created_at"] = doc["created_at"].isoformat()
+                if doc["last_accessed"]:
+                    doc["last_accessed"] = doc["last_accessed"].isoformat()
+
+                operations.append({"index": {"_index": self.LINEAGE_INDEX, "_id": lineage.id}})
+                operations.append(doc)
+
+            result = await self.es.bulk(operations=operations)
+            return len(lineages) - len(self._bulk_failed_ids(result))
+
+        except Exception as e:
+            logger.error(f"Bulk lineage storage failed: {e}")
+            raise
+
     async def get_lineage(self, record_id: str) -> list[DataLineageRecord]:
         """
         Get lineage records for a data record.
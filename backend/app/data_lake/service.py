@@ -11,6 +11,7 @@ This module provides high-level business logic for data lake operations includin
 
 import hashlib
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Any
@@ -18,6 +19,12 @@ from typing import Any
 from ..db.elasticsearch import ElasticsearchManager
 from ..db.neo4j import Neo4jManager
 from ..db.redis import RedisManager
+from ..utils import hex_index
+from .aggregations import (
+    CellStats,
+    ElasticsearchAggregationEngine,
+    IncidentAggregationEngine,
+)
 from .models import (
     CrimeCategory,
     CrimeDataPartition,
@@ -60,6 +67,7 @@ class DataLakeService:
         es: ElasticsearchManager,
         redis: RedisManager,
         config: DataLakeConfig | None = None,
+        aggregator: IncidentAggregationEngine | None = None,
     ):
         """
         Initialize the Data Lake Service.
@@ -69,10 +77,12 @@ class DataLakeService:
             es: Elasticsearch manager
             redis: Redis manager
             config: Optional data lake configuration
+            aggregator: Optional aggregation engine (defaults to Elasticsearch)
         """
         self.repository = DataLakeRepository(neo4j, es, redis)
         self.config = config or DataLakeConfig()
         self.redis = redis
+        self.aggregator = aggregator or ElasticsearchAggregationEngine(self.repository)
 
         logger.info("DataLakeService initialized")
 
@@ -97,6 +107,185 @@ class DataLakeService:
         Returns:
             Stored incident record
         """
+        incident = self._build_incident_record(incident_data, source_system, source_id)
+
+        # Store incident
+        await self.repository.store_incident(incident)
+
+        # Create lineage record
+        await self._create_lineage_record(incident, source_system, source_id)
+
+        # Ensure partition exists
+        await self._ensure_partition(incident.partition_month, incident.timestamp)
+
+        # Update offender profiles if offenders are known
+        for offender_id in incident.offender_ids:
+            await self._update_offender_profile(offender_id, incident)
+
+        logger.info(f"Ingested incident {incident.id} from {source_system}")
+        return incident
+
+    async def ingest_incidents_bulk(
+        self,
+        incidents_data: list[dict[str, Any]],
+        source_system: str,
+        batch_size: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Bulk ingest incidents into the data lake.
+
+        Records are classified, enriched and validated in a single pass and
+        then written in batches: one bulk incident write, one bulk lineage
+        write, one partition check per distinct month and one profile update
+        per offender for each batch. The stats cache is invalidated once per
+        batch rather than once per record.
+
+        Args:
+            incidents_data: List of raw incident data
+            source_system: Source system identifier
+            batch_size: Records per batch (defaults to config.bulk_batch_size)
+
+        Returns:
+            Bulk operation result with per-batch throughput and error counts
+        """
+        batch_size = batch_size or self.config.bulk_batch_size
+        started = time.perf_counter()
+
+        # Single pass: classify, enrich and validate
+        prepared: list[tuple[int, IncidentRecord]] = []
+        errors: list[dict[str, Any]] = []
+
+        for idx, data in enumerate(incidents_data):
+            try:
+                source_id = data.get("source_id", str(idx))
+                incident = self._build_incident_record(data, source_system, source_id)
+                prepared.append((idx, incident))
+            except Exception as e:
+                errors.append({"index": idx, "error": str(e)})
+                logger.warning(f"Failed to prepare incident {idx}: {e}")
+
+        batches: list[dict[str, Any]] = []
+        successful = 0
+        ensured_partitions: set[str] = set()
+
+        for batch_number, offset in enumerate(range(0, len(prepared), batch_size)):
+            batch = prepared[offset : offset + batch_size]
+            batch_started = time.perf_counter()
+            batch_errors = await self._ingest_batch(
+                batch, source_system, ensured_partitions
+            )
+            elapsed = time.perf_counter() - batch_started
+
+            stored = len(batch) - len(batch_errors)
+            successful += stored
+            errors.extend(batch_errors)
+
+            batches.append({
+                "batch": batch_number,
+                "size": len(batch),
+                "successful": stored,
+                "failed": len(batch_errors),
+                "duration_seconds": round(elapsed, 4),
+                "records_per_second": round(stored / elapsed, 2) if elapsed > 0 else 0.0,
+            })
+
+        duration = time.perf_counter() - started
+        errors.sort(key=lambda e: e["index"])
+
+        logger.info(
+            f"Bulk ingested {successful}/{len(incidents_data)} incidents from "
+            f"{source_system} in {len(batches)} batches ({duration:.2f}s)"
+        )
+
+        return {
+            "total": len(incidents_data),
+            "successful": successful,
+            "failed": len(errors),
+            "errors": errors,
+            "batches": batches,
+            "duration_seconds": round(duration, 4),
+            "records_per_second": round(successful / duration, 2) if duration > 0 else 0.0,
+        }
+
+    async def _ingest_batch(
+        self,
+        batch: list[tuple[int, IncidentRecord]],
+        source_system: str,
+        ensured_partitions: set[str],
+    ) -> list[dict[str, Any]]:
+        """
+        Store one batch of prepared incidents and their side records.
+
+        Args:
+            batch: (original index, incident) pairs
+            source_system: Source system identifier
+            ensured_partitions: Partition keys already verified in this run
+
+        Returns:
+            Errors for records in the batch that could not be stored
+        """
+        incidents = [incident for _, incident in batch]
+
+        try:
+            result = await self.repository.store_incidents_bulk(incidents)
+        except Exception as e:
+            logger.warning(f"Bulk store failed for batch of {len(batch)}: {e}")
+            return [{"index": idx, "error": str(e)} for idx, _ in batch]
+
+        failed_ids: dict[str, str] = result.get("failed_ids", {})
+        errors = [
+            {"index": idx, "error": failed_ids[incident.id]}
+            for idx, incident in batch
+            if incident.id in failed_ids
+        ]
+        stored = [incident for incident in incidents if incident.id not in failed_ids]
+
+        # Lineage in one bulk write
+        try:
+            await self.repository.store_lineage_records_bulk(
+                [
+                    self._build_lineage_record(incident, source_system, incident.source_id)
+                    for incident in stored
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Bulk lineage write failed: {e}")
+
+        # One partition check per distinct month
+        try:
+            for incident in stored:
+                if incident.partition_month not in ensured_partitions:
+                    await self._ensure_partition(incident.partition_month, incident.timestamp)
+                    ensured_partitions.add(incident.partition_month)
+        except Exception as e:
+            logger.warning(f"Partition check failed for batch of {len(batch)}: {e}")
+            return errors + [
+                {"index": idx, "error": str(e)}
+                for idx, incident in batch
+                if incident.id not in failed_ids
+            ]
+
+        # One profile read/write per offender
+        incidents_by_offender: dict[str, list[IncidentRecord]] = {}
+        for incident in stored:
+            for offender_id in incident.offender_ids:
+                incidents_by_offender.setdefault(offender_id, []).append(incident)
+
+        for offender_id, offender_incidents in incidents_by_offender.items():
+            try:
+                await self._update_offender_profile_bulk(offender_id, offender_incidents)
+            except Exception as e:
+                logger.warning(f"Failed to update offender profile {offender_id}: {e}")
+
+        return errors
+
+    def _build_incident_record(
+        self,
+        incident_data: dict[str, Any],
+        source_system: str,
+        source_id: str,
+    ) -> IncidentRecord:
+        """Classify, enrich and validate raw incident data into a record."""
         # Generate unique ID
         incident_id = self._generate_incident_id(source_system, source_id)
 
@@ -118,11 +307,6 @@ class DataLakeService:
         # Determine severity
         severity = self._assess_severity(incident_data)
 
-        # Create partition keys
-        partition_date = timestamp.strftime("%Y-%m-%d")
-        partition_month = timestamp.strftime("%Y-%m")
-        partition_year = timestamp.year
-
         # Create incident record
         incident = IncidentRecord(
             id=incident_id,
@@ -149,65 +333,17 @@ class DataLakeService:
             gang_related=incident_data.get("gang_related", False),
             source_system=source_system,
             source_id=source_id,
-            partition_date=partition_date,
-            partition_month=partition_month,
-            partition_year=partition_year,
+            partition_date=timestamp.strftime("%Y-%m-%d"),
+            partition_month=timestamp.strftime("%Y-%m"),
+            partition_year=timestamp.year,
         )
 
         # Validate incident
         if self.config.validation_enabled:
             self._validate_incident(incident)
 
-        # Store incident
-        await self.repository.store_incident(incident)
-
-        # Create lineage record
-        await self._create_lineage_record(incident, source_system, source_id)
-
-        # Ensure partition exists
-        await self._ensure_partition(partition_month, timestamp)
-
-        # Update offender profiles if offenders are known
-        for offender_id in incident.offender_ids:
-            await self._update_offender_profile(offender_id, incident)
-
-        logger.info(f"Ingested incident {incident_id} from {source_system}")
         return incident
 
-    async def ingest_incidents_bulk(
-        self,
-        incidents_data: list[dict[str, Any]],
-        source_system: str,
-    ) -> dict[str, Any]:
-        """
-        Bulk ingest incidents into the data lake.
-
-        Args:
-            incidents_data: List of raw incident data
-            source_system: Source system identifier
-
-        Returns:
-            Bulk operation result
-        """
-        incidents = []
-        errors = []
-
-        for idx, data in enumerate(incidents_data):
-            try:
-                source_id = data.get("source_id", str(idx))
-                incident = await self.ingest_incident(data, source_system, source_id)
-                incidents.append(incident)
-            except Exception as e:
-                errors.append({"index": idx, "error": str(e)})
-                logger.warning(f"Failed to ingest incident {idx}: {e}")
-
-        return {
-            "total": len(incidents_data),
-            "successful": len(incidents),
-            "failed": len(errors),
-            "errors": errors,
-        }
-
     def _generate_incident_id(self, source_system: str, source_id: str) -> str:
         """Generate unique incident ID."""
         hash_input = f"{source_system}:{source_id}"
@@ -241,15 +377,15 @@ class DataLakeService:
             h3_index=self._compute_h3_index(lat, lon),
         )
 
-    def _compute_h3_index(self, lat: float, lon: float, resolution: int = 8) -> str | None:
-        """Compute H3 index for location."""
+    def _compute_h3_index(
+        self, lat: float, lon: float, resolution: int | None = None
+    ) -> str | None:
+        """Compute hexagonal cell index for location."""
         try:
-            # H3 index computation (simplified - would use h3 library in production)
-            # Format: resolution + geohash-like encoding
-            lat_part = int((lat + 90) * 1000) % 10000
-            lon_part = int((lon + 180) * 1000) % 10000
-            return f"{resolution:x}{lat_part:04x}{lon_part:04x}"
-        except Exception:
+            return hex_index.latlng_to_cell(
+                float(lat), float(lon), resolution or self.config.h3_resolution
+            )
+        except (TypeError, ValueError):
             return None
 
     def _classify_crime(self, crime_type: str, description: str) -> CrimeCategory:
@@ -341,7 +477,17 @@ class DataLakeService:
         source_id: str,
     ) -> None:
         """Create data lineage record for incident."""
-        lineage = DataLineageRecord(
+        lineage = self._build_lineage_record(incident, source_system, source_id)
+        await self.repository.store_lineage_record(lineage)
+
+    def _build_lineage_record(
+        self,
+        incident: IncidentRecord,
+        source_system: str,
+        source_id: str,
+    ) -> DataLineageRecord:
+        """Build the ingestion lineage record for an incident."""
+        return DataLineageRecord(
             id=str(uuid.uuid4()),
             record_id=incident.id,
             record_type="incident",
@@ -360,8 +506,6 @@ class DataLakeService:
             created_by="data_lake_service",
         )
 
-        await self.repository.store_lineage_record(lineage)
-
     async def _ensure_partition(self, partition_key: str, timestamp: datetime) -> None:
         """Ensure partition exists for the given key."""
         existing = await self.repository.get_partition(partition_key)
@@ -394,53 +538,70 @@ class DataLakeService:
         incident: IncidentRecord,
     ) -> None:
         """Update offender profile with new incident."""
+        await self._update_offender_profile_bulk(offender_id, [incident])
+
+    async def _update_offender_profile_bulk(
+        self,
+        offender_id: str,
+        incidents: list[IncidentRecord],
+    ) -> None:
+        """Merge several incidents into an offender profile with one read and one write."""
         profile = await self.repository.get_offender_profile(offender_id)
 
-        if profile:
-            # Update existing profile
-            profile.total_incidents += 1
-            profile.incident_ids.append(incident.id)
-            profile.last_seen = incident.timestamp
-
-            # Update crime breakdown
-            category = incident.crime_category.value
-            profile.crime_categories[category] = profile.crime_categories.get(category, 0) + 1
-            profile.crime_types[incident.crime_type] = (
-                profile.crime_types.get(incident.crime_type, 0) + 1
-            )
+        for incident in incidents:
+            if profile:
+                self._apply_incident_to_profile(profile, incident)
+            else:
+                # Create new profile
+                profile = OffenderProfile(
+                    id=offender_id,
+                    first_seen=incident.timestamp,
+                    last_seen=incident.timestamp,
+                    total_incidents=1,
+                    incident_ids=[incident.id],
+                    crime_categories={incident.crime_category.value: 1},
+                    crime_types={incident.crime_type: 1},
+                    critical_incidents=1 if incident.severity == SeverityLevel.CRITICAL else 0,
+                    high_incidents=1 if incident.severity == SeverityLevel.HIGH else 0,
+                    violent_incidents=1 if incident.crime_category == CrimeCategory.VIOLENT else 0,
+                    primary_locations=[incident.location],
+                    primary_beats=[incident.beat] if incident.beat else [],
+                )
 
-            # Update severity counts
-            if incident.severity == SeverityLevel.CRITICAL:
-                profile.critical_incidents += 1
-            elif incident.severity == SeverityLevel.HIGH:
-                profile.high_incidents += 1
+        if profile is None:
+            return
 
-            if incident.crime_category == CrimeCategory.VIOLENT:
-                profile.violent_incidents += 1
+        # Recalculate risk scores
+        profile = self._calculate_risk_scores(profile)
+        profile.last_updated = datetime.utcnow()
 
-            # Recalculate risk scores
-            profile = self._calculate_risk_scores(profile)
-            profile.last_updated = datetime.utcnow()
+        await self.repository.store_offender_profile(profile)
 
-        else:
-            # Create new profile
-            profile = OffenderProfile(
-                id=offender_id,
-                first_seen=incident.timestamp,
-                last_seen=incident.timestamp,
-                total_incidents=1,
-                incident_ids=[incident.id],
-                crime_categories={incident.crime_category.value: 1},
-                crime_types={incident.crime_type: 1},
-                critical_incidents=1 if incident.severity == SeverityLevel.CRITICAL else 0,
-                high_incidents=1 if incident.severity == SeverityLevel.HIGH else 0,
-                violent_incidents=1 if incident.crime_category == CrimeCategory.VIOLENT else 0,
-                primary_locations=[incident.location],
-                primary_beats=[incident.beat] if incident.beat else [],
-            )
-            profile = self._calculate_risk_scores(profile)
+    def _apply_incident_to_profile(
+        self,
+        profile: OffenderProfile,
+        incident: IncidentRecord,
+    ) -> None:
+        """Fold a single incident into an existing offender profile."""
+        profile.total_incidents += 1
+        profile.incident_ids.append(incident.id)
+        profile.last_seen = incident.timestamp
+
+        # Update crime breakdown
+        category = incident.crime_category.value
+        profile.crime_categories[category] = profile.crime_categories.get(category, 0) + 1
+        profile.crime_types[incident.crime_type] = (
+            profile.crime_types.get(incident.crime_type, 0) + 1
+        )
 
-        await self.repository.store_offender_profile(profile)
+        # Update severity counts
+        if incident.severity == SeverityLevel.CRITICAL:
+            profile.critical_incidents += 1
+        elif incident.severity == SeverityLevel.HIGH:
+            profile.high_incidents += 1
+
+        if incident.crime_category == CrimeCategory.VIOLENT:
+            profile.violent_incidents += 1
 
     def _calculate_risk_scores(self, profile: OffenderProfile) -> OffenderProfile:
         """Calculate risk scores for offender profile."""
@@ -575,65 +736,24 @@ class DataLakeService:
         beat: str | None = None,
     ) -> HistoricalAggregate:
         """Compute aggregate for a time period."""
-        # Query incidents
-        incidents, total = await self.repository.query_incidents(
+        breakdown = await self.aggregator.breakdown(
             start_date=start_date,
             end_date=end_date,
             jurisdiction=jurisdiction,
             crime_category=crime_category,
             beat=beat,
-            limit=100000,
         )
+        total = breakdown.total
 
-        # Initialize counters
-        incidents_by_category: dict[str, int] = {}
-        incidents_by_type: dict[str, int] = {}
-        incidents_by_severity: dict[str, int] = {}
-        incidents_by_hour: dict[int, int] = {h: 0 for h in range(24)}
-        incidents_by_day: dict[int, int] = {d: 0 for d in range(7)}
-        hotspot_counts: dict[str, int] = {}
-
-        violent_count = 0
-        property_count = 0
-        arrests_count = 0
-
-        for incident in incidents:
-            # Category breakdown
-            cat = incident.crime_category.value
-            incidents_by_category[cat] = incidents_by_category.get(cat, 0) + 1
-
-            # Type breakdown
-            incidents_by_type[incident.crime_type] = (
-                incidents_by_type.get(incident.crime_type, 0) + 1
-            )
-
-            # Severity breakdown
-            sev = incident.severity.value
-            incidents_by_severity[sev] = incidents_by_severity.get(sev, 0) + 1
-
-            # Temporal breakdown
-            incidents_by_hour[incident.timestamp.hour] += 1
-            incidents_by_day[incident.timestamp.weekday()] += 1
-
-            # Hotspot tracking
-            if incident.location.h3_index:
-                h3 = incident.location.h3_index
-                hotspot_counts[h3] = hotspot_counts.get(h3, 0) + 1
-
-            # Category counts
-            if incident.crime_category == CrimeCategory.VIOLENT:
-                violent_count += 1
-            elif incident.crime_category == CrimeCategory.PROPERTY:
-                property_count += 1
-
-            if incident.arrest_made:
-                arrests_count += 1
-
-        # Get top hotspots
-        sorted_hotspots = sorted(hotspot_counts.items(), key=lambda x: x[1], reverse=True)
-        top_hotspots = [h[0] for h in sorted_hotspots[:20]]
+        # Get top hotspots, rolled up from stored fine cells
+        breakdown.h3_counts = hex_index.rollup_counts(
+            breakdown.h3_counts, self.config.hotspot_resolution
+        )
+        sorted_hotspots = breakdown.top_hotspots(20)
+        top_hotspots = [h[0] for h in sorted_hotspots]
 
         # Calculate clearance rate
+        arrests_count = breakdown.arrests
         clearance_rate = arrests_count / total if total > 0 else 0.0
 
         # Generate aggregate ID
@@ -652,17 +772,17 @@ class DataLakeService:
             beat=beat,
             crime_category=crime_category,
             total_incidents=total,
-            violent_incidents=violent_count,
-            property_incidents=property_count,
+            violent_incidents=breakdown.by_category.get(CrimeCategory.VIOLENT.value, 0),
+            property_incidents=breakdown.by_category.get(CrimeCategory.PROPERTY.value, 0),
             arrests_made=arrests_count,
             clearance_rate=clearance_rate,
-            incidents_by_category=incidents_by_category,
-            incidents_by_type=incidents_by_type,
-            incidents_by_severity=incidents_by_severity,
-            incidents_by_hour=incidents_by_hour,
-            incidents_by_day_of_week=incidents_by_day,
+            incidents_by_category=breakdown.by_category,
+            incidents_by_type=breakdown.by_type,
+            incidents_by_severity=breakdown.by_severity,
+            incidents_by_hour=breakdown.by_hour,
+            incidents_by_day_of_week=breakdown.by_weekday,
             hotspot_h3_indices=top_hotspots,
-            hotspot_counts=dict(sorted_hotspots[:20]),
+            hotspot_counts=dict(sorted_hotspots),
         )
 
         # Store aggregate
@@ -760,7 +880,7 @@ class DataLakeService:
             start_year: Start year
             end_year: End year
             crime_category: Optional crime category filter
-            resolution: H3 resolution (7-10)
+            resolution: Cell resolution (6-10), rolled up from stored cells
 
         Returns:
             Multi-year heatmap data
@@ -768,67 +888,51 @@ class DataLakeService:
         years = list(range(start_year, end_year + 1))
         yearly_heatmaps: dict[int, list[HeatmapCell]] = {}
         combined_counts: dict[str, int] = {}
-        yearly_totals: dict[int, int] = {}
+        combined_coords: dict[str, tuple[float, float]] = {}
 
-        for year in years:
-            start_date = datetime(year, 1, 1)
-            end_date = datetime(year + 1, 1, 1) - timedelta(seconds=1)
-
-            incidents, total = await self.repository.query_incidents(
-                start_date=start_date,
-                end_date=end_date,
-                jurisdiction=jurisdiction,
-                crime_category=crime_category,
-                limit=100000,
-            )
-
-            yearly_totals[year] = total
-
-            # Aggregate by H3 index
-            h3_counts: dict[str, int] = {}
-            h3_coords: dict[str, tuple[float, float]] = {}
+        breakdown = await self.aggregator.yearly_cells(
+            start_year=start_year,
+            end_year=end_year,
+            jurisdiction=jurisdiction,
+            crime_category=crime_category,
+        )
+        yearly_totals: dict[int, int] = {year: breakdown.totals.get(year, 0) for year in years}
 
-            for incident in incidents:
-                h3_index = incident.location.h3_index
-                if h3_index:
-                    h3_counts[h3_index] = h3_counts.get(h3_index, 0) + 1
-                    combined_counts[h3_index] = combined_counts.get(h3_index, 0) + 1
-                    h3_coords[h3_index] = (
-                        incident.location.latitude,
-                        incident.location.longitude,
-                    )
+        for year in years:
+            year_cells = self._rollup_cells(breakdown.cells.get(year, {}), resolution)
 
             # Create heatmap cells for this year
-            max_count = max(h3_counts.values()) if h3_counts else 1
+            max_count = max((c.count for c in year_cells.values()), default=1)
             cells = []
-            for h3_index, count in h3_counts.items():
-                lat, lon = h3_coords.get(h3_index, (0, 0))
+            for h3_index, stats in year_cells.items():
                 cells.append(
                     HeatmapCell(
                         h3_index=h3_index,
-                        latitude=lat,
-                        longitude=lon,
-                        value=float(count),
-                        incident_count=count,
-                        normalized_value=count / max_count,
+                        latitude=stats.latitude,
+                        longitude=stats.longitude,
+                        value=float(stats.count),
+                        incident_count=stats.count,
+                        normalized_value=stats.count / max_count,
                     )
                 )
 
-            yearly_heatmaps[year] = sorted(cells, key=lambda x: x.value, reverse=True)[:500]
+                # Count-weighted centroid across years
+                prev = combined_counts.get(h3_index, 0)
+                lat, lon = combined_coords.get(h3_index, (0.0, 0.0))
+                combined_counts[h3_index] = prev + stats.count
+                combined_coords[h3_index] = (
+                    (lat * prev + stats.latitude * stats.count) / (prev + stats.count),
+                    (lon * prev + stats.longitude * stats.count) / (prev + stats.count),
+                )
+
+            yearly_heatmaps[year] = sorted(cells, key=lambda x: (-x.value, x.h3_index))[:500]
 
         # Create combined heatmap
         max_combined = max(combined_counts.values()) if combined_counts else 1
         combined_cells = []
 
-        # Get coordinates from most recent year's data
-        all_coords: dict[str, tuple[float, float]] = {}
-        for year in reversed(years):
-            for cell in yearly_heatmaps.get(year, []):
-                if cell.h3_index not in all_coords:
-                    all_coords[cell.h3_index] = (cell.latitude, cell.longitude)
-
         for h3_index, count in combined_counts.items():
-            lat, lon = all_coords.get(h3_index, (0, 0))
+            lat, lon = combined_coords[h3_index]
             combined_cells.append(
                 HeatmapCell(
                     h3_index=h3_index,
@@ -840,7 +944,7 @@ class DataLakeService:
                 )
             )
 
-        combined_heatmap = sorted(combined_cells, key=lambda x: x.value, reverse=True)[:500]
+        combined_heatmap = sorted(combined_cells, key=lambda x: (-x.value, x.h3_index))[:500]
 
         # Identify hotspot evolution
         persistent_hotspots = []
@@ -853,7 +957,9 @@ class DataLakeService:
             persistent_set = all_year_h3s[0]
             for h3_set in all_year_h3s[1:]:
                 persistent_set = persistent_set.intersection(h3_set)
-            persistent_hotspots = list(persistent_set)[:20]
+            persistent_hotspots = sorted(
+                persistent_set, key=lambda h: (-combined_counts.get(h, 0), h)
+            )[:20]
 
         # Compare first and last year for emerging/declining
         if len(years) >= 2:
@@ -923,6 +1029,29 @@ class DataLakeService:
 
         return heatmap_data
 
+    def _rollup_cells(
+        self,
+        cells: dict[str, CellStats],
+        resolution: int,
+    ) -> dict[str, CellStats]:
+        """Roll stored fine cells up to a heatmap resolution with weighted centroids."""
+        rolled: dict[str, CellStats] = {}
+        for h3_index, stats in cells.items():
+            parent = hex_index.rollup_cell(h3_index, resolution)
+            existing = rolled.get(parent)
+            if existing is None:
+                rolled[parent] = CellStats(stats.count, stats.latitude, stats.longitude)
+                continue
+            total = existing.count + stats.count
+            existing.latitude = (
+                existing.latitude * existing.count + stats.latitude * stats.count
+            ) / total
+            existing.longitude = (
+                existing.longitude * existing.count + stats.longitude * stats.count
+            ) / total
+            existing.count = total
+        return rolled
+
     # ==================== Repeat Offender Analytics ====================
 
     async def get_repeat_offender_analytics(
@@ -7,42 +7,43 @@ drones, vehicles, and events.
 """
 
 from app.digital_twin.building_models import (
-    BuildingModelsLoader,
     Building,
+    BuildingModelsLoader,
     BuildingType,
     Floor,
     Room,
 )
-from app.digital_twin.road_network import (
-    RoadNetworkModel,
-    Road,
-    RoadType,
-    Intersection,
-    TrafficCondition,
-)
-from app.digital_twin.interior_mapping import (
-    InteriorMappingService,
-    InteriorMap,
-    PointOfInterest,
-    AccessPoint,
-)
 from app.digital_twin.entity_renderer import (
+    EntityPosition,
     EntityRenderer,
     EntityType,
     RenderedEntity,
-    EntityPosition,
+)
+from app.digital_twin.interior_mapping import (
+    AccessPoint,
+    InteriorMap,
+    InteriorMappingService,
+    PointOfInterest,
 )
 from app.digital_twin.overlay_engine import (
+    IncidentOverlay,
     OverlayEngine,
     OverlayType,
-    WeatherOverlay,
     TrafficOverlay,
-    IncidentOverlay,
+    WeatherOverlay,
+)
+from app.digital_twin.road_network import (
+    Intersection,
+    Road,
+    RoadNetworkModel,
+    RoadType,
+    TrafficCondition,
 )
 from app.digital_twin.time_travel import (
-    TimeTravelEngine,
     HistoricalSnapshot,
     PlaybackState,
+    SnapshotStore,
+    TimeTravelEngine,
 )
 
 __all__ = [
@@ -72,4 +73,5 @@ __all__ = [
     "TimeTravelEngine",
     "HistoricalSnapshot",
     "PlaybackState",
+    "SnapshotStore",
 ]
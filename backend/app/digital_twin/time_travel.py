@@ -5,10 +5,13 @@ Provides historical playback and time-scrubbing capabilities for the digital twi
 """
 
 import uuid
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Callable, Optional
-from collections import deque
+
 from pydantic import BaseModel, Field
 
 
@@ -105,6 +108,7 @@ class PlaybackSession(BaseModel):
 class TimeTravelConfig(BaseModel):
     """Configuration for time travel engine."""
     max_snapshots: int = 100000
+    keyframe_interval: int = 60
     snapshot_interval_seconds: int = 60
     max_playback_speed: float = 100.0
     retention_days: int = 30
@@ -119,6 +123,403 @@ class TimeTravelMetrics(BaseModel):
     active_sessions: int = 0
     oldest_snapshot: Optional[datetime] = None
     newest_snapshot: Optional[datetime] = None
+    keyframes: int = 0
+
+
+@dataclass
+class _CollectionDelta:
+    """Changes to a keyed collection (entities or incidents) since the previous snapshot."""
+    changed: dict[str, Any]
+    removed: tuple[str, ...] = ()
+    order: tuple[str, ...] | None = None  # Set when item order differs from applying the changes
+
+    def apply(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Apply the changes to a state in place and return it."""
+        for key in self.removed:
+            del state[key]
+        state.update(self.changed)
+        if self.order is not None:
+            return {key: state[key] for key in self.order}
+        return state
+
+
+def _diff(previous: dict[str, Any], current: dict[str, Any]) -> _CollectionDelta:
+    """Compute the delta that turns one collection state into another."""
+    changed = {
+        key: item for key, item in current.items()
+        if previous.get(key) is not item and previous.get(key) != item
+    }
+    removed = tuple(key for key in previous if key not in current)
+    delta = _CollectionDelta(changed, removed)
+
+    # Applying keeps surviving items in place and appends new ones
+    expected = [key for key in previous if key in current]
+    expected.extend(key for key in current if key not in previous)
+    if expected != list(current):
+        delta.order = tuple(current)
+
+    return delta
+
+
+@dataclass
+class _SnapshotRecord:
+    """Stored snapshot: full collections for keyframes, deltas otherwise."""
+    snapshot_id: str
+    timestamp: datetime
+    snapshot_type: SnapshotType
+    entities: _CollectionDelta
+    incidents: _CollectionDelta
+    overlays: OverlaySnapshot | None
+    event_log: list[dict[str, Any]]
+    metadata: dict[str, Any]
+    keyframe: bool
+
+
+class _ChangeLog:
+    """Per-key change points (position, value or None if removed) for track queries."""
+
+    def __init__(self):
+        self._positions: dict[str, list[int]] = {}
+        self._values: dict[str, list[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def record(self, position: int, delta: _CollectionDelta) -> None:
+        """Record the changes made at a position."""
+        for key, value in delta.changed.items():
+            self._positions.setdefault(key, []).append(position)
+            self._values.setdefault(key, []).append(value)
+        for key in delta.removed:
+            self._positions[key].append(position)
+            self._values[key].append(None)
+
+    def values(self, key: str, lo: int, hi: int) -> list[Any]:
+        """Get a key's value at each position in [lo, hi) where it is present."""
+        positions = self._positions.get(key)
+        if not positions:
+            return []
+        values = self._values[key]
+
+        result: list[Any] = []
+        i = max(bisect_right(positions, lo) - 1, 0)
+        while i < len(positions) and positions[i] < hi:
+            start = max(positions[i], lo)
+            end = min(positions[i + 1], hi) if i + 1 < len(positions) else hi
+            if values[i] is not None and end > start:
+                result.extend([values[i]] * (end - start))
+            i += 1
+        return result
+
+
+class SnapshotStore:
+    """
+    Time-indexed, delta-encoded snapshot storage.
+
+    Every `keyframe_interval`-th snapshot stores full entity and incident
+    collections; the rest store only what changed. Snapshots are kept in
+    timestamp order for binary search, per-entity and per-incident change
+    logs answer track queries without scanning snapshots, and rebuilding
+    a snapshot replays only from its nearest keyframe.
+    """
+
+    # Evicted slots are compacted once they are at least this many and half the list
+    COMPACT_THRESHOLD = 1024
+
+    def __init__(self, max_snapshots: int = 100000, keyframe_interval: int = 60):
+        self.max_snapshots = max_snapshots
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._records: list[_SnapshotRecord | None] = []
+        self._timestamps: list[datetime] = []
+        self._head = 0  # Position of the oldest live snapshot (always a keyframe)
+        self._by_id: dict[str, _SnapshotRecord] = {}
+        self._type_counts: dict[str, int] = {}
+        self._keyframes = 0
+        self._since_keyframe = 0
+        # Collections of the newest snapshot, for diffing the next capture
+        self._latest_entities: dict[str, EntitySnapshot] = {}
+        self._latest_incidents: dict[str, IncidentSnapshot] = {}
+        self._entity_log = _ChangeLog()
+        self._incident_log = _ChangeLog()
+        self._index_dirty = False
+        # Last rebuilt (position, entities, incidents), so sequential playback applies one delta
+        self._cursor: tuple[int, dict[str, Any], dict[str, Any]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._records) - self._head
+
+    @property
+    def type_counts(self) -> dict[str, int]:
+        """Snapshot counts by snapshot type."""
+        return dict(self._type_counts)
+
+    @property
+    def keyframes(self) -> int:
+        """Number of stored keyframes."""
+        return self._keyframes
+
+    def add(self, snapshot: HistoricalSnapshot) -> None:
+        """Store a snapshot."""
+        entities = {e.entity_id: e for e in snapshot.entities}
+        incidents = {i.incident_id: i for i in snapshot.incidents}
+        position = bisect_right(self._timestamps, snapshot.timestamp, self._head)
+
+        if position == len(self._records):
+            entity_delta = _diff(self._latest_entities, entities)
+            incident_delta = _diff(self._latest_incidents, incidents)
+            keyframe = len(self) == 0 or self._since_keyframe + 1 >= self.keyframe_interval
+            self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+            record = self._make_record(snapshot, entities, incidents, entity_delta, incident_delta, keyframe)
+            self._records.append(record)
+            self._timestamps.append(snapshot.timestamp)
+            self._latest_entities, self._latest_incidents = entities, incidents
+            if not self._index_dirty:
+                self._entity_log.record(position, entity_delta)
+                self._incident_log.record(position, incident_delta)
+        else:
+            # Out-of-order capture: store it and its successor as keyframes
+            following = self._records[position]
+            if not following.keyframe:
+                self._make_keyframe(following, *self._state_at(position))
+            record = self._make_record(snapshot, entities, incidents, None, None, True)
+            self._records.insert(position, record)
+            self._timestamps.insert(position, snapshot.timestamp)
+            self._cursor = None
+            self._index_dirty = True
+
+        self._by_id[record.snapshot_id] = record
+        type_key = record.snapshot_type.value
+        self._type_counts[type_key] = self._type_counts.get(type_key, 0) + 1
+
+        if len(self) > self.max_snapshots:
+            self._evict(len(self) - self.max_snapshots)
+
+    def _make_record(
+        self,
+        snapshot: HistoricalSnapshot,
+        entities: dict[str, EntitySnapshot],
+        incidents: dict[str, IncidentSnapshot],
+        entity_delta: _CollectionDelta | None,
+        incident_delta: _CollectionDelta | None,
+        keyframe: bool,
+    ) -> _SnapshotRecord:
+        if keyframe:
+            self._keyframes += 1
+            entity_delta = _CollectionDelta(entities)
+            incident_delta = _CollectionDelta(incidents)
+        return _SnapshotRecord(
+            snapshot_id=snapshot.snapshot_id,
+            timestamp=snapshot.timestamp,
+            snapshot_type=snapshot.snapshot_type,
+            entities=entity_delta,
+            incidents=incident_delta,
+            overlays=snapshot.overlays,
+            event_log=snapshot.event_log,
+            metadata=snapshot.metadata,
+            keyframe=keyframe,
+        )
+
+    def _make_keyframe(
+        self,
+        record: _SnapshotRecord,
+        entities: dict[str, Any],
+        incidents: dict[str, Any],
+    ) -> None:
+        record.entities = _CollectionDelta(dict(entities))
+        record.incidents = _CollectionDelta(dict(incidents))
+        record.keyframe = True
+        self._keyframes += 1
+
+    def _state_at(self, position: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Rebuild entity and incident collections at a position. Callers must not mutate them."""
+        if self._cursor is not None and self._cursor[0] == position:
+            return self._cursor[1], self._cursor[2]
+        if position == len(self._records) - 1:
+            return self._latest_entities, self._latest_incidents
+
+        keyframe = position
+        while not self._records[keyframe].keyframe:
+            keyframe -= 1
+
+        if self._cursor is not None and keyframe <= self._cursor[0] < position:
+            start = self._cursor[0] + 1
+            entities, incidents = dict(self._cursor[1]), dict(self._cursor[2])
+        else:
+            start = keyframe
+            entities, incidents = {}, {}
+
+        for record in self._records[start:position + 1]:
+            entities = record.entities.apply(entities)
+            incidents = record.incidents.apply(incidents)
+
+        self._cursor = (position, entities, incidents)
+        return entities, incidents
+
+    def _materialize(self, position: int) -> HistoricalSnapshot:
+        record = self._records[position]
+        entities, incidents = self._state_at(position)
+        return HistoricalSnapshot.model_construct(
+            snapshot_id=record.snapshot_id,
+            timestamp=record.timestamp,
+            snapshot_type=record.snapshot_type,
+            entities=list(entities.values()),
+            incidents=list(incidents.values()),
+            overlays=record.overlays,
+            event_log=record.event_log,
+            metadata=record.metadata,
+        )
+
+    def _position(self, record: _SnapshotRecord) -> int:
+        position = bisect_left(self._timestamps, record.timestamp, self._head)
+        while self._records[position] is not record:
+            position += 1
+        return position
+
+    def get(self, snapshot_id: str) -> HistoricalSnapshot | None:
+        """Get a snapshot by ID."""
+        record = self._by_id.get(snapshot_id)
+        if record is None:
+            return None
+        return self._materialize(self._position(record))
+
+    def closest(self, target_time: datetime) -> HistoricalSnapshot | None:
+        """Get the snapshot closest to a time (the earliest one on ties)."""
+        if not len(self):
+            return None
+
+        after = bisect_left(self._timestamps, target_time, self._head)
+        position = after
+        if after == len(self._records) or (
+            after > self._head
+            and target_time - self._timestamps[after - 1] <= self._timestamps[after] - target_time
+        ):
+            position = bisect_left(self._timestamps, self._timestamps[after - 1], self._head)
+        return self._materialize(position)
+
+    def in_range(self, start_time: datetime, end_time: datetime) -> list[HistoricalSnapshot]:
+        """Get snapshots within a time range, oldest first."""
+        lo = bisect_left(self._timestamps, start_time, self._head)
+        hi = bisect_right(self._timestamps, end_time, self._head)
+        return [self._materialize(position) for position in range(lo, hi)]
+
+    def recent(self, limit: int = 100) -> list[HistoricalSnapshot]:
+        """Get the newest snapshots, newest first."""
+        lo = max(self._head, len(self._records) - max(limit, 0))
+        snapshots = [self._materialize(position) for position in range(lo, len(self._records))]
+        snapshots.reverse()
+        return snapshots
+
+    def entity_track(
+        self,
+        entity_id: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[EntitySnapshot]:
+        """Get an entity's state in each snapshot of a time range that contains it."""
+        self._ensure_index()
+        lo = bisect_left(self._timestamps, start_time, self._head)
+        hi = bisect_right(self._timestamps, end_time, self._head)
+        return self._entity_log.values(entity_id, lo, hi)
+
+    def incident_timeline(self, incident_id: str) -> list[IncidentSnapshot]:
+        """Get an incident's state in each snapshot that contains it."""
+        self._ensure_index()
+        return self._incident_log.values(incident_id, self._head, len(self._records))
+
+    def time_range(self) -> tuple[datetime | None, datetime | None]:
+        """Get the oldest and newest snapshot times."""
+        if not len(self):
+            return None, None
+        return self._timestamps[self._head], self._timestamps[-1]
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """Remove snapshots older than a cutoff; returns the number removed."""
+        count = bisect_left(self._timestamps, cutoff, self._head) - self._head
+        if count > 0:
+            self._evict(count)
+        return max(count, 0)
+
+    def _evict(self, count: int) -> None:
+        """Remove the oldest snapshots, making the new oldest one a keyframe."""
+        new_head = self._head + count
+        if new_head >= len(self._records):
+            self.clear()
+            return
+
+        if not self._records[new_head].keyframe:
+            self._make_keyframe(self._records[new_head], *self._state_at(new_head))
+
+        for position in range(self._head, new_head):
+            record = self._records[position]
+            self._records[position] = None
+            del self._by_id[record.snapshot_id]
+            self._type_counts[record.snapshot_type.value] -= 1
+            if record.keyframe:
+                self._keyframes -= 1
+        self._head = new_head
+        if self._cursor is not None and self._cursor[0] < new_head:
+            self._cursor = None
+
+        if self._head >= self.COMPACT_THRESHOLD and self._head * 2 >= len(self._records):
+            del self._records[:self._head]
+            del self._timestamps[:self._head]
+            self._head = 0
+            self._cursor = None
+            self._index_dirty = True
+
+    def _ensure_index(self) -> None:
+        """Rebuild the change logs after out-of-order inserts or compaction."""
+        if not self._index_dirty:
+            return
+
+        self._entity_log = _ChangeLog()
+        self._incident_log = _ChangeLog()
+        entities: dict[str, Any] = {}
+        incidents: dict[str, Any] = {}
+        for position in range(self._head, len(self._records)):
+            record = self._records[position]
+            if record.keyframe:
+                entity_delta = _diff(entities, record.entities.changed)
+                incident_delta = _diff(incidents, record.incidents.changed)
+                entities = dict(record.entities.changed)
+                incidents = dict(record.incidents.changed)
+            else:
+                entity_delta, incident_delta = record.entities, record.incidents
+                entities = entity_delta.apply(entities)
+                incidents = incident_delta.apply(incidents)
+            self._entity_log.record(position, entity_delta)
+            self._incident_log.record(position, incident_delta)
+
+        self._index_dirty = False
+
+    def clear(self) -> None:
+        """Remove all snapshots."""
+        self._records.clear()
+        self._timestamps.clear()
+        self._head = 0
+        self._by_id.clear()
+        self._type_counts.clear()
+        self._keyframes = 0
+        self._since_keyframe = 0
+        self._latest_entities, self._latest_incidents = {}, {}
+        self._entity_log = _ChangeLog()
+        self._incident_log = _ChangeLog()
+        self._index_dirty = False
+        self._cursor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get storage metrics."""
+        stored_entities = sum(
+            len(record.entities.changed)
+            for record in self._records[self._head:]
+        )
+        return {
+            "snapshots": len(self),
+            "keyframes": self._keyframes,
+            "keyframe_interval": self.keyframe_interval,
+            "stored_entity_states": stored_entities,
+            "tracked_entities": len(self._entity_log),
+        }
 
 
 class TimeTravelEngine:
@@ -130,7 +531,10 @@ class TimeTravelEngine:
     
     def __init__(self, config: Optional[TimeTravelConfig] = None):
         self.config = config or TimeTravelConfig()
-        self._snapshots: deque[HistoricalSnapshot] = deque(maxlen=self.config.max_snapshots)
+        self._snapshots = SnapshotStore(
+            max_snapshots=self.config.max_snapshots,
+            keyframe_interval=self.config.keyframe_interval,
+        )
         self._timeline_events: deque[TimelineEvent] = deque(maxlen=self.config.max_timeline_events)
         self._sessions: dict[str, PlaybackSession] = {}
         self._callbacks: list[Callable] = []
@@ -165,33 +569,18 @@ class TimeTravelEngine:
             event_log=event_log or [],
         )
         
-        self._snapshots.append(snapshot)
+        self._snapshots.add(snapshot)
         self._update_metrics()
         
         return snapshot
     
     def get_snapshot(self, snapshot_id: str) -> Optional[HistoricalSnapshot]:
         """Get a snapshot by ID."""
-        for snapshot in self._snapshots:
-            if snapshot.snapshot_id == snapshot_id:
-                return snapshot
-        return None
+        return self._snapshots.get(snapshot_id)
     
     def get_snapshot_at_time(self, target_time: datetime) -> Optional[HistoricalSnapshot]:
         """Get the snapshot closest to a specific time."""
-        if not self._snapshots:
-            return None
-        
-        closest = None
-        min_diff = float("inf")
-        
-        for snapshot in self._snapshots:
-            diff = abs((snapshot.timestamp - target_time).total_seconds())
-            if diff < min_diff:
-                min_diff = diff
-                closest = snapshot
-        
-        return closest
+        return self._snapshots.closest(target_time)
     
     def get_snapshots_in_range(
         self,
@@ -199,16 +588,11 @@ class TimeTravelEngine:
         end_time: datetime,
     ) -> list[HistoricalSnapshot]:
         """Get all snapshots within a time range."""
-        return [
-            s for s in self._snapshots
-            if start_time <= s.timestamp <= end_time
-        ]
+        return self._snapshots.in_range(start_time, end_time)
     
     def get_recent_snapshots(self, limit: int = 100) -> list[HistoricalSnapshot]:
         """Get recent snapshots."""
-        snapshots = list(self._snapshots)
-        snapshots.reverse()
-        return snapshots[:limit]
+        return self._snapshots.recent(limit)
     
     def add_timeline_event(
         self,
@@ -420,55 +804,25 @@ class TimeTravelEngine:
         end_time: datetime,
     ) -> list[EntitySnapshot]:
         """Get the track (position history) for an entity."""
-        track = []
-        
-        for snapshot in self._snapshots:
-            if start_time <= snapshot.timestamp <= end_time:
-                for entity in snapshot.entities:
-                    if entity.entity_id == entity_id:
-                        track.append(entity)
-                        break
-        
-        return track
+        return self._snapshots.entity_track(entity_id, start_time, end_time)
     
     def get_incident_timeline(
         self,
         incident_id: str,
     ) -> list[IncidentSnapshot]:
         """Get the timeline of an incident."""
-        timeline = []
-        
-        for snapshot in self._snapshots:
-            for incident in snapshot.incidents:
-                if incident.incident_id == incident_id:
-                    timeline.append(incident)
-                    break
-        
-        return timeline
+        return self._snapshots.incident_timeline(incident_id)
     
     def get_time_range(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get the available time range for playback."""
-        if not self._snapshots:
-            return None, None
-        
-        oldest = min(s.timestamp for s in self._snapshots)
-        newest = max(s.timestamp for s in self._snapshots)
-        
-        return oldest, newest
+        return self._snapshots.time_range()
     
     def cleanup_old_snapshots(self, retention_days: Optional[int] = None) -> int:
         """Remove snapshots older than retention period."""
         days = retention_days or self.config.retention_days
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         
-        original_count = len(self._snapshots)
-        
-        self._snapshots = deque(
-            [s for s in self._snapshots if s.timestamp >= cutoff],
-            maxlen=self.config.max_snapshots,
-        )
-        
-        removed = original_count - len(self._snapshots)
+        removed = self._snapshots.evict_before(cutoff)
         self._update_metrics()
         
         return removed
@@ -512,6 +866,7 @@ class TimeTravelEngine:
             "oldest_snapshot": oldest.isoformat() if oldest else None,
             "newest_snapshot": newest.isoformat() if newest else None,
             "metrics": self._metrics.model_dump(),
+            "storage": self._snapshots.get_stats(),
         }
     
     def register_callback(self, callback: Callable) -> None:
@@ -526,15 +881,15 @@ class TimeTravelEngine:
     
     def _update_metrics(self) -> None:
         """Update time travel metrics."""
-        type_counts: dict[str, int] = {}
-        
-        for snapshot in self._snapshots:
-            type_counts[snapshot.snapshot_type.value] = type_counts.get(snapshot.snapshot_type.value, 0) + 1
-        
         oldest, newest = self.get_time_range()
         
         self._metrics.total_snapshots = len(self._snapshots)
-        self._metrics.snapshots_by_type = type_counts
+        self._metrics.snapshots_by_type = {
+            snapshot_type: count
+            for snapshot_type, count in self._snapshots.type_counts.items()
+            if count
+        }
+        self._metrics.keyframes = self._snapshots.keyframes
         self._metrics.total_timeline_events = len(self._timeline_events)
         self._metrics.active_sessions = len(self._sessions)
         self._metrics.oldest_snapshot = oldest
@@ -6,6 +6,9 @@ This module provides Extract-Transform-Load capabilities including:
 - Batch processing for historical data imports
 - Data transformation and normalization
 - Data validation and quality checks
+- Inline, thread-pool or process-pool execution of record stages
+- Checkpointed, incremental extraction with high-watermarks
+- Scheduling with concurrency limits and misfire handling
 - Pipeline monitoring and alerting
 
 The ETL module integrates with:
@@ -14,6 +17,13 @@ The ETL module integrates with:
 - Quality monitoring systems
 """
 
+from .checkpoints import (
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    RedisCheckpointStore,
+)
+from .executors import ExecutionMode, StageExecutor
 from .pipeline import ETLPipeline, PipelineConfig, PipelineStatus
 from .processors import (
     CADProcessor,
@@ -22,7 +32,7 @@ from .processors import (
     RMSProcessor,
     ShotSpotterProcessor,
 )
-from .scheduler import ETLScheduler, ScheduledJob
+from .scheduler import ETLScheduler, ScheduledJob, SchedulerConfig
 from .transformers import (
     DataTransformer,
     GeoEnricher,
@@ -33,19 +43,26 @@ from .validators import DataValidator, ValidationResult, ValidationRule
 
 __all__ = [
     "CADProcessor",
+    "Checkpoint",
+    "CheckpointStore",
     "DataProcessor",
     "DataTransformer",
     "DataValidator",
     "ETLPipeline",
     "ETLScheduler",
+    "ExecutionMode",
+    "FileCheckpointStore",
     "GeoEnricher",
     "IncidentNormalizer",
     "LPRProcessor",
     "PipelineConfig",
     "PipelineStatus",
     "RMSProcessor",
+    "RedisCheckpointStore",
     "ScheduledJob",
+    "SchedulerConfig",
     "ShotSpotterProcessor",
+    "StageExecutor",
     "TimeNormalizer",
     "ValidationResult",
     "ValidationRule",
@@ -0,0 +1,324 @@
+"""
+Extraction Checkpoints for Incremental ETL Pipelines.
+
+This module tracks per-source extraction progress so scheduled runs
+only process new and changed records:
+- High-watermark of the last completed run
+- Progress of the current run, for resuming after a crash or stop
+- Record fingerprints for idempotent loads
+- Redis persistence with a local file fallback
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from app.db.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path(tempfile.gettempdir()) / "rtcc_etl_checkpoints"
+
+
+def record_fingerprint(record: Any) -> str:
+    """Hash a record's content, independent of key order."""
+    payload = json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def watermark_value(value: Any) -> Any:
+    """Normalize a watermark so it compares and serializes consistently."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _higher(current: Any, value: Any) -> Any:
+    if value is None:
+        return current
+    return value if current is None or value > current else current
+
+
+def _lower(current: Any, value: Any) -> Any:
+    if value is None:
+        return current
+    return value if current is None or value < current else current
+
+
+class Checkpoint(BaseModel):
+    """
+    Extraction progress for one pipeline source.
+
+    A run extracts from the watermark of the last completed run. As each
+    chunk is loaded, the records that reached the data lake are
+    fingerprinted and their highest watermark is kept. If every record
+    in the chunk loaded and every earlier chunk also succeeded, the run
+    offset advances past it. An interrupted run is resumed from the same
+    watermark, skipping the records covered by the offset. Records that
+    failed to transform or load hold the next watermark back to their
+    lowest value, so they are extracted again while those already loaded
+    are skipped by fingerprint.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    key: str = Field(description="Checkpoint key (source type and pipeline name)")
+    watermark: Any = Field(default=None, description="High-watermark of the last completed run")
+    completed_runs: int = Field(default=0, description="Completed run count")
+
+    # Current (or interrupted) run
+    run_id: str | None = Field(default=None, description="Run in progress")
+    run_since: Any = Field(default=None, description="Watermark the run extracts from")
+    run_offset: int = Field(default=0, description="Extracted records in committed chunks")
+    run_watermark: Any = Field(default=None, description="Highest committed watermark")
+    run_floor: Any = Field(default=None, description="Lowest watermark in failed chunks")
+
+    # Record key -> [fingerprint, completed_runs when last seen]
+    fingerprints: dict[str, list[Any]] = Field(default_factory=dict)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def in_progress(self) -> bool:
+        """Check if a run started from this checkpoint without completing."""
+        return self.run_id is not None
+
+    def begin_run(self, run_id: str) -> bool:
+        """
+        Start a run, continuing an interrupted one if there is one.
+
+        Args:
+            run_id: New run ID
+
+        Returns:
+            True if an interrupted run is being resumed
+        """
+        resumed = self.in_progress
+        if not resumed:
+            self.run_since = self.watermark
+            self.run_offset = 0
+            self.run_watermark = self.watermark
+            self.run_floor = None
+        self.run_id = run_id
+        self.updated_at = datetime.utcnow()
+        return resumed
+
+    def is_unchanged(self, key: str, fingerprint: str) -> bool:
+        """Check if a record was already loaded with the same content."""
+        seen = self.fingerprints.get(key)
+        return seen is not None and seen[0] == fingerprint
+
+    def commit_chunk(
+        self,
+        extracted: int,
+        fingerprints: dict[str, str],
+        low: Any,
+        high: Any,
+        succeeded: bool,
+    ) -> None:
+        """
+        Record the outcome of loading one extracted chunk.
+
+        Args:
+            extracted: Records extracted for the chunk
+            fingerprints: Record key -> fingerprint for the records that loaded
+            low: Lowest watermark value of the records that did not load
+            high: Highest watermark value of the records that loaded
+            succeeded: Whether every record in the chunk loaded
+        """
+        for key, fingerprint in fingerprints.items():
+            self.fingerprints[key] = [fingerprint, self.completed_runs]
+        self.run_watermark = _higher(self.run_watermark, high)
+        if succeeded:
+            if self.run_floor is None:
+                self.run_offset += extracted
+        else:
+            self.run_floor = _lower(self.run_floor, low)
+        self.updated_at = datetime.utcnow()
+
+    def complete_run(self, retention_runs: int) -> None:
+        """
+        Advance the watermark and forget fingerprints not seen recently.
+
+        Args:
+            retention_runs: Completed runs a fingerprint is kept after last seen
+        """
+        watermark = self.run_watermark
+        if self.run_floor is not None:
+            watermark = _lower(watermark, self.run_floor)
+        self.watermark = watermark
+        self.completed_runs += 1
+
+        oldest = self.completed_runs - retention_runs
+        self.fingerprints = {
+            key: seen for key, seen in self.fingerprints.items() if seen[1] >= oldest
+        }
+
+        self.run_id = None
+        self.run_since = None
+        self.run_offset = 0
+        self.run_watermark = None
+        self.run_floor = None
+        self.updated_at = datetime.utcnow()
+
+
+class CheckpointStore(ABC):
+    """Base class for checkpoint persistence."""
+
+    @abstractmethod
+    async def load(self, key: str) -> Checkpoint | None:
+        """
+        Load a checkpoint.
+
+        Args:
+            key: Checkpoint key
+
+        Returns:
+            Stored checkpoint or None
+        """
+        pass
+
+    @abstractmethod
+    async def save(self, checkpoint: Checkpoint) -> None:
+        """
+        Persist a checkpoint.
+
+        Args:
+            checkpoint: Checkpoint to store
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Delete a checkpoint.
+
+        Args:
+            key: Checkpoint key
+        """
+        pass
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Stores checkpoints as JSON files, one per key."""
+
+    def __init__(self, directory: str | Path = DEFAULT_CHECKPOINT_DIR):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding checkpoint files
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+
+    async def load(self, key: str) -> Checkpoint | None:
+        """Load a checkpoint from its file."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        data = await asyncio.to_thread(path.read_text)
+        return Checkpoint.model_validate_json(data)
+
+    async def save(self, checkpoint: Checkpoint) -> None:
+        """Write a checkpoint, replacing the file atomically."""
+        await asyncio.to_thread(self._write, checkpoint)
+
+    def _write(self, checkpoint: Checkpoint) -> None:
+        path = self._path(checkpoint.key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(checkpoint.model_dump_json())
+        os.replace(temp_path, path)
+
+    async def delete(self, key: str) -> None:
+        """Delete a checkpoint file."""
+        self._path(key).unlink(missing_ok=True)
+
+
+class RedisCheckpointStore(CheckpointStore):
+    """
+    Stores checkpoints in Redis, falling back to local files.
+
+    Checkpoints are written to the fallback store while Redis is
+    unavailable. Loads read both and return the most recently updated,
+    so progress made during an outage is not lost when Redis returns.
+    """
+
+    def __init__(
+        self,
+        redis: "RedisManager | None" = None,
+        fallback: CheckpointStore | None = None,
+        prefix: str = "etl:checkpoint:",
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            redis: Redis manager (defaults to the application manager)
+            fallback: Store used while Redis is unavailable
+            prefix: Redis key prefix
+        """
+        self._redis = redis
+        self._fallback = fallback or FileCheckpointStore()
+        self._prefix = prefix
+        self._redis_available = True
+
+    async def _manager(self) -> "RedisManager":
+        if self._redis is None:
+            from app.db.redis import get_redis
+
+            self._redis = await get_redis()
+        return self._redis
+
+    def _redis_failed(self, error: Exception) -> None:
+        if self._redis_available:
+            logger.warning(f"Redis unavailable for ETL checkpoints, using local files: {error}")
+        self._redis_available = False
+
+    async def load(self, key: str) -> Checkpoint | None:
+        """Load the newest checkpoint from Redis or the fallback store."""
+        stored = None
+        try:
+            data = await (await self._manager()).get_json(self._prefix + key)
+            if data is not None:
+                stored = Checkpoint.model_validate(data)
+            self._redis_available = True
+        except Exception as e:
+            self._redis_failed(e)
+
+        local = await self._fallback.load(key)
+        if stored is None or (local is not None and local.updated_at > stored.updated_at):
+            return local
+        return stored
+
+    async def save(self, checkpoint: Checkpoint) -> None:
+        """Save a checkpoint to Redis, or the fallback store if that fails."""
+        try:
+            await (await self._manager()).set_json(
+                self._prefix + checkpoint.key, checkpoint.model_dump(mode="json")
+            )
+            self._redis_available = True
+        except Exception as e:
+            self._redis_failed(e)
+            await self._fallback.save(checkpoint)
+
+    async def delete(self, key: str) -> None:
+        """Delete a checkpoint from Redis and the fallback store."""
+        try:
+            await (await self._manager()).delete(self._prefix + key)
+        except Exception as e:
+            self._redis_failed(e)
+        await self._fallback.delete(key)
@@ -0,0 +1,160 @@
+"""
+Stage Executors for ETL Pipelines.
+
+This module runs per-record stage functions (transform, validate) over
+batches of records in one of three modes:
+- Inline on the event loop (yielding between chunks)
+- Thread pool
+- Process pool, for CPU-heavy transforms
+"""
+
+import asyncio
+import logging
+import pickle
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (record index, succeeded, result or error message)
+RecordOutcome = tuple[int, bool, Any]
+
+
+class ExecutionMode(StrEnum):
+    """Where per-record stage functions run."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def _run_chunk(
+    func: Callable[[Any], Any],
+    start: int,
+    records: list[Any],
+) -> list[RecordOutcome]:
+    """Apply a function to each record, capturing per-record errors."""
+    outcomes: list[RecordOutcome] = []
+    for offset, record in enumerate(records):
+        try:
+            outcomes.append((start + offset, True, func(record)))
+        except Exception as e:
+            outcomes.append((start + offset, False, str(e)))
+    return outcomes
+
+
+class StageExecutor:
+    """
+    Runs a per-record function over records in chunks.
+
+    Chunks are submitted to a thread or process pool (created on first
+    use) so CPU-bound stages do not block the event loop. Process mode
+    runs a pickled copy of the function, so changes it makes to its own
+    state are not seen by the caller. Results are returned in input
+    order unless preserve_order is disabled, in which case chunks are
+    collected as they finish.
+    """
+
+    def __init__(
+        self,
+        mode: ExecutionMode = ExecutionMode.INLINE,
+        max_workers: int = 4,
+        chunk_size: int = 500,
+        preserve_order: bool = True,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            mode: Execution mode
+            max_workers: Pool size for thread and process modes
+            chunk_size: Records per submitted chunk
+            preserve_order: Return outcomes in input order
+        """
+        self.mode = ExecutionMode(mode)
+        self.max_workers = max_workers
+        self.chunk_size = max(1, chunk_size)
+        self.preserve_order = preserve_order
+        self._pools: dict[ExecutionMode, Executor] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pools stay with the owner when a processor holding this executor is pickled
+        return {**self.__dict__, "_pools": {}}
+
+    def _get_pool(self, mode: ExecutionMode) -> Executor:
+        pool = self._pools.get(mode)
+        if pool is None:
+            if mode == ExecutionMode.PROCESS:
+                pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="etl-stage"
+                )
+            self._pools[mode] = pool
+        return pool
+
+    def _mode_for(self, func: Callable[[Any], Any]) -> ExecutionMode:
+        """Fall back to threads for functions that cannot be sent to a process."""
+        if self.mode != ExecutionMode.PROCESS:
+            return self.mode
+        try:
+            pickle.dumps(func)
+        except Exception:
+            logger.warning(
+                f"{getattr(func, '__qualname__', func)!s} cannot be pickled, "
+                "running it in a thread pool"
+            )
+            return ExecutionMode.THREAD
+        return ExecutionMode.PROCESS
+
+    async def map(
+        self,
+        func: Callable[[Any], Any],
+        records: list[Any],
+    ) -> list[RecordOutcome]:
+        """
+        Apply a function to every record.
+
+        Args:
+            func: Synchronous per-record function
+            records: Input records
+
+        Returns:
+            (index, succeeded, result or error message) per record
+        """
+        chunks = [
+            (start, records[start : start + self.chunk_size])
+            for start in range(0, len(records), self.chunk_size)
+        ]
+        mode = self._mode_for(func)
+
+        if mode == ExecutionMode.INLINE:
+            outcomes: list[RecordOutcome] = []
+            for start, chunk in chunks:
+                outcomes.extend(_run_chunk(func, start, chunk))
+                await asyncio.sleep(0)
+            return outcomes
+
+        pool = self._get_pool(mode)
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(pool, _run_chunk, func, start, chunk)
+            for start, chunk in chunks
+        ]
+
+        outcomes = []
+        if self.preserve_order:
+            for chunk_outcomes in await asyncio.gather(*futures):
+                outcomes.extend(chunk_outcomes)
+        else:
+            for future in asyncio.as_completed(futures):
+                outcomes.extend(await future)
+        return outcomes
+
+    def shutdown(self) -> None:
+        """Shut down the worker pools."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
@@ -3,20 +3,33 @@ ETL Pipeline Core for G3TI RTCC-UIP.
 
 This module provides the core ETL pipeline infrastructure including:
 - Pipeline configuration and management
-- Execution orchestration
+- Execution orchestration (batch or streaming)
+- Incremental extraction from checkpointed watermarks
 - Status tracking and monitoring
 - Error handling and recovery
 """
 
 import asyncio
+import inspect
 import logging
 import uuid
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .checkpoints import (
+    Checkpoint,
+    CheckpointStore,
+    RedisCheckpointStore,
+    record_fingerprint,
+    watermark_value,
+)
+from .executors import ExecutionMode, RecordOutcome, StageExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +74,39 @@ class PipelineConfig(BaseModel):
     quality_threshold: float = Field(
         default=0.95, ge=0, le=1, description="Minimum quality score"
     )
+    streaming_enabled: bool = Field(
+        default=False,
+        description="Stream records through all stages in batch_size chunks",
+    )
+    max_pending_chunks: int = Field(
+        default=2, ge=1, description="Chunks buffered between streaming stages"
+    )
+    execution_mode: ExecutionMode = Field(
+        default=ExecutionMode.INLINE,
+        description="Where transform and validate run (inline, thread, process)",
+    )
+    executor_chunk_size: int = Field(
+        default=250, ge=1, description="Records per transform/validate work item"
+    )
+    preserve_order: bool = Field(
+        default=True, description="Keep input order through parallel stages"
+    )
+    checkpoint_enabled: bool = Field(
+        default=False,
+        description="Resume from per-source checkpoints and skip unchanged records",
+    )
+    watermark_field: str | None = Field(
+        default=None, description="Record field tracked as the extraction high-watermark"
+    )
+    watermark_param: str = Field(
+        default="since", description="Extractor parameter receiving the last watermark"
+    )
+    record_key_field: str = Field(
+        default="id", description="Record field identifying a source record"
+    )
+    fingerprint_retention_runs: int = Field(
+        default=3, ge=1, description="Completed runs a record fingerprint is kept for"
+    )
 
 
 class PipelineMetrics(BaseModel):
@@ -97,6 +143,41 @@ class PipelineRun(BaseModel):
     config: PipelineConfig | None = Field(default=None)
 
 
+@dataclass
+class _ChunkProgress:
+    """Checkpoint bookkeeping for one extracted chunk."""
+
+    extracted: int
+    # Record key -> fingerprint / watermark, for every record in the chunk
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    watermarks: dict[str, Any] = field(default_factory=dict)
+    # Keys of the new or changed records passed on to transform, in order
+    pending: list[str] = field(default_factory=list)
+    # Keys of records that did not reach the loader or failed to load
+    failed: set[str] = field(default_factory=set)
+
+    def settle(self) -> tuple[dict[str, str], Any, Any]:
+        """
+        Split the chunk into loaded and failed records.
+
+        Returns:
+            Fingerprints of loaded records, the lowest watermark of the
+            failed records, and the highest watermark of the loaded ones
+        """
+        fingerprints = {}
+        low = high = None
+        for key, fingerprint in self.fingerprints.items():
+            value = self.watermarks.get(key)
+            if key in self.failed:
+                if value is not None and (low is None or value < low):
+                    low = value
+            else:
+                fingerprints[key] = fingerprint
+                if value is not None and (high is None or value > high):
+                    high = value
+        return fingerprints, low, high
+
+
 class ETLPipeline:
     """
     Core ETL Pipeline orchestrator.
@@ -112,6 +193,7 @@ class ETLPipeline:
         transformer: Callable[..., Any] | None = None,
         validator: Callable[..., Any] | None = None,
         loader: Callable[..., Any] | None = None,
+        checkpoint_store: CheckpointStore | None = None,
     ):
         """
         Initialize the ETL Pipeline.
@@ -122,6 +204,8 @@ class ETLPipeline:
             transformer: Data transformation function
             validator: Data validation function
             loader: Data loading function
+            checkpoint_store: Checkpoint persistence (defaults to Redis
+                with a local file fallback when checkpointing is enabled)
         """
         self.config = config
         self.extractor = extractor
@@ -131,8 +215,21 @@ class ETLPipeline:
 
         self._current_run: PipelineRun | None = None
         self._is_running = False
+        self._streaming = False
+        self._executor = StageExecutor(
+            mode=config.execution_mode,
+            max_workers=config.parallel_workers,
+            chunk_size=config.executor_chunk_size,
+            preserve_order=config.preserve_order,
+        )
         self._should_stop = False
 
+        self._checkpoints = checkpoint_store
+        if config.checkpoint_enabled and checkpoint_store is None:
+            self._checkpoints = RedisCheckpointStore()
+        self._checkpoint: Checkpoint | None = None
+        self._resume_offset = 0
+
         logger.info(f"ETLPipeline '{config.name}' initialized")
 
     @property
@@ -145,6 +242,20 @@ class ETLPipeline:
         """Get current run information."""
         return self._current_run
 
+    @property
+    def streams(self) -> bool:
+        """Check if runs stream records instead of staging full lists."""
+        return (
+            self.config.streaming_enabled
+            or self.config.checkpoint_enabled
+            or inspect.isasyncgenfunction(self.extractor)
+        )
+
+    @property
+    def checkpoint_key(self) -> str:
+        """Key of this pipeline's extraction checkpoint."""
+        return f"{self.config.source_type}:{self.config.name}"
+
     async def execute(
         self,
         source_params: dict[str, Any] | None = None,
@@ -174,10 +285,28 @@ class ETLPipeline:
         )
         self._is_running = True
         self._should_stop = False
+        self._streaming = self.streams
 
         logger.info(f"Starting pipeline run {run_id} for '{self.config.name}'")
 
         try:
+            if self._streaming:
+                source_params = source_params or {}
+                if self.config.checkpoint_enabled:
+                    source_params = await self._begin_checkpoint(source_params)
+
+                await self._execute_streaming(source_params, target_params or {})
+
+                if self._should_stop:
+                    return self._finalize_run(PipelineStatus.CANCELLED)
+
+                if self._checkpoint is not None:
+                    self._checkpoint.complete_run(self.config.fingerprint_retention_runs)
+                    await self._checkpoints.save(self._checkpoint)
+
+                self._current_run.current_stage = PipelineStage.COMPLETE
+                return self._finalize_run(PipelineStatus.COMPLETED)
+
             # Extract stage
             self._current_run.current_stage = PipelineStage.EXTRACT
             extracted_data = await self._execute_extract(source_params or {})
@@ -196,6 +325,7 @@ class ETLPipeline:
             if self.config.validation_enabled:
                 self._current_run.current_stage = PipelineStage.VALIDATE
                 validated_data = await self._execute_validate(transformed_data)
+                self._check_quality()
             else:
                 validated_data = transformed_data
 
@@ -249,99 +379,131 @@ class ETLPipeline:
             raise
 
     async def _execute_transform(
-        self, data: list[dict[str, Any]]
+        self,
+        data: list[dict[str, Any]],
+        origins: list[int] | None = None,
+        failed: set[int] | None = None,
     ) -> list[dict[str, Any]]:
-        """Execute transformation stage."""
+        """
+        Execute transformation stage.
+
+        Args:
+            data: Records to transform
+            origins: If given, receives the input index of each transformed record
+            failed: If given, receives the input indexes of records whose transform raised
+        """
         logger.info(f"Transforming {len(data)} records")
 
         if self.transformer is None:
-            self._current_run.metrics.records_transformed = len(data)
+            self._current_run.metrics.records_transformed += len(data)
+            if origins is not None:
+                origins.extend(range(len(data)))
             return data
 
         transformed = []
         errors = 0
 
-        for record in data:
-            try:
-                if asyncio.iscoroutinefunction(self.transformer):
-                    result = await self.transformer(record)
-                else:
-                    result = self.transformer(record)
-
+        for index, succeeded, result in await self._run_stage(self.transformer, data):
+            if succeeded:
                 if result is not None:
                     transformed.append(result)
-
-            except Exception as e:
+                    if origins is not None:
+                        origins.append(index)
+            else:
                 errors += 1
-                logger.warning(f"Transform error: {e}")
+                if failed is not None:
+                    failed.add(index)
+                logger.warning(f"Transform error: {result}")
                 self._current_run.errors.append({
                     "stage": "transform",
-                    "error": str(e),
-                    "record_id": record.get("id", "unknown"),
+                    "error": result,
+                    "record_id": data[index].get("id", "unknown"),
                     "timestamp": datetime.utcnow().isoformat(),
                 })
 
-        self._current_run.metrics.records_transformed = len(transformed)
-        self._current_run.metrics.transform_errors = errors
+        self._current_run.metrics.records_transformed += len(transformed)
+        self._current_run.metrics.transform_errors += errors
         logger.info(f"Transformed {len(transformed)} records, {errors} errors")
 
         return transformed
 
     async def _execute_validate(
-        self, data: list[dict[str, Any]]
+        self,
+        data: list[dict[str, Any]],
+        failed: set[int] | None = None,
     ) -> list[dict[str, Any]]:
-        """Execute validation stage."""
+        """
+        Execute validation stage.
+
+        Args:
+            data: Records to validate
+            failed: If given, receives the indexes of records whose validator raised
+        """
         logger.info(f"Validating {len(data)} records")
 
         if self.validator is None:
-            self._current_run.metrics.records_validated = len(data)
+            self._current_run.metrics.records_validated += len(data)
             return data
 
         validated = []
         errors = 0
 
-        for record in data:
-            try:
-                if asyncio.iscoroutinefunction(self.validator):
-                    is_valid = await self.validator(record)
-                else:
-                    is_valid = self.validator(record)
-
-                if is_valid:
-                    validated.append(record)
-                else:
-                    errors += 1
-
-            except Exception as e:
+        for index, succeeded, is_valid in await self._run_stage(self.validator, data):
+            if succeeded and is_valid:
+                validated.append(data[index])
+            else:
                 errors += 1
-                logger.warning(f"Validation error: {e}")
+                if not succeeded:
+                    logger.warning(f"Validation error: {is_valid}")
+                    if failed is not None:
+                        failed.add(index)
 
-        self._current_run.metrics.records_validated = len(validated)
-        self._current_run.metrics.validation_errors = errors
+        self._current_run.metrics.records_validated += len(validated)
+        self._current_run.metrics.validation_errors += errors
         logger.info(f"Validated {len(validated)} records, {errors} invalid")
 
-        # Check quality threshold
-        if len(data) > 0:
-            quality_score = len(validated) / len(data)
+        return validated
+
+    async def _run_stage(
+        self,
+        func: Callable[..., Any],
+        data: list[dict[str, Any]],
+    ) -> list[RecordOutcome]:
+        """Apply a stage function to each record, on the configured executor."""
+        if not asyncio.iscoroutinefunction(func):
+            return await self._executor.map(func, data)
+
+        outcomes: list[RecordOutcome] = []
+        for index, record in enumerate(data):
+            try:
+                outcomes.append((index, True, await func(record)))
+            except Exception as e:
+                outcomes.append((index, False, str(e)))
+        return outcomes
+
+    def _check_quality(self) -> None:
+        """Warn if the share of transformed records passing validation is too low."""
+        metrics = self._current_run.metrics
+        if metrics.records_transformed > 0:
+            quality_score = metrics.records_validated / metrics.records_transformed
             if quality_score < self.config.quality_threshold:
                 logger.warning(
                     f"Quality score {quality_score:.2f} below threshold "
                     f"{self.config.quality_threshold}"
                 )
 
-        return validated
-
     async def _execute_load(
         self,
         data: list[dict[str, Any]],
         params: dict[str, Any],
+        offset: int = 0,
     ) -> None:
         """Execute loading stage."""
         logger.info(f"Loading {len(data)} records")
 
         if self.loader is None:
             logger.warning("No loader configured, skipping load")
-            self._current_run.metrics.records_loaded = len(data)
+            self._current_run.metrics.records_loaded += len(data)
             return
 
         loaded = 0
@@ -369,15 +531,263 @@ class ETLPipeline:
                 self._current_run.errors.append({
                     "stage": "load",
                     "error": str(e),
-                    "batch_start": i,
+                    "batch_start": offset + i,
                     "batch_size": len(batch),
                     "timestamp": datetime.utcnow().isoformat(),
                 })
 
-        self._current_run.metrics.records_loaded = loaded
-        self._current_run.metrics.load_errors = errors
+        self._current_run.metrics.records_loaded += loaded
+        self._current_run.metrics.load_errors += errors
         logger.info(f"Loaded {loaded} records, {errors} errors")
 
+    async def _execute_streaming(
+        self,
+        source_params: dict[str, Any],
+        target_params: dict[str, Any],
+    ) -> None:
+        """
+        Execute all stages concurrently over bounded chunks.
+
+        Extraction, transform/validate and load run as separate tasks
+        connected by queues of at most max_pending_chunks chunks, so a
+        slow stage holds back the ones before it and memory use does
+        not grow with the size of the input.
+        """
+        extracted: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_pending_chunks)
+        processed: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_pending_chunks)
+
+        load_task = asyncio.create_task(self._stream_load(processed, target_params))
+        tasks = [
+            asyncio.create_task(self._stream_extract(source_params, extracted)),
+            asyncio.create_task(self._stream_process(extracted, processed)),
+            load_task,
+        ]
+
+        pending = set(tasks)
+        try:
+            while not load_task.done():
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        raise task.exception()
+        finally:
+            # Stops extraction left blocked on a full queue after stop()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.config.validation_enabled:
+            self._check_quality()
+
+    async def _begin_checkpoint(self, source_params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Load this source's checkpoint and start the run from it.
+
+        Returns:
+            Source parameters with the watermark to extract from added
+        """
+        checkpoint = await self._checkpoints.load(self.checkpoint_key)
+        if checkpoint is None:
+            checkpoint = Checkpoint(key=self.checkpoint_key)
+
+        resumed = checkpoint.begin_run(self._current_run.id)
+        self._checkpoint = checkpoint
+        self._resume_offset = checkpoint.run_offset
+        await self._checkpoints.save(checkpoint)
+
+        if resumed:
+            logger.info(
+                f"Resuming '{self.config.name}' after {checkpoint.run_offset} "
+                f"committed records"
+            )
+
+        param = self.config.watermark_param
+        if checkpoint.run_since is None or param in source_params:
+            return source_params
+        if not self._extractor_accepts(param):
+            logger.debug(f"Extractor for '{self.config.name}' does not accept '{param}'")
+            return source_params
+        return {**source_params, param: checkpoint.run_since}
+
+    def _extractor_accepts(self, param: str) -> bool:
+        try:
+            parameters = inspect.signature(self.extractor).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            p.name == param or p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters
+        )
+
+    def _track_chunk(
+        self, chunk: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], _ChunkProgress]:
+        """
+        Fingerprint an extracted chunk and drop records loaded unchanged before.
+
+        Returns:
+            New or changed records, and the chunk's checkpoint progress
+        """
+        progress = _ChunkProgress(extracted=len(chunk))
+        key_field = self.config.record_key_field
+        watermark_field = self.config.watermark_field
+        changed = []
+
+        for record in chunk:
+            fingerprint = record_fingerprint(record)
+            key = record.get(key_field) if isinstance(record, dict) else None
+            key = fingerprint if key is None else str(key)
+            progress.fingerprints[key] = fingerprint
+
+            if watermark_field and isinstance(record, dict):
+                progress.watermarks[key] = watermark_value(record.get(watermark_field))
+
+            if not self._checkpoint.is_unchanged(key, fingerprint):
+                changed.append(record)
+                progress.pending.append(key)
+
+        self._current_run.metrics.records_skipped += len(chunk) - len(changed)
+        return changed, progress
+
+    async def _stream_extract(
+        self,
+        params: dict[str, Any],
+        chunks: asyncio.Queue,
+    ) -> None:
+        """Extract records into chunks of batch_size."""
+        skip = self._resume_offset if self._checkpoint is not None else 0
+        try:
+            async for chunk in self._iter_extract(params):
+                if skip:
+                    # Already committed by the interrupted run being resumed
+                    skipped = min(skip, len(chunk))
+                    self._current_run.metrics.records_skipped += skipped
+                    skip -= skipped
+                    chunk = chunk[skipped:]
+                    if not chunk:
+                        continue
+
+                self._current_run.metrics.records_extracted += len(chunk)
+                await chunks.put(chunk)
+                if self._should_stop:
+                    break
+        except Exception as e:
+            logger.error(f"Extraction failed: {e}")
+            self._current_run.current_stage = PipelineStage.EXTRACT
+            self._current_run.errors.append({
+                "stage": "extract",
+                "error": str(e),
+                "timestamp": datetime.utcnow().isoformat(),
+            })
+            raise
+
+        await chunks.put(None)
+
+    async def _iter_extract(
+        self, params: dict[str, Any]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterate the extractor's output in chunks of batch_size.
+
+        The extractor may be an async generator, or a sync or async
+        function returning a record, a list, or any (async) iterable.
+        Items that are lists (e.g. API pages) are flattened.
+        """
+        if self.extractor is None:
+            logger.warning("No extractor configured, returning empty data")
+            return
+
+        source = self.extractor(**params)
+        if inspect.isawaitable(source):
+            source = await source
+        if source is None:
+            return
+        if isinstance(source, dict):
+            source = [source]
+        if not hasattr(source, "__aiter__"):
+            source = _iterate(source)
+
+        batch_size = self.config.batch_size
+        chunk: list[dict[str, Any]] = []
+        async for item in source:
+            if isinstance(item, list):
+                chunk.extend(item)
+            else:
+                chunk.append(item)
+            while len(chunk) >= batch_size:
+                yield chunk[:batch_size]
+                chunk = chunk[batch_size:]
+        if chunk:
+            yield chunk
+
+    async def _stream_process(
+        self,
+        chunks: asyncio.Queue,
+        processed: asyncio.Queue,
+    ) -> None:
+        """
+        Transform and validate chunks as they arrive.
+
+        Records whose transform or validator raised are marked failed in
+        the chunk's checkpoint progress so they are extracted again by
+        the next run. Records the validator rejects are not retried.
+        """
+        while (chunk := await chunks.get()) is not None:
+            if self._should_stop:
+                break
+
+            progress = None
+            if self._checkpoint is not None:
+                chunk, progress = self._track_chunk(chunk)
+
+            origins: list[int] = []
+            failed: set[int] = set()
+
+            self._current_run.current_stage = PipelineStage.TRANSFORM
+            records = await self._execute_transform(chunk, origins, failed) if chunk else []
+
+            if self.config.validation_enabled and records:
+                self._current_run.current_stage = PipelineStage.VALIDATE
+                rejected: set[int] = set()
+                records = await self._execute_validate(records, rejected)
+                failed.update(origins[index] for index in rejected)
+
+            if progress is not None:
+                progress.failed.update(progress.pending[index] for index in failed)
+
+            if records or progress is not None:
+                await processed.put((records, progress))
+
+        await processed.put(None)
+
+    async def _stream_load(
+        self,
+        processed: asyncio.Queue,
+        params: dict[str, Any],
+    ) -> None:
+        """Load chunks as they arrive, committing each to the checkpoint."""
+        metrics = self._current_run.metrics
+        offset = 0
+        while (item := await processed.get()) is not None:
+            records, progress = item
+            load_errors = metrics.load_errors
+            if records:
+                self._current_run.current_stage = PipelineStage.LOAD
+                await self._execute_load(records, params, offset)
+                offset += len(records)
+
+            if progress is not None:
+                if metrics.load_errors != load_errors:
+                    progress.failed.update(progress.pending)
+                fingerprints, low, high = progress.settle()
+                self._checkpoint.commit_chunk(
+                    progress.extracted,
+                    fingerprints,
+                    low,
+                    high,
+                    succeeded=not progress.failed,
+                )
+                await self._checkpoints.save(self._checkpoint)
+
     def _finalize_run(self, status: PipelineStatus) -> PipelineRun:
         """Finalize the pipeline run."""
         self._current_run.status = status
@@ -409,6 +819,16 @@ class ETLPipeline:
         logger.info(f"Stop requested for pipeline '{self.config.name}'")
         self._should_stop = True
 
+    async def reset_checkpoint(self) -> None:
+        """Forget extraction progress so the next run starts from scratch."""
+        if self._checkpoints is not None:
+            await self._checkpoints.delete(self.checkpoint_key)
+        self._checkpoint = None
+
+    def close(self) -> None:
+        """Release transform/validate worker pools."""
+        self._executor.shutdown()
+
     def get_status(self) -> dict[str, Any]:
         """Get current pipeline status."""
         if self._current_run is None:
@@ -428,11 +848,30 @@ class ETLPipeline:
                 if self._current_run.started_at
                 else None
             ),
+            "streaming": self._streaming,
+            "checkpoint": (
+                {
+                    "key": self._checkpoint.key,
+                    "watermark": self._checkpoint.watermark,
+                    "resumed_from": self._resume_offset,
+                    "committed_records": self._checkpoint.run_offset,
+                }
+                if self._checkpoint is not None
+                else None
+            ),
             "metrics": self._current_run.metrics.model_dump(),
             "error_count": len(self._current_run.errors),
         }
 
 
+async def _iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Adapt a sync iterable to async iteration, yielding to the loop between items."""
+    for index, item in enumerate(items):
+        if index % 1000 == 999:
+            await asyncio.sleep(0)
+        yield item
+
+
 class PipelineManager:
     """
     Manager for multiple ETL pipelines.
@@ -15,6 +15,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .executors import ExecutionMode, StageExecutor
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +29,11 @@ class ProcessorConfig(BaseModel):
     batch_size: int = Field(default=1000, description="Processing batch size")
     timeout_seconds: int = Field(default=300, description="Processing timeout")
     retry_count: int = Field(default=3, description="Retry attempts")
+    execution_mode: ExecutionMode = Field(
+        default=ExecutionMode.INLINE,
+        description="Where transform and validate run (inline, thread, process)",
+    )
+    max_workers: int = Field(default=4, ge=1, description="Worker pool size")
 
 
 class ProcessorResult(BaseModel):
@@ -56,6 +63,11 @@ class DataProcessor(ABC):
             config: Processor configuration
         """
         self.config = config
+        self._executor = StageExecutor(
+            mode=config.execution_mode,
+            max_workers=config.max_workers,
+            chunk_size=config.batch_size,
+        )
         logger.info(f"Initialized {self.__class__.__name__} for {config.source_name}")
 
     @abstractmethod
@@ -117,19 +129,17 @@ class DataProcessor(ABC):
             logger.info(f"Extracted {len(raw_records)} records from {self.config.source_name}")
 
             # Transform and validate
-            for record in raw_records:
-                try:
-                    transformed = self.transform(record)
-                    if transformed and self.validate(transformed):
-                        processed += 1
-                    else:
-                        failed += 1
-                except Exception as e:
+            outcomes = await self._executor.map(self._process_record, raw_records)
+            for index, succeeded, is_valid in outcomes:
+                if succeeded and is_valid:
+                    processed += 1
+                else:
                     failed += 1
-                    errors.append({
-                        "record_id": record.get("id", "unknown"),
-                        "error": str(e),
-                    })
+                    if not succeeded:
+                        errors.append({
+                            "record_id": raw_records[index].get("id", "unknown"),
+                            "error": is_valid,
+                        })
 
             return ProcessorResult(
                 success=True,
@@ -151,6 +161,15 @@ class DataProcessor(ABC):
                 errors=[{"error": str(e)}],
             )
 
+    def _process_record(self, record: dict[str, Any]) -> bool:
+        """Transform and validate one record."""
+        transformed = self.transform(record)
+        return bool(transformed and self.validate(transformed))
+
+    def close(self) -> None:
+        """Release worker pools."""
+        self._executor.shutdown()
+
 
 class CADProcessor(DataProcessor):
     """
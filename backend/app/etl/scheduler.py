@@ -5,13 +5,19 @@ This module provides scheduling capabilities for ETL pipelines including:
 - Cron-based scheduling
 - Interval-based scheduling
 - One-time job execution
+- Global and per-job-type concurrency limits
+- Start jitter and misfire handling
 - Job monitoring and management
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import random
+from collections import deque
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any, Callable
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -38,6 +44,32 @@ class JobStatus(str, Enum):
     PAUSED = "paused"
 
 
+class MisfirePolicy(StrEnum):
+    """What to do with a run that is later than the misfire grace time."""
+
+    RUN_ONCE = "run_once"
+    SKIP = "skip"
+
+
+class SchedulerConfig(BaseModel):
+    """Scheduler configuration."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    max_concurrent_jobs: int = Field(
+        default=4, ge=1, description="Jobs the scheduler runs at once"
+    )
+    job_type_limits: dict[str, int] = Field(
+        default_factory=dict, description="Concurrent job limit per job type"
+    )
+    jitter_seconds: float = Field(
+        default=0.0, ge=0, description="Maximum random delay added to each run"
+    )
+    misfire_grace_seconds: float = Field(
+        default=300.0, ge=0, description="Lateness after which a run has misfired"
+    )
+
+
 class ScheduledJob(BaseModel):
     """Scheduled job configuration."""
 
@@ -47,11 +79,15 @@ class ScheduledJob(BaseModel):
     name: str = Field(description="Job name")
     pipeline_name: str = Field(description="Pipeline to execute")
     schedule_type: ScheduleType = Field(description="Schedule type")
+    job_type: str = Field(default="default", description="Job type for concurrency limits")
 
     # Schedule configuration
     cron_expression: str | None = Field(default=None, description="Cron expression")
     interval_seconds: int | None = Field(default=None, description="Interval in seconds")
     run_at: datetime | None = Field(default=None, description="One-time run datetime")
+    misfire_policy: MisfirePolicy = Field(
+        default=MisfirePolicy.RUN_ONCE, description="Handling of runs missed by too long"
+    )
 
     # Execution parameters
     source_params: dict[str, Any] = Field(default_factory=dict, description="Source parameters")
@@ -86,6 +122,9 @@ class JobExecution(BaseModel):
     completed_at: datetime | None = Field(default=None, description="Completion time")
     duration_seconds: float | None = Field(default=None, description="Duration")
     records_processed: int = Field(default=0, description="Records processed")
+    records_skipped: int = Field(
+        default=0, description="Records skipped as already loaded"
+    )
     errors: list[dict[str, Any]] = Field(default_factory=list, description="Errors")
 
 
@@ -98,21 +137,45 @@ class ETLScheduler:
     - Interval-based scheduling
     - One-time execution
     - Job monitoring and history
+
+    Due times are kept in a heap, and the scheduler loop sleeps until
+    the earliest one (or until jobs change). Due jobs wait in a ready
+    queue until the global and per-job-type concurrency limits allow
+    them to start.
     """
 
-    def __init__(self, pipeline_executor: Callable[..., Any] | None = None):
+    def __init__(
+        self,
+        pipeline_executor: Callable[..., Any] | None = None,
+        config: SchedulerConfig | None = None,
+    ):
         """
         Initialize the scheduler.
 
         Args:
             pipeline_executor: Function to execute pipelines
+            config: Scheduler configuration
         """
+        self.config = config or SchedulerConfig()
         self._jobs: dict[str, ScheduledJob] = {}
         self._executions: list[JobExecution] = []
         self._running = False
         self._executor = pipeline_executor
         self._tasks: dict[str, asyncio.Task[Any]] = {}
 
+        # (due, sequence, job_id, version); entries with an old version are stale
+        self._heap: list[tuple[datetime, int, str, int]] = []
+        self._versions: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._ready: deque[tuple[datetime, str, int]] = deque()
+        self._active_by_type: dict[str, int] = {}
+        self._wakeup = asyncio.Event()
+        self._loop_task: asyncio.Task[Any] | None = None
+
+        self._lag_samples: deque[float] = deque(maxlen=100)
+        self._max_lag = 0.0
+        self._misfires = 0
+
         logger.info("ETLScheduler initialized")
 
     @property
@@ -130,6 +193,7 @@ class ETLScheduler:
         # Calculate next run time
         job.next_run = self._calculate_next_run(job)
         self._jobs[job.id] = job
+        self._schedule(job)
         logger.info(f"Added job '{job.name}' (id={job.id}), next run: {job.next_run}")
 
     def remove_job(self, job_id: str) -> bool:
@@ -149,6 +213,8 @@ class ETLScheduler:
                 del self._tasks[job_id]
 
             del self._jobs[job_id]
+            # Keep the version counter so a re-added job's run supersedes this one
+            self._unschedule(job_id)
             logger.info(f"Removed job {job_id}")
             return True
         return False
@@ -189,6 +255,7 @@ class ETLScheduler:
             job.status = JobStatus.PAUSED
             job.enabled = False
             job.updated_at = datetime.utcnow()
+            self._unschedule(job_id)
             logger.info(f"Paused job {job_id}")
             return True
         return False
@@ -209,6 +276,7 @@ class ETLScheduler:
             job.enabled = True
             job.next_run = self._calculate_next_run(job)
             job.updated_at = datetime.utcnow()
+            self._schedule(job)
             logger.info(f"Resumed job {job_id}")
             return True
         return False
@@ -223,16 +291,23 @@ class ETLScheduler:
         logger.info("Starting ETL scheduler")
 
         # Start the main scheduler loop
-        asyncio.create_task(self._scheduler_loop())
+        self._wakeup = asyncio.Event()
+        self._loop_task = asyncio.create_task(self._scheduler_loop())
 
     async def stop(self) -> None:
         """Stop the scheduler."""
         logger.info("Stopping ETL scheduler")
         self._running = False
 
+        tasks = list(self._tasks.values())
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+            self._loop_task = None
+
         # Cancel all running tasks
-        for task in self._tasks.values():
+        for task in tasks:
             task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         self._tasks.clear()
 
@@ -253,31 +328,112 @@ class ETLScheduler:
 
         return await self._execute_job(job)
 
+    def _schedule(self, job: ScheduledJob) -> None:
+        """Queue a job's next run, replacing any run already queued."""
+        version = self._versions.get(job.id, 0) + 1
+        self._versions[job.id] = version
+        if job.next_run is None or not job.enabled:
+            return
+
+        if len(self._heap) > 2 * len(self._jobs) + 16:
+            self._heap = [e for e in self._heap if self._is_current(e[2], e[3])]
+            heapq.heapify(self._heap)
+
+        due = job.next_run
+        if self.config.jitter_seconds:
+            due += timedelta(seconds=random.uniform(0, self.config.jitter_seconds))
+        heapq.heappush(self._heap, (due, next(self._sequence), job.id, version))
+        self._wakeup.set()
+
+    def _unschedule(self, job_id: str) -> None:
+        """Drop a job's queued run."""
+        if job_id in self._versions:
+            self._versions[job_id] += 1
+
+    def _is_current(self, job_id: str, version: int) -> bool:
+        return self._versions.get(job_id) == version
+
+    def _release_due(self, now: datetime) -> None:
+        """Move runs that are due from the heap to the ready queue."""
+        grace = self.config.misfire_grace_seconds
+        while self._heap and self._heap[0][0] <= now:
+            due, _, job_id, version = heapq.heappop(self._heap)
+            if not self._is_current(job_id, version):
+                continue
+
+            job = self._jobs[job_id]
+            late = (now - due).total_seconds()
+            if late > grace and job.misfire_policy == MisfirePolicy.SKIP:
+                self._misfires += 1
+                logger.warning(f"Job '{job.name}' misfired by {late:.0f}s, skipping run")
+                if job.schedule_type == ScheduleType.INTERVAL:
+                    job.next_run = now + timedelta(seconds=job.interval_seconds)
+                else:
+                    job.next_run = self._calculate_next_run(job)
+                self._schedule(job)
+                continue
+            if late > grace:
+                # RUN_ONCE: however many runs were missed, run once now
+                self._misfires += 1
+                logger.warning(f"Job '{job.name}' misfired by {late:.0f}s, running now")
+
+            self._ready.append((due, job_id, version))
+
+    def _dispatch(self, now: datetime) -> None:
+        """Start ready jobs the concurrency limits allow."""
+        limits = self.config.job_type_limits
+        waiting: deque[tuple[datetime, str, int]] = deque()
+
+        while self._ready:
+            due, job_id, version = self._ready.popleft()
+            if not self._is_current(job_id, version):
+                continue
+            job = self._jobs[job_id]
+            if job.status == JobStatus.RUNNING:
+                # Started by run_job_now; rescheduled when it completes
+                continue
+
+            active = self._active_by_type.get(job.job_type, 0)
+            if len(self._tasks) >= self.config.max_concurrent_jobs or (
+                job.job_type in limits and active >= limits[job.job_type]
+            ):
+                waiting.append((due, job_id, version))
+                continue
+
+            lag = (now - due).total_seconds()
+            self._lag_samples.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+
+            self._active_by_type[job.job_type] = active + 1
+            task = asyncio.create_task(self._execute_job(job))
+            task.add_done_callback(lambda _, job_type=job.job_type: self._job_done(job_type))
+            self._tasks[job_id] = task
+
+        self._ready = waiting
+
+    def _job_done(self, job_type: str) -> None:
+        self._active_by_type[job_type] -= 1
+        self._wakeup.set()
+
     async def _scheduler_loop(self) -> None:
         """Main scheduler loop."""
         logger.info("Scheduler loop started")
 
         while self._running:
             try:
+                self._wakeup.clear()
                 now = datetime.utcnow()
-
-                for job_id, job in list(self._jobs.items()):
-                    # Skip disabled or paused jobs
-                    if not job.enabled or job.status == JobStatus.PAUSED:
-                        continue
-
-                    # Skip jobs already running
-                    if job.status == JobStatus.RUNNING:
-                        continue
-
-                    # Check if job should run
-                    if job.next_run and job.next_run <= now:
-                        # Execute job in background
-                        task = asyncio.create_task(self._execute_job(job))
-                        self._tasks[job_id] = task
-
-                # Sleep before next check
-                await asyncio.sleep(1)
+                self._release_due(now)
+                self._dispatch(now)
+
+                # Sleep until the next run is due, or jobs or free slots change
+                timeout = None
+                if self._heap:
+                    timeout = max(0.0, (self._heap[0][0] - now).total_seconds())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except TimeoutError:
+                    pass
 
             except asyncio.CancelledError:
                 break
@@ -334,8 +490,14 @@ class ETLScheduler:
 
                 if isinstance(result, dict):
                     execution.records_processed = result.get("records_loaded", 0)
+                    execution.records_skipped = result.get("records_skipped", 0)
                     if result.get("errors"):
                         execution.errors = result["errors"]
+                elif hasattr(result, "metrics"):
+                    # PipelineRun from PipelineManager.execute_pipeline
+                    execution.records_processed = result.metrics.records_loaded
+                    execution.records_skipped = result.metrics.records_skipped
+                    execution.errors = list(result.errors)
 
             execution.status = JobStatus.COMPLETED
             job.status = JobStatus.COMPLETED
@@ -359,6 +521,7 @@ class ETLScheduler:
         # Update job for next run
         job.next_run = self._calculate_next_run(job)
         job.updated_at = datetime.utcnow()
+        self._schedule(job)
 
         # Store execution record
         self._executions.append(execution)
@@ -502,6 +665,12 @@ class ETLScheduler:
             Status summary
         """
         jobs = list(self._jobs.values())
+        now = datetime.utcnow()
+        next_due = min(
+            (due for due, _, job_id, version in self._heap if self._is_current(job_id, version)),
+            default=None,
+        )
+        lags = self._lag_samples
 
         return {
             "is_running": self._running,
@@ -513,6 +682,17 @@ class ETLScheduler:
             "recent_failures": sum(
                 1 for e in self._executions[-100:] if e.status == JobStatus.FAILED
             ),
+            "queue_depth": len(self._ready),
+            "active_by_type": {k: v for k, v in self._active_by_type.items() if v},
+            "next_due_in_seconds": (
+                max(0.0, (next_due - now).total_seconds()) if next_due else None
+            ),
+            "lag_seconds": {
+                "last": lags[-1] if lags else None,
+                "average": sum(lags) / len(lags) if lags else None,
+                "max": self._max_lag,
+            },
+            "misfires": self._misfires,
         }
 
 
@@ -537,6 +717,7 @@ def create_daily_aggregate_job(
         name=f"Daily Aggregate - {jurisdiction}",
         pipeline_name=pipeline_name,
         schedule_type=ScheduleType.CRON,
+        job_type="daily_aggregate",
         cron_expression="0 2 * * *",  # 2 AM daily
         source_params={"jurisdiction": jurisdiction},
         target_params={},
@@ -564,6 +745,7 @@ def create_hourly_ingestion_job(
         name=f"Hourly Ingestion - {source_type}",
         pipeline_name=pipeline_name,
         schedule_type=ScheduleType.INTERVAL,
+        job_type="hourly_ingestion",
         interval_seconds=3600,  # 1 hour
         source_params={"source_type": source_type},
         target_params={},
@@ -591,6 +773,7 @@ def create_quality_check_job(
         name=f"Quality Check - {partition_key}",
         pipeline_name=pipeline_name,
         schedule_type=ScheduleType.CRON,
+        job_type="quality_check",
         cron_expression="0 4 * * *",  # 4 AM daily
         source_params={"partition_key": partition_key},
         target_params={},
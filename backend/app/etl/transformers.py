@@ -15,6 +15,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..utils import hex_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -255,11 +257,11 @@ class GeoEnricher:
     Adds geographic metadata like H3 indices, geohashes, and zone information.
     """
 
-    # H3 resolution levels
-    H3_RESOLUTION_CITY = 7  # ~5km cells
-    H3_RESOLUTION_NEIGHBORHOOD = 8  # ~1km cells
-    H3_RESOLUTION_BLOCK = 9  # ~200m cells
-    H3_RESOLUTION_STREET = 10  # ~50m cells
+    # Cell resolution levels (nominal edge length)
+    H3_RESOLUTION_CITY = 7  # ~1.4km edge
+    H3_RESOLUTION_NEIGHBORHOOD = 8  # ~530m edge
+    H3_RESOLUTION_BLOCK = 9  # ~200m edge
+    H3_RESOLUTION_STREET = 10  # ~76m edge
 
     def __init__(self, default_resolution: int = 8):
         """
@@ -310,18 +312,10 @@ class GeoEnricher:
         return enriched
 
     def _compute_h3_index(self, lat: float, lon: float, resolution: int) -> str:
-        """
-        Compute H3 index for coordinates.
-
-        Note: In production, would use the h3 library.
-        This is a simplified implementation for demonstration.
-        """
+        """Compute hexagonal cell index for coordinates."""
         try:
-            # Simplified H3-like index computation
-            lat_part = int((lat + 90) * (10 ** (resolution - 5))) % (10 ** 6)
-            lon_part = int((lon + 180) * (10 ** (resolution - 5))) % (10 ** 6)
-            return f"{resolution:x}{lat_part:06x}{lon_part:06x}"
-        except Exception:
+            return hex_index.latlng_to_cell(float(lat), float(lon), resolution)
+        except (TypeError, ValueError):
             return ""
 
     def _compute_geohash(self, lat: float, lon: float, precision: int = 7) -> str:
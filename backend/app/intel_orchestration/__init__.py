@@ -27,6 +27,7 @@ from .audit_log import (
     AuditEntry,
     IntelAuditLog,
 )
+from .cache import TTLCache
 from .correlator import (
     CorrelationConfig,
     CorrelationEngine,
@@ -34,6 +35,7 @@ from .correlator import (
     EntityCorrelation,
     PatternCorrelation,
 )
+from .entity_index import EntityIndex
 from .knowledge_graph_sync import (
     GraphSyncConfig,
     KnowledgeGraphSync,
@@ -55,6 +57,7 @@ from .pipelines import (
     PipelineStage,
     RealTimePipeline,
 )
+from .rule_compiler import RulePlan
 from .rules_engine import (
     PriorityScore,
     RiskProfile,
@@ -78,9 +81,12 @@ __all__ = [
     "CorrelationEngine",
     "EntityCorrelation",
     "PatternCorrelation",
+    "EntityIndex",
+    "TTLCache",
     "CorrelationResult",
     "CorrelationConfig",
     "RulesEngine",
+    "RulePlan",
     "PriorityScore",
     "ScoringRule",
     "ThreatAssessment",
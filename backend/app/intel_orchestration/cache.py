@@ -0,0 +1,279 @@
+"""
+Bounded Caches for G3TI RTCC-UIP Intelligence Orchestration.
+
+This module provides the cache layer shared by the correlation and rules
+engines:
+- LRU eviction bounded by entry count and approximate memory footprint
+- TTL expiry, purged incrementally in write order
+- Tag-based targeted invalidation
+- Hit/miss/eviction/expiration/invalidation metrics
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def approximate_size(obj: Any, _seen: set[int] | None = None) -> int:
+    """
+    Estimate the memory footprint of an object graph in bytes.
+
+    Follows dicts, sequences, sets and pydantic models; shared objects
+    are counted once.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, BaseModel):
+        size += approximate_size(obj.__dict__, seen)
+    elif isinstance(obj, dict):
+        size += sum(
+            approximate_size(k, seen) + approximate_size(v, seen) for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item, seen) for item in obj)
+    return size
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("value", "expires_at", "size", "tags")
+
+    def __init__(self, value: V, expires_at: float | None, size: int, tags: frozenset):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tags
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU cache with optional TTL expiry, memory cap and tag invalidation.
+
+    ``get`` refreshes recency; ``peek``, ``values`` and ``items`` do not, so
+    scans over the cache leave the LRU order untouched. Entries evicted for
+    capacity or expired by TTL are reported through ``on_evict``; explicit
+    ``pop``/``invalidate_tags``/``clear`` calls are not.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 10000,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+        on_evict: Callable[[K, V], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries (None for unbounded)
+            ttl_seconds: Lifetime of an entry after it is written (None for no expiry)
+            max_bytes: Approximate memory cap across all values (None for no cap)
+            sizeof: Value size estimator used with max_bytes
+            on_evict: Callback for entries evicted by capacity or expiry
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or approximate_size
+        self.on_evict = on_evict
+        self.clock = clock
+
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._write_order: OrderedDict[K, None] = OrderedDict()
+        self._tags: dict[Hashable, set[K]] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ==================== Access ====================
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Get a value, refreshing its recency and recording a hit or miss."""
+        entry = self._live_entry(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def peek(self, key: K, default: Any = None) -> V | Any:
+        """Get a value without touching recency or metrics."""
+        entry = self._live_entry(key)
+        return default if entry is None else entry.value
+
+    def set(self, key: K, value: V, tags: Iterable[Hashable] = ()) -> None:
+        """Store a value, evicting least recently used entries as needed."""
+        self._discard(key)
+
+        tag_set = frozenset(tags)
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = self.clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+
+        self._entries[key] = _Entry(value, expires_at, size, tag_set)
+        self._write_order[key] = None
+        self._bytes += size
+        for tag in tag_set:
+            self._tags.setdefault(tag, set()).add(key)
+
+        self.purge_expired()
+        self._enforce_limits(keep=key)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return self._live_entry(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._entries))
+
+    def keys(self) -> list[K]:
+        """Snapshot of live keys from least to most recently used."""
+        self.purge_expired()
+        return list(self._entries)
+
+    def values(self) -> list[V]:
+        """Snapshot of live values without touching recency."""
+        self.purge_expired()
+        return [entry.value for entry in self._entries.values()]
+
+    def items(self) -> list[tuple[K, V]]:
+        """Snapshot of live items without touching recency."""
+        self.purge_expired()
+        return [(key, entry.value) for key, entry in self._entries.items()]
+
+    # ==================== Invalidation ====================
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        """Remove and return a value."""
+        entry = self._discard(key)
+        if entry is None:
+            return default
+        self.invalidations += 1
+        return entry.value
+
+    def invalidate_tags(self, tags: Iterable[Hashable]) -> int:
+        """Remove every entry carrying any of the given tags."""
+        keys: set[K] = set()
+        for tag in tags:
+            keys.update(self._tags.get(tag, ()))
+        for key in keys:
+            self._discard(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry; metrics are kept."""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._write_order.clear()
+        self._tags.clear()
+        self._bytes = 0
+
+    def has_expired(self) -> bool:
+        """Whether any entry is past its TTL."""
+        if self.ttl_seconds is None or not self._write_order:
+            return False
+        expires_at = self._entries[next(iter(self._write_order))].expires_at
+        return expires_at is not None and expires_at <= self.clock()
+
+    def purge_expired(self) -> int:
+        """Drop expired entries, oldest writes first."""
+        if self.ttl_seconds is None:
+            return 0
+
+        now = self.clock()
+        purged = 0
+        while self._write_order:
+            key = next(iter(self._write_order))
+            entry = self._entries[key]
+            if entry.expires_at is None or entry.expires_at > now:
+                break
+            self._discard(key)
+            self.expirations += 1
+            purged += 1
+            if self.on_evict is not None:
+                self.on_evict(key, entry.value)
+        return purged
+
+    # ==================== Metrics ====================
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache size and hit/miss/eviction metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes if self.max_bytes is not None else None,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    # ==================== Internals ====================
+
+    def _live_entry(self, key: K) -> _Entry[V] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self.clock():
+            self._discard(key)
+            self.expirations += 1
+            if self.on_evict is not None:
+                self.on_evict(key, entry.value)
+            return None
+        return entry
+
+    def _discard(self, key: K) -> _Entry[V] | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._write_order.pop(key, None)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return entry
+
+    def _enforce_limits(self, keep: K) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            if key == keep and len(self._entries) == 1:
+                break
+            entry = self._discard(key)
+            self.evictions += 1
+            if self.on_evict is not None and entry is not None:
+                self.on_evict(key, entry.value)
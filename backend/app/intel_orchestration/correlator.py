@@ -15,6 +15,17 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from .cache import TTLCache
+from .entity_index import EntityIndex
+from .fuzzy_matcher import (
+    NameIndex,
+    PlateIndex,
+    levenshtein_similarity,
+    name_similarity,
+    plate_similarity,
+)
+from .locks import AsyncReadWriteLock
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +43,22 @@ class EntityType(str, Enum):
     PATTERN = "pattern"
 
 
+# Key attributes compared for exact matching. Types not listed compare
+# every attribute of the query entity.
+KEY_ATTRIBUTES: dict[EntityType, list[str]] = {
+    EntityType.PERSON: ["ssn", "name", "dob", "drivers_license"],
+    EntityType.VEHICLE: ["vin", "plate", "make_model"],
+    EntityType.WEAPON: ["serial_number", "type", "caliber"],
+    EntityType.LOCATION: ["address", "latitude", "longitude"],
+}
+
+# Attribute compared for fuzzy matching and its blocking index, by entity type
+FUZZY_ATTRIBUTES: dict[EntityType, tuple[str, Any]] = {
+    EntityType.PERSON: ("name", NameIndex),
+    EntityType.VEHICLE: ("plate", PlateIndex),
+}
+
+
 class CorrelationType(str, Enum):
     """Types of correlations."""
     EXACT_MATCH = "exact_match"
@@ -66,7 +93,13 @@ class CorrelationConfig(BaseModel):
     enable_temporal_fusion: bool = True
     enable_geographic_fusion: bool = True
     enable_network_analysis: bool = True
+    enable_candidate_index: bool = True
     cache_ttl_seconds: int = 300
+    correlation_cache_max_entries: int = 10000
+    correlation_cache_max_bytes: int | None = None
+    entity_cache_max_entries: int = 100000
+    entity_cache_ttl_seconds: int | None = 7 * 24 * 3600
+    entity_cache_max_bytes: int | None = None
 
 
 class EntityReference(BaseModel):
@@ -147,10 +180,26 @@ class CorrelationEngine:
 
     def __init__(self, config: CorrelationConfig | None = None):
         self.config = config or CorrelationConfig()
-        self._entity_cache: dict[str, EntityReference] = {}
-        self._correlation_cache: dict[str, list[EntityCorrelation]] = {}
+        self._entity_cache: TTLCache[str, EntityReference] = TTLCache(
+            max_entries=self.config.entity_cache_max_entries,
+            ttl_seconds=self.config.entity_cache_ttl_seconds,
+            max_bytes=self.config.entity_cache_max_bytes,
+            on_evict=self._on_entity_evicted,
+        )
+        self._correlation_cache: TTLCache[str, list[EntityCorrelation]] = TTLCache(
+            max_entries=self.config.correlation_cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            max_bytes=self.config.correlation_cache_max_bytes,
+        )
         self._pattern_cache: dict[str, PatternCorrelation] = {}
-        self._lock = asyncio.Lock()
+        self._index = EntityIndex(
+            key_attributes=KEY_ATTRIBUTES,
+            fuzzy_attributes=FUZZY_ATTRIBUTES,
+            time_bucket_seconds=self.config.temporal_window_hours * 3600,
+            geo_cell_meters=self.config.geographic_radius_meters,
+        )
+        # Lookups share the lock; cache and index mutations are exclusive
+        self._lock = AsyncReadWriteLock()
 
         logger.info("CorrelationEngine initialized")
 
@@ -272,49 +321,62 @@ class CorrelationEngine:
 
         # Check cache first
         cached = self._correlation_cache.get(entity.id)
-        if cached:
+        if cached is not None:
             return CorrelationResult(
                 query_entity_id=entity.id,
                 entity_correlations=cached,
                 total_correlations=len(cached),
             )
 
-        # Perform correlation analysis
-        async with self._lock:
+        # Drop expired entities from the cache and indexes
+        if self._entity_cache.has_expired():
+            async with self._lock.write():
+                self._entity_cache.purge_expired()
+
+        # Perform correlation analysis; other lookups may run concurrently,
+        # so yield to the event loop between matching stages
+        async with self._lock.read():
             # Exact matching
             exact_matches = await self._find_exact_matches(entity)
             entity_correlations.extend(exact_matches)
+            await asyncio.sleep(0)
 
             # Fuzzy matching
             if self.config.enable_probabilistic_matching:
                 fuzzy_matches = await self._find_fuzzy_matches(entity)
                 entity_correlations.extend(fuzzy_matches)
+                await asyncio.sleep(0)
 
             # Temporal correlation
             if self.config.enable_temporal_fusion:
                 temporal_matches = await self._find_temporal_correlations(entity)
                 entity_correlations.extend(temporal_matches)
+                await asyncio.sleep(0)
 
             # Geographic correlation
             if self.config.enable_geographic_fusion:
                 geo_matches = await self._find_geographic_correlations(entity)
                 entity_correlations.extend(geo_matches)
+                await asyncio.sleep(0)
 
             # Pattern detection
             patterns = await self._detect_patterns(entity, entity_correlations)
             pattern_correlations.extend(patterns)
 
-        # Filter by minimum score
-        entity_correlations = [
-            c for c in entity_correlations
-            if c.score >= self.config.min_correlation_score
-        ]
+            # Filter by minimum score
+            entity_correlations = [
+                c for c in entity_correlations
+                if c.score >= self.config.min_correlation_score
+            ]
 
-        # Limit results
-        entity_correlations = entity_correlations[:self.config.max_correlations_per_entity]
+            # Limit results
+            entity_correlations = entity_correlations[:self.config.max_correlations_per_entity]
 
-        # Cache results
-        self._correlation_cache[entity.id] = entity_correlations
+            # Cache results while no writer can have invalidated them,
+            # tagged with the index keys they depend on
+            self._correlation_cache.set(
+                entity.id, entity_correlations, tags=self._dependency_keys(entity)
+            )
 
         elapsed_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
@@ -332,8 +394,15 @@ class CorrelationEngine:
         """Find exact matches for an entity."""
         correlations = []
 
-        for cached_id, cached_entity in self._entity_cache.items():
-            if cached_id == entity.id:
+        if not self.config.enable_candidate_index:
+            candidates = list(self._entity_cache.values())
+        elif self.config.exact_match_threshold <= 0:
+            candidates = self._index.all_of_type(entity.entity_type)
+        else:
+            candidates = self._index.exact_candidates(entity)
+
+        for cached_entity in candidates:
+            if cached_entity.id == entity.id:
                 continue
 
             if cached_entity.entity_type != entity.entity_type:
@@ -372,15 +441,7 @@ class CorrelationEngine:
         if not attrs1 or not attrs2:
             return 0.0
 
-        # Define key attributes by entity type
-        key_attrs = {
-            EntityType.PERSON: ["ssn", "name", "dob", "drivers_license"],
-            EntityType.VEHICLE: ["vin", "plate", "make_model"],
-            EntityType.WEAPON: ["serial_number", "type", "caliber"],
-            EntityType.LOCATION: ["address", "latitude", "longitude"],
-        }
-
-        attrs_to_check = key_attrs.get(entity1.entity_type, list(attrs1.keys()))
+        attrs_to_check = KEY_ATTRIBUTES.get(entity1.entity_type, list(attrs1.keys()))
 
         matches = 0
         total = 0
@@ -412,17 +473,22 @@ class CorrelationEngine:
     ) -> list[EntityCorrelation]:
         """Find fuzzy/probabilistic matches for an entity."""
         correlations = []
+        threshold = self.config.fuzzy_match_threshold
 
-        for cached_id, cached_entity in self._entity_cache.items():
-            if cached_id == entity.id:
-                continue
+        if self.config.enable_candidate_index and threshold > 0:
+            # Blocking index returns candidates already scored
+            scored = self._index.fuzzy_candidates(entity, threshold)
+        else:
+            scored = [
+                (cached_entity, self._calculate_fuzzy_match_score(entity, cached_entity, threshold))
+                for cached_entity in self._entity_cache.values()
+                if cached_entity.entity_type == entity.entity_type
+            ]
 
-            if cached_entity.entity_type != entity.entity_type:
+        for cached_entity, match_score in scored:
+            if cached_entity.id == entity.id:
                 continue
 
-            # Calculate fuzzy match score
-            match_score = self._calculate_fuzzy_match_score(entity, cached_entity)
-
             if match_score >= self.config.fuzzy_match_threshold:
                 correlations.append(EntityCorrelation(
                     entity1_id=entity.id,
@@ -441,9 +507,15 @@ class CorrelationEngine:
         return correlations
 
     def _calculate_fuzzy_match_score(
-        self, entity1: EntityReference, entity2: EntityReference
+        self, entity1: EntityReference, entity2: EntityReference, threshold: float = 0.0
     ) -> float:
-        """Calculate fuzzy match score using probabilistic matching."""
+        """
+        Calculate fuzzy match score using probabilistic matching.
+
+        Names use token-order insensitive Jaro-Winkler and plates use
+        OCR-aware weighted Levenshtein; either may return 0.0 early once
+        the score cannot reach ``threshold``.
+        """
         if entity1.entity_type != entity2.entity_type:
             return 0.0
 
@@ -457,35 +529,23 @@ class CorrelationEngine:
 
         # Name similarity (for persons)
         if entity1.entity_type == EntityType.PERSON:
-            name1 = attrs1.get("name", "").lower()
-            name2 = attrs2.get("name", "").lower()
+            name1 = attrs1.get("name", "")
+            name2 = attrs2.get("name", "")
             if name1 and name2:
-                scores.append(self._string_similarity(name1, name2))
+                scores.append(name_similarity(name1, name2, threshold))
 
         # Plate similarity (for vehicles)
         if entity1.entity_type == EntityType.VEHICLE:
-            plate1 = attrs1.get("plate", "").upper()
-            plate2 = attrs2.get("plate", "").upper()
+            plate1 = attrs1.get("plate", "")
+            plate2 = attrs2.get("plate", "")
             if plate1 and plate2:
-                scores.append(self._string_similarity(plate1, plate2))
+                scores.append(plate_similarity(plate1, plate2, threshold))
 
         return sum(scores) / len(scores) if scores else 0.0
 
     def _string_similarity(self, s1: str, s2: str) -> float:
-        """Calculate string similarity using Levenshtein-like approach."""
-        if s1 == s2:
-            return 1.0
-
-        if not s1 or not s2:
-            return 0.0
-
-        # Simple character overlap similarity
-        set1 = set(s1)
-        set2 = set(s2)
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        return intersection / union if union > 0 else 0.0
+        """Calculate string similarity as normalized Levenshtein distance."""
+        return levenshtein_similarity(s1, s2)
 
     def _get_similarity_factors(
         self, entity1: EntityReference, entity2: EntityReference
@@ -509,8 +569,13 @@ class CorrelationEngine:
         correlations = []
         window = timedelta(hours=self.config.temporal_window_hours)
 
-        for cached_id, cached_entity in self._entity_cache.items():
-            if cached_id == entity.id:
+        if self.config.enable_candidate_index:
+            candidates = self._index.temporal_candidates(entity, window.total_seconds())
+        else:
+            candidates = list(self._entity_cache.values())
+
+        for cached_entity in candidates:
+            if cached_entity.id == entity.id:
                 continue
 
             # Check temporal proximity
@@ -551,8 +616,15 @@ class CorrelationEngine:
         if entity_lat is None or entity_lon is None:
             return correlations
 
-        for cached_id, cached_entity in self._entity_cache.items():
-            if cached_id == entity.id:
+        if self.config.enable_candidate_index:
+            candidates = self._index.geographic_candidates(
+                entity_lat, entity_lon, self.config.geographic_radius_meters
+            )
+        else:
+            candidates = list(self._entity_cache.values())
+
+        for cached_entity in candidates:
+            if cached_entity.id == entity.id:
                 continue
 
             cached_lat = cached_entity.attributes.get("latitude")
@@ -663,14 +735,52 @@ class CorrelationEngine:
 
     async def add_entity(self, entity: EntityReference):
         """Add an entity to the correlation cache."""
-        async with self._lock:
-            self._entity_cache[entity.id] = entity
+        async with self._lock.write():
+            previous = self._entity_cache.peek(entity.id)
+            self._entity_cache.set(entity.id, entity)
+            self._index.add(entity)
+            self._invalidate_related(entity.id, entity, previous)
 
     async def remove_entity(self, entity_id: str):
         """Remove an entity from the cache."""
-        async with self._lock:
-            self._entity_cache.pop(entity_id, None)
-            self._correlation_cache.pop(entity_id, None)
+        async with self._lock.write():
+            entity = self._entity_cache.pop(entity_id)
+            self._index.remove(entity_id)
+            self._invalidate_related(entity_id, entity)
+
+    def _on_entity_evicted(self, entity_id: str, entity: EntityReference):
+        """Keep indexes and correlations consistent with entity cache eviction."""
+        self._index.remove(entity_id)
+        self._invalidate_related(entity_id, entity)
+
+    def _invalidate_related(self, entity_id: str, *entities: EntityReference | None):
+        """Drop cached correlations that the given entity versions could affect."""
+        self._correlation_cache.pop(entity_id)
+        keys: set[Any] = set()
+        for entity in entities:
+            if entity is not None:
+                keys |= self._index.entity_keys(entity)
+        if keys:
+            self._correlation_cache.invalidate_tags(keys)
+
+    def _dependency_keys(self, entity: EntityReference) -> set[Any]:
+        """Index keys of entities that could change an entity's correlations."""
+        return self._index.dependency_keys(
+            entity,
+            exact_threshold=self.config.exact_match_threshold,
+            fuzzy_threshold=(
+                self.config.fuzzy_match_threshold
+                if self.config.enable_probabilistic_matching else None
+            ),
+            window_seconds=(
+                self.config.temporal_window_hours * 3600
+                if self.config.enable_temporal_fusion else None
+            ),
+            radius_meters=(
+                self.config.geographic_radius_meters
+                if self.config.enable_geographic_fusion else None
+            ),
+        )
 
     async def infer_threat_trajectory(
         self, entity_id: str
@@ -765,12 +875,15 @@ class CorrelationEngine:
                 len(v) for v in self._correlation_cache.values()
             ),
             "patterns_cached": len(self._pattern_cache),
+            "entity_cache": self._entity_cache.stats(),
+            "correlation_cache": self._correlation_cache.stats(),
             "config": self.config.model_dump(),
         }
 
     async def clear_cache(self):
         """Clear all caches."""
-        async with self._lock:
+        async with self._lock.write():
             self._entity_cache.clear()
+            self._index.clear()
             self._correlation_cache.clear()
             self._pattern_cache.clear()
@@ -0,0 +1,425 @@
+"""
+Entity Candidate Index for G3TI RTCC-UIP.
+
+This module maintains secondary indexes over the correlation engine's
+entity cache so candidate generation no longer scans every cached entity:
+- Hash index on key attributes (plate, VIN, SSN, DL, ...) for exact matching
+- Fuzzy blocking indexes for name/plate matching (see fuzzy_matcher)
+- Time-bucketed index for temporal window queries
+- Spatial grid index for geographic radius queries
+
+Exact, temporal and geographic indexes only narrow the candidate set; the
+correlator still scores every candidate, so results are identical to a full
+scan. Candidates are returned in cache insertion order to preserve result
+ordering.
+"""
+
+import math
+from collections.abc import Callable, Hashable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from .fuzzy_matcher import FuzzyIndex
+
+EARTH_RADIUS_METERS = 6371000.0
+METERS_PER_DEGREE = 2 * math.pi * EARTH_RADIUS_METERS / 360.0
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+
+class EntityIndex:
+    """
+    Secondary indexes over cached correlation entities.
+
+    Entities are any objects exposing ``id``, ``entity_type``, ``attributes``
+    and ``timestamp``. Indexes are updated incrementally on add/remove;
+    exact, temporal and geographic lookups return a superset of the
+    entities that could pass the corresponding correlation check.
+    """
+
+    # Above this many time buckets or grid cells, a query depends on a wide key
+    MAX_DEPENDENCY_KEYS = 4096
+
+    def __init__(
+        self,
+        key_attributes: dict[Any, list[str]],
+        fuzzy_attributes: dict[Any, tuple[str, Callable[[], FuzzyIndex]]],
+        time_bucket_seconds: float = 3600.0,
+        geo_cell_meters: float = 1000.0,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            key_attributes: Exact-match attributes by entity type; types not
+                listed index every attribute
+            fuzzy_attributes: Fuzzy-match attribute and blocking index
+                factory by entity type
+            time_bucket_seconds: Width of each temporal bucket
+            geo_cell_meters: Approximate edge of each spatial grid cell
+        """
+        self.key_attributes = key_attributes
+        self.fuzzy_attributes = fuzzy_attributes
+        self.time_bucket_seconds = max(1.0, time_bucket_seconds)
+
+        # Use an even number of columns per turn so cells tile [-180, 180) exactly
+        cell_degrees = max(1e-6, geo_cell_meters / METERS_PER_DEGREE)
+        self._cols_per_turn = 2 * math.ceil(180.0 / cell_degrees)
+        self.geo_cell_degrees = 360.0 / self._cols_per_turn
+
+        self._reset()
+
+    def _reset(self) -> None:
+        self._entities: dict[str, Any] = {}
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+
+        self._by_type: dict[Any, set[str]] = {}
+        self._attr_index: dict[tuple[Any, str, Hashable], set[str]] = {}
+        self._unhashable: dict[Any, set[str]] = {}
+        self._fuzzy: dict[Any, FuzzyIndex] = {
+            etype: factory() for etype, (_, factory) in self.fuzzy_attributes.items()
+        }
+        self._time_index: dict[int, set[str]] = {}
+        self._time_keys: dict[str, int] = {}
+        self._geo_index: dict[tuple[int, int], set[str]] = {}
+        self._geo_keys: dict[str, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # ==================== Maintenance ====================
+
+    def add(self, entity: Any) -> None:
+        """Index an entity, replacing any previous version with the same ID."""
+        if entity.id in self._entities:
+            self._unindex(self._entities[entity.id])
+        else:
+            self._seq[entity.id] = self._next_seq
+            self._next_seq += 1
+
+        self._entities[entity.id] = entity
+        self._index(entity)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from all indexes."""
+        entity = self._entities.pop(entity_id, None)
+        if entity is None:
+            return
+        self._unindex(entity)
+        self._seq.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Remove every entity from all indexes."""
+        self._reset()
+
+    def _indexed_attributes(self, entity: Any) -> Iterable[str]:
+        keys = self.key_attributes.get(entity.entity_type)
+        return keys if keys is not None else list(entity.attributes.keys())
+
+    def _index(self, entity: Any) -> None:
+        eid = entity.id
+        etype = entity.entity_type
+        self._by_type.setdefault(etype, set()).add(eid)
+
+        for attr in self._indexed_attributes(entity):
+            if attr not in entity.attributes:
+                continue
+            value = entity.attributes[attr]
+            if isinstance(value, Hashable):
+                self._attr_index.setdefault((etype, attr, value), set()).add(eid)
+            else:
+                self._unhashable.setdefault(etype, set()).add(eid)
+
+        value = self.fuzzy_value(entity)
+        if value is not None:
+            self._fuzzy[etype].add(eid, value)
+
+        time_key = self._time_bucket(self._epoch_seconds(entity.timestamp))
+        self._time_keys[eid] = time_key
+        self._time_index.setdefault(time_key, set()).add(eid)
+
+        point = self._point(entity.attributes)
+        if point is not None:
+            geo_key = self._geo_cell(*point)
+            self._geo_keys[eid] = geo_key
+            self._geo_index.setdefault(geo_key, set()).add(eid)
+
+    def _unindex(self, entity: Any) -> None:
+        eid = entity.id
+        etype = entity.entity_type
+        self._discard(self._by_type, etype, eid)
+
+        for attr in self._indexed_attributes(entity):
+            if attr not in entity.attributes:
+                continue
+            value = entity.attributes[attr]
+            if isinstance(value, Hashable):
+                self._discard(self._attr_index, (etype, attr, value), eid)
+        self._discard(self._unhashable, etype, eid)
+
+        if etype in self._fuzzy:
+            self._fuzzy[etype].remove(eid)
+
+        self._discard(self._time_index, self._time_keys.pop(eid), eid)
+
+        geo_key = self._geo_keys.pop(eid, None)
+        if geo_key is not None:
+            self._discard(self._geo_index, geo_key, eid)
+
+    @staticmethod
+    def _discard(index: dict[Any, set[str]], key: Any, eid: str) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(eid)
+            if not bucket:
+                del index[key]
+
+    def _ordered(self, ids: Iterable[str]) -> list[Any]:
+        return [self._entities[eid] for eid in sorted(ids, key=self._seq.__getitem__)]
+
+    # ==================== Candidate Lookup ====================
+
+    def all_entities(self) -> list[Any]:
+        """Get every indexed entity in insertion order."""
+        return self._ordered(self._entities)
+
+    def all_of_type(self, entity_type: Any) -> list[Any]:
+        """Get all indexed entities of a type."""
+        return self._ordered(self._by_type.get(entity_type, ()))
+
+    def exact_candidates(self, entity: Any) -> list[Any]:
+        """Get same-type entities sharing at least one key attribute value."""
+        etype = entity.entity_type
+        ids: set[str] = set(self._unhashable.get(etype, ()))
+
+        for attr in self.key_attributes.get(etype, list(entity.attributes.keys())):
+            if attr not in entity.attributes:
+                continue
+            value = entity.attributes[attr]
+            if isinstance(value, Hashable):
+                ids.update(self._attr_index.get((etype, attr, value), ()))
+
+        return self._ordered(ids)
+
+    def fuzzy_value(self, entity: Any) -> str | None:
+        """Get the raw fuzzy-match value for an entity, if it has one."""
+        spec = self.fuzzy_attributes.get(entity.entity_type)
+        if spec is None:
+            return None
+        value = entity.attributes.get(spec[0])
+        if not isinstance(value, str) or not value:
+            return None
+        return value
+
+    def fuzzy_candidates(self, entity: Any, threshold: float) -> list[tuple[Any, float]]:
+        """
+        Get same-type entities whose fuzzy value scores at least ``threshold``.
+
+        Returns (entity, score) pairs scored by the type's blocking index.
+        """
+        value = self.fuzzy_value(entity)
+        if value is None:
+            return []
+
+        scores = self._fuzzy[entity.entity_type].search(value, threshold)
+        return [(e, scores[e.id]) for e in self._ordered(scores)]
+
+    def temporal_candidates(self, entity: Any, window_seconds: float) -> list[Any]:
+        """Get entities in time buckets overlapping the window around an entity."""
+        first, last = self._time_range(entity, window_seconds)
+
+        ids: set[str] = set()
+        if last - first + 1 > len(self._time_index):
+            for bucket, bucket_ids in self._time_index.items():
+                if first <= bucket <= last:
+                    ids.update(bucket_ids)
+        else:
+            for bucket in range(first, last + 1):
+                ids.update(self._time_index.get(bucket, ()))
+        return self._ordered(ids)
+
+    def geographic_candidates(self, lat: Any, lon: Any, radius_meters: float) -> list[Any]:
+        """Get entities in grid cells intersecting a radius around a point."""
+        cells = self._geo_range(lat, lon, radius_meters)
+        if cells is None:
+            return []
+        row_min, row_max, cols = cells
+
+        ids: set[str] = set()
+        n_cells = (row_max - row_min + 1) * (len(cols) if cols is not None else self._cols_per_turn)
+        if cols is None or n_cells > len(self._geo_index):
+            for (row, col), bucket_ids in self._geo_index.items():
+                if row_min <= row <= row_max and (cols is None or col in cols):
+                    ids.update(bucket_ids)
+        else:
+            for row in range(row_min, row_max + 1):
+                for col in cols:
+                    ids.update(self._geo_index.get((row, col), ()))
+        return self._ordered(ids)
+
+    # ==================== Invalidation Keys ====================
+
+    def entity_keys(self, entity: Any) -> set[Hashable]:
+        """
+        Keys an entity contributes to the indexes.
+
+        A cached correlation result tagged with dependency_keys() can only
+        change when an entity sharing one of these keys is added or removed.
+        """
+        etype = entity.entity_type
+        keys: set[Hashable] = {
+            ("type", etype),
+            ("time", self._time_bucket(self._epoch_seconds(entity.timestamp))),
+            ("time-wide",),
+        }
+
+        for attr in self._indexed_attributes(entity):
+            if attr not in entity.attributes:
+                continue
+            value = entity.attributes[attr]
+            if isinstance(value, Hashable):
+                keys.add(("attr", etype, attr, value))
+            else:
+                keys.add(("unhashable", etype))
+
+        value = self.fuzzy_value(entity)
+        if value is not None:
+            keys.update(("fuzzy", etype, k) for k in self._fuzzy[etype].index_keys(value))
+
+        point = self._point(entity.attributes)
+        if point is not None:
+            keys.add(("geo", self._geo_cell(*point)))
+            keys.add(("geo-wide",))
+        return keys
+
+    def dependency_keys(
+        self,
+        entity: Any,
+        exact_threshold: float | None = None,
+        fuzzy_threshold: float | None = None,
+        window_seconds: float | None = None,
+        radius_meters: float | None = None,
+    ) -> set[Hashable]:
+        """
+        Keys of entities that could appear in a correlation query's result.
+
+        Pass None for a matcher that is disabled.
+        """
+        etype = entity.entity_type
+        keys: set[Hashable] = set()
+
+        if exact_threshold is not None:
+            if exact_threshold <= 0:
+                keys.add(("type", etype))
+            else:
+                keys.add(("unhashable", etype))
+                for attr in self.key_attributes.get(etype, list(entity.attributes.keys())):
+                    value = entity.attributes.get(attr)
+                    if attr in entity.attributes and isinstance(value, Hashable):
+                        keys.add(("attr", etype, attr, value))
+
+        if fuzzy_threshold is not None:
+            value = self.fuzzy_value(entity)
+            if fuzzy_threshold <= 0:
+                keys.add(("type", etype))
+            elif value is not None:
+                blocks = self._fuzzy[etype].query_keys(value, fuzzy_threshold)
+                if blocks is None:
+                    keys.add(("type", etype))
+                else:
+                    keys.update(("fuzzy", etype, k) for k in blocks)
+
+        if window_seconds is not None:
+            first, last = self._time_range(entity, window_seconds)
+            if last - first >= self.MAX_DEPENDENCY_KEYS:
+                keys.add(("time-wide",))
+            else:
+                keys.update(("time", bucket) for bucket in range(first, last + 1))
+
+        if radius_meters is not None:
+            cells = self._geo_range(
+                entity.attributes.get("latitude"), entity.attributes.get("longitude"), radius_meters
+            )
+            if cells is not None:
+                row_min, row_max, cols = cells
+                if cols is None or (row_max - row_min + 1) * len(cols) > self.MAX_DEPENDENCY_KEYS:
+                    keys.add(("geo-wide",))
+                else:
+                    keys.update(
+                        ("geo", (row, col)) for row in range(row_min, row_max + 1) for col in cols
+                    )
+        return keys
+
+    # ==================== Keys ====================
+
+    def _time_range(self, entity: Any, window_seconds: float) -> tuple[int, int]:
+        """First and last time bucket overlapping the window around an entity."""
+        ts = self._epoch_seconds(entity.timestamp)
+        return self._time_bucket(ts - window_seconds), self._time_bucket(ts + window_seconds)
+
+    def _geo_range(
+        self, lat: Any, lon: Any, radius_meters: float
+    ) -> tuple[int, int, set[int] | None] | None:
+        """Grid rows and columns intersecting a radius; None columns means all."""
+        point = self._point({"latitude": lat, "longitude": lon})
+        if point is None:
+            return None
+        lat, lon = point
+
+        # Great-circle bounding box (with a small margin for rounding)
+        angular = max(0.0, radius_meters) / EARTH_RADIUS_METERS
+        lat_delta = math.degrees(angular) + 1e-9
+        min_lat, max_lat = lat - lat_delta, lat + lat_delta
+
+        cos_lat = math.cos(math.radians(lat))
+        if max_lat >= 90 or min_lat <= -90 or angular >= math.pi / 2:
+            lon_delta = 180.0
+        else:
+            ratio = math.sin(angular) / cos_lat
+            lon_delta = 180.0 if ratio >= 1 else math.degrees(math.asin(ratio)) + 1e-9
+
+        row_min = math.floor(min_lat / self.geo_cell_degrees)
+        row_max = math.floor(max_lat / self.geo_cell_degrees)
+
+        cols: set[int] | None = None
+        col_min = math.floor((lon - lon_delta) / self.geo_cell_degrees)
+        col_max = math.floor((lon + lon_delta) / self.geo_cell_degrees)
+        if lon_delta < 180.0 and col_max - col_min + 1 < self._cols_per_turn:
+            cols = {self._wrap_col(c) for c in range(col_min, col_max + 1)}
+        return row_min, row_max, cols
+
+    @staticmethod
+    def _epoch_seconds(timestamp: datetime) -> float:
+        """Seconds since the epoch, linear for both naive and aware datetimes."""
+        epoch = _EPOCH_NAIVE if timestamp.tzinfo is None else _EPOCH_UTC
+        return (timestamp - epoch).total_seconds()
+
+    def _time_bucket(self, seconds: float) -> int:
+        return math.floor(seconds / self.time_bucket_seconds)
+
+    def _geo_cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.geo_cell_degrees),
+            self._wrap_col(math.floor(lon / self.geo_cell_degrees)),
+        )
+
+    def _wrap_col(self, col: int) -> int:
+        """Map a longitude column into the range covering [-180, 180)."""
+        half = self._cols_per_turn // 2
+        return (col + half) % self._cols_per_turn - half
+
+    @staticmethod
+    def _point(attributes: dict[str, Any]) -> tuple[float, float] | None:
+        lat = attributes.get("latitude")
+        lon = attributes.get("longitude")
+        if lat is None or lon is None:
+            return None
+        try:
+            lat, lon = float(lat), float(lon)
+        except (TypeError, ValueError):
+            return None
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            return None
+        return lat, lon
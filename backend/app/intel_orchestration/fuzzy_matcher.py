@@ -0,0 +1,597 @@
+"""
+Fuzzy Matcher for G3TI RTCC-UIP.
+
+This module provides edit-distance based fuzzy matching for the correlation
+engine's license plate and person name comparisons:
+- OCR-aware weighted Levenshtein similarity for plates (0/O, 8/B, 1/I, ...)
+- Jaro-Winkler similarity for person names, token-order insensitive
+- Blocking indexes that select candidates without scanning every value:
+  padded q-grams with a count filter for plates, Soundex codes for names
+- Vectorized bulk plate scoring with early exit at the match threshold
+"""
+
+import math
+import re
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# Characters license plate OCR commonly confuses, grouped by look-alike class
+OCR_CONFUSIONS: list[str] = ["0OQD", "1IL", "8B", "5S", "2Z", "6G"]
+
+# Substitution cost for two characters in the same OCR confusion class
+OCR_SUBSTITUTION_COST = 0.25
+
+_PLATE_STRIP = re.compile(r"[^A-Z0-9]")
+_NAME_STRIP = re.compile(r"[^a-z\s]")
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def _build_cost_table() -> np.ndarray:
+    table = np.ones((256, 256), dtype=np.float64)
+    np.fill_diagonal(table, 0.0)
+    for group in OCR_CONFUSIONS:
+        for a in group:
+            for b in group:
+                if a != b:
+                    table[ord(a), ord(b)] = OCR_SUBSTITUTION_COST
+    return table
+
+
+_COST_TABLE = _build_cost_table()
+_COST_ROWS: list[list[float]] = _COST_TABLE.tolist()
+_CANONICAL = {c: group[0] for group in OCR_CONFUSIONS for c in group}
+
+
+# ==================== Normalization ====================
+
+
+def normalize_plate(plate: str) -> str:
+    """Uppercase a plate and strip everything but letters and digits."""
+    return _PLATE_STRIP.sub("", plate.upper())
+
+
+def canonical_plate(plate: str) -> str:
+    """Map every OCR-confusable character of a normalized plate to one form."""
+    return "".join(_CANONICAL.get(c, c) for c in plate)
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name, drop punctuation and collapse whitespace."""
+    return " ".join(_NAME_STRIP.sub("", name.lower()).split())
+
+
+def soundex(token: str) -> str:
+    """Compute the American Soundex code of a lowercase token."""
+    if not token:
+        return ""
+
+    code = token[0].upper()
+    last = _SOUNDEX_CODES.get(token[0], "")
+    for char in token[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+# ==================== Scoring ====================
+
+
+def plate_distance(a: str, b: str, max_distance: float = math.inf) -> float:
+    """
+    Weighted Levenshtein distance between two normalized plates.
+
+    OCR-confusable substitutions cost OCR_SUBSTITUTION_COST, every other
+    edit costs 1. Returns math.inf as soon as the distance must exceed
+    ``max_distance``.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return math.inf
+
+    prev = [float(j) for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        costs = _COST_ROWS[ord(ca)]
+        cur = [float(i)]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + costs[ord(cb)], prev[j] + 1.0, cur[j - 1] + 1.0))
+        if min(cur) > max_distance:
+            return math.inf
+        prev = cur
+    return prev[-1] if prev[-1] <= max_distance else math.inf
+
+
+def plate_similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    OCR-aware similarity between two plates in [0, 1].
+
+    Returns 0.0 early once the similarity cannot reach ``threshold``.
+    """
+    a, b = normalize_plate(a), normalize_plate(b)
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+
+    longest = max(len(a), len(b))
+    distance = plate_distance(a, b, (1.0 - threshold) * longest + 1e-9)
+    if math.isinf(distance):
+        return 0.0
+    return 1.0 - distance / longest
+
+
+def levenshtein_similarity(a: str, b: str) -> float:
+    """Unweighted normalized Levenshtein similarity in [0, 1]."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + (ca != cb), prev[j] + 1, cur[j - 1] + 1))
+        prev = cur
+    return 1.0 - prev[-1] / max(len(a), len(b))
+
+
+def _jaro_upper_bound(matches: int, len1: int, len2: int) -> float:
+    """Largest Jaro-Winkler score reachable with ``matches`` matching chars."""
+    jaro = (matches / len1 + matches / len2 + 1.0) / 3.0
+    return jaro + 0.4 * (1.0 - jaro)
+
+
+def jaro_winkler(s1: str, s2: str, threshold: float = 0.0) -> float:
+    """
+    Jaro-Winkler similarity with a prefix scale of 0.1 (max prefix 4).
+
+    Returns 0.0 early once the similarity cannot reach ``threshold``.
+    """
+    if s1 == s2:
+        return 1.0 if s1 else 0.0
+    len1, len2 = len(s1), len(s2)
+    if not len1 or not len2:
+        return 0.0
+    if _jaro_upper_bound(min(len1, len2), len1, len2) < threshold:
+        return 0.0
+
+    window = max(0, max(len1, len2) // 2 - 1)
+    used = [False] * len2
+    matched1 = []
+    for i, char in enumerate(s1):
+        for j in range(max(0, i - window), min(len2, i + window + 1)):
+            if not used[j] and s2[j] == char:
+                used[j] = True
+                matched1.append(char)
+                break
+
+    matches = len(matched1)
+    if not matches or _jaro_upper_bound(matches, len1, len2) < threshold:
+        return 0.0
+
+    matched2 = [s2[j] for j in range(len2) if used[j]]
+    transpositions = sum(a != b for a, b in zip(matched1, matched2, strict=True)) // 2
+    jaro = (matches / len1 + matches / len2 + (matches - transpositions) / matches) / 3.0
+
+    prefix = 0
+    for a, b in zip(s1[:4], s2[:4], strict=False):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1.0 - jaro)
+
+
+def name_similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    Jaro-Winkler similarity between two names, insensitive to token order.
+
+    Returns 0.0 early once the similarity cannot reach ``threshold``.
+    """
+    a, b = normalize_name(a), normalize_name(b)
+    if not a or not b:
+        return 0.0
+    score = jaro_winkler(a, b, threshold)
+    if score < 1.0:
+        sorted_a, sorted_b = " ".join(sorted(a.split())), " ".join(sorted(b.split()))
+        if (sorted_a, sorted_b) != (a, b):
+            score = max(score, jaro_winkler(sorted_a, sorted_b, threshold))
+    return score
+
+
+def plate_similarities(
+    query: str, plates: np.ndarray, lengths: np.ndarray, threshold: float = 0.0
+) -> np.ndarray:
+    """
+    Vectorized OCR-aware similarity of one plate against many.
+
+    Args:
+        query: Normalized query plate
+        plates: (N, W) uint8 matrix of zero-padded normalized plates
+        lengths: (N,) plate lengths
+        threshold: Minimum similarity of interest; candidates whose
+            distance exceeds the bound are dropped early and score 0.0
+
+    Returns:
+        (N,) float64 similarities
+    """
+    count = len(lengths)
+    scores = np.zeros(count, dtype=np.float64)
+    if not query or count == 0:
+        return scores
+
+    qlen = len(query)
+    width = plates.shape[1]
+    longest = np.maximum(lengths, qlen).astype(np.float64)
+    bound = (1.0 - threshold) * longest + 1e-9
+
+    rows = np.flatnonzero(np.abs(lengths.astype(np.int64) - qlen) <= bound)
+    offsets = np.arange(width + 1, dtype=np.float64)
+    prev = np.broadcast_to(offsets, (len(rows), width + 1)).copy()
+    cand = plates[rows]
+
+    for i, char in enumerate(query.encode("ascii"), 1):
+        step = np.empty_like(prev)
+        step[:, 0] = i
+        step[:, 1:] = np.minimum(prev[:, :-1] + _COST_TABLE[char][cand], prev[:, 1:] + 1.0)
+        # Insertions: cur[j] = min_k (step[k] + j - k), a running minimum
+        prev = np.minimum.accumulate(step - offsets, axis=1) + offsets
+
+        keep = prev.min(axis=1) <= bound[rows]
+        if not keep.all():
+            rows, prev, cand = rows[keep], prev[keep], cand[keep]
+            if not len(rows):
+                return scores
+
+    distance = prev[np.arange(len(rows)), lengths[rows]]
+    ok = distance <= bound[rows]
+    scores[rows[ok]] = 1.0 - distance[ok] / longest[rows[ok]]
+    return scores
+
+
+# ==================== Blocking Indexes ====================
+
+
+class FuzzyIndex(ABC):
+    """
+    Base interface for fuzzy-match blocking indexes.
+
+    Indexes map entity IDs to one string value each and return scored
+    candidates at or above a similarity threshold.
+    """
+
+    @abstractmethod
+    def add(self, entity_id: str, value: str) -> None:
+        """Index a value, replacing any previous value for the entity."""
+        pass
+
+    @abstractmethod
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity's value."""
+        pass
+
+    @abstractmethod
+    def search(self, value: str, threshold: float) -> dict[str, float]:
+        """Get entity IDs scoring at least ``threshold`` against a value."""
+        pass
+
+    @abstractmethod
+    def similarity(self, a: str, b: str, threshold: float = 0.0) -> float:
+        """Score two raw values with this index's similarity measure."""
+        pass
+
+    @abstractmethod
+    def index_keys(self, value: str) -> set[str]:
+        """Blocking keys a value is indexed under."""
+        pass
+
+    @abstractmethod
+    def query_keys(self, value: str, threshold: float) -> set[str] | None:
+        """
+        Blocking keys every match of a query must share at least one of.
+
+        Returns None when a match may share no key with the query.
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of indexed entities."""
+        pass
+
+
+class PlateIndex(FuzzyIndex):
+    """
+    Padded q-gram index over OCR-canonical plates.
+
+    A plate within weighted distance d of the query differs from it by at
+    most floor(d) non-OCR edits, so with q-grams of the canonical forms the
+    q-gram lemma gives a lossless count filter. Surviving candidates are
+    scored in bulk with the vectorized weighted Levenshtein.
+    """
+
+    Q = 2
+    PAD_START = "^"
+    PAD_END = "$"
+
+    def __init__(self, initial_capacity: int = 1024):
+        """
+        Initialize the plate index.
+
+        Args:
+            initial_capacity: Number of plate slots to preallocate
+        """
+        self._reset(initial_capacity)
+
+    def _reset(self, initial_capacity: int) -> None:
+        self._slots: dict[str, int] = {}
+        self._slot_ids: list[str | None] = []
+        self._plates = np.zeros((initial_capacity, 8), dtype=np.uint8)
+        self._lengths = np.zeros(initial_capacity, dtype=np.int64)
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+        self._postings: dict[str, list[int]] = {}
+        self._posting_arrays: dict[str, np.ndarray] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _grams(self, plate: str) -> list[str]:
+        padded = self.PAD_START * (self.Q - 1) + canonical_plate(plate) + self.PAD_END * (self.Q - 1)
+        return [padded[i:i + self.Q] for i in range(len(padded) - self.Q + 1)]
+
+    def _grow(self, slots: int, width: int) -> None:
+        capacity, current_width = self._plates.shape
+        if slots <= capacity and width <= current_width:
+            return
+        new_capacity = max(capacity, 1)
+        while new_capacity < slots:
+            new_capacity *= 2
+        new_width = max(current_width, width)
+
+        plates = np.zeros((new_capacity, new_width), dtype=np.uint8)
+        plates[:capacity, :current_width] = self._plates
+        self._plates = plates
+        self._lengths = np.resize(self._lengths, new_capacity)
+        self._lengths[capacity:] = 0
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[:capacity] = self._alive
+        self._alive = alive
+
+    def add(self, entity_id: str, value: str) -> None:
+        """Index a plate, replacing any previous plate for the entity."""
+        self.remove(entity_id)
+        plate = normalize_plate(value)
+        if not plate:
+            return
+
+        slot = len(self._slot_ids)
+        encoded = plate.encode("ascii")
+        self._grow(slot + 1, len(encoded))
+        self._plates[slot, :len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+        self._lengths[slot] = len(encoded)
+        self._alive[slot] = True
+        self._slot_ids.append(entity_id)
+        self._slots[entity_id] = slot
+
+        for gram in self._grams(plate):
+            self._postings.setdefault(gram, []).append(slot)
+            self._posting_arrays.pop(gram, None)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity's plate."""
+        slot = self._slots.pop(entity_id, None)
+        if slot is None:
+            return
+        self._alive[slot] = False
+        self._slot_ids[slot] = None
+        self._dead += 1
+        if self._dead > 1024 and self._dead > len(self._slots):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the index without tombstoned slots."""
+        live = [
+            (eid, self._plates[slot, :self._lengths[slot]].tobytes().decode("ascii"))
+            for eid, slot in self._slots.items()
+        ]
+        self._reset(max(1024, len(live)))
+        for eid, plate in live:
+            self.add(eid, plate)
+
+    def _posting(self, gram: str) -> np.ndarray:
+        array = self._posting_arrays.get(gram)
+        if array is None:
+            array = np.asarray(self._postings.get(gram, ()), dtype=np.int64)
+            self._posting_arrays[gram] = array
+        return array
+
+    def _count_filter(
+        self, lengths: np.ndarray, qlen: int, threshold: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (length-eligible mask, required shared q-grams) per length."""
+        longest = np.maximum(lengths, qlen)
+        # Non-OCR edits allowed for each candidate length
+        edits = np.floor((1.0 - threshold) * longest + 1e-9).astype(np.int64)
+        # q-gram lemma: k edits destroy at most q * k padded q-grams
+        required = longest + self.Q - 1 - self.Q * edits
+        return np.abs(lengths - qlen) <= edits, required
+
+    def _gram_filter_complete(self, qlen: int, threshold: float) -> bool:
+        """Whether every plate that can match shares at least one q-gram."""
+        if threshold <= 0:
+            return False
+        # Matches satisfy |L - qlen| <= (1 - t) * L, so L <= qlen / t
+        possible = np.arange(1, int(qlen / threshold) + 2)
+        length_ok, required = self._count_filter(possible, qlen, threshold)
+        return not (length_ok & (required <= 0)).any()
+
+    def _candidate_slots(self, plate: str, threshold: float) -> np.ndarray:
+        """Apply the length and q-gram count filters."""
+        n_slots = len(self._slot_ids)
+        qlen = len(plate)
+        hits = np.concatenate([self._posting(g) for g in self._grams(plate)])
+
+        if not self._gram_filter_complete(qlen, threshold):
+            # Plates sharing no q-gram can still match; filter every slot
+            lengths = self._lengths[:n_slots]
+            length_ok, required = self._count_filter(lengths, qlen, threshold)
+            shared = np.bincount(hits, minlength=n_slots)
+            return np.flatnonzero(self._alive[:n_slots] & length_ok & (shared >= required))
+
+        slots, shared = np.unique(hits, return_counts=True)
+        length_ok, required = self._count_filter(self._lengths[slots], qlen, threshold)
+        return slots[self._alive[slots] & length_ok & (shared >= required)]
+
+    def search(self, value: str, threshold: float) -> dict[str, float]:
+        """Get entity IDs whose plate scores at least ``threshold``."""
+        plate = normalize_plate(value)
+        if not plate or not self._slots:
+            return {}
+
+        slots = self._candidate_slots(plate, threshold)
+        scores = plate_similarities(plate, self._plates[slots], self._lengths[slots], threshold)
+        return {
+            self._slot_ids[slot]: float(score)
+            for slot, score in zip(slots, scores, strict=True)
+            if score >= threshold and score > 0.0
+        }
+
+    def similarity(self, a: str, b: str, threshold: float = 0.0) -> float:
+        """Score two raw plates."""
+        return plate_similarity(a, b, threshold)
+
+    def index_keys(self, value: str) -> set[str]:
+        """Canonical q-grams of a plate."""
+        plate = normalize_plate(value)
+        return set(self._grams(plate)) if plate else set()
+
+    def query_keys(self, value: str, threshold: float) -> set[str] | None:
+        """Canonical q-grams of a plate, when the count filter guarantees one is shared."""
+        plate = normalize_plate(value)
+        if not plate:
+            return set()
+        if not self._gram_filter_complete(len(plate), threshold):
+            return None
+        return set(self._grams(plate))
+
+
+class NameIndex(FuzzyIndex):
+    """
+    Phonetic blocking index over person names.
+
+    Candidates share the Soundex code of at least one name token, which
+    tolerates spelling variants ("Jon Smyth" / "John Smith") and token
+    reordering. Tokens are also blocked on their Soundex digits without
+    the initial letter, so variants differing only in how the first sound
+    is spelled ("Catherine" / "Katherine", "Philip" / "Filip") still
+    meet. Candidates are scored with token-order insensitive Jaro-Winkler.
+    """
+
+    def __init__(self):
+        """Initialize the name index."""
+        self._names: dict[str, str] = {}
+        self._codes: dict[str, set[str]] = {}
+        self._blocks: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def blocking_keys(name: str) -> set[str]:
+        """
+        Soundex codes of a normalized name's tokens, with and without the initial.
+
+        Initial-free keys are skipped for tokens with no coded consonants
+        ("000"), which would otherwise put every short name in one block.
+        """
+        keys = set()
+        for token in name.split():
+            code = soundex(token)
+            keys.add(code)
+            if code[1:] != "000":
+                keys.add(code[1:])
+        return keys
+
+    def add(self, entity_id: str, value: str) -> None:
+        """Index a name, replacing any previous name for the entity."""
+        self.remove(entity_id)
+        name = normalize_name(value)
+        if not name:
+            return
+
+        codes = self.blocking_keys(name)
+        self._names[entity_id] = name
+        self._codes[entity_id] = codes
+        for code in codes:
+            self._blocks.setdefault(code, set()).add(entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity's name."""
+        self._names.pop(entity_id, None)
+        for code in self._codes.pop(entity_id, ()):
+            block = self._blocks.get(code)
+            if block is not None:
+                block.discard(entity_id)
+                if not block:
+                    del self._blocks[code]
+
+    def search(self, value: str, threshold: float) -> dict[str, float]:
+        """Get entity IDs whose name scores at least ``threshold``."""
+        name = normalize_name(value)
+        if not name:
+            return {}
+
+        candidates: set[str] = set()
+        for code in self.blocking_keys(name):
+            candidates.update(self._blocks.get(code, ()))
+
+        results: dict[str, float] = {}
+        for entity_id in candidates:
+            score = name_similarity(name, self._names[entity_id], threshold)
+            if score >= threshold and score > 0.0:
+                results[entity_id] = score
+        return results
+
+    def similarity(self, a: str, b: str, threshold: float = 0.0) -> float:
+        """Score two raw names."""
+        return name_similarity(a, b, threshold)
+
+    def index_keys(self, value: str) -> set[str]:
+        """Soundex blocking keys of a name's tokens."""
+        return self.blocking_keys(normalize_name(value))
+
+    def query_keys(self, value: str, threshold: float) -> set[str] | None:
+        """Soundex blocking keys of a name's tokens; search only visits these blocks."""
+        return self.blocking_keys(normalize_name(value))
+
+
+def build_plate_matrix(plates: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode plates into the zero-padded matrix used for bulk scoring.
+
+    Args:
+        plates: Raw plate strings
+
+    Returns:
+        (matrix, lengths) for plate_similarities
+    """
+    encoded = [normalize_plate(p).encode("ascii") for p in plates]
+    width = max((len(e) for e in encoded), default=0)
+    matrix = np.zeros((len(encoded), max(width, 1)), dtype=np.uint8)
+    for row, value in enumerate(encoded):
+        matrix[row, :len(value)] = np.frombuffer(value, dtype=np.uint8)
+    return matrix, np.array([len(e) for e in encoded], dtype=np.int64)
+
@@ -0,0 +1,69 @@
+"""
+Async Locking Primitives for G3TI RTCC-UIP Intelligence Orchestration.
+
+This module provides a readers-writer lock so correlation lookups can run
+concurrently while cache and index mutations remain exclusive.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class AsyncReadWriteLock:
+    """
+    Readers-writer lock for asyncio tasks.
+
+    Any number of readers may hold the lock together; a writer holds it
+    alone. Waiting writers block new readers so a steady stream of reads
+    cannot starve mutations.
+    """
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @property
+    def readers(self) -> int:
+        """Number of readers currently holding the lock."""
+        return self._readers
+
+    @property
+    def locked(self) -> bool:
+        """Whether a writer currently holds the lock."""
+        return self._writer
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """Hold the lock shared with other readers."""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: not self._writer and not self._writers_waiting
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Hold the lock exclusively."""
+        async with self._condition:
+            self._writers_waiting += 1
+            try:
+                await self._condition.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
@@ -334,37 +334,22 @@ class IntelOrchestrator:
                 self._check_degraded_mode()
 
     async def _process_signal_batch(self, signals: list[IntelSignal]):
-        """Process a batch of signals through the pipeline."""
-        start_time = datetime.now(UTC)
-
-        for signal in signals:
-            try:
-                # Normalize signal
-                normalized = await self._normalize_signal(signal)
-
-                # Enrich signal
-                enriched = await self._enrich_signal(normalized)
-
-                # Correlate with existing intelligence
-                if self._correlator:
-                    correlations = await self._correlator.correlate(enriched)
-                    enriched.metadata["correlations"] = correlations
-
-                # Score priority
-                if self._rules_engine:
-                    priority = await self._rules_engine.calculate_priority(enriched)
-                    enriched.priority_modifiers["calculated"] = priority
+        """
+        Process a batch of signals through the pipeline.
 
-                # Check if signal should be fused
-                if self._should_fuse(enriched):
-                    fused = await self._create_fusion(enriched)
-                    await self._fusion_queue.put(fused)
+        Signals are partitioned into lanes by the entities they reference;
+        lanes run concurrently, bounded by max_concurrent_pipelines, while
+        signals within a lane keep their arrival order.
+        """
+        start_time = datetime.now(UTC)
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_pipelines))
 
-                self.metrics.signals_processed += 1
+        async def run_lane(lane: list[IntelSignal]):
+            for signal in lane:
+                async with semaphore:
+                    await self._process_signal(signal)
 
-            except Exception as e:
-                logger.error("Error processing signal %s: %s", signal.id, e)
-                self.metrics.pipeline_errors += 1
+        await asyncio.gather(*(run_lane(lane) for lane in self._partition_by_entity(signals)))
 
         # Update processing time metric
         elapsed_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -372,6 +357,87 @@ class IntelOrchestrator:
             self.metrics.avg_processing_time_ms * 0.9 + elapsed_ms * 0.1
         )
 
+    async def _process_signal(self, signal: IntelSignal):
+        """Normalize, enrich, correlate, score and fuse a single signal."""
+        try:
+            # Normalize signal
+            normalized = await self._normalize_signal(signal)
+
+            # Enrich signal
+            enriched = await self._enrich_signal(normalized)
+
+            # Correlate with existing intelligence
+            if self._correlator:
+                correlations = await self._correlator.correlate(enriched)
+                enriched.metadata["correlations"] = correlations
+
+            # Score priority
+            if self._rules_engine:
+                priority = await self._rules_engine.calculate_priority(enriched)
+                enriched.priority_modifiers["calculated"] = priority
+
+            # Check if signal should be fused
+            if self._should_fuse(enriched):
+                fused = await self._create_fusion(enriched)
+                await self._fusion_queue.put(fused)
+
+            self.metrics.signals_processed += 1
+
+        except Exception as e:
+            logger.error("Error processing signal %s: %s", signal.id, e)
+            self.metrics.pipeline_errors += 1
+
+    def _entity_keys(self, signal: IntelSignal) -> set[str]:
+        """Get keys of the entities a signal refers to, for ordering."""
+        keys: set[str] = set()
+        data = signal.data
+
+        for section in ("entity", "person", "suspect", "offender", "vehicle", "weapon"):
+            entity = data.get(section)
+            if not isinstance(entity, dict):
+                continue
+            if entity.get("id"):
+                keys.add(f"id:{entity['id']}")
+            if section == "vehicle":
+                for attr in ("plate", "vin"):
+                    if entity.get(attr):
+                        keys.add(f"{attr}:{str(entity[attr]).upper()}")
+
+        if data.get("entity_id"):
+            keys.add(f"id:{data['entity_id']}")
+        keys.update(f"id:{hint}" for hint in signal.correlation_hints)
+
+        return keys
+
+    def _partition_by_entity(self, signals: list[IntelSignal]) -> list[list[IntelSignal]]:
+        """
+        Group signals that share any entity key into ordered lanes.
+
+        Signals referencing no known entity each get their own lane.
+        """
+        parent = list(range(len(signals)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        owner: dict[str, int] = {}
+        for i, signal in enumerate(signals):
+            for key in self._entity_keys(signal):
+                if key in owner:
+                    root_a, root_b = find(owner[key]), find(i)
+                    if root_a != root_b:
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+                else:
+                    owner[key] = i
+
+        lanes: dict[int, list[IntelSignal]] = {}
+        for i, signal in enumerate(signals):
+            lanes.setdefault(find(i), []).append(signal)
+        return list(lanes.values())
+
     async def _normalize_signal(self, signal: IntelSignal) -> IntelSignal:
         """Normalize signal data to standard format."""
         # Apply source-specific normalization
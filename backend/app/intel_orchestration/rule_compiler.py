@@ -0,0 +1,270 @@
+"""
+Rule Compilation for G3TI RTCC-UIP Intelligence Orchestration.
+
+This module turns scoring rule definitions into an evaluation plan:
+- Field paths pre-split into accessors
+- Operators pre-bound to their expected values
+- Rules pre-sorted by evaluation priority
+- Rules indexed by the field that gates them, so rules whose required
+  fields are absent from a signal are skipped without evaluation
+- Fingerprints of exactly the signal fields the rules read, for caching
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+Accessor = Callable[[dict[str, Any]], Any]
+Predicate = Callable[[Any], bool]
+
+
+def compile_accessor(field: str) -> Accessor:
+    """
+    Compile a dotted field path into a value accessor.
+
+    Any non-dict value along the path yields None.
+    """
+    parts = tuple(field.split("."))
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda data: data.get(key)
+
+    def accessor(data: dict[str, Any]) -> Any:
+        value: Any = data
+        for part in parts:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    return accessor
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convert a signal value into an equivalent hashable form.
+
+    Containers are tagged by kind so, e.g., a dict and a set of its items
+    (which behave differently under ``contains``) never collide.
+    """
+    if isinstance(value, dict):
+        return ("dict", frozenset((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("seq", tuple(freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return ("repr", type(value).__name__, repr(value))
+    return value
+
+
+def _equals(expected: Any) -> Predicate:
+    return lambda actual: actual == expected
+
+
+def _not_equals(expected: Any) -> Predicate:
+    return lambda actual: actual != expected
+
+
+def _greater_than(expected: Any) -> Predicate:
+    return lambda actual: actual is not None and actual > expected
+
+
+def _less_than(expected: Any) -> Predicate:
+    return lambda actual: actual is not None and actual < expected
+
+
+def _greater_or_equal(expected: Any) -> Predicate:
+    return lambda actual: actual is not None and actual >= expected
+
+
+def _less_or_equal(expected: Any) -> Predicate:
+    return lambda actual: actual is not None and actual <= expected
+
+
+def _contains(expected: Any) -> Predicate:
+    return lambda actual: expected in actual if actual else False
+
+
+def _not_contains(expected: Any) -> Predicate:
+    return lambda actual: expected not in actual if actual else True
+
+
+def _in(expected: Any) -> Predicate:
+    if not expected:
+        return lambda actual: False
+    return lambda actual: actual in expected
+
+
+def _not_in(expected: Any) -> Predicate:
+    if not expected:
+        return lambda actual: True
+    return lambda actual: actual not in expected
+
+
+def _exists(expected: Any) -> Predicate:
+    return lambda actual: actual is not None
+
+
+def _not_exists(expected: Any) -> Predicate:
+    return lambda actual: actual is None
+
+
+def _never(expected: Any) -> Predicate:
+    return lambda actual: False
+
+
+OPERATORS: dict[str, Callable[[Any], Predicate]] = {
+    "equals": _equals,
+    "not_equals": _not_equals,
+    "greater_than": _greater_than,
+    "less_than": _less_than,
+    "greater_or_equal": _greater_or_equal,
+    "less_or_equal": _less_or_equal,
+    "contains": _contains,
+    "not_contains": _not_contains,
+    "in": _in,
+    "not_in": _not_in,
+    "exists": _exists,
+    "not_exists": _not_exists,
+}
+
+
+# Operators whose outcome depends only on whether the field is present
+PRESENCE_OPERATORS = frozenset({"exists", "not_exists"})
+
+
+class CompiledCondition:
+    """A rule condition with its accessor and operator bound."""
+
+    __slots__ = ("field", "operator", "value", "root", "accessor", "predicate", "requires_field")
+
+    def __init__(self, condition: dict[str, Any]):
+        self.field: str = condition.get("field", "")
+        self.operator: str = condition.get("operator", "equals")
+        self.value: Any = condition.get("value")
+        self.root = self.field.split(".", 1)[0]
+        self.accessor = compile_accessor(self.field)
+        self.predicate = OPERATORS.get(self.operator, _never)(self.value)
+
+        # A condition that cannot hold when its field is missing lets the
+        # whole rule be skipped for signals without the field's root key.
+        try:
+            self.requires_field = not self.predicate(None)
+        except Exception:
+            self.requires_field = False
+
+    def evaluate(self, data: dict[str, Any]) -> bool:
+        """Evaluate the condition against signal data."""
+        return self.predicate(self.accessor(data))
+
+
+class CompiledRule:
+    """An enabled scoring rule with compiled conditions."""
+
+    __slots__ = ("rule", "conditions", "gate")
+
+    def __init__(self, rule: Any):
+        self.rule = rule
+        self.conditions = tuple(CompiledCondition(c) for c in rule.conditions)
+        self.gate: str | None = next(
+            (c.root for c in self.conditions if c.requires_field), None
+        )
+
+    def matches(self, data: dict[str, Any]) -> bool:
+        """Evaluate all conditions (AND logic)."""
+        for condition in self.conditions:
+            if not condition.predicate(condition.accessor(data)):
+                return False
+        return True
+
+
+class RulePlan:
+    """
+    Evaluation plan for a set of scoring rules.
+
+    Enabled rules are held in evaluation order (highest priority first,
+    ties in insertion order). Rules gated on a field are only evaluated
+    when the signal carries a non-null value for that field's root key.
+    """
+
+    def __init__(self, rules: Iterable[Any], key_fields: Iterable[str] = ()):
+        """
+        Compile a plan.
+
+        Args:
+            rules: Scoring rules; disabled rules are left out
+            key_fields: Extra field paths the fingerprint must cover, for
+                signal values that shape the result outside of conditions
+        """
+        ordered = sorted((r for r in rules if r.enabled), key=lambda r: r.priority, reverse=True)
+        self.rules: tuple[CompiledRule, ...] = tuple(CompiledRule(r) for r in ordered)
+
+        # Fields read by any condition; presence-only fields fingerprint as
+        # a flag so payload changes under them do not split cache entries
+        presence_only: dict[str, bool] = dict.fromkeys(key_fields, False)
+        for compiled in self.rules:
+            for condition in compiled.conditions:
+                only = condition.operator in PRESENCE_OPERATORS
+                presence_only[condition.field] = presence_only.get(condition.field, only) and only
+        self._key_fields = tuple(
+            (field, compile_accessor(field), only)
+            for field, only in sorted(presence_only.items())
+        )
+
+        always: list[int] = []
+        by_field: dict[str, list[int]] = {}
+        for position, compiled in enumerate(self.rules):
+            if compiled.gate is None:
+                always.append(position)
+            else:
+                by_field.setdefault(compiled.gate, []).append(position)
+
+        self._always = tuple(always)
+        self._by_field = {field: tuple(positions) for field, positions in by_field.items()}
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @property
+    def key_fields(self) -> tuple[str, ...]:
+        """Field paths covered by the fingerprint."""
+        return tuple(field for field, _, _ in self._key_fields)
+
+    @property
+    def fields(self) -> frozenset[str]:
+        """Root keys that gate at least one rule."""
+        return frozenset(self._by_field)
+
+    def candidates(self, data: dict[str, Any]) -> list[CompiledRule]:
+        """Rules that could match the signal, in evaluation order."""
+        positions = list(self._always)
+        if len(self._by_field) <= len(data):
+            for field, indexed in self._by_field.items():
+                if data.get(field) is not None:
+                    positions.extend(indexed)
+        else:
+            for field, value in data.items():
+                if value is not None:
+                    positions.extend(self._by_field.get(field, ()))
+        positions.sort()
+        rules = self.rules
+        return [rules[p] for p in positions]
+
+    def fingerprint(self, data: dict[str, Any]) -> tuple:
+        """
+        Hashable key over exactly the signal values the plan reads.
+
+        Signals with equal fingerprints match the same rules.
+        """
+        return tuple(
+            accessor(data) is not None if only else freeze(accessor(data))
+            for _, accessor, only in self._key_fields
+        )
+
+    def matching(self, data: dict[str, Any]) -> Iterator[CompiledRule]:
+        """Rules whose conditions all hold for the signal, in evaluation order."""
+        for compiled in self.candidates(data):
+            if compiled.matches(data):
+                yield compiled
@@ -6,7 +6,7 @@ using configurable rulesets.
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -14,8 +14,14 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from .cache import TTLCache
+from .rule_compiler import RulePlan, freeze
+
 logger = logging.getLogger(__name__)
 
+# Signal fields that shape a PriorityScore outside of rule conditions
+SCORE_KEY_FIELDS = ("entity.id",)
+
 
 class RuleCategory(str, Enum):
     """Categories of scoring rules."""
@@ -131,6 +137,8 @@ class RulesEngineConfig(BaseModel):
     max_score: float = 100.0
     enable_caching: bool = True
     cache_ttl_seconds: int = 60
+    cache_max_entries: int = 10000
+    cache_max_bytes: int | None = None
     parallel_evaluation: bool = True
 
 
@@ -146,8 +154,13 @@ class RulesEngine:
         self.config = config or RulesEngineConfig()
         self._rules: dict[str, ScoringRule] = {}
         self._custom_evaluators: dict[str, Callable] = {}
-        self._score_cache: dict[str, PriorityScore] = {}
+        self._score_cache: TTLCache[str, PriorityScore] = TTLCache(
+            max_entries=self.config.cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            max_bytes=self.config.cache_max_bytes,
+        )
         self._risk_profiles: dict[str, RiskProfile] = {}
+        self._plan = RulePlan(())
 
         # Initialize default rules
         self._initialize_default_rules()
@@ -286,6 +299,7 @@ class RulesEngine:
 
         for rule in default_rules:
             self._rules[rule.id] = rule
+        self._rules_changed()
 
     async def calculate_priority(self, signal: Any) -> float:
         """
@@ -296,23 +310,46 @@ class RulesEngine:
         if not self.config.enabled:
             return self.config.default_base_score
 
+        return (await self._score_signal(signal, self._plan)).total_score
+
+    async def calculate_priorities(self, signals: Iterable[Any]) -> list[float]:
+        """
+        Calculate priority scores for a batch of signals.
+
+        The whole batch is scored against the same evaluation plan, even
+        if rules change while custom evaluators are awaited.
+
+        Returns scores from 0-100, in signal order.
+        """
+        signals = list(signals)
+        if not self.config.enabled:
+            return [self.config.default_base_score] * len(signals)
+
+        plan = self._plan
+        return [(await self._score_signal(signal, plan)).total_score for signal in signals]
+
+    async def _score_signal(self, signal: Any, plan: RulePlan) -> PriorityScore:
+        """Score one signal against a plan, going through the score cache."""
         # Extract signal data
         signal_data = self._extract_signal_data(signal)
 
+        if not self.config.enable_caching:
+            return await self._evaluate_rules(signal_data, plan)
+
         # Check cache
-        cache_key = self._get_cache_key(signal_data)
-        if self.config.enable_caching and cache_key in self._score_cache:
-            cached = self._score_cache[cache_key]
-            return cached.total_score
+        cache_key = self._get_cache_key(signal_data, plan)
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Calculate score
-        priority_score = await self._evaluate_rules(signal_data)
+        priority_score = await self._evaluate_rules(signal_data, plan)
 
-        # Cache result
-        if self.config.enable_caching:
-            self._score_cache[cache_key] = priority_score
+        # Cache result, unless rules changed while custom evaluators ran
+        if plan is self._plan:
+            self._score_cache.set(cache_key, priority_score)
 
-        return priority_score.total_score
+        return priority_score
 
     def _extract_signal_data(self, signal: Any) -> dict[str, Any]:
         """Extract data from signal for rule evaluation."""
@@ -338,21 +375,21 @@ class RulesEngine:
 
         return data
 
-    def _get_cache_key(self, data: dict[str, Any]) -> str:
-        """Generate cache key from signal data."""
-        import hashlib
-        import json
+    def _get_cache_key(self, data: dict[str, Any], plan: RulePlan) -> Hashable:
+        """
+        Generate cache key from signal data.
 
-        # Create deterministic string representation
-        key_data = {
-            "source": data.get("source"),
-            "category": data.get("category"),
-            "entity_id": data.get("entity", {}).get("id") if isinstance(data.get("entity"), dict) else None,
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        The key covers exactly the fields the enabled rules read, plus the
+        entity id reported on the score. Custom evaluators may read any
+        field, so while any are registered the whole payload is keyed.
+        """
+        if self._custom_evaluators:
+            return ("payload", freeze(data))
+        return ("fields", plan.fingerprint(data))
 
-    async def _evaluate_rules(self, data: dict[str, Any]) -> PriorityScore:
+    async def _evaluate_rules(
+        self, data: dict[str, Any], plan: RulePlan | None = None
+    ) -> PriorityScore:
         """Evaluate all rules against signal data."""
         base_score = self.config.default_base_score
         total_score = base_score
@@ -360,36 +397,30 @@ class RulesEngine:
         rules_applied: list[str] = []
         factors: list[str] = []
 
-        # Sort rules by priority
-        sorted_rules = sorted(
-            self._rules.values(),
-            key=lambda r: r.priority,
-            reverse=True,
-        )
-
-        for rule in sorted_rules:
-            if not rule.enabled:
-                continue
+        if plan is None:
+            plan = self._plan
 
-            # Evaluate rule conditions
-            if self._evaluate_conditions(rule.conditions, data):
-                # Calculate contribution
-                contribution = rule.score_modifier
+        # Compiled rules come pre-sorted by priority; rules gated on
+        # fields the signal lacks are skipped
+        for compiled in plan.matching(data):
+            rule = compiled.rule
+            # Calculate contribution
+            contribution = rule.score_modifier
 
-                # Apply multiplier if set
-                if rule.score_multiplier != 1.0:
-                    contribution = total_score * (rule.score_multiplier - 1.0)
+            # Apply multiplier if set
+            if rule.score_multiplier != 1.0:
+                contribution = total_score * (rule.score_multiplier - 1.0)
 
-                # Clamp contribution
-                contribution = max(
-                    rule.min_contribution,
-                    min(rule.max_contribution, contribution),
-                )
+            # Clamp contribution
+            contribution = max(
+                rule.min_contribution,
+                min(rule.max_contribution, contribution),
+            )
 
-                total_score += contribution
-                rule_contributions[rule.id] = contribution
-                rules_applied.append(rule.name)
-                factors.append(rule.description)
+            total_score += contribution
+            rule_contributions[rule.id] = contribution
+            rules_applied.append(rule.name)
+            factors.append(rule.description)
 
         # Evaluate custom evaluators
         for name, evaluator in self._custom_evaluators.items():
@@ -425,71 +456,6 @@ class RulesEngine:
             factors=factors,
         )
 
-    def _evaluate_conditions(
-        self, conditions: list[dict[str, Any]], data: dict[str, Any]
-    ) -> bool:
-        """Evaluate all conditions (AND logic)."""
-        if not conditions:
-            return True
-
-        for condition in conditions:
-            if not self._evaluate_condition(condition, data):
-                return False
-
-        return True
-
-    def _evaluate_condition(
-        self, condition: dict[str, Any], data: dict[str, Any]
-    ) -> bool:
-        """Evaluate a single condition."""
-        field = condition.get("field", "")
-        operator = condition.get("operator", "equals")
-        expected = condition.get("value")
-
-        # Get actual value from data (supports nested fields)
-        actual = self._get_nested_value(data, field)
-
-        # Evaluate based on operator
-        if operator == "equals":
-            return actual == expected
-        elif operator == "not_equals":
-            return actual != expected
-        elif operator == "greater_than":
-            return actual is not None and actual > expected
-        elif operator == "less_than":
-            return actual is not None and actual < expected
-        elif operator == "greater_or_equal":
-            return actual is not None and actual >= expected
-        elif operator == "less_or_equal":
-            return actual is not None and actual <= expected
-        elif operator == "contains":
-            return expected in actual if actual else False
-        elif operator == "not_contains":
-            return expected not in actual if actual else True
-        elif operator == "in":
-            return actual in expected if expected else False
-        elif operator == "not_in":
-            return actual not in expected if expected else True
-        elif operator == "exists":
-            return actual is not None
-        elif operator == "not_exists":
-            return actual is None
-
-        return False
-
-    def _get_nested_value(self, data: dict[str, Any], field: str) -> Any:
-        """Get value from nested dictionary using dot notation."""
-        parts = field.split(".")
-        value = data
-
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-
-        return value
-
     def _get_threat_level(self, score: float) -> ThreatLevel:
         """Get threat level from score."""
         if score >= 85:
@@ -591,27 +557,46 @@ class RulesEngine:
     def add_rule(self, rule: ScoringRule):
         """Add a scoring rule."""
         self._rules[rule.id] = rule
+        self._rules_changed()
         logger.info("Added rule: %s", rule.name)
 
     def remove_rule(self, rule_id: str):
         """Remove a scoring rule."""
         if rule_id in self._rules:
             del self._rules[rule_id]
+            self._rules_changed()
             logger.info("Removed rule: %s", rule_id)
 
     def enable_rule(self, rule_id: str):
         """Enable a rule."""
         if rule_id in self._rules:
             self._rules[rule_id].enabled = True
+            self._rules_changed()
 
     def disable_rule(self, rule_id: str):
         """Disable a rule."""
         if rule_id in self._rules:
             self._rules[rule_id].enabled = False
+            self._rules_changed()
 
     def register_custom_evaluator(self, name: str, evaluator: Callable):
         """Register a custom score evaluator."""
         self._custom_evaluators[name] = evaluator
+        self._score_cache.clear()
+
+    def recompile_rules(self):
+        """
+        Rebuild the evaluation plan.
+
+        Needed only after mutating a ScoringRule in place; the engine's own
+        rule management methods recompile automatically.
+        """
+        self._rules_changed()
+
+    def _rules_changed(self):
+        """Recompile the evaluation plan and drop cached scores."""
+        self._plan = RulePlan(self._rules.values(), key_fields=SCORE_KEY_FIELDS)
+        self._score_cache.clear()
 
     def get_rules(self) -> list[ScoringRule]:
         """Get all rules."""
@@ -630,8 +615,10 @@ class RulesEngine:
         return {
             "total_rules": len(self._rules),
             "enabled_rules": sum(1 for r in self._rules.values() if r.enabled),
+            "compiled_rules": len(self._plan),
             "custom_evaluators": len(self._custom_evaluators),
             "cached_scores": len(self._score_cache),
+            "score_cache": self._score_cache.stats(),
             "risk_profiles": len(self._risk_profiles),
             "config": self.config.model_dump(),
         }
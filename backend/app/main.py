@@ -21,10 +21,10 @@ from fastapi.responses import JSONResponse
 from app.ai_engine import get_ai_manager
 from app.api import api_router
 from app.api.cameras import router as cameras_router
-from app.crime_analysis import crime_router
-from app.crime_analysis.websocket_handler import crime_alerts_websocket
-from app.camera_network.camera_ingestion_engine import get_ingestion_engine
 from app.camera_network.camera_health_monitor import get_health_monitor
+from app.camera_network.camera_ingestion_engine import get_ingestion_engine
+from app.camera_network.frame_hub import get_frame_hub
+from app.camera_network.io_scheduler import get_io_scheduler
 from app.core.config import settings
 from app.core.exceptions import (
     AuthenticationError,
@@ -35,9 +35,16 @@ from app.core.exceptions import (
     ValidationError,
 )
 from app.core.logging import audit_logger, get_logger, setup_logging
+from app.crime_analysis import crime_router
+from app.crime_analysis.websocket_handler import crime_alerts_websocket
 from app.db.elasticsearch import close_elasticsearch, get_elasticsearch
 from app.db.neo4j import close_neo4j, get_neo4j
 from app.db.redis import close_redis, get_redis
+from app.services.events.broadcast_bus import (
+    RedisBroadcastBus,
+    get_broadcast_bus,
+    set_broadcast_bus,
+)
 from app.services.events.websocket_manager import get_websocket_manager
 
 # Initialize logging
@@ -98,6 +105,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             redis_mgr = await get_redis()
             if redis_mgr._client is not None:
                 logger.info("redis_initialized")
+                if settings.ws_broadcast_backend == "redis":
+                    set_broadcast_bus(RedisBroadcastBus(redis_mgr))
             else:
                 logger.warning("redis_running_in_demo_mode")
         except Exception as e:
@@ -108,6 +117,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await ws_manager.start()
     logger.info("websocket_manager_started")
 
+    # Start the broadcast bus that fans WebSocket broadcasts out across workers
+    broadcast_bus = get_broadcast_bus()
+    await broadcast_bus.start()
+
     # Initialize AI Engine only when NOT in SAFE_MODE
     if not settings.safe_mode:
         try:
@@ -152,9 +165,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("application_stopping")
 
-    # Stop WebSocket manager
+    # Stop broadcast bus and WebSocket manager
+    await broadcast_bus.stop()
     await ws_manager.stop()
 
+    # Stop camera frame fetchers and close the camera HTTP pool
+    await get_frame_hub().close()
+    await get_io_scheduler().close()
+
     # Close database connections only if NOT in SAFE_MODE
     if not settings.safe_mode:
         await close_neo4j()
@@ -1,15 +1,17 @@
 """
 Phase 38: Workflow Engine
 Implements multi-step automated workflows for cross-subsystem orchestration.
-Supports sequential and parallel execution with guardrails and audit logging.
+Runs steps as a dependency graph with per-step timeouts, guardrails,
+cancellation, latency/critical-path timing and audit logging.
 """
 
+import asyncio
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set
-import uuid
-import asyncio
 
 
 class WorkflowStatus(Enum):
@@ -24,6 +26,13 @@ class WorkflowStatus(Enum):
 
 
 class StepExecutionMode(Enum):
+    """
+    How a step without explicit depends_on is placed in the workflow graph.
+
+    A SEQUENTIAL step waits for the previous SEQUENTIAL step; a PARALLEL
+    step waits for the SEQUENTIAL step before it and runs alongside the
+    steps that follow.
+    """
     SEQUENTIAL = "sequential"
     PARALLEL = "parallel"
 
@@ -87,9 +96,11 @@ class WorkflowStep:
     guardrails: List[str] = field(default_factory=list)
     on_success: Optional[str] = None
     on_failure: Optional[str] = None
+    depends_on: list[str] | None = None
     status: WorkflowStatus = WorkflowStatus.PENDING
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    latency_ms: float | None = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
@@ -108,9 +119,11 @@ class WorkflowStep:
             "guardrails": self.guardrails,
             "on_success": self.on_success,
             "on_failure": self.on_failure,
+            "depends_on": self.depends_on,
             "status": self.status.value,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "latency_ms": self.latency_ms,
             "result": self.result,
             "error": self.error,
         }
@@ -140,6 +153,7 @@ class Workflow:
     triggered_by: Optional[str] = None
     execution_context: Dict[str, Any] = field(default_factory=dict)
     audit_log: List[Dict[str, Any]] = field(default_factory=list)
+    timing: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -165,6 +179,7 @@ class Workflow:
             "triggered_by": self.triggered_by,
             "execution_context": self.execution_context,
             "audit_log": self.audit_log,
+            "timing": self.timing,
         }
 
     def add_audit_entry(self, action: str, details: Dict[str, Any] = None):
@@ -176,10 +191,69 @@ class Workflow:
         })
 
 
+def resolve_step_dependencies(workflow: Workflow) -> dict[str, list[str]]:
+    """
+    Map each step_id to the step_ids it waits for.
+
+    depends_on entries may name a step by step_id or name. Steps without
+    depends_on are placed by execution_mode (see StepExecutionMode).
+    Raises ValueError for unknown references and cycles.
+    """
+    by_ref: dict[str, str] = {}
+    for step in workflow.steps:
+        by_ref.setdefault(step.name, step.step_id)
+        by_ref[step.step_id] = step.step_id
+
+    dependencies: dict[str, list[str]] = {}
+    previous_sequential: str | None = None
+    for step in workflow.steps:
+        if step.depends_on is not None:
+            missing = [ref for ref in step.depends_on if ref not in by_ref]
+            if missing:
+                raise ValueError(f"Step '{step.name}' depends on unknown steps: {missing}")
+            dependencies[step.step_id] = list(dict.fromkeys(by_ref[ref] for ref in step.depends_on))
+        else:
+            dependencies[step.step_id] = [previous_sequential] if previous_sequential else []
+        if step.execution_mode == StepExecutionMode.SEQUENTIAL:
+            previous_sequential = step.step_id
+
+    # Kahn's algorithm: every step must become ready
+    waiting = {step_id: len(deps) for step_id, deps in dependencies.items()}
+    dependents: dict[str, list[str]] = {step_id: [] for step_id in dependencies}
+    for step_id, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(step_id)
+    ready = [step_id for step_id, count in waiting.items() if count == 0]
+    visited = 0
+    while ready:
+        step_id = ready.pop()
+        visited += 1
+        for child in dependents[step_id]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                ready.append(child)
+    if visited != len(dependencies):
+        raise ValueError(f"Workflow '{workflow.name}' has a dependency cycle")
+
+    return dependencies
+
+
+@dataclass
+class _Execution:
+    """Runtime state of an active workflow execution."""
+    running: dict[asyncio.Task, str] = field(default_factory=dict)
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    started: float = field(default_factory=time.perf_counter)
+    step_start: dict[str, float] = field(default_factory=dict)
+    step_end: dict[str, float] = field(default_factory=dict)
+    cancelled: bool = False
+
+
 class WorkflowEngine:
     """
     Executes multi-step workflows across RTCC subsystems.
-    Supports sequential and parallel execution with guardrails.
+    Runs steps as a dependency graph: each step starts once the steps it
+    depends on have finished, subject to step and workflow timeouts.
     """
 
     _instance = None
@@ -205,9 +279,13 @@ class WorkflowEngine:
             "total_executions": 0,
             "successful_executions": 0,
             "failed_executions": 0,
+            "cancelled_executions": 0,
             "active_executions": 0,
             "average_execution_time_ms": 0.0,
+            "step_timeouts": 0,
         }
+        self.timing_statistics: dict[str, dict[str, Any]] = {}
+        self._executions: dict[str, _Execution] = {}
         self._register_default_handlers()
 
     def _register_default_handlers(self):
@@ -268,6 +346,7 @@ class WorkflowEngine:
                     guardrails=s.guardrails,
                     on_success=s.on_success,
                     on_failure=s.on_failure,
+                    depends_on=_instance_dependencies(s, template),
                 )
                 for s in template.steps
             ],
@@ -291,6 +370,8 @@ class WorkflowEngine:
         workflow.execution_context = {**workflow.execution_context, **(context or {})}
         workflow.add_audit_entry("workflow_started", {"context": context})
 
+        execution = _Execution()
+        self._executions[workflow.workflow_id] = execution
         self.active_executions[workflow.workflow_id] = workflow
         self.statistics["total_executions"] += 1
         self.statistics["active_executions"] += 1
@@ -305,78 +386,253 @@ class WorkflowEngine:
                         workflow.add_audit_entry("guardrail_failed", {"guardrail": guardrail, "result": check_result})
                         raise Exception(f"Guardrail check failed: {guardrail}")
 
-            sequential_steps = [s for s in workflow.steps if s.execution_mode == StepExecutionMode.SEQUENTIAL]
-            parallel_steps = [s for s in workflow.steps if s.execution_mode == StepExecutionMode.PARALLEL]
-
-            for step in sequential_steps:
-                await self._execute_step(step, workflow)
-                if step.status == WorkflowStatus.FAILED:
-                    if step.on_failure:
-                        pass
-                    else:
-                        workflow.status = WorkflowStatus.FAILED
-                        break
-
-            if parallel_steps and workflow.status != WorkflowStatus.FAILED:
-                await asyncio.gather(*[
-                    self._execute_step(step, workflow) for step in parallel_steps
-                ])
-
-            if workflow.status != WorkflowStatus.FAILED:
-                workflow.status = WorkflowStatus.COMPLETED
-                self.statistics["successful_executions"] += 1
-            else:
-                self.statistics["failed_executions"] += 1
+            await self._run_graph(workflow, execution)
 
         except Exception as e:
             workflow.status = WorkflowStatus.FAILED
             workflow.add_audit_entry("workflow_error", {"error": str(e)})
+
+        finally:
+            for task in execution.running:
+                task.cancel()
+
+        if workflow.status == WorkflowStatus.COMPLETED:
+            self.statistics["successful_executions"] += 1
+        elif workflow.status == WorkflowStatus.CANCELLED:
+            self.statistics["cancelled_executions"] += 1
+        else:
             self.statistics["failed_executions"] += 1
 
         workflow.completed_at = datetime.utcnow()
+        self._record_timing(workflow, execution)
         workflow.add_audit_entry("workflow_completed", {"status": workflow.status.value})
 
         del self.active_executions[workflow.workflow_id]
+        del self._executions[workflow.workflow_id]
         self.statistics["active_executions"] -= 1
         self.execution_history.append(workflow)
 
         return workflow
 
-    async def _execute_step(self, step: WorkflowStep, workflow: Workflow):
+    async def _run_graph(self, workflow: Workflow, execution: _Execution):
+        """Run the workflow's steps as their dependencies complete."""
+        dependencies = resolve_step_dependencies(workflow)
+        steps = {step.step_id: step for step in workflow.steps}
+        waiting = {step_id: set(deps) for step_id, deps in dependencies.items()}
+        dependents: dict[str, list[str]] = {step_id: [] for step_id in steps}
+        for step_id, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(step_id)
+
+        ready = [step.step_id for step in workflow.steps if not waiting[step.step_id]]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + workflow.timeout_seconds
+        failed = False
+
+        while ready or execution.running:
+            if execution.cancelled:
+                break
+
+            if workflow.status != WorkflowStatus.PAUSED and not failed:
+                for step_id in ready:
+                    task = asyncio.create_task(self._execute_step(steps[step_id], workflow, execution))
+                    execution.running[task] = step_id
+                ready = []
+            elif failed:
+                ready = []
+            if not ready and not execution.running:
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                workflow.status = WorkflowStatus.TIMEOUT
+                workflow.add_audit_entry("workflow_timeout", {"timeout_seconds": workflow.timeout_seconds})
+                break
+
+            execution.wake.clear()
+            waker = asyncio.create_task(execution.wake.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    [*execution.running, waker], timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                waker.cancel()
+
+            for task in done:
+                step_id = execution.running.pop(task, None)
+                if step_id is None:
+                    continue
+                step = steps[step_id]
+                handled = step.status == WorkflowStatus.COMPLETED or step.on_failure is not None
+                if not handled and step.execution_mode == StepExecutionMode.SEQUENTIAL:
+                    failed = True
+                for child in dependents[step_id]:
+                    if handled:
+                        waiting[child].discard(step_id)
+                        if not waiting[child]:
+                            ready.append(child)
+                    else:
+                        self._skip_dependents(child, step, steps, dependents)
+
+        # Cancel steps still running after cancellation or timeout
+        for task in execution.running:
+            task.cancel()
+        if execution.running:
+            await asyncio.gather(*execution.running, return_exceptions=True)
+            execution.running.clear()
+
+        for step in workflow.steps:
+            if step.status == WorkflowStatus.PENDING:
+                step.status = WorkflowStatus.CANCELLED
+
+        if workflow.status == WorkflowStatus.RUNNING:
+            workflow.status = WorkflowStatus.FAILED if failed else WorkflowStatus.COMPLETED
+
+    def _skip_dependents(
+        self,
+        step_id: str,
+        failed_step: WorkflowStep,
+        steps: dict[str, WorkflowStep],
+        dependents: dict[str, list[str]],
+    ):
+        """Cancel a step, and everything after it, whose dependency failed."""
+        step = steps[step_id]
+        if step.status != WorkflowStatus.PENDING:
+            return
+        step.status = WorkflowStatus.CANCELLED
+        step.error = f"Dependency failed: {failed_step.name}"
+        for child in dependents[step_id]:
+            self._skip_dependents(child, failed_step, steps, dependents)
+
+    async def _execute_step(
+        self, step: WorkflowStep, workflow: Workflow, execution: _Execution | None = None
+    ):
         """Execute a single workflow step."""
         step.status = WorkflowStatus.RUNNING
         step.started_at = datetime.utcnow()
+        started = time.perf_counter()
+        if execution is not None:
+            execution.step_start[step.step_id] = started
         workflow.add_audit_entry("step_started", {"step_id": step.step_id, "name": step.name})
 
         try:
-            for guardrail in step.guardrails:
-                checker = self.guardrail_checkers.get(guardrail)
-                if checker:
-                    check_result = await checker(step, workflow.execution_context)
-                    if not check_result.get("passed", True):
-                        step.status = WorkflowStatus.FAILED
-                        step.error = f"Guardrail check failed: {guardrail}"
-                        return
+            await asyncio.wait_for(self._run_step(step, workflow), timeout=step.timeout_seconds)
 
-            handler = self.step_handlers.get(step.action_type, self._default_step_handler)
-            result = await handler(step, workflow.execution_context)
+        except TimeoutError:
+            step.status = WorkflowStatus.TIMEOUT
+            step.error = f"Step timed out after {step.timeout_seconds}s"
+            self.statistics["step_timeouts"] += 1
 
-            step.result = result
-            step.status = WorkflowStatus.COMPLETED if result.get("success") else WorkflowStatus.FAILED
-            if not result.get("success"):
-                step.error = result.get("error", "Step execution failed")
+        except asyncio.CancelledError:
+            step.status = WorkflowStatus.CANCELLED
+            step.error = "Step cancelled"
 
         except Exception as e:
             step.status = WorkflowStatus.FAILED
             step.error = str(e)
 
+        finished = time.perf_counter()
+        if execution is not None:
+            execution.step_end[step.step_id] = finished
         step.completed_at = datetime.utcnow()
+        step.latency_ms = (finished - started) * 1000
         workflow.add_audit_entry("step_completed", {
             "step_id": step.step_id,
             "status": step.status.value,
             "error": step.error,
+            "latency_ms": round(step.latency_ms, 3),
         })
 
+    async def _run_step(self, step: WorkflowStep, workflow: Workflow):
+        """Check a step's guardrails and run its handler."""
+        for guardrail in step.guardrails:
+            checker = self.guardrail_checkers.get(guardrail)
+            if checker:
+                check_result = await checker(step, workflow.execution_context)
+                if not check_result.get("passed", True):
+                    step.status = WorkflowStatus.FAILED
+                    step.error = f"Guardrail check failed: {guardrail}"
+                    return
+
+        handler = self.step_handlers.get(step.action_type, self._default_step_handler)
+        result = await handler(step, workflow.execution_context)
+
+        step.result = result
+        step.status = WorkflowStatus.COMPLETED if result.get("success") else WorkflowStatus.FAILED
+        if not result.get("success"):
+            step.error = result.get("error", "Step execution failed")
+
+    def _record_timing(self, workflow: Workflow, execution: _Execution):
+        """Record latency and critical-path timing for a finished workflow."""
+        total_ms = (time.perf_counter() - execution.started) * 1000
+        step_ends = execution.step_end
+        completed = [
+            step for step in workflow.steps
+            if step.status == WorkflowStatus.COMPLETED and step.step_id in step_ends
+        ]
+        first_action_ms = (
+            (min(step_ends[step.step_id] for step in completed) - execution.started) * 1000
+            if completed else None
+        )
+
+        # Walk back from the last step to finish through the dependency that gated each start
+        critical_path: list[str] = []
+        try:
+            dependencies = resolve_step_dependencies(workflow)
+        except ValueError:
+            dependencies = {}
+        names = {step.step_id: step.name for step in workflow.steps}
+        current = max(step_ends, key=step_ends.get) if step_ends else None
+        while current is not None:
+            critical_path.append(names[current])
+            finished = [dep for dep in dependencies.get(current, []) if dep in step_ends]
+            current = max(finished, key=step_ends.get) if finished else None
+        critical_path.reverse()
+        critical_path_ms = (
+            (max(step_ends.values()) - execution.started) * 1000 if step_ends else 0.0
+        )
+
+        workflow.timing = {
+            "total_ms": total_ms,
+            "time_to_first_action_ms": first_action_ms,
+            "critical_path": critical_path,
+            "critical_path_ms": critical_path_ms,
+            "step_latency_ms": {
+                step.name: step.latency_ms for step in workflow.steps if step.latency_ms is not None
+            },
+        }
+
+        finished_count = (
+            self.statistics["successful_executions"]
+            + self.statistics["failed_executions"]
+            + self.statistics["cancelled_executions"]
+        )
+        average = self.statistics["average_execution_time_ms"]
+        self.statistics["average_execution_time_ms"] = average + (total_ms - average) / finished_count
+
+        stats = self.timing_statistics.setdefault(workflow.name, {
+            "executions": 0,
+            "average_total_ms": 0.0,
+            "average_time_to_first_action_ms": None,
+            "average_critical_path_ms": 0.0,
+            "average_step_latency_ms": {},
+        })
+        stats["executions"] += 1
+        count = stats["executions"]
+        stats["average_total_ms"] += (total_ms - stats["average_total_ms"]) / count
+        stats["average_critical_path_ms"] += (critical_path_ms - stats["average_critical_path_ms"]) / count
+        if first_action_ms is not None:
+            previous = stats["average_time_to_first_action_ms"]
+            stats["average_time_to_first_action_ms"] = (
+                first_action_ms if previous is None else previous + (first_action_ms - previous) / count
+            )
+        stats["critical_path"] = critical_path
+        for name, latency in workflow.timing["step_latency_ms"].items():
+            previous = stats["average_step_latency_ms"].get(name)
+            stats["average_step_latency_ms"][name] = (
+                latency if previous is None else previous + (latency - previous) / count
+            )
+
     def execute_workflow_sync(
         self, workflow: Workflow, context: Dict[str, Any] = None
     ) -> Workflow:
@@ -419,12 +675,18 @@ class WorkflowEngine:
         return [w.to_dict() for w in history]
 
     def cancel_workflow(self, workflow_id: str) -> bool:
-        """Cancel a running workflow."""
+        """Cancel a running workflow, including any steps in progress."""
         if workflow_id in self.active_executions:
             workflow = self.active_executions[workflow_id]
             workflow.status = WorkflowStatus.CANCELLED
             workflow.completed_at = datetime.utcnow()
             workflow.add_audit_entry("workflow_cancelled")
+            execution = self._executions.get(workflow_id)
+            if execution is not None:
+                execution.cancelled = True
+                for task in execution.running:
+                    task.cancel()
+                execution.wake.set()
             return True
         return False
 
@@ -444,9 +706,18 @@ class WorkflowEngine:
             if workflow.status == WorkflowStatus.PAUSED:
                 workflow.status = WorkflowStatus.RUNNING
                 workflow.add_audit_entry("workflow_resumed")
+                execution = self._executions.get(workflow_id)
+                if execution is not None:
+                    execution.wake.set()
                 return True
         return False
 
+    def get_timing_statistics(self, workflow_name: str = None) -> dict[str, Any]:
+        """Get average latency and critical-path timing per workflow."""
+        if workflow_name:
+            return self.timing_statistics.get(workflow_name, {})
+        return self.timing_statistics
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get workflow engine statistics."""
         return {
@@ -473,3 +744,11 @@ class WorkflowEngine:
                         triggered_workflows.append(instance)
                     break
         return triggered_workflows
+
+
+def _instance_dependencies(step: WorkflowStep, template: Workflow) -> list[str] | None:
+    """Rewrite template step_id references to names, since instances get new ids."""
+    if step.depends_on is None:
+        return None
+    names = {s.step_id: s.name for s in template.steps}
+    return [names.get(ref, ref) for ref in step.depends_on]
@@ -48,6 +48,7 @@ def create_gunfire_response_workflow() -> Workflow:
                 target_subsystem="drone_ops",
                 parameters={"mission_type": "surveillance", "priority": "emergency", "capabilities": ["thermal", "spotlight"]},
                 execution_mode=StepExecutionMode.PARALLEL,
+                depends_on=["Verify Gunshot Detection"],
                 timeout_seconds=30,
                 guardrails=["airspace_clearance", "operator_certification"],
             ),
@@ -58,6 +59,7 @@ def create_gunfire_response_workflow() -> Workflow:
                 target_subsystem="cctv_network",
                 parameters={"radius_meters": 500, "recording_mode": "high_priority"},
                 execution_mode=StepExecutionMode.PARALLEL,
+                depends_on=["Verify Gunshot Detection"],
                 timeout_seconds=15,
                 guardrails=["privacy_protection"],
             ),
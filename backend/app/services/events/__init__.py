@@ -6,9 +6,21 @@ This module provides real-time event processing including:
 - Event broadcasting
 - Event normalization from various sources
 - Subscription management
+- Cross-process broadcast fan-out
 """
 
+from app.services.events.broadcast_bus import (
+    BroadcastBus,
+    InProcessBroadcastBus,
+    RedisBroadcastBus,
+)
 from app.services.events.event_processor import EventProcessor
 from app.services.events.websocket_manager import WebSocketManager
 
-__all__ = ["WebSocketManager", "EventProcessor"]
+__all__ = [
+    "WebSocketManager",
+    "EventProcessor",
+    "BroadcastBus",
+    "InProcessBroadcastBus",
+    "RedisBroadcastBus",
+]
@@ -0,0 +1,406 @@
+"""
+Cross-process broadcast bus for the G3TI RTCC-UIP Backend.
+
+WebSocket connections and subscription maps live in each worker process.
+The broadcast bus lets every worker fan out messages published by any
+worker to its own connected clients.
+
+Features:
+- Pluggable transport (Redis pub/sub, or in-process for tests and
+  single-worker deployments)
+- Immediate delivery to the publishing worker's own subscribers
+- Per-channel batching of messages sent to other workers
+- Per-channel ordering
+- Deduplication by message_id
+"""
+
+import asyncio
+import json
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from app.core.logging import get_logger
+from app.db.redis import RedisManager
+
+logger = get_logger(__name__)
+
+MessageHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+
+
+class BroadcastBus(ABC):
+    """
+    Base broadcast bus.
+
+    Handles local dispatch, batching, ordering and deduplication.
+    Subclasses provide the transport by implementing ``_send`` and,
+    for transports with a background reader, ``start`` and ``stop``.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        flush_interval: float = 0.005,
+        dedupe_window: int = 10_000,
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            batch_size: Messages per channel that trigger an immediate flush
+            flush_interval: Seconds a partial batch waits before being sent
+            dedupe_window: Number of recent message IDs remembered
+        """
+        self.origin = uuid.uuid4().hex
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dedupe_window = dedupe_window
+
+        self._handlers: dict[str, list[MessageHandler]] = {}
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._flush_tasks: dict[str, asyncio.Task] = {}
+        self._channel_locks: dict[str, asyncio.Lock] = {}
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._running = False
+
+        self.published_count = 0
+        self.batches_sent = 0
+        self.duplicates_dropped = 0
+
+    @property
+    def has_peers(self) -> bool:
+        """Whether messages need to be sent to other workers."""
+        return True
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """Register a handler for messages on a channel."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        """Remove a handler from a channel."""
+        handlers = self._handlers.get(channel, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(channel, None)
+
+    def channels(self) -> list[str]:
+        """Get the channels with registered handlers."""
+        return list(self._handlers)
+
+    async def start(self) -> None:
+        """Start the bus."""
+        self._running = True
+
+    async def stop(self) -> None:
+        """Send any pending batches and stop the bus."""
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        self._flush_tasks.clear()
+        await self.flush()
+        self._running = False
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> str:
+        """
+        Publish a message to all workers.
+
+        The message is delivered to this worker's handlers before
+        returning, and queued for the other workers. A message whose ID
+        was already published or received is dropped.
+
+        Args:
+            channel: Channel name
+            message: JSON-serializable message (a message_id is added if missing)
+
+        Returns:
+            str: The message ID
+        """
+        if "message_id" not in message:
+            message = {**message, "message_id": str(uuid.uuid4())}
+        message_id = message["message_id"]
+        if message_id in self._seen:
+            self.duplicates_dropped += 1
+            return message_id
+
+        self._mark_seen(message_id)
+        self.published_count += 1
+        await self._dispatch(channel, message)
+
+        if self.has_peers:
+            pending = self._pending.setdefault(channel, [])
+            pending.append(message)
+            if len(pending) >= self.batch_size:
+                await self._flush_channel(channel)
+            elif channel not in self._flush_tasks:
+                self._flush_tasks[channel] = asyncio.create_task(self._flush_later(channel))
+
+        return message_id
+
+    async def flush(self) -> None:
+        """Send all pending batches now."""
+        for channel in list(self._pending):
+            await self._flush_channel(channel)
+
+    async def _flush_later(self, channel: str) -> None:
+        """Send a channel's partial batch after the flush interval."""
+        try:
+            await asyncio.sleep(self.flush_interval)
+            self._flush_tasks.pop(channel, None)
+            await self._flush_channel(channel)
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_channel(self, channel: str) -> None:
+        """Send a channel's pending messages as one batch."""
+        lock = self._channel_locks.setdefault(channel, asyncio.Lock())
+        # Batches for a channel are sent one at a time, in publish order
+        async with lock:
+            batch = self._pending.pop(channel, None)
+            if not batch:
+                return
+            envelope = {"origin": self.origin, "channel": channel, "messages": batch}
+            try:
+                await self._send(channel, envelope)
+                self.batches_sent += 1
+            except Exception as e:
+                logger.error(
+                    "broadcast_bus_send_failed", channel=channel, messages=len(batch), error=str(e)
+                )
+
+    @abstractmethod
+    async def _send(self, channel: str, envelope: dict[str, Any]) -> None:
+        """Send a batch envelope to the other workers."""
+        pass
+
+    async def _receive(self, channel: str, envelope: dict[str, Any]) -> None:
+        """Dispatch a batch received from the transport."""
+        if envelope.get("origin") == self.origin:
+            return
+        for message in envelope.get("messages", []):
+            message_id = message.get("message_id")
+            if message_id is not None:
+                if message_id in self._seen:
+                    self.duplicates_dropped += 1
+                    continue
+                self._mark_seen(message_id)
+            await self._dispatch(channel, message)
+
+    async def _dispatch(self, channel: str, message: dict[str, Any]) -> None:
+        """Run this worker's handlers for a message."""
+        for handler in list(self._handlers.get(channel, [])):
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.warning("broadcast_bus_handler_failed", channel=channel, error=str(e))
+
+    def _mark_seen(self, message_id: str) -> None:
+        """Remember a message ID, forgetting the oldest beyond the window."""
+        self._seen[message_id] = None
+        self._seen.move_to_end(message_id)
+        while len(self._seen) > self.dedupe_window:
+            self._seen.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bus statistics."""
+        return {
+            "transport": type(self).__name__,
+            "running": self._running,
+            "channels": len(self._handlers),
+            "published": self.published_count,
+            "batches_sent": self.batches_sent,
+            "duplicates_dropped": self.duplicates_dropped,
+            "pending": sum(len(batch) for batch in self._pending.values()),
+        }
+
+
+class InProcessBroker:
+    """Connects in-process buses the way Redis connects worker processes."""
+
+    def __init__(self) -> None:
+        """Initialize the broker."""
+        self.buses: list[InProcessBroadcastBus] = []
+
+
+class InProcessBroadcastBus(BroadcastBus):
+    """
+    Broadcast bus whose peers are other buses on the same broker.
+
+    Each bus reads its inbox in a background task, so delivery is
+    asynchronous and ordered like a real transport. Without a shared
+    broker the bus only delivers locally.
+    """
+
+    def __init__(self, broker: InProcessBroker | None = None, **kwargs: Any) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            broker: Broker shared with peer buses (a private one if omitted)
+            **kwargs: BroadcastBus options
+        """
+        super().__init__(**kwargs)
+        self.broker = broker or InProcessBroker()
+        self.broker.buses.append(self)
+        self._inbox: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        self._reader_task: asyncio.Task | None = None
+
+    @property
+    def has_peers(self) -> bool:
+        """Whether other buses share the broker."""
+        return len(self.broker.buses) > 1
+
+    async def start(self) -> None:
+        """Start reading the inbox."""
+        if self._reader_task is None:
+            self._reader_task = asyncio.create_task(self._read_inbox())
+        await super().start()
+
+    async def stop(self) -> None:
+        """Flush, then stop reading the inbox."""
+        await super().stop()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+    async def drain(self) -> None:
+        """Wait until every received batch has been dispatched."""
+        await self._inbox.join()
+
+    async def _send(self, channel: str, envelope: dict[str, Any]) -> None:
+        """Queue the batch on every peer's inbox."""
+        # Round-trip through JSON like a real transport
+        data = json.loads(json.dumps(envelope, default=str))
+        for bus in self.broker.buses:
+            if bus is not self:
+                bus._inbox.put_nowait((channel, data))
+
+    async def _read_inbox(self) -> None:
+        """Dispatch received batches in arrival order."""
+        while True:
+            channel, envelope = await self._inbox.get()
+            try:
+                await self._receive(channel, envelope)
+            finally:
+                self._inbox.task_done()
+
+
+class RedisBroadcastBus(BroadcastBus):
+    """Broadcast bus over Redis pub/sub, shared by all worker processes."""
+
+    def __init__(
+        self,
+        redis: RedisManager,
+        prefix: str = "rtcc:ws:",
+        poll_timeout: float = 1.0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            redis: Connected Redis manager
+            prefix: Prefix for Redis channel names
+            poll_timeout: Seconds to wait for a message before re-checking channels
+            **kwargs: BroadcastBus options
+        """
+        super().__init__(**kwargs)
+        self.redis = redis
+        self.prefix = prefix
+        self.poll_timeout = poll_timeout
+        self._subscribed: set[str] = set()
+        self._pubsub: Any = None
+        self._listener_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Subscribe to handler channels and start listening."""
+        await self._sync_subscriptions()
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+        await super().start()
+        logger.info("redis_broadcast_bus_started", channels=len(self._subscribed))
+
+    async def stop(self) -> None:
+        """Flush, stop listening and unsubscribe."""
+        await super().stop()
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._subscribed:
+            await self.redis.unsubscribe(*(self.prefix + c for c in self._subscribed))
+            self._subscribed.clear()
+
+    async def _sync_subscriptions(self) -> None:
+        """Subscribe to channels whose handlers were added since the last check."""
+        new_channels = [c for c in self._handlers if c not in self._subscribed]
+        if new_channels:
+            self._pubsub = await self.redis.subscribe(*(self.prefix + c for c in new_channels))
+            self._subscribed.update(new_channels)
+
+    async def _send(self, channel: str, envelope: dict[str, Any]) -> None:
+        """Publish the batch on the channel's Redis channel."""
+        await self.redis.publish(self.prefix + channel, json.dumps(envelope, default=str))
+
+    async def _listen(self) -> None:
+        """Read batches from Redis and dispatch them in order."""
+        while True:
+            try:
+                await self._sync_subscriptions()
+                if self._pubsub is None:
+                    await asyncio.sleep(self.poll_timeout)
+                    continue
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_timeout
+                )
+                if message is None or message.get("type") != "message":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                await self._receive(channel[len(self.prefix):], json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("redis_broadcast_bus_listen_error", error=str(e))
+                await asyncio.sleep(self.poll_timeout)
+
+
+# Global broadcast bus instance
+_broadcast_bus: BroadcastBus | None = None
+
+
+def get_broadcast_bus() -> BroadcastBus:
+    """Get the broadcast bus (in-process until a shared transport is configured)."""
+    global _broadcast_bus
+    if _broadcast_bus is None:
+        _broadcast_bus = InProcessBroadcastBus()
+    return _broadcast_bus
+
+
+def set_broadcast_bus(bus: BroadcastBus) -> BroadcastBus:
+    """
+    Replace the broadcast bus, keeping the handlers registered on the old one.
+
+    Args:
+        bus: New bus
+
+    Returns:
+        BroadcastBus: The previous bus
+    """
+    global _broadcast_bus
+    previous = get_broadcast_bus()
+    for channel, handlers in previous._handlers.items():
+        for handler in handlers:
+            if handler not in bus._handlers.get(channel, []):
+                bus.subscribe(channel, handler)
+    _broadcast_bus = bus
+    return previous
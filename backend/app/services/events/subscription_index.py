@@ -0,0 +1,228 @@
+"""
+Subscription index for WebSocket event routing.
+
+Finds the clients whose subscriptions match an event without testing every
+connection:
+- Inverted indexes keyed by event type, source, priority and tag
+- Grid index of subscribed geographic bounds
+- Incremental updates as clients subscribe, unsubscribe and disconnect
+
+Matching follows ClientConnection.matches_event: an empty filter matches
+everything, and tag and bounds filters only apply when the event carries
+tags or a location.
+"""
+
+import math
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from app.schemas.events import EventPriority, EventSource, EventSubscription, EventType
+
+# Grid cell size for subscribed bounds, in degrees (~11 km)
+GEO_CELL_DEG = 0.1
+
+# Bounds spanning more cells than this are checked directly instead
+MAX_CELLS_PER_BOUNDS = 1024
+
+
+class _FieldIndex:
+    """Clients by subscribed value for one filter field, plus the unfiltered ones."""
+
+    def __init__(self) -> None:
+        self.wildcard: set[str] = set()
+        self.by_value: dict[Hashable, set[str]] = {}
+
+    def add(self, client_id: str, values: Iterable[Hashable]) -> None:
+        values = set(values)
+        if not values:
+            self.wildcard.add(client_id)
+            return
+        for value in values:
+            self.by_value.setdefault(value, set()).add(client_id)
+
+    def remove(self, client_id: str, values: Iterable[Hashable]) -> None:
+        values = set(values)
+        if not values:
+            self.wildcard.discard(client_id)
+            return
+        for value in values:
+            clients = self.by_value.get(value)
+            if clients is not None:
+                clients.discard(client_id)
+                if not clients:
+                    del self.by_value[value]
+
+    def matching(self, values: Iterable[Hashable]) -> list[set[str]]:
+        """Get the client sets that together match any of the values."""
+        sets = [self.wildcard]
+        for value in values:
+            clients = self.by_value.get(value)
+            if clients:
+                sets.append(clients)
+        return sets
+
+
+def _contains(bounds: dict[str, float], lat: float, lon: float) -> bool:
+    """Check whether a point lies within subscribed bounds."""
+    return (
+        bounds.get("south", -90) <= lat <= bounds.get("north", 90)
+        and bounds.get("west", -180) <= lon <= bounds.get("east", 180)
+    )
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / GEO_CELL_DEG), math.floor(lon / GEO_CELL_DEG)
+
+
+class _BoundsIndex:
+    """Grid of subscribed bounding boxes."""
+
+    def __init__(self) -> None:
+        self.unbounded: set[str] = set()
+        self.bounds: dict[str, dict[str, float]] = {}
+        self._cells: dict[tuple[int, int], set[str]] = {}
+        self._oversized: set[str] = set()
+
+    def _cells_for(self, bounds: dict[str, float]) -> list[tuple[int, int]] | None:
+        """Get the grid cells a box overlaps, or None if it spans too many."""
+        south, west = _cell(max(bounds.get("south", -90), -90), max(bounds.get("west", -180), -180))
+        north, east = _cell(min(bounds.get("north", 90), 90), min(bounds.get("east", 180), 180))
+        if north < south or east < west:
+            return []
+        if (north - south + 1) * (east - west + 1) > MAX_CELLS_PER_BOUNDS:
+            return None
+        return [(i, j) for i in range(south, north + 1) for j in range(west, east + 1)]
+
+    def add(self, client_id: str, bounds: dict[str, float] | None) -> None:
+        if not bounds:
+            self.unbounded.add(client_id)
+            return
+        self.bounds[client_id] = bounds
+        cells = self._cells_for(bounds)
+        if cells is None:
+            self._oversized.add(client_id)
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(client_id)
+
+    def remove(self, client_id: str, bounds: dict[str, float] | None) -> None:
+        if not bounds:
+            self.unbounded.discard(client_id)
+            return
+        self.bounds.pop(client_id, None)
+        cells = self._cells_for(bounds)
+        if cells is None:
+            self._oversized.discard(client_id)
+            return
+        for cell in cells:
+            clients = self._cells.get(cell)
+            if clients is not None:
+                clients.discard(client_id)
+                if not clients:
+                    del self._cells[cell]
+
+    def containing(self, lat: float, lon: float) -> set[str]:
+        """Get bounded clients whose bounds contain the point."""
+        candidates = self._cells.get(_cell(lat, lon), set()) | self._oversized
+        return {c for c in candidates if _contains(self.bounds[c], lat, lon)}
+
+
+class SubscriptionIndex:
+    """Index of client subscriptions for fast event matching."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._subscriptions: dict[str, EventSubscription] = {}
+        self._event_types = _FieldIndex()
+        self._sources = _FieldIndex()
+        self._priorities = _FieldIndex()
+        self._tags = _FieldIndex()
+        self._bounds = _BoundsIndex()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __contains__(self, client_id: str) -> bool:
+        return client_id in self._subscriptions
+
+    def add(self, client_id: str, subscription: EventSubscription) -> None:
+        """
+        Index a client's subscription, replacing any previous one.
+
+        Args:
+            client_id: Client identifier
+            subscription: Subscription filters
+        """
+        self.remove(client_id)
+        self._subscriptions[client_id] = subscription
+        self._event_types.add(client_id, subscription.event_types)
+        self._sources.add(client_id, subscription.sources)
+        self._priorities.add(client_id, subscription.priorities)
+        self._tags.add(client_id, subscription.tags)
+        self._bounds.add(client_id, subscription.geographic_bounds)
+
+    def remove(self, client_id: str) -> None:
+        """Remove a client from the index."""
+        subscription = self._subscriptions.pop(client_id, None)
+        if subscription is None:
+            return
+        self._event_types.remove(client_id, subscription.event_types)
+        self._sources.remove(client_id, subscription.sources)
+        self._priorities.remove(client_id, subscription.priorities)
+        self._tags.remove(client_id, subscription.tags)
+        self._bounds.remove(client_id, subscription.geographic_bounds)
+
+    def match(
+        self,
+        event_type: EventType,
+        source: EventSource,
+        priority: EventPriority,
+        location: dict[str, float] | None = None,
+        tags: list[str] | None = None,
+    ) -> set[str]:
+        """
+        Find the clients whose subscriptions match an event.
+
+        Args:
+            event_type: Event type
+            source: Event source
+            priority: Event priority
+            location: Event location (lat, lon)
+            tags: Event tags
+
+        Returns:
+            set: Matching client IDs
+        """
+        # Each filter contributes a union of client sets; a client matches
+        # when it appears in every filter's union
+        filters = [
+            self._event_types.matching([event_type]),
+            self._sources.matching([source]),
+            self._priorities.matching([priority]),
+        ]
+        if tags:
+            filters.append(self._tags.matching(tags))
+        if location:
+            lat, lon = location.get("lat", 0), location.get("lon", 0)
+            filters.append([self._bounds.unbounded, self._bounds.containing(lat, lon)])
+
+        # Start from the most selective filter; set intersection iterates
+        # the smaller operand, so narrowing stays proportional to the result
+        filters.sort(key=lambda sets: sum(len(s) for s in sets))
+        matched = set().union(*filters[0])
+        for sets in filters[1:]:
+            if not matched:
+                break
+            matched = set().union(*(matched & s for s in sets))
+        return matched
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            "clients": len(self._subscriptions),
+            "event_type_keys": len(self._event_types.by_value),
+            "source_keys": len(self._sources.by_value),
+            "priority_keys": len(self._priorities.by_value),
+            "tag_keys": len(self._tags.by_value),
+            "bounded_clients": len(self._bounds.bounds),
+        }
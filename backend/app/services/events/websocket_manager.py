@@ -6,15 +6,18 @@ event broadcasting to connected clients.
 
 Features:
 - Connection lifecycle management
-- Client subscription management
+- Client subscription management, indexed for event matching
 - Broadcast and targeted messaging
+- Per-connection outbound queues so slow clients never stall broadcasts
 - Heartbeat monitoring
 - Connection authentication
 """
 
 import asyncio
 import json
+import time
 import uuid
+from collections import deque
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
@@ -32,9 +35,88 @@ from app.schemas.events import (
     WebSocketMessage,
     WebSocketMessageType,
 )
+from app.services.events.subscription_index import SubscriptionIndex
 
 logger = get_logger(__name__)
 
+# Recent send latencies kept for metrics
+LATENCY_WINDOW = 1000
+
+
+class OutboundQueue:
+    """
+    Bounded queue of encoded messages waiting to be written to one client.
+
+    When a slow client's queue is full, the oldest non-critical message is
+    dropped. Messages sharing a coalesce key replace the queued one in place,
+    so a client that falls behind receives only the latest state.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued messages
+        """
+        self.maxsize = maxsize
+        # Entries are [text, enqueued_at, coalesce_key, critical]
+        self._entries: deque[list[Any]] = deque()
+        self._by_key: dict[str, list[Any]] = {}
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, text: str, coalesce_key: str | None = None, critical: bool = False) -> None:
+        """
+        Queue an encoded message.
+
+        Args:
+            text: Encoded message
+            coalesce_key: Key of messages this one supersedes
+            critical: Never drop this message to make room
+        """
+        now = time.perf_counter()
+        if coalesce_key is not None:
+            queued = self._by_key.get(coalesce_key)
+            if queued is not None:
+                queued[0] = text
+                queued[3] = queued[3] or critical
+                self.coalesced += 1
+                return
+
+        if len(self._entries) >= self.maxsize:
+            self._drop_one()
+
+        entry = [text, now, coalesce_key, critical]
+        self._entries.append(entry)
+        if coalesce_key is not None:
+            self._by_key[coalesce_key] = entry
+        self.high_water = max(self.high_water, len(self._entries))
+        self._ready.set()
+
+    def _drop_one(self) -> None:
+        """Drop the oldest non-critical message (the oldest if all are critical)."""
+        victim = next((e for e in self._entries if not e[3]), self._entries[0])
+        self._entries.remove(victim)
+        if victim[2] is not None:
+            self._by_key.pop(victim[2], None)
+        self.dropped += 1
+
+    async def get(self) -> tuple[str, float]:
+        """Wait for the next message; returns (text, enqueued_at)."""
+        while not self._entries:
+            self._ready.clear()
+            await self._ready.wait()
+        text, enqueued_at, coalesce_key, _ = self._entries.popleft()
+        if coalesce_key is not None:
+            self._by_key.pop(coalesce_key, None)
+        return text, enqueued_at
+
 
 class ClientConnection:
     """
@@ -49,6 +131,7 @@ class ClientConnection:
         client_id: str,
         user_id: str | None = None,
         user_role: str | None = None,
+        queue_size: int | None = None,
     ) -> None:
         """
         Initialize client connection.
@@ -58,6 +141,7 @@ class ClientConnection:
             client_id: Unique client identifier
             user_id: Authenticated user ID
             user_role: User's role for authorization
+            queue_size: Outbound queue bound (defaults to settings)
         """
         self.websocket = websocket
         self.client_id = client_id
@@ -68,6 +152,8 @@ class ClientConnection:
         self.subscription = EventSubscription()
         self.message_count = 0
         self.is_authenticated = user_id is not None
+        self.outbound = OutboundQueue(queue_size or settings.ws_outbound_queue_size)
+        self.writer_task: asyncio.Task | None = None
 
     def update_activity(self) -> None:
         """Update last activity timestamp."""
@@ -141,12 +227,16 @@ class WebSocketManager:
         """Initialize the WebSocket manager."""
         self._connections: dict[str, ClientConnection] = {}
         self._user_connections: dict[str, set[str]] = {}  # user_id -> client_ids
+        self._subscriptions = SubscriptionIndex()
         self._heartbeat_task: asyncio.Task | None = None
         self._running = False
         self._message_handlers: dict[
             WebSocketMessageType,
             Callable[[ClientConnection, dict[str, Any]], Coroutine[Any, Any, None]],
         ] = {}
+        self._send_latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._messages_sent = 0
+        self._send_failures = 0
 
         # Register default handlers
         self._register_default_handlers()
@@ -211,6 +301,8 @@ class WebSocketManager:
         )
 
         self._connections[client_id] = connection
+        self._subscriptions.add(client_id, connection.subscription)
+        connection.writer_task = asyncio.create_task(self._writer_loop(connection))
 
         # Track user connections
         if user_id:
@@ -250,6 +342,12 @@ class WebSocketManager:
         connection = self._connections.pop(client_id, None)
         if not connection:
             return
+        self._subscriptions.remove(client_id)
+
+        # Stop the writer (unless it is the task disconnecting its own client)
+        writer = connection.writer_task
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
         # Remove from user connections
         if connection.user_id and connection.user_id in self._user_connections:
@@ -315,10 +413,15 @@ class WebSocketManager:
         payload: dict[str, Any],
         location: dict[str, float] | None = None,
         tags: list[str] | None = None,
+        coalesce_key: str | None = None,
     ) -> int:
         """
         Broadcast an event to all subscribed clients.
 
+        The message is encoded once and queued for each matching client;
+        each client's writer task sends it, so slow clients do not delay
+        the others.
+
         Args:
             event_type: Event type
             source: Event source
@@ -326,9 +429,10 @@ class WebSocketManager:
             payload: Event payload
             location: Event location
             tags: Event tags
+            coalesce_key: Replace a still-queued message with the same key
 
         Returns:
-            int: Number of clients that received the event
+            int: Number of clients the event was queued for
         """
         message = WebSocketMessage(
             type=WebSocketMessageType.EVENT,
@@ -344,16 +448,12 @@ class WebSocketManager:
             message_id=str(uuid.uuid4()),
         )
 
-        sent_count = 0
-        for connection in list(self._connections.values()):
-            if connection.matches_event(event_type, source, priority, location, tags):
-                try:
-                    await self._send_message(connection, message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.warning(
-                        "broadcast_send_error", client_id=connection.client_id, error=str(e)
-                    )
+        sent_count = self._fan_out(
+            message,
+            self._subscriptions.match(event_type, source, priority, location, tags),
+            coalesce_key=coalesce_key,
+            critical=priority == EventPriority.CRITICAL,
+        )
 
         logger.debug(
             "event_broadcast",
@@ -364,6 +464,28 @@ class WebSocketManager:
 
         return sent_count
 
+    def _fan_out(
+        self,
+        message: WebSocketMessage,
+        client_ids: set[str],
+        coalesce_key: str | None = None,
+        critical: bool = False,
+    ) -> int:
+        """
+        Queue a message for the given clients, encoding it once.
+
+        Returns:
+            int: Number of clients the message was queued for
+        """
+        text = message.model_dump_json()
+        queued = 0
+        for client_id in client_ids:
+            connection = self._connections.get(client_id)
+            if connection is not None:
+                connection.outbound.put(text, coalesce_key, critical)
+                queued += 1
+        return queued
+
     async def send_to_user(self, user_id: str, message: WebSocketMessage) -> int:
         """
         Send a message to all connections for a specific user.
@@ -389,19 +511,25 @@ class WebSocketManager:
 
         return sent_count
 
-    async def send_to_client(self, client_id: str, message: WebSocketMessage) -> bool:
+    async def send_to_client(
+        self, client_id: str, message: WebSocketMessage | dict[str, Any]
+    ) -> bool:
         """
-        Send a message to a specific client.
+        Queue a message for a specific client.
+
+        The message is written by the client's writer loop. A failed write
+        disconnects the client, and messages dropped from a full queue are
+        counted; both show up in get_stats rather than in this result.
 
         Args:
             client_id: Client identifier
-            message: Message to send
+            message: Message to send (a WebSocketMessage or a JSON-serializable dict)
 
         Returns:
-            bool: True if sent successfully
+            bool: True if the message was queued for the client
         """
         connection = self._connections.get(client_id)
-        if not connection:
+        if not connection or connection.websocket.client_state != WebSocketState.CONNECTED:
             return False
 
         try:
@@ -418,6 +546,35 @@ class WebSocketManager:
         """Get the number of connections for a specific user."""
         return len(self._user_connections.get(user_id, set()))
 
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get delivery statistics.
+
+        Returns:
+            dict: Connection count, outbound queue depths, drop/coalesce
+            counts and recent send latency percentiles (milliseconds)
+        """
+        depths = [len(c.outbound) for c in self._connections.values()]
+        latencies = sorted(self._send_latencies)
+
+        def percentile(p: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+
+        return {
+            "connections": len(self._connections),
+            "subscriptions": self._subscriptions.get_stats(),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_messages": sum(c.outbound.dropped for c in self._connections.values()),
+            "coalesced_messages": sum(c.outbound.coalesced for c in self._connections.values()),
+            "messages_sent": self._messages_sent,
+            "send_failures": self._send_failures,
+            "send_latency_p50_ms": percentile(0.5),
+            "send_latency_p99_ms": percentile(0.99),
+        }
+
     async def broadcast_ai_insight(
         self,
         insight_type: str,
@@ -425,6 +582,7 @@ class WebSocketManager:
         priority: EventPriority = EventPriority.MEDIUM,
         related_entities: list[str] | None = None,
         location: dict[str, float] | None = None,
+        coalesce_key: str | None = None,
     ) -> int:
         """
         Broadcast an AI insight event to subscribed clients.
@@ -442,9 +600,10 @@ class WebSocketManager:
             priority: Event priority level
             related_entities: List of related entity IDs
             location: Geographic location if applicable
+            coalesce_key: Replace a still-queued message with the same key
 
         Returns:
-            int: Number of clients that received the insight
+            int: Number of clients the insight was queued for
         """
         # Map insight type to event type
         event_type_map = {
@@ -474,19 +633,15 @@ class WebSocketManager:
             message_id=str(uuid.uuid4()),
         )
 
-        sent_count = 0
-        for connection in list(self._connections.values()):
-            # Check if client is subscribed to AI events
-            if connection.matches_event(
+        # Queue for clients subscribed to AI events
+        sent_count = self._fan_out(
+            message,
+            self._subscriptions.match(
                 event_type, EventSource.AI_ENGINE, priority, location, ["ai", "intelligence"]
-            ):
-                try:
-                    await self._send_message(connection, message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.warning(
-                        "ai_insight_send_error", client_id=connection.client_id, error=str(e)
-                    )
+            ),
+            coalesce_key=coalesce_key,
+            critical=priority == EventPriority.CRITICAL,
+        )
 
         logger.debug(
             "ai_insight_broadcast",
@@ -623,6 +778,8 @@ class WebSocketManager:
             },
             priority=priority_map.get(risk_level.lower(), EventPriority.MEDIUM),
             related_entities=[entity_id],
+            # Clients that fall behind only need the latest score per entity
+            coalesce_key=f"ai_risk:{entity_id}",
         )
 
     async def broadcast_ai_prediction(
@@ -667,13 +824,43 @@ class WebSocketManager:
             location=location,
         )
 
-    async def _send_message(self, connection: ClientConnection, message: WebSocketMessage) -> None:
-        """Send a message to a client."""
+    async def _send_message(
+        self, connection: ClientConnection, message: WebSocketMessage | dict[str, Any]
+    ) -> None:
+        """
+        Queue a message for a client.
+
+        Targeted messages are queued as critical: a full queue drops
+        non-critical broadcasts first, and only drops the oldest critical
+        message once nothing else is left to evict.
+        """
         if connection.websocket.client_state != WebSocketState.CONNECTED:
             return
 
-        await connection.websocket.send_text(message.model_dump_json())
-        connection.message_count += 1
+        if isinstance(message, dict):
+            text = json.dumps(message, default=str)
+        else:
+            text = message.model_dump_json()
+        connection.outbound.put(text, critical=True)
+
+    async def _writer_loop(self, connection: ClientConnection) -> None:
+        """Write a client's queued messages in order until it disconnects."""
+        while True:
+            text, enqueued_at = await connection.outbound.get()
+            if connection.websocket.client_state != WebSocketState.CONNECTED:
+                continue
+            try:
+                await connection.websocket.send_text(text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._send_failures += 1
+                logger.warning("websocket_send_error", client_id=connection.client_id, error=str(e))
+                await self.disconnect(connection.client_id)
+                return
+            connection.message_count += 1
+            self._messages_sent += 1
+            self._send_latencies.append(time.perf_counter() - enqueued_at)
 
     async def _send_error(self, connection: ClientConnection, error_message: str) -> None:
         """Send an error message to a client."""
@@ -689,6 +876,7 @@ class WebSocketManager:
         try:
             subscription = EventSubscription(**payload)
             connection.subscription = subscription
+            self._subscriptions.add(connection.client_id, subscription)
 
             await self._send_message(
                 connection,
@@ -712,6 +900,7 @@ class WebSocketManager:
     ) -> None:
         """Handle unsubscription request."""
         connection.subscription = EventSubscription()
+        self._subscriptions.add(connection.client_id, connection.subscription)
 
         await self._send_message(
             connection, WebSocketMessage(type=WebSocketMessageType.UNSUBSCRIBED, payload={})
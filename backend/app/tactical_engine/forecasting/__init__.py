@@ -20,6 +20,7 @@ import numpy as np
 from ...db.elasticsearch import ElasticsearchManager
 from ...db.neo4j import Neo4jManager
 from ...db.redis import RedisManager
+from ..kde import GridKDE
 
 logger = logging.getLogger(__name__)
 
@@ -571,24 +572,8 @@ class TacticalForecaster:
         grid_size: int,
     ) -> np.ndarray:
         """Compute KDE on a grid."""
-        lat_range = np.linspace(bounds["min_lat"], bounds["max_lat"], grid_size)
-        lon_range = np.linspace(bounds["min_lon"], bounds["max_lon"], grid_size)
-
-        density = np.zeros((grid_size, grid_size))
         bandwidth = 0.01
-
-        for i, lat in enumerate(lat_range):
-            for j, lon in enumerate(lon_range):
-                distances = np.sqrt(
-                    (points[:, 0] - lat) ** 2 + (points[:, 1] - lon) ** 2
-                )
-                kernel_values = np.exp(-0.5 * (distances / bandwidth) ** 2)
-                density[i, j] = np.sum(kernel_values)
-
-        if density.max() > 0:
-            density = density / density.max()
-
-        return density
+        return GridKDE(bounds, grid_size, bandwidth).fit(points).density()
 
     def _find_hotspots(
         self,
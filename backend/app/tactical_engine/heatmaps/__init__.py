@@ -7,11 +7,12 @@ This module provides heatmap generation capabilities including:
 - Bayesian spatial likelihood grids
 - Time-weighted decay for recent incidents
 - Multi-layer scoring (gunfire, violent crime, vehicle activity)
+- Live KDE layers updated incrementally as incidents arrive
 """
 
 import logging
 import math
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
 
 import numpy as np
@@ -19,6 +20,8 @@ import numpy as np
 from ...db.elasticsearch import ElasticsearchManager
 from ...db.neo4j import Neo4jManager
 from ...db.redis import RedisManager
+from ...utils.spatial_clustering import METERS_PER_DEGREE, dbscan
+from ..kde import GridKDE
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +44,19 @@ class PredictiveHeatmapEngine:
     DECAY_HALF_LIFE_HOURS = 72  # Half-life for time decay
 
     # DBSCAN parameters
-    DBSCAN_EPS = 0.003  # ~300m in degrees
+    DBSCAN_EPS_METERS = 300.0
     DBSCAN_MIN_SAMPLES = 3
 
+    # Live KDE layers kept for incremental updates
+    MAX_LIVE_LAYERS = 16
+
+    # Incident types matched by each heatmap type (others match all types)
+    HEATMAP_INCIDENT_TYPES = {
+        "gunfire": ("shotspotter", "shots_fired", "weapon_offense"),
+        "vehicles": ("lpr_hit", "vehicle_incident"),
+        "crime": ("violent_crime", "property_crime"),
+    }
+
     # Heatmap types and their weights
     HEATMAP_WEIGHTS = {
         "gunfire": {
@@ -84,6 +97,9 @@ class PredictiveHeatmapEngine:
         # Cache for computed heatmaps
         self._cache_ttl = 300  # 5 minutes
 
+        # Live KDE layers by (type, bounds, grid size, hours back)
+        self._live_layers: OrderedDict[tuple, dict] = OrderedDict()
+
         logger.info("PredictiveHeatmapEngine initialized")
 
     async def generate_current_heatmap(
@@ -118,21 +134,39 @@ class PredictiveHeatmapEngine:
         grid_sizes = {"low": 50, "medium": 100, "high": 200}
         grid_size = grid_sizes.get(resolution, 100)
 
-        # Fetch incident data
-        incidents = await self._fetch_incidents(
-            heatmap_type=heatmap_type,
-            bounds=bounds,
-            hours_back=hours_back,
-        )
+        # Reuse a live layer kept current by update_with_incident
+        layer_key = self._layer_key(heatmap_type, bounds, grid_size, hours_back)
+        layer = self._get_live_layer(layer_key)
+
+        if layer is None:
+            # Fetch incident data
+            incidents = await self._fetch_incidents(
+                heatmap_type=heatmap_type,
+                bounds=bounds,
+                hours_back=hours_back,
+            )
 
-        if not incidents:
-            return self._empty_heatmap_response(bounds, heatmap_type)
+            if not incidents:
+                return self._empty_heatmap_response(bounds, heatmap_type)
 
-        # Extract coordinates and weights
-        points, weights = self._extract_points_and_weights(incidents, heatmap_type)
+            # Extract coordinates and weights
+            points, weights = self._extract_points_and_weights(incidents, heatmap_type)
+
+            # Fit KDE layer
+            layer = {
+                "kde": self._fit_kde(points, weights, bounds, grid_size),
+                "points": points,
+                "weights": weights,
+                "incident_count": len(incidents),
+                "fitted_at": datetime.utcnow(),
+            }
+            self._store_live_layer(layer_key, layer)
+
+        points, weights = layer["points"], layer["weights"]
+        incident_count = layer["incident_count"]
 
         # Generate KDE heatmap
-        kde_grid = self._compute_kde(points, weights, bounds, grid_size)
+        kde_grid = layer["kde"].density()
 
         # Detect clusters using DBSCAN
         clusters = self._detect_clusters(points, weights)
@@ -144,7 +178,7 @@ class PredictiveHeatmapEngine:
         geojson = self._grid_to_geojson(kde_grid, bounds, grid_size)
 
         # Calculate confidence based on data density
-        confidence = self._calculate_confidence(len(incidents), hours_back)
+        confidence = self._calculate_confidence(incident_count, hours_back)
 
         return {
             "geojson": geojson,
@@ -153,7 +187,7 @@ class PredictiveHeatmapEngine:
             "confidence": confidence,
             "metadata": {
                 "type": heatmap_type,
-                "incident_count": len(incidents),
+                "incident_count": incident_count,
                 "hours_back": hours_back,
                 "resolution": resolution,
                 "generated_at": datetime.utcnow().isoformat(),
@@ -275,13 +309,16 @@ class PredictiveHeatmapEngine:
         incident_type = incident_data.get("type", "unknown")
 
         affected_zones = []
+        layers_updated = 0
         if lat and lon:
             affected_zones = self._get_affected_zones(lat, lon)
+            layers_updated = self._update_live_layers(incident_data)
 
         return {
             "updated": True,
             "incident_type": incident_type,
             "affected_zones": affected_zones,
+            "layers_updated": layers_updated,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -342,23 +379,10 @@ class PredictiveHeatmapEngine:
             }
         }
 
-        type_filters = []
-        if heatmap_type == "gunfire":
-            type_filters = [
-                {"term": {"type": "shotspotter"}},
-                {"term": {"type": "shots_fired"}},
-                {"term": {"type": "weapon_offense"}},
-            ]
-        elif heatmap_type == "vehicles":
-            type_filters = [
-                {"term": {"type": "lpr_hit"}},
-                {"term": {"type": "vehicle_incident"}},
-            ]
-        elif heatmap_type == "crime":
-            type_filters = [
-                {"term": {"type": "violent_crime"}},
-                {"term": {"type": "property_crime"}},
-            ]
+        type_filters = [
+            {"term": {"type": incident_type}}
+            for incident_type in self.HEATMAP_INCIDENT_TYPES.get(heatmap_type, ())
+        ]
 
         query = {
             "bool": {
@@ -479,16 +503,16 @@ class PredictiveHeatmapEngine:
 
         Uses Gaussian kernel with adaptive bandwidth.
         """
-        if len(points) == 0:
-            return np.zeros((grid_size, grid_size))
-
-        # Create grid
-        lat_range = np.linspace(bounds["min_lat"], bounds["max_lat"], grid_size)
-        lon_range = np.linspace(bounds["min_lon"], bounds["max_lon"], grid_size)
-
-        # Initialize density grid
-        density = np.zeros((grid_size, grid_size))
+        return self._fit_kde(points, weights, bounds, grid_size).density()
 
+    def _fit_kde(
+        self,
+        points: np.ndarray,
+        weights: np.ndarray,
+        bounds: dict,
+        grid_size: int,
+    ) -> GridKDE:
+        """Fit a KDE grid with bandwidth adapted to the data spread."""
         # Compute bandwidth based on data spread
         if len(points) > 1:
             std_lat = np.std(points[:, 0])
@@ -500,25 +524,87 @@ class PredictiveHeatmapEngine:
         else:
             bandwidth = self.DEFAULT_BANDWIDTH
 
-        # Compute KDE using vectorized operations
-        for i, lat in enumerate(lat_range):
-            for j, lon in enumerate(lon_range):
-                # Calculate distances to all points
-                distances = np.sqrt(
-                    (points[:, 0] - lat) ** 2 + (points[:, 1] - lon) ** 2
-                )
+        return GridKDE(bounds, grid_size, bandwidth).fit(points, weights)
 
-                # Gaussian kernel
-                kernel_values = np.exp(-0.5 * (distances / bandwidth) ** 2)
+    # ==================== Live Layers ====================
 
-                # Weighted sum
-                density[i, j] = np.sum(kernel_values * weights)
+    def _layer_key(
+        self,
+        heatmap_type: str,
+        bounds: dict,
+        grid_size: int,
+        hours_back: int,
+    ) -> tuple:
+        """Key identifying a live KDE layer."""
+        return (
+            heatmap_type,
+            bounds["min_lat"],
+            bounds["max_lat"],
+            bounds["min_lon"],
+            bounds["max_lon"],
+            grid_size,
+            hours_back,
+        )
 
-        # Normalize to 0-1 range
-        if density.max() > 0:
-            density = density / density.max()
+    def _get_live_layer(self, key: tuple) -> dict | None:
+        """Get a live layer fitted within the cache TTL."""
+        layer = self._live_layers.get(key)
+        if layer is None:
+            return None
+        if self._layer_expired(layer):
+            del self._live_layers[key]
+            return None
+        self._live_layers.move_to_end(key)
+        return layer
+
+    def _layer_expired(self, layer: dict) -> bool:
+        """Whether a live layer is older than the cache TTL."""
+        age = (datetime.utcnow() - layer["fitted_at"]).total_seconds()
+        return age > self._cache_ttl
+
+    def _store_live_layer(self, key: tuple, layer: dict) -> None:
+        """Store a live layer, evicting the least recently used."""
+        self._live_layers[key] = layer
+        self._live_layers.move_to_end(key)
+        while len(self._live_layers) > self.MAX_LIVE_LAYERS:
+            self._live_layers.popitem(last=False)
+
+    def _update_live_layers(self, incident_data: dict) -> int:
+        """
+        Fold a new incident into every live layer that would include it.
 
-        return density
+        Layers keep the bandwidth they were fitted with; the point is
+        added as a single outer-product update rather than a refit.
+
+        Returns:
+            Number of layers updated
+        """
+        points, weights = self._extract_points_and_weights([incident_data], "all")
+        if len(points) == 0:
+            return 0
+        lat, lon = points[0]
+        incident_type = incident_data.get("type")
+
+        updated = 0
+        for key, layer in list(self._live_layers.items()):
+            if self._layer_expired(layer):
+                del self._live_layers[key]
+                continue
+
+            heatmap_type, min_lat, max_lat, min_lon, max_lon = key[:5]
+            types = self.HEATMAP_INCIDENT_TYPES.get(heatmap_type)
+            if types and incident_type not in types:
+                continue
+            if not (min_lat <= lat <= max_lat and min_lon <= lon <= max_lon):
+                continue
+
+            layer["kde"].add(points, weights)
+            layer["points"] = np.vstack([layer["points"].reshape(-1, 2), points])
+            layer["weights"] = np.concatenate([layer["weights"], weights])
+            layer["incident_count"] += 1
+            updated += 1
+
+        return updated
 
     # ==================== DBSCAN Clustering ====================
 
@@ -535,99 +621,36 @@ class PredictiveHeatmapEngine:
         if len(points) < self.DBSCAN_MIN_SAMPLES:
             return []
 
-        # Simple DBSCAN implementation
-        clusters = []
-        visited = set()
-        cluster_id = 0
-
-        for i in range(len(points)):
-            if i in visited:
-                continue
-
-            # Find neighbors
-            neighbors = self._get_neighbors(points, i, self.DBSCAN_EPS)
-
-            if len(neighbors) < self.DBSCAN_MIN_SAMPLES:
-                continue
-
-            # Start new cluster
-            cluster_points = []
-            cluster_weights = []
-
-            # Expand cluster
-            to_process = list(neighbors)
-            while to_process:
-                point_idx = to_process.pop()
-                if point_idx in visited:
-                    continue
-
-                visited.add(point_idx)
-                cluster_points.append(points[point_idx])
-                cluster_weights.append(weights[point_idx])
-
-                # Find neighbors of this point
-                point_neighbors = self._get_neighbors(
-                    points, point_idx, self.DBSCAN_EPS
-                )
-
-                if len(point_neighbors) >= self.DBSCAN_MIN_SAMPLES:
-                    to_process.extend(
-                        n for n in point_neighbors if n not in visited
-                    )
-
-            if cluster_points:
-                cluster_points = np.array(cluster_points)
-                cluster_weights = np.array(cluster_weights)
-
-                # Calculate weighted centroid
-                total_weight = cluster_weights.sum()
-                centroid = (
-                    (cluster_points * cluster_weights[:, np.newaxis]).sum(axis=0)
-                    / total_weight
-                )
-
-                clusters.append({
-                    "id": f"cluster_{cluster_id}",
-                    "centroid": {
-                        "lat": float(centroid[0]),
-                        "lon": float(centroid[1]),
-                    },
-                    "point_count": len(cluster_points),
-                    "total_weight": float(total_weight),
-                    "radius": float(self._calculate_cluster_radius(
-                        cluster_points, centroid
-                    )),
-                    "confidence": min(1.0, len(cluster_points) / 20),
-                })
+        result = dbscan(
+            points,
+            eps_meters=self.DBSCAN_EPS_METERS,
+            min_samples=self.DBSCAN_MIN_SAMPLES,
+            weights=weights,
+            radius_percentile=90,
+        )
 
-                cluster_id += 1
+        clusters = []
+        for cluster_id in range(result.n_clusters):
+            point_count = int(result.sizes[cluster_id])
+            radius_meters = float(result.radii_meters[cluster_id])
+            clusters.append({
+                "id": f"cluster_{cluster_id}",
+                "centroid": {
+                    "lat": float(result.centroids[cluster_id, 0]),
+                    "lon": float(result.centroids[cluster_id, 1]),
+                },
+                "point_count": point_count,
+                "total_weight": float(result.weights[cluster_id]),
+                "radius": radius_meters / METERS_PER_DEGREE,
+                "radius_meters": radius_meters,
+                "confidence": min(1.0, point_count / 20),
+            })
 
         # Sort by weight (most significant first)
         clusters.sort(key=lambda x: x["total_weight"], reverse=True)
 
         return clusters[:10]  # Return top 10 clusters
 
-    def _get_neighbors(
-        self,
-        points: np.ndarray,
-        point_idx: int,
-        eps: float,
-    ) -> list[int]:
-        """Get indices of points within eps distance."""
-        distances = np.sqrt(
-            np.sum((points - points[point_idx]) ** 2, axis=1)
-        )
-        return list(np.where(distances <= eps)[0])
-
-    def _calculate_cluster_radius(
-        self,
-        points: np.ndarray,
-        centroid: np.ndarray,
-    ) -> float:
-        """Calculate the radius of a cluster."""
-        distances = np.sqrt(np.sum((points - centroid) ** 2, axis=1))
-        return float(np.percentile(distances, 90))  # 90th percentile
-
     # ==================== Bayesian Likelihood ====================
 
     def _compute_bayesian_likelihood(
@@ -0,0 +1,454 @@
+"""
+Hierarchical hexagonal cell index for the G3TI RTCC-UIP Backend.
+
+This module provides an H3-style spatial index used for hotspot, heatmap
+and aggregation keys:
+- Point-to-cell and cell-to-center/boundary conversion
+- k-ring (grid disk) and hollow ring neighbor queries
+- Parent/child roll-up between resolutions
+- Vectorized batch conversion for coordinate arrays
+
+Cells are pointy-top hexagons laid out on the spherical Web Mercator plane.
+Each resolution is an independent hex lattice whose edge length shrinks by
+sqrt(7) per level, matching H3's average edge lengths at the equator
+(resolution 8 ~ 530 m, resolution 10 ~ 76 m). True ground size shrinks with
+cos(latitude). The parent of a cell is the coarser cell containing its
+center, and the children of a cell are exactly the finer cells whose parent
+it is, so rolling counts up from a fine resolution is lossless.
+
+Cell identifiers are 16-character hex strings encoding the resolution and
+the axial lattice coordinates.
+"""
+
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+EARTH_RADIUS_M = 6378137.0
+MAX_MERCATOR_LAT = 85.05112878
+
+MIN_RESOLUTION = 0
+MAX_RESOLUTION = 15
+
+# Average H3 hexagon edge length at resolution 0, in meters
+_RES0_EDGE_M = 1281256.011
+_APERTURE_SCALE = math.sqrt(7.0)
+
+_COORD_BITS = 29
+_COORD_OFFSET = 1 << (_COORD_BITS - 1)
+_COORD_MASK = (1 << _COORD_BITS) - 1
+_RES_SHIFT = 2 * _COORD_BITS
+
+_SQRT3 = math.sqrt(3.0)
+
+# Axial neighbor directions for pointy-top hexagons
+_DIRECTIONS = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
+
+
+def edge_length_m(resolution: int) -> float:
+    """
+    Get the nominal hexagon edge length for a resolution.
+
+    Args:
+        resolution: Cell resolution (0-15)
+
+    Returns:
+        float: Edge length in meters at the equator
+    """
+    _check_resolution(resolution)
+    return _RES0_EDGE_M / (_APERTURE_SCALE**resolution)
+
+
+def _check_resolution(resolution: int) -> None:
+    if not MIN_RESOLUTION <= resolution <= MAX_RESOLUTION:
+        raise ValueError(
+            f"Resolution must be between {MIN_RESOLUTION} and {MAX_RESOLUTION}, got {resolution}"
+        )
+
+
+# ==================== Encoding ====================
+
+
+def _encode(resolution: int, q: int, r: int) -> int:
+    return (
+        (resolution << _RES_SHIFT)
+        | (((q + _COORD_OFFSET) & _COORD_MASK) << _COORD_BITS)
+        | ((r + _COORD_OFFSET) & _COORD_MASK)
+    )
+
+
+def _decode(cell_int: int) -> tuple[int, int, int]:
+    resolution = cell_int >> _RES_SHIFT
+    q = ((cell_int >> _COORD_BITS) & _COORD_MASK) - _COORD_OFFSET
+    r = (cell_int & _COORD_MASK) - _COORD_OFFSET
+    return resolution, q, r
+
+
+def cell_to_int(cell: str) -> int:
+    """Convert a cell identifier string to its integer form."""
+    return int(cell, 16)
+
+
+def int_to_cell(cell_int: int) -> str:
+    """Convert an integer cell to its identifier string."""
+    return f"{cell_int:016x}"
+
+
+def is_valid_cell(cell: str) -> bool:
+    """
+    Check whether a string is a valid cell identifier.
+
+    Args:
+        cell: Candidate cell identifier
+
+    Returns:
+        bool: True if the string decodes to a valid cell
+    """
+    if not isinstance(cell, str) or len(cell) != 16:
+        return False
+    try:
+        resolution, _, _ = _decode(cell_to_int(cell))
+    except ValueError:
+        return False
+    return MIN_RESOLUTION <= resolution <= MAX_RESOLUTION
+
+
+def get_resolution(cell: str) -> int:
+    """Get the resolution of a cell."""
+    return _decode(cell_to_int(cell))[0]
+
+
+# ==================== Projection ====================
+
+
+def _project(lat: float, lon: float) -> tuple[float, float]:
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    x = EARTH_RADIUS_M * math.radians(lon)
+    y = EARTH_RADIUS_M * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+    return x, y
+
+
+def _unproject(x: float, y: float) -> tuple[float, float]:
+    lon = math.degrees(x / EARTH_RADIUS_M)
+    lat = math.degrees(2 * math.atan(math.exp(y / EARTH_RADIUS_M)) - math.pi / 2)
+    return lat, lon
+
+
+def _axial_round(qf: float, rf: float) -> tuple[int, int]:
+    sf = -qf - rf
+    q, r, s = round(qf), round(rf), round(sf)
+    dq, dr, ds = abs(q - qf), abs(r - rf), abs(s - sf)
+    if dq > dr and dq > ds:
+        q = -r - s
+    elif dr > ds:
+        r = -q - s
+    return int(q), int(r)
+
+
+def _xy_to_axial(x: float, y: float, resolution: int) -> tuple[int, int]:
+    size = edge_length_m(resolution)
+    qf = (_SQRT3 / 3 * x - y / 3) / size
+    rf = (2 / 3 * y) / size
+    return _axial_round(qf, rf)
+
+
+def _axial_to_xy(q: int, r: int, resolution: int) -> tuple[float, float]:
+    size = edge_length_m(resolution)
+    return size * (_SQRT3 * q + _SQRT3 / 2 * r), size * 1.5 * r
+
+
+# ==================== Point / Cell Conversion ====================
+
+
+def latlng_to_cell(lat: float, lon: float, resolution: int) -> str:
+    """
+    Get the cell containing a point.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+        resolution: Cell resolution (0-15)
+
+    Returns:
+        str: Cell identifier
+    """
+    _check_resolution(resolution)
+    x, y = _project(lat, lon)
+    q, r = _xy_to_axial(x, y, resolution)
+    return int_to_cell(_encode(resolution, q, r))
+
+
+def cell_to_latlng(cell: str) -> tuple[float, float]:
+    """
+    Get the center of a cell.
+
+    Args:
+        cell: Cell identifier
+
+    Returns:
+        tuple: (lat, lon) of the cell center
+    """
+    resolution, q, r = _decode(cell_to_int(cell))
+    return _unproject(*_axial_to_xy(q, r, resolution))
+
+
+def cell_to_boundary(cell: str) -> list[tuple[float, float]]:
+    """
+    Get the six vertices of a cell.
+
+    Args:
+        cell: Cell identifier
+
+    Returns:
+        list: (lat, lon) vertices in counter-clockwise order
+    """
+    resolution, q, r = _decode(cell_to_int(cell))
+    cx, cy = _axial_to_xy(q, r, resolution)
+    size = edge_length_m(resolution)
+
+    vertices = []
+    for i in range(6):
+        angle = math.radians(60 * i - 30)
+        vertices.append(_unproject(cx + size * math.cos(angle), cy + size * math.sin(angle)))
+    return vertices
+
+
+# ==================== Neighbors ====================
+
+
+def grid_distance(origin: str, destination: str) -> int:
+    """
+    Get the grid distance between two cells of the same resolution.
+
+    Args:
+        origin: Origin cell
+        destination: Destination cell
+
+    Returns:
+        int: Number of grid steps between the cells
+    """
+    res_a, qa, ra = _decode(cell_to_int(origin))
+    res_b, qb, rb = _decode(cell_to_int(destination))
+    if res_a != res_b:
+        raise ValueError("Cells must share a resolution")
+    dq, dr = qa - qb, ra - rb
+    return int((abs(dq) + abs(dr) + abs(dq + dr)) // 2)
+
+
+def grid_ring(cell: str, k: int) -> list[str]:
+    """
+    Get the hollow ring of cells exactly k steps from a cell.
+
+    Args:
+        cell: Center cell
+        k: Ring distance
+
+    Returns:
+        list: Cell identifiers on the ring
+    """
+    resolution, q, r = _decode(cell_to_int(cell))
+    if k == 0:
+        return [cell]
+
+    ring = []
+    dq, dr = _DIRECTIONS[4]
+    cq, cr = q + dq * k, r + dr * k
+    for side in range(6):
+        sq, sr = _DIRECTIONS[side]
+        for _ in range(k):
+            ring.append(int_to_cell(_encode(resolution, cq, cr)))
+            cq, cr = cq + sq, cr + sr
+    return ring
+
+
+def grid_disk(cell: str, k: int) -> list[str]:
+    """
+    Get all cells within k steps of a cell (the k-ring).
+
+    Args:
+        cell: Center cell
+        k: Maximum grid distance
+
+    Returns:
+        list: Cell identifiers, center first, ordered by ring
+    """
+    cells = []
+    for ring in range(k + 1):
+        cells.extend(grid_ring(cell, ring))
+    return cells
+
+
+# ==================== Hierarchy ====================
+
+
+def cell_to_parent(cell: str, resolution: int) -> str:
+    """
+    Get the coarser cell containing a cell's center.
+
+    Args:
+        cell: Cell identifier
+        resolution: Parent resolution (<= the cell's resolution)
+
+    Returns:
+        str: Parent cell identifier
+    """
+    _check_resolution(resolution)
+    cell_res, q, r = _decode(cell_to_int(cell))
+    if resolution > cell_res:
+        raise ValueError("Parent resolution must not be finer than the cell")
+    if resolution == cell_res:
+        return cell
+    x, y = _axial_to_xy(q, r, cell_res)
+    pq, pr = _xy_to_axial(x, y, resolution)
+    return int_to_cell(_encode(resolution, pq, pr))
+
+
+def cell_to_children(cell: str, resolution: int) -> list[str]:
+    """
+    Get the finer cells whose parent is a cell.
+
+    Args:
+        cell: Cell identifier
+        resolution: Child resolution (>= the cell's resolution)
+
+    Returns:
+        list: Child cell identifiers
+    """
+    _check_resolution(resolution)
+    cell_res, q, r = _decode(cell_to_int(cell))
+    if resolution < cell_res:
+        raise ValueError("Child resolution must not be coarser than the cell")
+    if resolution == cell_res:
+        return [cell]
+
+    # Candidate fine cells around the parent's center, then keep exact members
+    cx, cy = _axial_to_xy(q, r, cell_res)
+    fq, fr = _xy_to_axial(cx, cy, resolution)
+    k = int(math.ceil(_APERTURE_SCALE ** (resolution - cell_res))) + 1
+
+    dq, dr = np.meshgrid(np.arange(-k, k + 1), np.arange(-k, k + 1), indexing="ij")
+    mask = np.abs(dq + dr) <= k
+    cand_q = (fq + dq[mask]).astype(np.int64)
+    cand_r = (fr + dr[mask]).astype(np.int64)
+
+    size = edge_length_m(resolution)
+    x = size * (_SQRT3 * cand_q + _SQRT3 / 2 * cand_r)
+    y = size * 1.5 * cand_r
+    pq, pr = _xy_to_axial_array(x, y, cell_res)
+    keep = (pq == q) & (pr == r)
+
+    return [
+        int_to_cell(_encode(resolution, int(cq), int(cr)))
+        for cq, cr in zip(cand_q[keep], cand_r[keep], strict=True)
+    ]
+
+
+def rollup_cell(cell: str, resolution: int) -> str:
+    """
+    Map a cell onto the roll-up key for a coarser resolution.
+
+    Cells already at or coarser than the target resolution, and legacy
+    identifiers that are not valid cells, are returned as-is.
+
+    Args:
+        cell: Cell identifier
+        resolution: Target resolution
+
+    Returns:
+        str: Parent cell identifier, or the cell itself
+    """
+    if not is_valid_cell(cell) or get_resolution(cell) <= resolution:
+        return cell
+    return cell_to_parent(cell, resolution)
+
+
+def rollup_counts(counts: dict[str, int], resolution: int) -> dict[str, int]:
+    """
+    Roll cell counts up to a coarser resolution.
+
+    Args:
+        counts: Counts keyed by cell identifier
+        resolution: Target resolution
+
+    Returns:
+        dict: Counts keyed by parent cell identifier
+    """
+    rolled: dict[str, int] = {}
+    for cell, count in counts.items():
+        parent = rollup_cell(cell, resolution)
+        rolled[parent] = rolled.get(parent, 0) + count
+    return rolled
+
+
+# ==================== Vectorized Batch Conversion ====================
+
+
+def _xy_to_axial_array(
+    x: np.ndarray, y: np.ndarray, resolution: int
+) -> tuple[np.ndarray, np.ndarray]:
+    size = edge_length_m(resolution)
+    qf = (_SQRT3 / 3 * x - y / 3) / size
+    rf = (2 / 3 * y) / size
+    sf = -qf - rf
+
+    q, r, s = np.rint(qf), np.rint(rf), np.rint(sf)
+    dq, dr, ds = np.abs(q - qf), np.abs(r - rf), np.abs(s - sf)
+
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    q = np.where(fix_q, -r - s, q)
+    r = np.where(fix_r, -q - s, r)
+    return q.astype(np.int64), r.astype(np.int64)
+
+
+def latlng_to_cell_ints(
+    lats: Iterable[float] | np.ndarray,
+    lons: Iterable[float] | np.ndarray,
+    resolution: int,
+) -> np.ndarray:
+    """
+    Convert arrays of coordinates to integer cells in one vectorized pass.
+
+    Integer cells are convenient for grouping with NumPy (np.unique etc.).
+
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        resolution: Cell resolution (0-15)
+
+    Returns:
+        np.ndarray: uint64 cell values, one per coordinate
+    """
+    _check_resolution(resolution)
+    lat = np.clip(np.asarray(lats, dtype=np.float64), -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT)
+    lon = np.asarray(lons, dtype=np.float64)
+
+    x = EARTH_RADIUS_M * np.radians(lon)
+    y = EARTH_RADIUS_M * np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+    q, r = _xy_to_axial_array(x, y, resolution)
+
+    return (
+        (np.uint64(resolution) << np.uint64(_RES_SHIFT))
+        | (((q + _COORD_OFFSET) & _COORD_MASK).astype(np.uint64) << np.uint64(_COORD_BITS))
+        | ((r + _COORD_OFFSET) & _COORD_MASK).astype(np.uint64)
+    )
+
+
+def latlng_to_cells(
+    lats: Iterable[float] | np.ndarray,
+    lons: Iterable[float] | np.ndarray,
+    resolution: int,
+) -> list[str]:
+    """
+    Convert arrays of coordinates to cell identifiers.
+
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        resolution: Cell resolution (0-15)
+
+    Returns:
+        list: Cell identifiers, one per coordinate
+    """
+    return [int_to_cell(int(v)) for v in latlng_to_cell_ints(lats, lons, resolution)]
@@ -0,0 +1,437 @@
+"""
+Spatial clustering for the G3TI RTCC-UIP Backend.
+
+This module provides the DBSCAN engine shared by the crime analysis and
+tactical analytics hotspot detectors:
+- Geodesic epsilon in meters (great-circle distance on a spherical Earth)
+- Grid-accelerated neighbor search, with no pole or antimeridian special cases
+- Chunked pair generation under a memory budget
+- Cluster labels, weighted centroids and radii from NumPy arrays
+
+Points are mapped to 3D Earth-centered coordinates. Two points are within
+a great-circle distance ``eps`` exactly when their chord length is within
+``2R sin(eps / 2R)``. Points are bucketed into cubes whose diagonal is that
+chord, so points sharing a cube are always neighbors: cubes holding at least
+``min_samples`` points are core without any distance checks, and only pairs
+of cubes up to two steps apart are ever compared. Cube pairs whose core
+points are already connected are skipped.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.utils.geo_utils import EARTH_RADIUS_KM
+
+EARTH_RADIUS_M = EARTH_RADIUS_KM * 1000.0
+
+# Approximate length of one degree of latitude, for legacy degree epsilons
+METERS_PER_DEGREE = 111320.0
+
+# Candidate pairs materialized per chunk during neighbor search
+DEFAULT_MAX_PAIRS = 4_000_000
+
+NOISE = -1
+
+# Cube offsets that can hold points within eps of each other, nearest first
+_OFFSETS = sorted(
+    ((dx, dy, dz) for dx in range(-2, 3) for dy in range(-2, 3) for dz in range(-2, 3)),
+    key=lambda d: (sum(max(abs(c) - 1, 0) ** 2 for c in d), sum(c * c for c in d)),
+)
+# One of each +/- pair, for visiting every unordered cube pair once
+_HALF_OFFSETS = [d for d in _OFFSETS if d > (0, 0, 0)]
+
+
+@dataclass
+class ClusterResult:
+    """Result of a DBSCAN run."""
+
+    labels: np.ndarray  # Cluster index per point, NOISE (-1) for noise
+    core: np.ndarray  # Whether each point is a core point
+    centroids: np.ndarray  # (k, 2) weighted [lat, lon] per cluster
+    radii_meters: np.ndarray  # Distance from centroid covering radius_percentile of members
+    sizes: np.ndarray  # Member count per cluster
+    weights: np.ndarray  # Total member weight per cluster
+
+    @property
+    def n_clusters(self) -> int:
+        """Number of clusters found."""
+        return len(self.sizes)
+
+    def members(self, cluster: int) -> np.ndarray:
+        """Indices of the points in a cluster."""
+        return np.flatnonzero(self.labels == cluster)
+
+    def groups(self) -> list[np.ndarray]:
+        """Member indices of every cluster, in cluster order."""
+        order = np.argsort(self.labels, kind="stable")
+        order = order[self.labels[order] >= 0]
+        return np.split(order, np.cumsum(self.sizes)[:-1]) if self.n_clusters else []
+
+
+def to_xyz(points: np.ndarray) -> np.ndarray:
+    """
+    Convert [lat, lon] rows in degrees to Earth-centered coordinates.
+
+    Args:
+        points: Array of shape (n, 2)
+
+    Returns:
+        np.ndarray: Array of shape (n, 3) in meters
+    """
+    lat = np.radians(points[:, 0])
+    lon = np.radians(points[:, 1])
+    cos_lat = np.cos(lat)
+    return EARTH_RADIUS_M * np.column_stack(
+        [cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)]
+    )
+
+
+def chord_to_meters(chord: np.ndarray | float) -> np.ndarray | float:
+    """Convert chord lengths to great-circle distances in meters."""
+    ratio = np.clip(np.asarray(chord) / (2 * EARTH_RADIUS_M), 0.0, 1.0)
+    return 2 * EARTH_RADIUS_M * np.arcsin(ratio)
+
+
+def meters_to_chord(meters: float) -> float:
+    """Convert a great-circle distance in meters to a chord length."""
+    angle = min(meters / EARTH_RADIUS_M, np.pi)
+    return float(2 * EARTH_RADIUS_M * np.sin(angle / 2))
+
+
+def dbscan(
+    points: np.ndarray,
+    eps_meters: float,
+    min_samples: int,
+    weights: np.ndarray | None = None,
+    radius_percentile: float = 100.0,
+    max_pairs: int = DEFAULT_MAX_PAIRS,
+) -> ClusterResult:
+    """
+    Cluster points with DBSCAN using great-circle distance.
+
+    A point is a core point when at least ``min_samples`` points (itself
+    included) lie within ``eps_meters``. Core points within ``eps_meters``
+    of each other share a cluster; a non-core point within ``eps_meters``
+    of a core point joins the cluster of its lowest-indexed core neighbor.
+    Clusters are numbered in order of their lowest-indexed member, so
+    results do not depend on scan order.
+
+    Args:
+        points: Array of [lat, lon] rows in degrees
+        eps_meters: Neighborhood radius in meters
+        min_samples: Neighbors (including the point) required for a core point
+        weights: Per-point weights for centroids and totals (defaults to 1.0)
+        radius_percentile: Percentile of member distances reported as radius
+        max_pairs: Candidate pairs materialized at once during neighbor search
+
+    Returns:
+        ClusterResult: Labels, core flags and per-cluster statistics
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    n = len(points)
+    weights = np.ones(n) if weights is None else np.asarray(weights, dtype=float).reshape(-1)
+    if n == 0:
+        return _empty_result(0)
+
+    xyz = to_xyz(points)
+    chord = meters_to_chord(eps_meters)
+    grid = _CubeGrid(xyz, chord)
+
+    core = _core_points(grid, min_samples, max_pairs)
+    if not core.any():
+        return _empty_result(n, core)
+
+    # Core points first within each cube, lowest index first
+    grid.sort(core)
+    parent = _connect_core_points(grid, core, max_pairs)
+
+    labels = np.full(n, NOISE, dtype=np.int64)
+    cluster_roots, labels_core = np.unique(parent[core], return_inverse=True)
+    labels[core] = labels_core
+
+    border_core = _lowest_core_neighbors(grid, core, max_pairs)
+    attached = border_core < n
+    labels[attached] = labels[border_core[attached]]
+
+    return _summarize(points, xyz, weights, labels, core, len(cluster_roots), radius_percentile)
+
+
+class _CubeGrid:
+    """Points bucketed into cubes whose diagonal equals the chord epsilon."""
+
+    def __init__(self, xyz: np.ndarray, chord: float):
+        self.xyz = xyz
+        self.chord_sq = chord * chord
+        cells = np.floor(xyz / max(chord / np.sqrt(3.0), 1e-9)).astype(np.int64)
+
+        # Rank-compress each axis so cube keys are exact and fit in int64
+        self._ranks = []
+        self._shifted: list[dict[int, np.ndarray]] = []
+        self._extents = []
+        for axis in range(3):
+            values, rank = np.unique(cells[:, axis], return_inverse=True)
+            shifted = {}
+            for delta in range(-2, 3):
+                target = values[rank] + delta
+                pos = np.searchsorted(values, target)
+                pos[pos == len(values)] = 0
+                shifted[delta] = np.where(values[pos] == target, pos, -1)
+            self._ranks.append(rank)
+            self._shifted.append(shifted)
+            self._extents.append(len(values))
+
+        self.point_keys = self._key(*self._ranks)
+        self.sort(np.zeros(len(xyz), dtype=bool))
+
+    def _key(self, r0: np.ndarray, r1: np.ndarray, r2: np.ndarray) -> np.ndarray:
+        return (r0 * self._extents[1] + r1) * self._extents[2] + r2
+
+    def sort(self, first: np.ndarray) -> None:
+        """Order points by cube, then ``first`` points, then index."""
+        n = len(self.xyz)
+        self.order = np.lexsort((np.arange(n), ~first, self.point_keys))
+        sorted_keys = self.point_keys[self.order]
+        self.keys, self.starts, self.counts = np.unique(
+            sorted_keys, return_index=True, return_counts=True
+        )
+        self.cube_of = np.empty(n, dtype=np.int64)
+        self.cube_of[self.order] = np.repeat(np.arange(len(self.keys)), self.counts)
+        self._cube_point = self.order[self.starts]
+
+    def neighbor_cubes(self, offset: tuple[int, int, int], cubes: np.ndarray) -> np.ndarray:
+        """Index of the cube at ``offset`` from each cube, -1 if empty."""
+        points = self._cube_point[cubes]
+        shifted = [self._shifted[axis][offset[axis]][points] for axis in range(3)]
+        missing = (shifted[0] < 0) | (shifted[1] < 0) | (shifted[2] < 0)
+        keys = self._key(*shifted)
+        pos = np.searchsorted(self.keys, keys)
+        pos[pos == len(self.keys)] = 0
+        found = ~missing & (self.keys[pos] == keys)
+        return np.where(found, pos, -1)
+
+    def close_pairs(
+        self,
+        a_start: np.ndarray,
+        a_count: np.ndarray,
+        b_start: np.ndarray,
+        b_count: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """All pairs within epsilon between sorted-order ranges A x B."""
+        sizes = a_count * b_count
+        pair = np.repeat(np.arange(len(sizes)), sizes)
+        within = np.arange(len(pair)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        b_n = b_count[pair]
+        a_off = within // b_n
+        i = self.order[a_start[pair] + a_off]
+        j = self.order[b_start[pair] + within - a_off * b_n]
+        delta = self.xyz[i] - self.xyz[j]
+        close = np.einsum("ij,ij->i", delta, delta) <= self.chord_sq
+        return i[close], j[close]
+
+
+def _batches(sizes: np.ndarray, max_pairs: int) -> Iterator[tuple[int, int]]:
+    """Split consecutive work items so each batch expands to about max_pairs."""
+    if len(sizes) == 0:
+        return
+    bounds = np.cumsum(sizes)
+    cuts = np.searchsorted(bounds, np.arange(max_pairs, bounds[-1], max_pairs), side="right")
+    edges = np.unique(np.concatenate([[0], cuts, [len(sizes)]]))
+    for lo, hi in zip(edges[:-1], edges[1:], strict=True):
+        if lo < hi:
+            yield int(lo), int(hi)
+
+
+def _core_points(grid: _CubeGrid, min_samples: int, max_pairs: int) -> np.ndarray:
+    """Flag core points; only points in sparse cubes need neighbor counts."""
+    n = len(grid.xyz)
+    dense = grid.counts >= min_samples
+    core = dense[grid.cube_of]
+
+    sparse = np.flatnonzero(~dense)
+    degree = np.zeros(n, dtype=np.int64)
+    for offset in _OFFSETS:
+        neighbors = grid.neighbor_cubes(offset, sparse)
+        has = neighbors >= 0
+        a, b = sparse[has], neighbors[has]
+        sizes = grid.counts[a] * grid.counts[b]
+        for lo, hi in _batches(sizes, max_pairs):
+            i, _ = grid.close_pairs(
+                grid.starts[a[lo:hi]], grid.counts[a[lo:hi]],
+                grid.starts[b[lo:hi]], grid.counts[b[lo:hi]],
+            )
+            degree += np.bincount(i, minlength=n)
+
+    return core | (degree >= min_samples)
+
+
+def _connect_core_points(grid: _CubeGrid, core: np.ndarray, max_pairs: int) -> np.ndarray:
+    """
+    Union-find over core points within epsilon of each other.
+
+    Returns every point's root (the lowest index in its component).
+    """
+    n = len(grid.xyz)
+    core_counts = np.bincount(grid.cube_of[core], minlength=len(grid.keys))
+    cubes = np.flatnonzero(core_counts)
+
+    # Core points sharing a cube are always neighbors
+    parent = np.arange(n)
+    first_core = grid.order[grid.starts]
+    parent[core] = first_core[grid.cube_of[core]]
+
+    for offset in _HALF_OFFSETS:
+        neighbors = grid.neighbor_cubes(offset, cubes)
+        has = neighbors >= 0
+        a, b = cubes[has], neighbors[has]
+        has = core_counts[b] > 0
+        a, b = a[has], b[has]
+        sizes = core_counts[a] * core_counts[b]
+        for lo, hi in _batches(sizes, max_pairs):
+            # Skip cube pairs whose core points are already connected
+            parent = _compress(parent)
+            ab, bb = a[lo:hi], b[lo:hi]
+            apart = parent[first_core[ab]] != parent[first_core[bb]]
+            ab, bb = ab[apart], bb[apart]
+            if len(ab) == 0:
+                continue
+            i, j = grid.close_pairs(
+                grid.starts[ab], core_counts[ab], grid.starts[bb], core_counts[bb]
+            )
+            if len(i):
+                parent = _union(parent, i, j)
+
+    return _compress(parent)
+
+
+def _lowest_core_neighbors(grid: _CubeGrid, core: np.ndarray, max_pairs: int) -> np.ndarray:
+    """Lowest-indexed core neighbor of each non-core point (n if none)."""
+    n = len(grid.xyz)
+    border_core = np.full(n, n, dtype=np.int64)
+    core_counts = np.bincount(grid.cube_of[core], minlength=len(grid.keys))
+
+    # Positions of non-core points in sorted order, with their cubes
+    position = np.empty(n, dtype=np.int64)
+    position[grid.order] = np.arange(n)
+    loose = np.flatnonzero(~core)
+    loose_cubes = grid.cube_of[loose]
+
+    for offset in _OFFSETS:
+        neighbors = grid.neighbor_cubes(offset, loose_cubes)
+        has = neighbors >= 0
+        has[has] = core_counts[neighbors[has]] > 0
+        p, b = loose[has], neighbors[has]
+        sizes = core_counts[b]
+        for lo, hi in _batches(sizes, max_pairs):
+            i, j = grid.close_pairs(
+                position[p[lo:hi]], np.ones(hi - lo, dtype=np.int64),
+                grid.starts[b[lo:hi]], core_counts[b[lo:hi]],
+            )
+            if len(i):
+                np.minimum.at(border_core, i, j)
+
+    return border_core
+
+
+def _compress(parent: np.ndarray) -> np.ndarray:
+    """Point every node directly at its root."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def _union(parent: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Merge the components of each edge (a, b).
+
+    Roots are always hooked onto smaller roots, so every component's root
+    is its lowest index.
+    """
+    while True:
+        parent = _compress(parent)
+        root_a = parent[a]
+        root_b = parent[b]
+        pending = root_a != root_b
+        if not pending.any():
+            return parent
+        root_a = root_a[pending]
+        root_b = root_b[pending]
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+
+
+def _summarize(
+    points: np.ndarray,
+    xyz: np.ndarray,
+    weights: np.ndarray,
+    labels: np.ndarray,
+    core: np.ndarray,
+    n_clusters: int,
+    radius_percentile: float,
+) -> ClusterResult:
+    """Compute per-cluster sizes, weighted centroids and radii."""
+    member = labels >= 0
+    member_labels = labels[member]
+    member_weights = weights[member]
+
+    sizes = np.bincount(member_labels, minlength=n_clusters)
+    totals = np.bincount(member_labels, weights=member_weights, minlength=n_clusters)
+
+    # Weighted mean direction on the sphere
+    centroid_xyz = np.column_stack([
+        np.bincount(member_labels, weights=member_weights * xyz[member, axis], minlength=n_clusters)
+        for axis in range(3)
+    ])
+    norms = np.linalg.norm(centroid_xyz, axis=1)
+    # Zero total weight or antipodal members: fall back to the unweighted mean
+    degenerate = norms < 1e-9
+    if degenerate.any():
+        unweighted = np.column_stack([
+            np.bincount(member_labels, weights=xyz[member, axis], minlength=n_clusters)
+            for axis in range(3)
+        ])
+        centroid_xyz[degenerate] = unweighted[degenerate]
+        norms = np.linalg.norm(centroid_xyz, axis=1)
+    unit = centroid_xyz / np.where(norms > 0, norms, 1.0)[:, None]
+    centroids = np.column_stack([
+        np.degrees(np.arcsin(np.clip(unit[:, 2], -1.0, 1.0))),
+        np.degrees(np.arctan2(unit[:, 1], unit[:, 0])),
+    ])
+
+    # Radii: percentile of member distances to their centroid
+    distances = chord_to_meters(
+        np.linalg.norm(xyz[member] - unit[member_labels] * EARTH_RADIUS_M, axis=1)
+    )
+    order = np.lexsort((distances, member_labels))
+    sorted_distances = distances[order]
+    starts = np.cumsum(sizes) - sizes
+    rank = (sizes - 1) * (radius_percentile / 100.0)
+    lower = np.floor(rank).astype(np.int64)
+    upper = np.ceil(rank).astype(np.int64)
+    frac = rank - lower
+    radii = (
+        sorted_distances[starts + lower] * (1 - frac)
+        + sorted_distances[starts + upper] * frac
+    )
+
+    return ClusterResult(
+        labels=labels,
+        core=core,
+        centroids=centroids,
+        radii_meters=radii,
+        sizes=sizes,
+        weights=totals,
+    )
+
+
+def _empty_result(n: int, core: np.ndarray | None = None) -> ClusterResult:
+    return ClusterResult(
+        labels=np.full(n, NOISE, dtype=np.int64),
+        core=np.zeros(n, dtype=bool) if core is None else core,
+        centroids=np.empty((0, 2)),
+        radii_meters=np.empty(0),
+        sizes=np.empty(0, dtype=np.int64),
+        weights=np.empty(0),
+    )
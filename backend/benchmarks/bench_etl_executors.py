@@ -0,0 +1,110 @@
+"""
+Benchmark: ETL transform/validate throughput per execution mode.
+
+Runs a synthetic CAD dump through an ETLPipeline whose transform is
+CADProcessor.transform followed by DataTransformer address
+standardization, once per execution mode (inline, thread, process).
+Besides records per second it reports the longest event-loop stall seen
+by a heartbeat task, which is what other API requests on the same worker
+would wait.
+
+Run from the backend directory:
+    python -m benchmarks.bench_etl_executors --records 50000 --workers 4
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from app.etl.executors import ExecutionMode
+from app.etl.pipeline import ETLPipeline, PipelineConfig
+from app.etl.processors import CADProcessor
+from app.etl.transformers import DataTransformer
+
+_cad = CADProcessor()
+_standardizer = DataTransformer()
+
+STREETS = ["North Ocean Boulevard", "West Blue Heron Boulevard", "Avenue East", "Broadway Street"]
+CALL_TYPES = ["SHOTS FIRED", "DV IN PROGRESS", "BURGLARY RESIDENTIAL", "TRAFFIC STOP", "SUSPICIOUS PERSON"]
+
+
+def synthetic_cad_dump(count: int, seed: int = 42) -> list[dict]:
+    """Generate CAD calls shaped like a dispatch export."""
+    rng = random.Random(seed)
+    return [
+        {
+            "cad_number": f"CAD-2026-{i:07d}",
+            "event_type": rng.choice(CALL_TYPES),
+            "priority": str(rng.randint(1, 5)),
+            "timestamp": f"2026-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:15:00Z",
+            "latitude": 26.77 + rng.random() * 0.03,
+            "longitude": -80.08 + rng.random() * 0.03,
+            "address": f"{rng.randint(100, 9999)} {rng.choice(STREETS)} Apartment {rng.randint(1, 40)}",
+            "narrative": "Caller reports subject armed with a gun near the location " * 3,
+        }
+        for i in range(count)
+    ]
+
+
+def transform_cad(record: dict) -> dict | None:
+    """CAD normalization plus address standardization."""
+    result = _cad.transform(record)
+    if result is not None:
+        result["address"] = _standardizer._standardize_address(result["address"])
+    return result
+
+
+async def run_mode(mode: ExecutionMode, records: list[dict], workers: int, chunk: int) -> None:
+    pipeline = ETLPipeline(
+        PipelineConfig(
+            name=f"bench-{mode.value}",
+            source_type="CAD",
+            execution_mode=mode,
+            parallel_workers=workers,
+            executor_chunk_size=chunk,
+        ),
+        extractor=lambda: records,
+        transformer=transform_cad,
+        validator=_cad.validate,
+    )
+
+    stall = 0.0
+
+    async def heartbeat() -> None:
+        nonlocal stall
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    ticker = asyncio.create_task(heartbeat())
+    started = time.perf_counter()
+    run = await pipeline.execute()
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+    pipeline.close()
+
+    print(f"  {mode.value:8s} {run.metrics.records_loaded / elapsed:10,.0f} records/s   "
+          f"longest loop stall {stall * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk", type=int, default=250, help="records per work item")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    records = synthetic_cad_dump(args.records)
+    print(f"{args.records:,} CAD records, {args.workers} workers, chunks of {args.chunk}")
+    for mode in ExecutionMode:
+        asyncio.run(run_mode(mode, records, args.workers, args.chunk))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: fuzzy plate matching against a large plate cache.
+
+Compares the correlator's former full scan (character-set Jaccard against
+every cached plate) with the q-gram blocked, vectorized PlateIndex.
+
+Run from the backend directory:
+    python -m benchmarks.bench_fuzzy_matcher --plates 1000000 --queries 50
+"""
+
+import argparse
+import random
+import time
+
+from app.intel_orchestration.fuzzy_matcher import PlateIndex
+
+ALPHABET = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+OCR_SWAPS = {"0": "O", "O": "0", "8": "B", "B": "8", "1": "I", "I": "1"}
+
+
+def jaccard_scan(query: str, plates: list[str], threshold: float) -> list[int]:
+    """Former correlator behavior: set overlap against every cached plate."""
+    q = set(query.upper())
+    matches = []
+    for i, plate in enumerate(plates):
+        p = set(plate.upper())
+        if query == plate or len(q & p) / len(q | p) >= threshold:
+            matches.append(i)
+    return matches
+
+
+def ocr_variant(plate: str, rng: random.Random) -> str:
+    """Simulate an OCR misread of one character."""
+    pos = rng.randrange(len(plate))
+    char = OCR_SWAPS.get(plate[pos], rng.choice(ALPHABET))
+    return plate[:pos] + char + plate[pos + 1:]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--plates", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--scan-queries", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.75)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    plates = ["".join(rng.choice(ALPHABET) for _ in range(7)) for _ in range(args.plates)]
+    queries = [ocr_variant(rng.choice(plates), rng) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    index = PlateIndex(initial_capacity=args.plates)
+    for i, plate in enumerate(plates):
+        index.add(str(i), plate)
+    build_s = time.perf_counter() - start
+    print(f"PlateIndex build: {args.plates:,} plates in {build_s:.2f}s")
+
+    start = time.perf_counter()
+    found = 0
+    for query in queries:
+        found += len(index.search(query, args.threshold))
+    indexed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"PlateIndex search: {indexed_ms:.2f} ms/query ({found / len(queries):.1f} matches/query)")
+
+    scan_queries = queries[:args.scan_queries]
+    start = time.perf_counter()
+    scanned = 0
+    for query in scan_queries:
+        scanned += len(jaccard_scan(query, plates, args.threshold))
+    scan_ms = (time.perf_counter() - start) * 1000 / len(scan_queries)
+    print(f"Jaccard full scan: {scan_ms:.2f} ms/query ({scanned / len(scan_queries):.1f} matches/query)")
+
+    print(f"Speedup: {scan_ms / indexed_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: grid KDE for tactical heatmaps and forecasts.
+
+Compares the former per-cell loop (distances to every point recomputed
+for each grid cell) with the separable GridKDE, plus the cost of folding
+a single new incident into an existing grid.
+
+Run from the backend directory:
+    python -m benchmarks.bench_kde --points 10000 100000 --grid 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.tactical_engine.kde import GridKDE
+
+BOUNDS = {
+    "min_lat": 33.35,
+    "max_lat": 33.55,
+    "min_lon": -112.15,
+    "max_lon": -111.95,
+}
+BANDWIDTH = 0.005
+
+
+def per_cell_kde(points: np.ndarray, weights: np.ndarray, grid_size: int) -> np.ndarray:
+    """Former heatmap engine behavior: one Python iteration per grid cell."""
+    lat_range = np.linspace(BOUNDS["min_lat"], BOUNDS["max_lat"], grid_size)
+    lon_range = np.linspace(BOUNDS["min_lon"], BOUNDS["max_lon"], grid_size)
+    density = np.zeros((grid_size, grid_size))
+    for i, lat in enumerate(lat_range):
+        for j, lon in enumerate(lon_range):
+            distances = np.sqrt((points[:, 0] - lat) ** 2 + (points[:, 1] - lon) ** 2)
+            density[i, j] = np.sum(np.exp(-0.5 * (distances / BANDWIDTH) ** 2) * weights)
+    return density / density.max()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--grid", type=int, default=200)
+    parser.add_argument("--loop-rows", type=int, default=5,
+                        help="grid rows timed for the per-cell loop (extrapolated)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for n in args.points:
+        points = np.column_stack([
+            rng.normal(33.45, 0.03, n),
+            rng.normal(-112.05, 0.03, n),
+        ])
+        weights = rng.uniform(0.5, 1.5, n)
+        print(f"{n:,} points, {args.grid}x{args.grid} grid")
+
+        # Time a few rows of the per-cell loop and extrapolate to the grid
+        rows = min(args.loop_rows, args.grid)
+        lat_range = np.linspace(BOUNDS["min_lat"], BOUNDS["max_lat"], args.grid)
+        lon_range = np.linspace(BOUNDS["min_lon"], BOUNDS["max_lon"], args.grid)
+        start = time.perf_counter()
+        for lat in lat_range[:rows]:
+            for lon in lon_range:
+                distances = np.sqrt((points[:, 0] - lat) ** 2 + (points[:, 1] - lon) ** 2)
+                np.sum(np.exp(-0.5 * (distances / BANDWIDTH) ** 2) * weights)
+        loop_s = (time.perf_counter() - start) * args.grid / rows
+        print(f"  per-cell loop (extrapolated): {loop_s:8.2f} s")
+
+        start = time.perf_counter()
+        kde = GridKDE(BOUNDS, args.grid, BANDWIDTH).fit(points, weights)
+        kde.density()
+        grid_s = time.perf_counter() - start
+        print(f"  GridKDE fit:                  {grid_s:8.3f} s  ({loop_s / grid_s:.0f}x)")
+
+        start = time.perf_counter()
+        for _ in range(100):
+            kde.add(points[0], [1.0])
+        add_ms = (time.perf_counter() - start) * 1000 / 100
+        print(f"  GridKDE add one incident:     {add_ms:8.3f} ms")
+
+    small = np.column_stack([rng.normal(33.45, 0.03, 500), rng.normal(-112.05, 0.03, 500)])
+    small_weights = np.ones(500)
+    reference = per_cell_kde(small, small_weights, 50)
+    result = GridKDE(BOUNDS, 50, BANDWIDTH).fit(small, small_weights).density()
+    print(f"Max abs difference vs per-cell loop (500 points, 50x50): {np.abs(result - reference).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: WebSocket broadcast fan-out to many clients.
+
+Compares the former broadcast loop (encode the message for each client and
+await every send in turn) with per-connection outbound queues, where the
+message is encoded once and each client's writer task sends it. A few
+clients are slow, as on a congested mobile link; the metric that matters
+is how long the fast clients wait.
+
+Run from the backend directory:
+    python -m benchmarks.bench_ws_broadcast --clients 2000 --slow 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from starlette.websockets import WebSocketState
+
+from app.core.config import settings
+from app.schemas.events import (
+    EventPriority,
+    EventSource,
+    EventType,
+    WebSocketMessage,
+    WebSocketMessageType,
+)
+from app.services.events.websocket_manager import WebSocketManager
+
+
+class FakeWebSocket:
+    """Socket whose sends take a fixed time and record when they finished."""
+
+    def __init__(self, delay: float) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.delay = delay
+        self.delivered_at: float | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.client_state = WebSocketState.DISCONNECTED
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.delivered_at = time.perf_counter()
+
+
+def make_sockets(clients: int, slow: int, slow_delay: float) -> list[FakeWebSocket]:
+    """Create clients with the slow ones spread evenly through the list."""
+    step = clients // slow if slow else clients + 1
+    return [
+        FakeWebSocket(slow_delay if i % step == 0 and i // step < slow else 0.0)
+        for i in range(clients)
+    ]
+
+
+def fast_delivery(sockets: list[FakeWebSocket], started: float) -> float:
+    """Time until the last fast client had the message."""
+    return max(s.delivered_at for s in sockets if s.delay == 0.0) - started
+
+
+async def legacy_broadcast(manager: WebSocketManager, payload: dict) -> None:
+    """Former loop: per-client encode and awaited send."""
+    message = WebSocketMessage(type=WebSocketMessageType.EVENT, payload=payload)
+    for connection in list(manager._connections.values()):
+        if connection.matches_event(EventType.SYSTEM_ALERT, EventSource.SYSTEM, EventPriority.HIGH):
+            await connection.websocket.send_text(message.model_dump_json())
+
+
+async def run(clients: int, slow: int, slow_delay: float) -> None:
+    payload = {"data": {"alert": "test", "detail": "x" * 512}}
+
+    # Former behavior
+    manager = WebSocketManager()
+    sockets = make_sockets(clients, slow, slow_delay)
+    for socket in sockets:
+        await manager.connect(socket)
+    await asyncio.sleep(0.1)
+    started = time.perf_counter()
+    await legacy_broadcast(manager, payload)
+    call = time.perf_counter() - started
+    print(f"  sequential loop   call {call * 1000:8.1f} ms   "
+          f"fast clients served {fast_delivery(sockets, started) * 1000:8.1f} ms")
+    await manager.stop()
+
+    # Outbound queues
+    manager = WebSocketManager()
+    sockets = make_sockets(clients, slow, slow_delay)
+    for socket in sockets:
+        await manager.connect(socket)
+    await asyncio.sleep(0.1)
+    for socket in sockets:
+        socket.delivered_at = None
+    started = time.perf_counter()
+    await manager.broadcast_event(
+        EventType.SYSTEM_ALERT, EventSource.SYSTEM, EventPriority.HIGH, payload
+    )
+    call = time.perf_counter() - started
+    while any(s.delivered_at is None for s in sockets if s.delay == 0.0):
+        await asyncio.sleep(0.001)
+    print(f"  outbound queues   call {call * 1000:8.1f} ms   "
+          f"fast clients served {fast_delivery(sockets, started) * 1000:8.1f} ms")
+    stats = manager.get_stats()
+    print(f"  queued behind slow clients: {stats['queued_messages']}, "
+          f"send latency p50 {stats['send_latency_p50_ms']} ms")
+    await manager.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--slow", type=int, default=20, help="number of slow clients")
+    parser.add_argument("--slow-delay", type=float, default=0.05,
+                        help="seconds each send to a slow client takes")
+    args = parser.parse_args()
+
+    # One process stands in for the whole fleet of clients
+    settings.ws_max_connections = max(settings.ws_max_connections, args.clients)
+    print(f"{args.clients:,} clients, {args.slow} slow ({args.slow_delay * 1000:.0f} ms per send)")
+    asyncio.run(run(args.clients, args.slow, args.slow_delay))
+
+
+if __name__ == "__main__":
+    main()
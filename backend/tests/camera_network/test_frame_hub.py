@@ -0,0 +1,105 @@
+"""
+Tests for the shared camera Frame Hub.
+"""
+
+import asyncio
+
+import pytest
+
+from app.camera_network.frame_hub import FrameHub, encode_mjpeg_part
+from app.camera_network.streaming_adapter import StreamingAdapter
+from app.camera_network.video_wall_manager import VideoWallManager
+
+
+class CountingCamera:
+    """Upstream camera that counts snapshot requests."""
+
+    def __init__(self):
+        self.requests = 0
+
+    async def fetch(self) -> bytes:
+        self.requests += 1
+        return b"jpeg-%d" % self.requests
+
+
+class TestFrameHub:
+    """Test suite for FrameHub class."""
+
+    @pytest.mark.asyncio
+    async def test_viewers_share_one_fetcher(self):
+        """Test ten viewers of one camera cause one upstream fetch per interval."""
+        hub = FrameHub()
+        camera = CountingCamera()
+
+        async def view(frames_wanted):
+            async with hub.watch("cam-1", camera.fetch, refresh_interval=0.05) as frames:
+                return [await frames.__anext__() for _ in range(frames_wanted)]
+
+        results = await asyncio.gather(*(view(3) for _ in range(10)))
+
+        assert camera.requests <= 4
+        assert all(frames == results[0] for frames in results)
+        assert results[0][0] == encode_mjpeg_part(b"jpeg-1")
+        # Every viewer yields the same bytes object
+        assert all(frames[0] is results[0][0] for frames in results)
+
+    @pytest.mark.asyncio
+    async def test_fetcher_stops_with_last_viewer(self):
+        """Test the upstream fetcher stops when the last viewer leaves."""
+        hub = FrameHub()
+        camera = CountingCamera()
+
+        async with hub.watch("cam-2", camera.fetch, refresh_interval=0.01) as frames:
+            await frames.__anext__()
+            assert hub.get_stats()["viewers"] == 1
+        requests = camera.requests
+        await asyncio.sleep(0.05)
+
+        assert camera.requests == requests
+        assert hub.get_stats()["active_feeds"] == 0
+        assert hub.viewer_count("cam-2") == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_fetches_keep_last_frame(self):
+        """Test failed fetches are counted and viewers keep the last good frame."""
+        hub = FrameHub()
+        results = iter([b"good", None])
+
+        async def fetch():
+            return next(results, None)
+
+        async with hub.watch("cam-3", fetch, refresh_interval=0.01) as frames:
+            first = await frames.__anext__()
+            await asyncio.sleep(0.05)
+            stats = hub.get_stats()["feeds"][0]
+
+        assert first == encode_mjpeg_part(b"good")
+        assert stats["fetch_errors"] >= 1
+        assert stats["frames_served"] == 1
+
+
+class TestSharedStreams:
+    """Tests for streams served through the frame hub."""
+
+    @pytest.mark.asyncio
+    async def test_video_wall_slots_share_adapter_feed(self):
+        """Test two wall slots showing one camera share one feed."""
+        wall = VideoWallManager()
+        session = wall.create_session("hub-user", "2x2")
+        for position in (0, 1):
+            wall.add_camera_to_wall(
+                session.session_id, position, "wall-cam", stream_url="https://via.placeholder.com/1"
+            )
+        adapter = StreamingAdapter()
+        adapter.register_camera("wall-cam", wall.get_slot(session.session_id, 0).stream_url)
+
+        streams = [adapter.generate_mjpeg_stream("wall-cam", 0.01) for _ in range(2)]
+        frames = [await stream.__anext__() for stream in streams]
+
+        assert frames[0] is frames[1]
+        assert adapter.get_stream_info("wall-cam")["is_active"] is True
+        for stream in streams:
+            await stream.aclose()
+        assert adapter.get_stream_info("wall-cam")["is_active"] is False
+        assert wall.get_slot(session.session_id, 9) is None
+
@@ -0,0 +1,161 @@
+"""
+Tests for the Camera I/O Scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.camera_network.camera_health_monitor import CameraHealthMonitor, HealthStatus
+from app.camera_network.io_scheduler import CameraIOScheduler, IOPriority, get_io_scheduler
+from app.camera_network.video_wall_manager import VideoWallManager
+
+
+class FakeResponse:
+    """HTTP response stand-in."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.content = b"jpeg"
+
+
+class FakeClient:
+    """HTTP client stand-in that records request order and concurrency."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.urls = []
+
+    async def request(self, url: str, timeout: float) -> FakeResponse:
+        self.urls.append(url)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return FakeResponse()
+
+    head = request
+    get = request
+
+
+def _scheduler(client: FakeClient, **limits) -> CameraIOScheduler:
+    scheduler = CameraIOScheduler(**limits)
+    scheduler._http_client = client
+    return scheduler
+
+
+class TestCameraIOScheduler:
+    """Test suite for CameraIOScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_limits_global_and_per_host_concurrency(self):
+        """Test requests never exceed the global or per-host limits."""
+        client = FakeClient()
+        scheduler = _scheduler(client, max_concurrency=5, per_host_concurrency=2, per_host_rate=1000)
+        urls = [f"http://host-{i % 4}/cam/{i}" for i in range(40)]
+
+        responses = await asyncio.gather(*(
+            scheduler.submit(url, lambda c, t, url=url: c.get(url, timeout=t)) for url in urls
+        ))
+
+        assert len(responses) == 40
+        assert client.max_active == 5
+        assert all(host["completed"] == 10 for host in scheduler.get_stats()["hosts"])
+
+        single = FakeClient()
+        scheduler = _scheduler(single, max_concurrency=10, per_host_concurrency=2, per_host_rate=1000)
+        await asyncio.gather(*(
+            scheduler.submit("http://one/cam", lambda c, t: c.get("http://one/cam", timeout=t))
+            for _ in range(10)
+        ))
+        assert single.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_high_priority_runs_first(self):
+        """Test queued high-priority requests start before earlier normal ones."""
+        client = FakeClient()
+        scheduler = _scheduler(client, max_concurrency=1, per_host_rate=1000)
+
+        def submit(url, priority):
+            return scheduler.submit(url, lambda c, t: c.get(url, timeout=t), priority)
+
+        await asyncio.gather(
+            submit("http://a/first", IOPriority.NORMAL),
+            submit("http://a/normal", IOPriority.NORMAL),
+            submit("http://b/wall", IOPriority.HIGH),
+        )
+
+        assert client.urls == ["http://a/first", "http://b/wall", "http://a/normal"]
+
+    @pytest.mark.asyncio
+    async def test_per_host_rate_limit(self):
+        """Test request starts to one host are spaced by the rate limit."""
+        client = FakeClient(delay=0)
+        scheduler = _scheduler(client, per_host_rate=50)
+
+        started = time.monotonic()
+        await asyncio.gather(*(
+            scheduler.submit("http://fdot/cam", lambda c, t: c.get("http://fdot/cam", timeout=t))
+            for _ in range(6)
+        ))
+
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout(self):
+        """Test timeouts track response times and widen after a timeout."""
+        scheduler = _scheduler(FakeClient(), per_host_rate=1000)
+
+        async def respond_in(delay):
+            await asyncio.sleep(delay)
+
+        for _ in range(5):
+            await scheduler.submit("http://cam", lambda c, t: respond_in(0.01))
+        host = scheduler._hosts["cam"]
+        learned = host.timeout
+
+        with pytest.raises(asyncio.TimeoutError):
+            await scheduler.submit("http://cam", lambda c, t: respond_in(5), max_timeout=0.05)
+
+        assert learned == 1.0  # Fast host: clamped to the minimum
+        assert host.timeouts == 1
+        assert host.timeout == 2.0
+
+
+class TestSchedulerClients:
+    """Tests for camera subsystems using the shared scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_health_sweep_is_bounded_and_checks_wall_first(self):
+        """Test a sweep respects the concurrency limit and checks wall cameras first."""
+        scheduler = get_io_scheduler()
+        client = FakeClient()
+        saved = (scheduler._http_client, scheduler.max_concurrency, scheduler.per_host_rate)
+        scheduler._http_client = client
+        scheduler.configure(max_concurrency=4, per_host_rate=1000)
+
+        wall = VideoWallManager()
+        session = wall.create_session("sweep-user", "1x1")
+        wall.add_camera_to_wall(session.session_id, 0, "cam-99")
+        monitor = CameraHealthMonitor()
+        cameras = [
+            {"id": f"cam-{i}", "stream_url": f"http://sweep-{i % 8}.example/cam-{i}"}
+            for i in range(100)
+        ]
+
+        try:
+            results = await monitor.check_all_cameras(cameras)
+        finally:
+            wall.delete_session(session.session_id)
+            scheduler._http_client, scheduler.max_concurrency, scheduler.per_host_rate = saved
+
+        assert len(results) == 100
+        assert all(r.status == HealthStatus.GREEN for r in results)
+        assert client.max_active == 4
+        # The first four start before cam-99 is queued; it takes the next free slot
+        assert client.urls.index("http://sweep-3.example/cam-99") == 4
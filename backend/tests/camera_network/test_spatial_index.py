@@ -0,0 +1,116 @@
+"""
+Tests for the Camera Spatial Index.
+"""
+
+import random
+
+from app.camera_network.camera_registry import (
+    Camera,
+    CameraJurisdiction,
+    CameraRegistry,
+    CameraType,
+)
+from app.camera_network.spatial_index import CameraSpatialIndex, haversine_km
+
+
+def _brute_force(points, lat, lng):
+    return sorted(
+        ((item_id, haversine_km(lat, lng, p_lat, p_lng)) for item_id, (p_lat, p_lng) in points.items()),
+        key=lambda m: (m[1], m[0]),
+    )
+
+
+class TestCameraSpatialIndex:
+    """Test suite for CameraSpatialIndex class."""
+
+    def test_queries_match_linear_scan(self):
+        """Test radius and k-nearest results equal a scan over every point."""
+        rng = random.Random(7)
+        index = CameraSpatialIndex()
+        points = {}
+        for i in range(500):
+            # Dense city cluster plus scattered outliers
+            if i % 10:
+                point = (rng.uniform(26.70, 26.85), rng.uniform(-80.12, -80.02))
+            else:
+                point = (rng.uniform(24.0, 31.0), rng.uniform(-87.0, -80.0))
+            points[f"cam-{i}"] = point
+            index.insert(f"cam-{i}", *point)
+
+        for _ in range(100):
+            lat, lng = rng.uniform(24.0, 31.0), rng.uniform(-87.0, -79.0)
+            if rng.random() < 0.7:
+                lat, lng = rng.uniform(26.70, 26.85), rng.uniform(-80.12, -80.02)
+            expected = _brute_force(points, lat, lng)
+            radius = rng.choice([0.5, 2.0, 10.0, 300.0])
+            k = rng.choice([1, 5, 20])
+
+            within = index.within(lat, lng, radius)
+            nearest = index.nearest(lat, lng, k)
+
+            assert [m[0] for m in within] == [m[0] for m in expected if m[1] <= radius]
+            assert [m[0] for m in nearest] == [m[0] for m in expected[:k]]
+
+    def test_nearest_respects_radius_limit(self):
+        """Test k-nearest stops at the radius limit."""
+        index = CameraSpatialIndex()
+        index.insert("near", 26.7841, -80.0722)
+        index.insert("far", 27.0000, -80.0722)
+
+        assert [m[0] for m in index.nearest(26.7841, -80.0722, 5)] == ["near", "far"]
+        assert [m[0] for m in index.nearest(26.7841, -80.0722, 5, max_radius_km=5.0)] == ["near"]
+        assert index.nearest(26.7841, -80.0722, 0) == []
+
+    def test_insert_moves_and_remove(self):
+        """Test reinserting moves an item and removing drops its cell."""
+        index = CameraSpatialIndex()
+        index.insert("cam", 26.78, -80.07)
+        index.insert("cam", 26.50, -80.07)
+
+        assert index.within(26.78, -80.07, 1.0) == []
+        assert [m[0] for m in index.within(26.50, -80.07, 1.0)] == ["cam"]
+        assert index.remove("cam") is True
+        assert index.remove("cam") is False
+        assert index.get_stats()["occupied_cells"] == 0
+
+
+class TestRegistrySpatialQueries:
+    """Tests for registry location queries backed by the index."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.registry = CameraRegistry()
+        self.registry.clear()
+
+    def _add(self, camera_id, lat, lng):
+        self.registry.add_camera(Camera(
+            id=camera_id,
+            name=camera_id,
+            latitude=lat,
+            longitude=lng,
+            stream_url="https://example.com/stream",
+            camera_type=CameraType.CCTV,
+            jurisdiction=CameraJurisdiction.RBPD,
+        ))
+
+    def test_list_nearest(self):
+        """Test k-nearest returns camera dicts with distances."""
+        self._add("a", 26.7841, -80.0722)
+        self._add("b", 26.7900, -80.0722)
+        self._add("c", 26.9000, -80.0722)
+
+        nearest = self.registry.list_nearest(26.7841, -80.0722, k=2)
+
+        assert [c["id"] for c in nearest] == ["a", "b"]
+        assert nearest[0]["distance_km"] == 0.0
+
+    def test_index_follows_update_and_delete(self):
+        """Test moved and deleted cameras are reflected in location queries."""
+        self._add("moving", 26.7841, -80.0722)
+        self._add("gone", 26.7842, -80.0722)
+
+        self.registry.update_camera("moving", {"latitude": 26.5000})
+        self.registry.delete_camera("gone")
+
+        assert self.registry.list_nearby(26.7841, -80.0722, radius_km=1.0) == []
+        assert [c["id"] for c in self.registry.list_nearby(26.5, -80.0722, radius_km=1.0)] == ["moving"]
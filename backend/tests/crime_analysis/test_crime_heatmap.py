@@ -1,21 +1,23 @@
 """Tests for Crime Heatmap Engine Module."""
 
-import pytest
+import math
 from datetime import datetime, timedelta
+
+import pytest
+
 from app.crime_analysis.crime_heatmap_engine import (
     CrimeHeatmapEngine,
-    TimeRange,
-    HeatmapPoint,
-    HotspotCluster,
     HeatmapResult,
+    TimeRange,
     get_heatmap_engine,
 )
 from app.crime_analysis.crime_ingest import (
     CrimeDataIngestor,
-    NormalizedCrimeRecord,
-    CrimeType,
     CrimePriority,
+    CrimeType,
+    NormalizedCrimeRecord,
 )
+from app.utils.geo_utils import calculate_distance
 
 
 class TestCrimeHeatmapEngine:
@@ -43,68 +45,60 @@ class TestCrimeHeatmapEngine:
     def test_filter_by_time_range_24h(self):
         """Test filtering by 24 hour time range."""
         now = datetime.utcnow()
-        records = [
+        self.engine.ingestor.store.extend([
             self._create_mock_record(now - timedelta(hours=12)),
             self._create_mock_record(now - timedelta(hours=36)),
-        ]
+        ])
         
-        filtered, start, end = self.engine._filter_by_time_range(
-            records, TimeRange.HOURS_24
-        )
+        result = self.engine.generate_heatmap(time_range=TimeRange.HOURS_24)
         
-        assert len(filtered) == 1
+        assert result.total_incidents == 1
 
     def test_filter_by_time_range_7d(self):
         """Test filtering by 7 day time range."""
         now = datetime.utcnow()
-        records = [
+        self.engine.ingestor.store.extend([
             self._create_mock_record(now - timedelta(days=3)),
             self._create_mock_record(now - timedelta(days=10)),
-        ]
+        ])
         
-        filtered, start, end = self.engine._filter_by_time_range(
-            records, TimeRange.DAYS_7
-        )
+        result = self.engine.generate_heatmap(time_range=TimeRange.DAYS_7)
         
-        assert len(filtered) == 1
+        assert result.total_incidents == 1
 
     def test_filter_by_crime_type(self):
         """Test filtering by crime type."""
-        records = [
+        self.engine.ingestor.store.extend([
             self._create_mock_record(crime_type=CrimeType.VIOLENT),
             self._create_mock_record(crime_type=CrimeType.PROPERTY),
             self._create_mock_record(crime_type=CrimeType.VIOLENT),
-        ]
+        ])
         
-        filtered = self.engine._filter_by_crime_type(records, [CrimeType.VIOLENT])
+        result = self.engine.generate_heatmap(
+            time_range=TimeRange.DAYS_7, crime_types=[CrimeType.VIOLENT]
+        )
         
-        assert len(filtered) == 2
+        assert result.total_incidents == 2
 
     def test_filter_by_crime_type_none(self):
         """Test filtering with no crime type filter."""
-        records = [
+        self.engine.ingestor.store.extend([
             self._create_mock_record(crime_type=CrimeType.VIOLENT),
             self._create_mock_record(crime_type=CrimeType.PROPERTY),
-        ]
+        ])
         
-        filtered = self.engine._filter_by_crime_type(records, None)
+        result = self.engine.generate_heatmap(time_range=TimeRange.DAYS_7, crime_types=None)
         
-        assert len(filtered) == 2
+        assert result.total_incidents == 2
 
-    def test_gaussian_kernel(self):
-        """Test Gaussian kernel calculation."""
-        # At distance 0, kernel should be 1
-        assert self.engine._gaussian_kernel(0, 1) == 1.0
+    def test_clustering_epsilon_is_geodesic(self):
+        """Test the clustering radius is measured as haversine distance."""
+        # A row of points along a parallel, where a degree of longitude is short
+        records = [self._create_mock_record(lat=60.0, lng=10.0 + i * 0.001) for i in range(5)]
+        spacing = calculate_distance(60.0, 10.0, 60.0, 10.001, unit="km") * 1000
         
-        # Kernel should decrease with distance
-        k1 = self.engine._gaussian_kernel(0.5, 1)
-        k2 = self.engine._gaussian_kernel(1.0, 1)
-        assert k1 > k2
-
-    def test_calculate_distance(self):
-        """Test distance calculation."""
-        dist = self.engine._calculate_distance(0, 0, 3, 4)
-        assert dist == 5.0  # 3-4-5 triangle
+        assert len(self.engine._simple_clustering(records, epsilon_meters=spacing * 1.1)) == 1
+        assert self.engine._simple_clustering(records, epsilon_meters=spacing * 0.9) == []
 
     def test_calculate_bounds_empty(self):
         """Test bounds calculation with no records."""
@@ -172,6 +166,62 @@ class TestCrimeHeatmapEngine:
         assert isinstance(result, HeatmapResult)
         assert result.total_incidents == 2
 
+    def test_kernel_density_matches_per_cell_sum(self):
+        """Test the vectorized KDE equals the per-cell, per-record sum."""
+        records = [
+            self._create_mock_record(lat=26.78 + 0.002 * i, lng=-80.07 + 0.001 * (i % 5), crime_type=t)
+            for i, t in enumerate(list(CrimeType) * 4)
+        ]
+        bounds = self.engine._calculate_bounds(records)
+
+        points = self.engine._kernel_density_estimation(records, bounds)
+
+        lat_step = (bounds["north"] - bounds["south"]) / self.engine.GRID_SIZE
+        lng_step = (bounds["east"] - bounds["west"]) / self.engine.GRID_SIZE
+        expected = []
+        for i in range(self.engine.GRID_SIZE):
+            for j in range(self.engine.GRID_SIZE):
+                lat = bounds["south"] + (i + 0.5) * lat_step
+                lng = bounds["west"] + (j + 0.5) * lng_step
+                density = sum(
+                    self.engine.CRIME_WEIGHTS.get(r.type, 1.0) * math.exp(
+                        -math.hypot(lat - r.latitude, lng - r.longitude) ** 2
+                        / (2 * self.engine.DEFAULT_BANDWIDTH ** 2)
+                    )
+                    for r in records
+                )
+                if density > 0.01:
+                    expected.append((lat, lng, min(density, 10.0), density))
+
+        assert len(points) == len(expected)
+        for point, (lat, lng, intensity, weight) in zip(points, expected, strict=True):
+            assert point.latitude == pytest.approx(lat, abs=1e-9)
+            assert point.longitude == pytest.approx(lng, abs=1e-9)
+            assert point.intensity == pytest.approx(intensity)
+            assert point.weight == pytest.approx(weight)
+
+    def test_generate_heatmap_cached_until_data_changes(self):
+        """Test repeated queries hit the cache and new records invalidate it."""
+        self.engine.ingestor.ingest_json("""[
+            {"subcategory": "Assault", "latitude": 26.78, "longitude": -80.07, "type": "violent"}
+        ]""")
+
+        first = self.engine.generate_heatmap(time_range=TimeRange.DAYS_7)
+        again = self.engine.generate_heatmap(time_range=TimeRange.DAYS_7)
+        other_types = self.engine.generate_heatmap(
+            time_range=TimeRange.DAYS_7, crime_types=[CrimeType.PROPERTY]
+        )
+
+        self.engine.ingestor.ingest_json("""[
+            {"subcategory": "Theft", "latitude": 26.79, "longitude": -80.08, "type": "property"}
+        ]""")
+        refreshed = self.engine.generate_heatmap(time_range=TimeRange.DAYS_7)
+
+        assert again is first
+        assert other_types is not first
+        assert refreshed is not first
+        assert refreshed.total_incidents == first.total_incidents + 1
+
     def test_get_heatmap_engine_singleton(self):
         """Test global engine singleton."""
         engine1 = get_heatmap_engine()
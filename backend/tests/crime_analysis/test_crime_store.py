@@ -0,0 +1,141 @@
+"""Tests for the Columnar Crime Record Store."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.crime_analysis.crime_ingest import (
+    CrimeDataIngestor,
+    CrimePriority,
+    CrimeType,
+    NormalizedCrimeRecord,
+)
+from app.crime_analysis.crime_store import CrimeRecordStore, to_timestamp
+
+
+class SmallStore(CrimeRecordStore):
+    """Store that starts small so tests exercise column growth."""
+
+    INITIAL_CAPACITY = 16
+
+
+class TestCrimeRecordStore:
+    """Test suite for CrimeRecordStore class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = SmallStore(CrimeType)
+        self.base = datetime(2024, 6, 1)
+        rng = random.Random(7)
+        # Out-of-order times across several batches, with duplicate times
+        self.records = [
+            self._create_record(
+                i,
+                self.base + timedelta(hours=rng.randint(0, 240)),
+                rng.choice(list(CrimeType)),
+                rng.choice(["North", "South", "East"]),
+            )
+            for i in range(300)
+        ]
+        for start in range(0, 300, 70):
+            self.store.extend(self.records[start:start + 70])
+
+    def test_select_matches_list_filter(self):
+        """Test range, type and sector filters equal a list comprehension."""
+        start = self.base + timedelta(hours=50)
+        end = self.base + timedelta(hours=150)
+        types = [CrimeType.VIOLENT, "drug"]
+
+        rows = self.store.select(start, end, types, ["North", "East"])
+
+        expected = [
+            i for i, r in enumerate(self.records)
+            if start <= r.datetime_utc <= end
+            and r.type in (CrimeType.VIOLENT, CrimeType.DRUG)
+            and r.sector in ("North", "East")
+        ]
+        assert rows.tolist() == expected
+        assert self.store.records(rows) == [self.records[i] for i in expected]
+
+    def test_range_bounds_are_inclusive(self):
+        """Test records exactly at the range bounds are selected."""
+        moment = self.records[10].datetime_utc
+        rows = self.store.select(moment, moment)
+
+        assert rows.tolist() == [
+            i for i, r in enumerate(self.records) if r.datetime_utc == moment
+        ]
+
+    def test_unknown_filters_select_nothing(self):
+        """Test sectors that were never seen match no rows."""
+        assert len(self.store.select(sectors=["Nowhere"])) == 0
+        assert self.store.count() == 300
+
+    def test_columns(self):
+        """Test column views are read-only and selections are copies."""
+        columns = self.store.columns()
+        selected = self.store.columns(np.array([3, 5]))
+
+        assert len(columns) == 300
+        assert columns.latitudes[4] == self.records[4].latitude
+        assert columns.timestamps[4] == to_timestamp(self.records[4].datetime_utc)
+        assert columns.sector_names[columns.sector_codes[4]] == self.records[4].sector
+        with pytest.raises(ValueError):
+            columns.latitudes[0] = 0.0
+        assert selected.longitudes.tolist() == [
+            self.records[3].longitude, self.records[5].longitude
+        ]
+
+    def test_aware_and_naive_times_agree(self):
+        """Test aware datetimes are converted to UTC like naive ones."""
+        aware = self.base.replace(tzinfo=UTC) + timedelta(hours=100)
+
+        assert self.store.count(end=aware) == self.store.count(end=self.base + timedelta(hours=100))
+
+    def test_version_and_clear(self):
+        """Test the version changes on every mutation."""
+        version = self.store.version
+
+        self.store.clear()
+
+        assert self.store.version > version
+        assert len(self.store) == 0
+        assert self.store.sectors() == []
+        assert len(self.store.select(start=self.base)) == 0
+
+    def test_ingestor_queries_use_store(self):
+        """Test the ingestor keeps the store in sync with ingestion."""
+        ingestor = CrimeDataIngestor()
+        ingestor.ingest_json("""[
+            {"subcategory": "Assault", "date": "2024-01-15", "time": "10:00:00", "type": "violent", "sector": "A"},
+            {"subcategory": "Theft", "date": "2024-01-20", "time": "10:00:00", "type": "property", "sector": "B"}
+        ]""")
+
+        found = ingestor.query_records(start=datetime(2024, 1, 16), crime_types=[CrimeType.PROPERTY])
+
+        assert [r.subcategory for r in found] == ["Theft"]
+        assert ingestor.store.sectors() == ["A", "B"]
+
+    def _create_record(
+        self,
+        index: int,
+        dt: datetime,
+        crime_type: CrimeType,
+        sector: str,
+    ) -> NormalizedCrimeRecord:
+        """Create a crime record for testing."""
+        return NormalizedCrimeRecord(
+            id=f"test-{index}",
+            type=crime_type,
+            subcategory="Test Crime",
+            time=dt.strftime("%H:%M:%S"),
+            date=dt.strftime("%Y-%m-%d"),
+            datetime_utc=dt,
+            latitude=26.78 + index * 1e-4,
+            longitude=-80.07 - index * 1e-4,
+            sector=sector,
+            priority=CrimePriority.MEDIUM,
+            source="test",
+        )
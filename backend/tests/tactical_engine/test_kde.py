@@ -0,0 +1,129 @@
+"""Tests for the grid KDE engine."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.tactical_engine.heatmaps import PredictiveHeatmapEngine
+from app.tactical_engine.kde import GridKDE
+
+BOUNDS = {
+    "min_lat": 33.35,
+    "max_lat": 33.55,
+    "min_lon": -112.15,
+    "max_lon": -111.95,
+}
+
+
+def _random_points(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(BOUNDS["min_lat"], BOUNDS["max_lat"], n)
+    lon = rng.uniform(BOUNDS["min_lon"], BOUNDS["max_lon"], n)
+    return np.column_stack([lat, lon])
+
+
+def _brute_force_kde(points, weights, grid_size, bandwidth):
+    """Per-cell reference implementation."""
+    lat_range = np.linspace(BOUNDS["min_lat"], BOUNDS["max_lat"], grid_size)
+    lon_range = np.linspace(BOUNDS["min_lon"], BOUNDS["max_lon"], grid_size)
+    density = np.zeros((grid_size, grid_size))
+    for i, lat in enumerate(lat_range):
+        for j, lon in enumerate(lon_range):
+            distances = np.sqrt((points[:, 0] - lat) ** 2 + (points[:, 1] - lon) ** 2)
+            density[i, j] = np.sum(np.exp(-0.5 * (distances / bandwidth) ** 2) * weights)
+    return density / density.max()
+
+
+class TestGridKDE:
+    """Tests for GridKDE."""
+
+    def test_matches_per_cell_computation(self):
+        """Test the separable KDE equals the per-cell sum."""
+        points = _random_points(200)
+        weights = np.random.default_rng(1).uniform(0.5, 1.5, 200)
+
+        kde = GridKDE(BOUNDS, 25, 0.01).fit(points, weights)
+
+        np.testing.assert_allclose(
+            kde.density(), _brute_force_kde(points, weights, 25, 0.01), atol=1e-12
+        )
+
+    def test_chunking_respects_memory_budget(self):
+        """Test chunked accumulation gives the same grid as a single pass."""
+        points = _random_points(500)
+        full = GridKDE(BOUNDS, 40, 0.005).fit(points)
+        chunked = GridKDE(BOUNDS, 40, 0.005, max_bytes=40 * 16 * 7)
+
+        chunked.fit(points)
+
+        assert chunked.chunk_size == 7
+        np.testing.assert_allclose(chunked.density(), full.density())
+
+    def test_incremental_add_equals_refit(self):
+        """Test adding one point matches refitting with it included."""
+        points = _random_points(100)
+        kde = GridKDE(BOUNDS, 30, 0.01).fit(points[:-1])
+
+        kde.add(points[-1], [1.0])
+
+        np.testing.assert_allclose(
+            kde.density(), GridKDE(BOUNDS, 30, 0.01).fit(points).density()
+        )
+        assert kde.count == 100
+
+    def test_empty_grid(self):
+        """Test an empty fit yields an all-zero grid."""
+        kde = GridKDE(BOUNDS, 10, 0.01).fit(np.empty((0, 2)))
+
+        assert kde.density().shape == (10, 10)
+        assert not kde.density().any()
+
+
+class TestLiveHeatmapLayers:
+    """Tests for incremental heatmap layer updates."""
+
+    @pytest.fixture
+    def engine(self):
+        hits = [
+            {"_source": {"latitude": lat, "longitude": lon, "severity": "medium"}}
+            for lat, lon in _random_points(50)
+        ]
+        es = MagicMock()
+        es.search = AsyncMock(return_value={"hits": {"hits": hits}})
+        redis = MagicMock()
+        redis.delete_pattern = AsyncMock(return_value=0)
+        return PredictiveHeatmapEngine(neo4j=MagicMock(), es=es, redis=redis)
+
+    @pytest.mark.asyncio
+    async def test_update_folds_into_live_layer(self, engine):
+        """Test a new incident updates the live layer without refetching."""
+        first = await engine.generate_current_heatmap(heatmap_type="all", resolution="low")
+
+        update = await engine.update_with_incident({
+            "type": "shots_fired",
+            "latitude": 33.45,
+            "longitude": -112.05,
+            "timestamp": datetime.utcnow().isoformat(),
+        })
+        second = await engine.generate_current_heatmap(heatmap_type="all", resolution="low")
+
+        assert update["layers_updated"] == 1
+        assert second["metadata"]["incident_count"] == first["metadata"]["incident_count"] + 1
+        assert engine.es.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_skips_other_types_and_bounds(self, engine):
+        """Test incidents outside a layer's type or bounds leave it untouched."""
+        await engine.generate_current_heatmap(heatmap_type="gunfire", resolution="low")
+
+        wrong_type = await engine.update_with_incident(
+            {"type": "lpr_hit", "latitude": 33.45, "longitude": -112.05}
+        )
+        out_of_bounds = await engine.update_with_incident(
+            {"type": "shots_fired", "latitude": 34.5, "longitude": -112.05}
+        )
+
+        assert wrong_type["layers_updated"] == 0
+        assert out_of_bounds["layers_updated"] == 0
@@ -0,0 +1,217 @@
+"""
+Tests for the cross-process broadcast bus.
+
+Tests cover:
+- Local delivery and delivery to peer workers
+- Per-channel batching and ordering
+- Deduplication by message_id
+- Realtime broadcasts fanned out through the bus
+- Redis transport framing
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import app.api.realtime as realtime
+from app.services.events.broadcast_bus import (
+    InProcessBroadcastBus,
+    InProcessBroker,
+    RedisBroadcastBus,
+    set_broadcast_bus,
+)
+
+
+def _recorder(received: list):
+    async def handler(message: dict) -> None:
+        received.append(message)
+
+    return handler
+
+
+@pytest.fixture
+async def workers():
+    """Two buses on a shared broker, standing in for two worker processes."""
+    broker = InProcessBroker()
+    buses = [InProcessBroadcastBus(broker, flush_interval=0.001) for _ in range(2)]
+    for bus in buses:
+        await bus.start()
+    yield buses
+    for bus in buses:
+        await bus.stop()
+
+
+class TestBroadcastBus:
+    """Tests for InProcessBroadcastBus."""
+
+    async def test_delivers_locally_and_to_peers(self, workers):
+        """Test the publisher's handlers run immediately and peers get the message."""
+        local, peer = workers
+        local_received, peer_received = [], []
+        local.subscribe("alerts", _recorder(local_received))
+        peer.subscribe("alerts", _recorder(peer_received))
+
+        message_id = await local.publish("alerts", {"type": "alert", "n": 1})
+
+        assert [m["n"] for m in local_received] == [1]
+        await local.flush()
+        await peer.drain()
+        assert peer_received == [{"type": "alert", "n": 1, "message_id": message_id}]
+
+    async def test_batches_preserve_channel_order(self, workers):
+        """Test messages arrive in publish order, in fewer sends than messages."""
+        local, peer = workers
+        local.batch_size = 16
+        received = []
+        peer.subscribe("locations", _recorder(received))
+
+        for n in range(100):
+            await local.publish("locations", {"n": n})
+        await local.flush()
+        await peer.drain()
+
+        assert [m["n"] for m in received] == list(range(100))
+        assert local.batches_sent == 7
+
+    async def test_partial_batch_flushes_after_interval(self, workers):
+        """Test a partial batch is sent without an explicit flush."""
+        local, peer = workers
+        received = []
+        peer.subscribe("zones", _recorder(received))
+
+        await local.publish("zones", {"n": 1})
+        await asyncio.sleep(0.05)
+        await peer.drain()
+
+        assert len(received) == 1
+
+    async def test_deduplicates_by_message_id(self, workers):
+        """Test a message published on two workers is delivered once per worker."""
+        first, second = workers
+        received = []
+        second.subscribe("incidents", _recorder(received))
+
+        # Received from a peer, then republished locally
+        await first.publish("incidents", {"message_id": "m-1", "n": 1})
+        await first.flush()
+        await second.drain()
+        await second.publish("incidents", {"message_id": "m-1", "n": 1})
+
+        # Published locally, then received from a peer
+        await second.publish("incidents", {"message_id": "m-2", "n": 2})
+        await first.publish("incidents", {"message_id": "m-2", "n": 2})
+        await first.flush()
+        await second.drain()
+
+        assert [m["n"] for m in received] == [1, 2]
+        assert second.get_stats()["duplicates_dropped"] == 2
+
+    async def test_stop_flushes_pending(self, workers):
+        """Test stopping a bus sends queued messages."""
+        local, peer = workers
+        local.flush_interval = 60
+        received = []
+        peer.subscribe("alerts", _recorder(received))
+
+        await local.publish("alerts", {"n": 1})
+        await local.stop()
+        await peer.drain()
+
+        assert len(received) == 1
+
+
+class FakeWebSocketManager:
+    """Records messages sent to clients."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, dict]] = []
+
+    async def send_to_client(self, client_id: str, message: dict) -> bool:
+        self.sent.append((client_id, message))
+        return True
+
+
+class TestRealtimeFanOut:
+    """Tests for realtime broadcasts routed through the bus."""
+
+    async def test_officer_location_reaches_other_workers(self, workers, monkeypatch):
+        """Test a broadcast reaches local subscribers and peer workers."""
+        local, peer = workers
+        previous = set_broadcast_bus(local)
+        ws_manager = FakeWebSocketManager()
+        monkeypatch.setattr(realtime, "get_websocket_manager", lambda: ws_manager)
+        monkeypatch.setitem(realtime._officer_location_subscriptions, "B123", {"c1"})
+        monkeypatch.setitem(realtime._officer_location_subscriptions, "all", {"c1", "c2"})
+        peer_received = []
+        peer.subscribe("realtime.officer_location", _recorder(peer_received))
+
+        try:
+            await realtime.broadcast_officer_location("B123", {"lat": 26.78, "lon": -80.07})
+            await local.flush()
+            await peer.drain()
+        finally:
+            set_broadcast_bus(previous)
+
+        assert sorted(client_id for client_id, _ in ws_manager.sent) == ["c1", "c2"]
+        assert peer_received[0]["badge"] == "B123"
+        assert peer_received[0]["message_id"] == ws_manager.sent[0][1]["message_id"]
+
+
+class FakePubSub:
+    """Minimal Redis pub/sub stand-in."""
+
+    def __init__(self) -> None:
+        self.channels: set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class FakeRedis:
+    """Redis manager stand-in that loops published messages back."""
+
+    def __init__(self) -> None:
+        self.pubsub = FakePubSub()
+        self.published: list[tuple[str, str]] = []
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        if channel in self.pubsub.channels:
+            await self.pubsub.queue.put({"type": "message", "channel": channel, "data": message})
+        return 1
+
+    async def subscribe(self, *channels: str) -> FakePubSub:
+        self.pubsub.channels.update(channels)
+        return self.pubsub
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.pubsub.channels.difference_update(channels)
+
+
+class TestRedisBroadcastBus:
+    """Tests for RedisBroadcastBus framing."""
+
+    async def test_publishes_batches_and_dispatches_from_other_origins(self):
+        """Test batches are JSON envelopes and foreign batches are dispatched."""
+        redis = FakeRedis()
+        bus = RedisBroadcastBus(redis, poll_timeout=0.01)
+        received = []
+        bus.subscribe("alerts", _recorder(received))
+        await bus.start()
+
+        await bus.publish("alerts", {"n": 1})
+        await bus.flush()
+        channel, data = redis.published[0]
+        foreign = {"origin": "other-worker", "channel": "alerts", "messages": [{"n": 2, "message_id": "x"}]}
+        await redis.publish(channel, json.dumps(foreign))
+        await asyncio.sleep(0.05)
+        await bus.stop()
+
+        assert channel == "rtcc:ws:alerts"
+        assert json.loads(data)["messages"][0]["n"] == 1
+        assert [m["n"] for m in received] == [1, 2]
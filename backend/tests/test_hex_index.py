@@ -0,0 +1,119 @@
+"""
+Unit tests for the hierarchical hexagonal cell index.
+
+Tests cover:
+- Point/cell conversion and boundaries
+- k-ring neighbor queries
+- Parent/child roll-up between resolutions
+- Vectorized batch conversion
+"""
+
+import numpy as np
+import pytest
+
+from app.utils import hex_index
+
+RIVIERA_BEACH = (26.7753, -80.0581)
+
+
+class TestCellConversion:
+    """Tests for point/cell conversion."""
+
+    def test_round_trip_center_in_cell(self):
+        """Test a cell's center maps back to the same cell."""
+        cell = hex_index.latlng_to_cell(*RIVIERA_BEACH, 9)
+        center = hex_index.cell_to_latlng(cell)
+
+        assert hex_index.latlng_to_cell(*center, 9) == cell
+        assert hex_index.get_resolution(cell) == 9
+        assert hex_index.is_valid_cell(cell)
+
+    def test_nearby_points_share_cell(self):
+        """Test points a few meters apart share a resolution 8 cell."""
+        lat, lon = hex_index.cell_to_latlng(hex_index.latlng_to_cell(*RIVIERA_BEACH, 8))
+
+        assert hex_index.latlng_to_cell(lat, lon, 8) == hex_index.latlng_to_cell(
+            lat + 0.00001, lon + 0.00001, 8
+        )
+
+    def test_boundary_has_six_vertices_around_center(self):
+        """Test boundary vertices surround the cell center."""
+        cell = hex_index.latlng_to_cell(*RIVIERA_BEACH, 8)
+        lat, lon = hex_index.cell_to_latlng(cell)
+        boundary = hex_index.cell_to_boundary(cell)
+
+        assert len(boundary) == 6
+        assert min(v[0] for v in boundary) < lat < max(v[0] for v in boundary)
+        assert min(v[1] for v in boundary) < lon < max(v[1] for v in boundary)
+
+    def test_invalid_resolution(self):
+        """Test out-of-range resolutions are rejected."""
+        with pytest.raises(ValueError):
+            hex_index.latlng_to_cell(*RIVIERA_BEACH, 16)
+
+    def test_invalid_cell(self):
+        """Test malformed identifiers are not valid cells."""
+        assert not hex_index.is_valid_cell("8a2a1072b59ffff")
+        assert not hex_index.is_valid_cell("not-a-cell-at-al")
+
+
+class TestNeighbors:
+    """Tests for k-ring queries."""
+
+    @pytest.mark.parametrize("k,expected", [(0, 1), (1, 7), (2, 19), (3, 37)])
+    def test_grid_disk_size(self, k, expected):
+        """Test k-ring sizes follow 3k(k+1)+1."""
+        cell = hex_index.latlng_to_cell(*RIVIERA_BEACH, 9)
+        disk = hex_index.grid_disk(cell, k)
+
+        assert len(disk) == expected
+        assert len(set(disk)) == expected
+        assert disk[0] == cell
+
+    def test_grid_ring_distance(self):
+        """Test ring cells are exactly k steps away."""
+        cell = hex_index.latlng_to_cell(*RIVIERA_BEACH, 9)
+
+        assert all(hex_index.grid_distance(cell, c) == 2 for c in hex_index.grid_ring(cell, 2))
+
+
+class TestHierarchy:
+    """Tests for parent/child roll-up."""
+
+    @pytest.mark.parametrize("parent_res", [6, 7, 8, 9])
+    def test_children_contain_cell_and_share_parent(self, parent_res):
+        """Test a parent's children include the cell and all map back to it."""
+        cell = hex_index.latlng_to_cell(*RIVIERA_BEACH, 10)
+        parent = hex_index.cell_to_parent(cell, parent_res)
+        children = hex_index.cell_to_children(parent, 10)
+
+        assert cell in children
+        assert all(hex_index.cell_to_parent(c, parent_res) == parent for c in children)
+
+    def test_rollup_counts_is_lossless(self):
+        """Test rolled-up counts preserve the total."""
+        lats = np.random.default_rng(7).uniform(26.7, 26.8, 500)
+        lons = np.random.default_rng(8).uniform(-80.1, -80.0, 500)
+        counts: dict[str, int] = {}
+        for cell in hex_index.latlng_to_cells(lats, lons, 10):
+            counts[cell] = counts.get(cell, 0) + 1
+
+        rolled = hex_index.rollup_counts(counts, 7)
+
+        assert sum(rolled.values()) == 500
+        assert all(hex_index.get_resolution(c) == 7 for c in rolled)
+        assert len(rolled) < len(counts)
+
+
+class TestBatchConversion:
+    """Tests for vectorized conversion."""
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized conversion matches per-point conversion."""
+        rng = np.random.default_rng(42)
+        lats = rng.uniform(-60, 60, 1000)
+        lons = rng.uniform(-179, 179, 1000)
+
+        batch = hex_index.latlng_to_cells(lats, lons, 8)
+
+        assert batch == [hex_index.latlng_to_cell(la, lo, 8) for la, lo in zip(lats, lons, strict=True)]
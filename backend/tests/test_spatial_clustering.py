@@ -0,0 +1,126 @@
+"""
+Unit tests for the shared spatial clustering engine.
+
+Tests cover:
+- Agreement with a brute-force haversine DBSCAN
+- Antimeridian and polar neighborhoods
+- Chunked neighbor search
+- Centroids, radii and weights
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.geo_utils import calculate_distance
+from app.utils.spatial_clustering import NOISE, dbscan
+
+
+def _brute_force(points, eps_meters, min_samples):
+    """Reference DBSCAN labels with the same border-point rule."""
+    n = len(points)
+    dist = np.array([
+        [calculate_distance(*points[i], *points[j], unit="km") * 1000 for j in range(n)]
+        for i in range(n)
+    ])
+    near = dist <= eps_meters * (1 + 1e-9)
+    core = near.sum(axis=1) >= min_samples
+
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    for i in np.flatnonzero(core):
+        for j in np.flatnonzero(near[i] & core):
+            a, b = find(i), find(j)
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+
+    roots = sorted({find(i) for i in np.flatnonzero(core)})
+    labels = np.full(n, NOISE)
+    for i in np.flatnonzero(core):
+        labels[i] = roots.index(find(i))
+    for i in np.flatnonzero(~core):
+        neighbors = np.flatnonzero(near[i] & core)
+        if len(neighbors):
+            labels[i] = labels[neighbors.min()]
+    return labels, core
+
+
+def _blobs(centers, n, spread_deg, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = np.asarray(centers, dtype=float)
+    points = centers[rng.integers(0, len(centers), n)] + rng.normal(0, spread_deg, (n, 2))
+    points[:, 0] = np.clip(points[:, 0], -90, 90)
+    points[:, 1] = (points[:, 1] + 180) % 360 - 180
+    return points
+
+
+class TestDBSCAN:
+    """Tests for dbscan."""
+
+    @pytest.mark.parametrize("eps_meters,min_samples", [(150, 3), (400, 5), (1000, 1)])
+    def test_matches_brute_force(self, eps_meters, min_samples):
+        """Test labels and core flags equal a brute-force haversine DBSCAN."""
+        points = _blobs([(26.78, -80.07), (26.80, -80.05)], 150, 0.004)
+
+        result = dbscan(points, eps_meters, min_samples)
+        labels, core = _brute_force(points, eps_meters, min_samples)
+
+        np.testing.assert_array_equal(result.core, core)
+        np.testing.assert_array_equal(result.labels, labels)
+
+    @pytest.mark.parametrize("center", [(10.0, 179.999), (89.999, 0.0)])
+    def test_antimeridian_and_pole(self, center):
+        """Test neighborhoods spanning the antimeridian or a pole."""
+        points = _blobs([center], 120, 0.002, seed=3)
+
+        result = dbscan(points, 300, 3)
+        labels, _ = _brute_force(points, 300, 3)
+
+        np.testing.assert_array_equal(result.labels, labels)
+
+    def test_chunked_search_matches(self):
+        """Test a tiny pair budget gives the same clusters."""
+        points = _blobs([(26.78, -80.07)], 300, 0.003, seed=5)
+
+        full = dbscan(points, 200, 4)
+        chunked = dbscan(points, 200, 4, max_pairs=50)
+
+        np.testing.assert_array_equal(full.labels, chunked.labels)
+
+    def test_centroid_radius_and_weights(self):
+        """Test per-cluster statistics."""
+        points = np.array([[0.0, 0.0], [0.0, 0.001], [0.0, 0.002], [5.0, 5.0]])
+        weights = np.array([1.0, 2.0, 1.0, 9.0])
+
+        result = dbscan(points, 200, 2, weights=weights)
+
+        assert result.n_clusters == 1
+        assert result.labels[3] == NOISE
+        assert result.sizes[0] == 3
+        assert result.weights[0] == pytest.approx(4.0)
+        assert result.centroids[0] == pytest.approx([0.0, 0.001], abs=1e-9)
+        assert result.radii_meters[0] == pytest.approx(111.2, rel=1e-2)
+        assert [list(g) for g in result.groups()] == [[0, 1, 2]]
+
+    def test_empty_and_all_noise(self):
+        """Test inputs without clusters."""
+        assert dbscan(np.empty((0, 2)), 100, 3).n_clusters == 0
+
+        sparse = dbscan(np.array([[0.0, 0.0], [1.0, 1.0]]), 100, 2)
+        assert sparse.n_clusters == 0
+        assert (sparse.labels == NOISE).all()
+        assert sparse.groups() == []
+
+    def test_dense_cubes_match_brute_force(self):
+        """Test tight hotspots that skip per-point neighbor counting."""
+        points = _blobs([(40.71, -74.0), (40.715, -74.0)], 250, 0.0004, seed=9)
+
+        result = dbscan(points, 250, 8)
+        labels, core = _brute_force(points, 250, 8)
+
+        np.testing.assert_array_equal(result.core, core)
+        np.testing.assert_array_equal(result.labels, labels)
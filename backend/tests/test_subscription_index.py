@@ -0,0 +1,96 @@
+"""
+Tests for the WebSocket subscription index.
+
+Tests cover:
+- Matching identical to ClientConnection.matches_event
+- Incremental updates on subscribe, unsubscribe and removal
+- Geographic bounds, including boxes too large for the grid
+"""
+
+import random
+
+from app.schemas.events import EventPriority, EventSource, EventSubscription, EventType
+from app.services.events.subscription_index import SubscriptionIndex
+from app.services.events.websocket_manager import ClientConnection
+
+TAGS = ["ai", "intelligence", "gunfire", "lpr", "traffic"]
+
+
+def _random_subscription(rng: random.Random) -> EventSubscription:
+    def some(values: list, k: int) -> list:
+        return rng.sample(values, rng.randint(0, k)) if rng.random() < 0.6 else []
+
+    bounds = None
+    if rng.random() < 0.5:
+        south = rng.uniform(26.0, 27.0)
+        west = rng.uniform(-81.0, -80.0)
+        bounds = {
+            "south": south,
+            "north": south + rng.choice([0.05, 0.3, 200.0]),
+            "west": west,
+            "east": west + rng.uniform(0.05, 0.5),
+        }
+    return EventSubscription(
+        event_types=some(list(EventType), 4),
+        sources=some(list(EventSource), 3),
+        priorities=some(list(EventPriority), 2),
+        tags=some(TAGS, 2),
+        geographic_bounds=bounds,
+    )
+
+
+class TestSubscriptionIndex:
+    """Tests for SubscriptionIndex."""
+
+    def test_matches_same_clients_as_linear_scan(self):
+        """Test index results equal matches_event over every connection."""
+        rng = random.Random(11)
+        index = SubscriptionIndex()
+        connections = []
+        for i in range(300):
+            connection = ClientConnection(websocket=None, client_id=f"c{i}")
+            connection.subscription = _random_subscription(rng)
+            index.add(connection.client_id, connection.subscription)
+            connections.append(connection)
+
+        for _ in range(200):
+            event = (
+                rng.choice(list(EventType)),
+                rng.choice(list(EventSource)),
+                rng.choice(list(EventPriority)),
+                rng.choice([None, {"lat": rng.uniform(26.0, 27.5), "lon": rng.uniform(-81.0, -79.5)}]),
+                rng.choice([None, [], rng.sample(TAGS, 2)]),
+            )
+            expected = {c.client_id for c in connections if c.matches_event(*event)}
+            assert index.match(*event) == expected
+
+    def test_updates_incrementally(self):
+        """Test resubscribing and removing replace earlier index entries."""
+        index = SubscriptionIndex()
+        index.add("c1", EventSubscription(event_types=[EventType.CAMERA_ALERT]))
+        index.add("c2", EventSubscription())
+
+        index.add("c1", EventSubscription(event_types=[EventType.INCIDENT_CREATED]))
+        camera = index.match(EventType.CAMERA_ALERT, EventSource.MILESTONE, EventPriority.HIGH)
+        incident = index.match(EventType.INCIDENT_CREATED, EventSource.CAD, EventPriority.LOW)
+        index.remove("c2")
+
+        assert camera == {"c2"}
+        assert incident == {"c1", "c2"}
+        assert index.match(EventType.CAMERA_ALERT, EventSource.MILESTONE, EventPriority.HIGH) == set()
+        assert index.get_stats()["event_type_keys"] == 1
+
+    def test_bounds_filter_only_located_events(self):
+        """Test bounded clients get unlocated events and located ones inside their box."""
+        index = SubscriptionIndex()
+        index.add("city", EventSubscription(
+            geographic_bounds={"south": 26.7, "north": 26.8, "west": -80.1, "east": -80.0}
+        ))
+        index.add("hemisphere", EventSubscription(geographic_bounds={"north": 90, "south": 0}))
+        args = (EventType.SYSTEM_ALERT, EventSource.SYSTEM, EventPriority.INFO)
+
+        assert index.match(*args) == {"city", "hemisphere"}
+        assert index.match(*args, location={"lat": 26.75, "lon": -80.05}) == {"city", "hemisphere"}
+        assert index.match(*args, location={"lat": 40.0, "lon": -74.0}) == {"hemisphere"}
+        assert index.match(*args, location={"lat": -33.9, "lon": 151.2}) == set()
+
@@ -0,0 +1,164 @@
+"""
+Tests for WebSocketManager broadcast delivery.
+
+Tests cover:
+- Messages encoded once and delivered through per-client writers
+- Slow clients not delaying fast ones
+- Dropping and coalescing in full outbound queues
+- Delivery statistics
+- Routing by client subscriptions
+"""
+
+import asyncio
+import json
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from app.schemas.events import EventPriority, EventSource, EventType
+from app.services.events.websocket_manager import OutboundQueue, WebSocketManager
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records sent text."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.delay = delay
+        self.fail = fail
+        self.sent: list[dict] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.client_state = WebSocketState.DISCONNECTED
+
+    async def send_text(self, text: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection reset")
+        self.sent.append(json.loads(text))
+
+
+async def _settle(seconds: float = 0.01) -> None:
+    await asyncio.sleep(seconds)
+
+
+@pytest.fixture
+async def manager():
+    """WebSocket manager whose writers are stopped after the test."""
+    manager = WebSocketManager()
+    yield manager
+    await manager.stop()
+
+
+class TestOutboundQueue:
+    """Tests for OutboundQueue."""
+
+    async def test_full_queue_drops_oldest_non_critical(self):
+        """Test a full queue drops the oldest droppable message."""
+        queue = OutboundQueue(maxsize=3)
+        queue.put("critical", critical=True)
+        queue.put("a")
+        queue.put("b")
+        queue.put("c")
+
+        texts = [(await queue.get())[0] for _ in range(3)]
+
+        assert texts == ["critical", "b", "c"]
+        assert queue.dropped == 1
+
+    async def test_coalesces_by_key(self):
+        """Test a queued message is replaced in place by a newer one with the same key."""
+        queue = OutboundQueue(maxsize=10)
+        queue.put("risk-1", coalesce_key="risk:A")
+        queue.put("other")
+        queue.put("risk-2", coalesce_key="risk:A")
+
+        texts = [(await queue.get())[0] for _ in range(2)]
+        queue.put("risk-3", coalesce_key="risk:A")
+
+        assert texts == ["risk-2", "other"]
+        assert len(queue) == 1
+        assert queue.coalesced == 1
+
+
+class TestBroadcastDelivery:
+    """Tests for WebSocketManager broadcasts."""
+
+    async def test_broadcast_reaches_all_clients(self, manager):
+        """Test every connected client receives the broadcast after CONNECTED."""
+        sockets = [FakeWebSocket() for _ in range(5)]
+        for socket in sockets:
+            await manager.connect(socket)
+
+        count = await manager.broadcast_event(
+            EventType.SYSTEM_ALERT, EventSource.SYSTEM, EventPriority.HIGH, {"n": 1}
+        )
+        await _settle()
+
+        assert count == 5
+        for socket in sockets:
+            assert [m["type"] for m in socket.sent] == ["connected", "event"]
+        assert manager.get_stats()["messages_sent"] == 10
+
+    async def test_slow_client_does_not_delay_others(self, manager):
+        """Test broadcasting returns without waiting on a slow client."""
+        slow = FakeWebSocket(delay=0.5)
+        fast = FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(
+            manager.broadcast_event(EventType.SYSTEM_ALERT, EventSource.SYSTEM, EventPriority.HIGH, {}),
+            timeout=0.1,
+        )
+        await _settle()
+
+        assert [m["type"] for m in fast.sent] == ["connected", "event"]
+        assert slow.sent == []
+        assert manager.get_stats()["queued_messages"] == 1
+
+    async def test_risk_updates_coalesce_for_backlogged_client(self, manager):
+        """Test a backlogged client only gets the latest risk score per entity."""
+        socket = FakeWebSocket(delay=0.02)
+        await manager.connect(socket)
+
+        # All three arrive while the writer is still sending CONNECTED
+        for score in (0.2, 0.5, 0.9):
+            await manager.broadcast_ai_risk_update("entity-1", "person", score, "high", [])
+        await _settle(0.2)
+
+        risk = [m["payload"]["data"]["risk_score"] for m in socket.sent if m["type"] != "connected"]
+        assert risk == [0.9]
+        assert manager.get_stats()["coalesced_messages"] == 2
+
+    async def test_failed_send_disconnects_client(self, manager):
+        """Test a client whose socket errors is removed."""
+        client_id = await manager.connect(FakeWebSocket(fail=True))
+        await _settle()
+
+        assert client_id not in manager._connections
+        assert manager.get_stats()["send_failures"] == 1
+
+    async def test_subscribe_message_updates_routing(self, manager):
+        """Test a SUBSCRIBE message narrows the events a client receives."""
+        socket = FakeWebSocket()
+        client_id = await manager.connect(socket)
+        await manager.handle_message(client_id, json.dumps({
+            "type": "subscribe",
+            "payload": {"event_types": [EventType.CAMERA_ALERT.value]},
+        }))
+
+        skipped = await manager.broadcast_event(
+            EventType.INCIDENT_CREATED, EventSource.CAD, EventPriority.HIGH, {}
+        )
+        delivered = await manager.broadcast_event(
+            EventType.CAMERA_ALERT, EventSource.MILESTONE, EventPriority.HIGH, {}
+        )
+        await manager.disconnect(client_id)
+
+        assert (skipped, delivered) == (0, 1)
+        assert manager.get_stats()["subscriptions"]["clients"] == 0
@@ -0,0 +1,219 @@
+"""
+Tests for Data Lake aggregation engines.
+"""
+
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.data_lake.aggregations import (
+    ElasticsearchAggregationEngine,
+    InMemoryAggregationEngine,
+)
+from app.data_lake.models import (
+    CrimeCategory,
+    DataLakeConfig,
+    GeoPoint,
+    IncidentRecord,
+    SeverityLevel,
+)
+from app.data_lake.service import DataLakeService
+
+
+def _record(
+    idx: int,
+    timestamp: datetime,
+    category: CrimeCategory = CrimeCategory.PROPERTY,
+    h3_index: str | None = "8a0001",
+    arrest: bool = False,
+    jurisdiction: str = "ATL",
+) -> IncidentRecord:
+    return IncidentRecord(
+        id=f"inc-{idx}",
+        incident_number=f"N-{idx}",
+        timestamp=timestamp,
+        reported_at=timestamp,
+        crime_category=category,
+        crime_type="burglary" if category == CrimeCategory.PROPERTY else "assault",
+        crime_description="",
+        severity=SeverityLevel.MEDIUM,
+        location=GeoPoint(latitude=33.0 + idx * 0.001, longitude=-84.0, h3_index=h3_index),
+        jurisdiction=jurisdiction,
+        arrest_made=arrest,
+        source_system="RMS",
+        source_id=str(idx),
+        partition_date=timestamp.strftime("%Y-%m-%d"),
+        partition_month=timestamp.strftime("%Y-%m"),
+        partition_year=timestamp.year,
+    )
+
+
+@pytest.fixture
+def records():
+    """Sample incidents across two years and jurisdictions."""
+    return [
+        _record(1, datetime(2023, 3, 6, 14), arrest=True),
+        _record(2, datetime(2023, 3, 7, 14), category=CrimeCategory.VIOLENT),
+        _record(3, datetime(2024, 1, 1, 2), h3_index="8a0002"),
+        _record(4, datetime(2024, 6, 1, 23), h3_index=None),
+        _record(5, datetime(2024, 6, 2, 23), jurisdiction="OTHER"),
+    ]
+
+
+class TestInMemoryAggregationEngine:
+    """Tests for the pure-Python aggregation engine."""
+
+    @pytest.mark.asyncio
+    async def test_breakdown_applies_filters(self, records):
+        """Test breakdown only counts incidents matching the filters."""
+        engine = InMemoryAggregationEngine(records)
+
+        result = await engine.breakdown(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 12, 31, 23, 59, 59),
+            jurisdiction="ATL",
+        )
+
+        assert result.total == 2
+        assert result.by_category == {"property": 1, "violent": 1}
+        assert result.by_hour[14] == 2
+        assert result.by_weekday[0] == 1
+        assert result.by_weekday[1] == 1
+        assert result.h3_counts == {"8a0001": 2}
+
+    @pytest.mark.asyncio
+    async def test_yearly_cells(self, records):
+        """Test per-year cell counts, centroids and totals."""
+        engine = InMemoryAggregationEngine(records)
+
+        result = await engine.yearly_cells(2023, 2024, "ATL")
+
+        assert result.totals == {2023: 2, 2024: 2}
+        assert result.cells[2023]["8a0001"].count == 2
+        assert result.cells[2023]["8a0001"].latitude == pytest.approx(33.0015)
+        assert set(result.cells[2024]) == {"8a0002"}
+
+
+class TestElasticsearchAggregationEngine:
+    """Tests for the Elasticsearch aggregation engine."""
+
+    def _engine(self, responses, page_size=2):
+        repository = MagicMock()
+        repository.INCIDENTS_INDEX = "datalake_incidents"
+        repository.build_incident_query = MagicMock(return_value={"match_all": {}})
+        repository.es.search = AsyncMock(side_effect=responses)
+        return ElasticsearchAggregationEngine(repository, page_size=page_size)
+
+    @pytest.mark.asyncio
+    async def test_breakdown_pages_composite_buckets(self):
+        """Test composite aggregations are paged until exhausted."""
+        responses = [
+            {
+                "hits": {"total": {"value": 5}},
+                "aggregations": {
+                    "by_category": {"buckets": [{"key": "property", "doc_count": 5}]},
+                    "by_severity": {"buckets": [{"key": "medium", "doc_count": 5}]},
+                    "by_hour": {"buckets": [{"key": "14", "doc_count": 5}]},
+                    "by_weekday": {"buckets": [{"key": "0", "doc_count": 5}]},
+                    "arrests": {"doc_count": 1},
+                },
+            },
+            {"aggregations": {"pages": {"buckets": [
+                {"key": {"crime_type": "burglary"}, "doc_count": 5},
+            ]}}},
+            {"aggregations": {"pages": {
+                "buckets": [
+                    {"key": {"h3": "a"}, "doc_count": 2},
+                    {"key": {"h3": "b"}, "doc_count": 2},
+                ],
+                "after_key": {"h3": "b"},
+            }}},
+            {"aggregations": {"pages": {
+                "buckets": [{"key": {"h3": "c"}, "doc_count": 1}],
+                "after_key": {"h3": "c"},
+            }}},
+        ]
+        engine = self._engine(responses)
+
+        result = await engine.breakdown(datetime(2024, 1, 1), datetime(2024, 12, 31), "ATL")
+
+        assert result.total == 5
+        assert result.arrests == 1
+        assert result.by_hour[14] == 5
+        assert result.by_weekday[0] == 5
+        assert result.by_type == {"burglary": 5}
+        assert result.h3_counts == {"a": 2, "b": 2, "c": 1}
+        last_call = engine.repository.es.search.await_args_list[-1]
+        assert last_call.kwargs["aggs"]["pages"]["composite"]["after"] == {"h3": "b"}
+        assert all(c.kwargs["size"] == 0 for c in engine.repository.es.search.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_yearly_cells_parses_date_histogram(self):
+        """Test yearly totals and cells are keyed by calendar year."""
+        year_2024 = 1704067200000  # 2024-01-01T00:00:00Z
+        responses = [
+            {"aggregations": {"by_year": {"buckets": [{"key": year_2024, "doc_count": 3}]}}},
+            {"aggregations": {"pages": {"buckets": [
+                {
+                    "key": {"year": year_2024, "h3": "a"},
+                    "doc_count": 3,
+                    "lat": {"value": 33.5},
+                    "lon": {"value": -84.1},
+                },
+            ]}}},
+        ]
+        engine = self._engine(responses)
+
+        result = await engine.yearly_cells(2024, 2024, "ATL")
+
+        assert result.totals == {2024: 3}
+        assert result.cells[2024]["a"].count == 3
+        assert result.cells[2024]["a"].latitude == 33.5
+
+
+class TestServiceAggregates:
+    """Tests for service aggregates computed through an engine."""
+
+    def _service(self, records):
+        service = DataLakeService(
+            neo4j=MagicMock(),
+            es=MagicMock(),
+            redis=MagicMock(),
+            config=DataLakeConfig(),
+            aggregator=InMemoryAggregationEngine(records),
+        )
+        service.repository = MagicMock()
+        service.repository.store_aggregate = AsyncMock()
+        service.repository.store_multiyear_heatmap = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_yearly_aggregate(self, records):
+        """Test yearly aggregate metrics come from the engine breakdown."""
+        service = self._service(records)
+
+        aggregate = await service.compute_yearly_aggregate(2023, "ATL")
+
+        assert aggregate.total_incidents == 2
+        assert aggregate.violent_incidents == 1
+        assert aggregate.property_incidents == 1
+        assert aggregate.arrests_made == 1
+        assert aggregate.clearance_rate == 0.5
+        assert aggregate.hotspot_h3_indices == ["8a0001"]
+
+    @pytest.mark.asyncio
+    async def test_multiyear_heatmap(self, records):
+        """Test multi-year heatmap built from per-year cells."""
+        service = self._service(records)
+
+        heatmap = await service.generate_multiyear_heatmap("ATL", 2023, 2024)
+
+        assert heatmap.incidents_by_year == {2023: 2, 2024: 2}
+        assert heatmap.total_incidents == 4
+        assert {c.h3_index for c in heatmap.combined_heatmap} == {"8a0001", "8a0002"}
+        assert heatmap.persistent_hotspots == []
+        assert heatmap.emerging_hotspots == ["8a0002"]
@@ -0,0 +1,145 @@
+"""
+Tests for Data Lake Service module.
+"""
+
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.data_lake.models import DataLakeConfig
+from app.data_lake.service import DataLakeService
+
+
+def _make_service(batch_size: int = 2) -> DataLakeService:
+    """Create a service with a mocked repository."""
+    service = DataLakeService(
+        neo4j=MagicMock(),
+        es=MagicMock(),
+        redis=MagicMock(),
+        config=DataLakeConfig(bulk_batch_size=batch_size),
+    )
+    repository = MagicMock()
+    repository.store_incidents_bulk = AsyncMock(
+        side_effect=lambda incidents: {
+            "total": len(incidents),
+            "successful": len(incidents),
+            "failed": 0,
+            "failed_ids": {},
+        }
+    )
+    repository.store_lineage_records_bulk = AsyncMock(return_value=0)
+    repository.get_partition = AsyncMock(return_value=None)
+    repository.create_partition = AsyncMock()
+    repository.get_offender_profile = AsyncMock(return_value=None)
+    repository.store_offender_profile = AsyncMock()
+    repository.store_incident = AsyncMock()
+    service.repository = repository
+    return service
+
+
+def _incident(source_id: str, month: int = 1, offenders: list[str] | None = None) -> dict:
+    return {
+        "source_id": source_id,
+        "timestamp": datetime(2024, month, 15, 12, 0).isoformat(),
+        "crime_type": "burglary",
+        "latitude": 33.749,
+        "longitude": -84.388,
+        "offender_ids": offenders or [],
+    }
+
+
+class TestBulkIngestion:
+    """Tests for batched bulk ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_records_grouped_into_batches(self):
+        """Test records are written in configured batch sizes."""
+        service = _make_service(batch_size=2)
+        data = [_incident(str(i)) for i in range(5)]
+
+        result = await service.ingest_incidents_bulk(data, "RMS")
+
+        assert result["total"] == 5
+        assert result["successful"] == 5
+        assert result["failed"] == 0
+        assert [b["size"] for b in result["batches"]] == [2, 2, 1]
+        assert service.repository.store_incidents_bulk.await_count == 3
+        assert service.repository.store_lineage_records_bulk.await_count == 3
+        service.repository.store_incident.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_partition_checked_once_per_month(self):
+        """Test partitions are ensured once per distinct month across batches."""
+        service = _make_service(batch_size=2)
+        data = [_incident(str(i), month=1 + i % 2) for i in range(6)]
+
+        await service.ingest_incidents_bulk(data, "RMS")
+
+        assert service.repository.get_partition.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_offender_updates_merged_per_batch(self):
+        """Test offender profiles are read and written once per batch."""
+        service = _make_service(batch_size=10)
+        data = [_incident(str(i), offenders=["OFF-1"]) for i in range(4)]
+
+        await service.ingest_incidents_bulk(data, "RMS")
+
+        service.repository.get_offender_profile.assert_awaited_once_with("OFF-1")
+        service.repository.store_offender_profile.assert_awaited_once()
+        profile = service.repository.store_offender_profile.await_args.args[0]
+        assert profile.total_incidents == 4
+        assert len(profile.incident_ids) == 4
+
+    @pytest.mark.asyncio
+    async def test_store_failures_reported_per_record(self):
+        """Test per-document bulk failures are reported against the source index."""
+        service = _make_service(batch_size=10)
+        failing_id = service._generate_incident_id("RMS", "1")
+        service.repository.store_incidents_bulk = AsyncMock(
+            return_value={"failed_ids": {failing_id: "mapper_parsing_exception"}}
+        )
+        data = [_incident(str(i)) for i in range(3)]
+
+        result = await service.ingest_incidents_bulk(data, "RMS")
+
+        assert result["successful"] == 2
+        assert result["failed"] == 1
+        assert result["errors"] == [{"index": 1, "error": "mapper_parsing_exception"}]
+        assert result["batches"][0]["failed"] == 1
+        lineages = service.repository.store_lineage_records_bulk.await_args.args[0]
+        assert len(lineages) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_exception_marks_batch_failed(self):
+        """Test a failed bulk write fails only that batch."""
+        service = _make_service(batch_size=2)
+        service.repository.store_incidents_bulk = AsyncMock(
+            side_effect=[RuntimeError("cluster unavailable"), {"failed_ids": {}}]
+        )
+        data = [_incident(str(i)) for i in range(4)]
+
+        result = await service.ingest_incidents_bulk(data, "RMS")
+
+        assert result["successful"] == 2
+        assert [e["index"] for e in result["errors"]] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_partition_failure_marks_batch_failed(self):
+        """Test a failed partition check fails only that batch."""
+        service = _make_service(batch_size=2)
+        service.repository.get_partition = AsyncMock(
+            side_effect=[RuntimeError("neo4j unavailable"), None]
+        )
+        data = [_incident(str(i), offenders=["OFF-1"]) for i in range(4)]
+
+        result = await service.ingest_incidents_bulk(data, "RMS")
+
+        assert result["successful"] == 2
+        assert [e["index"] for e in result["errors"]] == [0, 1]
+        assert [b["failed"] for b in result["batches"]] == [2, 0]
+        service.repository.store_offender_profile.assert_awaited_once()
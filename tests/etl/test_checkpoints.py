@@ -0,0 +1,236 @@
+"""
+Tests for checkpointed, incremental ETL extraction.
+"""
+
+import json
+
+import pytest
+
+from app.etl.checkpoints import Checkpoint, FileCheckpointStore, RedisCheckpointStore
+from app.etl.pipeline import ETLPipeline, PipelineConfig, PipelineManager, PipelineStatus
+from app.etl.scheduler import ETLScheduler, create_hourly_ingestion_job
+
+
+def _config(**overrides) -> PipelineConfig:
+    return PipelineConfig(
+        name="cad_hourly",
+        source_type="CAD",
+        checkpoint_enabled=True,
+        watermark_field="updated_at",
+        **overrides,
+    )
+
+
+def _calls(start: int, stop: int) -> list[dict]:
+    return [{"id": f"CAD-{i}", "updated_at": f"2026-01-01T{i:02d}:00:00"} for i in range(start, stop)]
+
+
+class _FakeRedis:
+    """In-memory stand-in for RedisManager JSON operations."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.down = False
+
+    async def get_json(self, key):
+        if self.down:
+            raise ConnectionError("redis down")
+        value = self.data.get(key)
+        return None if value is None else json.loads(value)
+
+    async def set_json(self, key, value, expire=None):
+        if self.down:
+            raise ConnectionError("redis down")
+        self.data[key] = json.dumps(value)
+        return True
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+
+class TestIncrementalPipeline:
+    """Tests for ETLPipeline checkpointing."""
+
+    @pytest.mark.asyncio
+    async def test_only_new_and_changed_records_load(self, tmp_path):
+        """Test a rerun over an overlapping window loads only new and changed calls."""
+        source = _calls(0, 10)
+        requested = []
+        loaded = []
+
+        def extract(since=None):
+            requested.append(since)
+            return [r for r in source if since is None or r["updated_at"] >= since]
+
+        pipeline = ETLPipeline(
+            _config(batch_size=4),
+            extractor=extract,
+            loader=lambda batch: loaded.extend(r["id"] for r in batch),
+            checkpoint_store=FileCheckpointStore(tmp_path),
+        )
+
+        first = await pipeline.execute()
+        source[9] = {**source[9], "status": "closed"}
+        source.extend(_calls(10, 12))
+        loaded.clear()
+        second = await pipeline.execute()
+
+        assert first.status == second.status == PipelineStatus.COMPLETED
+        assert requested == [None, "2026-01-01T09:00:00"]
+        assert loaded == ["CAD-9", "CAD-10", "CAD-11"]
+        assert second.metrics.records_skipped == 0
+        assert pipeline.get_status()["checkpoint"]["watermark"] == "2026-01-01T11:00:00"
+
+        # Extractors that ignore the watermark are deduplicated by fingerprint
+        loaded.clear()
+        pipeline.extractor = lambda: source
+        third = await pipeline.execute()
+
+        assert loaded == []
+        assert third.metrics.records_skipped == 12
+
+    @pytest.mark.asyncio
+    async def test_resume_after_stop(self, tmp_path):
+        """Test a stopped run resumes after the last committed chunk."""
+        store = FileCheckpointStore(tmp_path)
+        loaded = []
+
+        def stop_after_two(batch):
+            loaded.extend(r["id"] for r in batch)
+            if len(loaded) == 20:
+                pipeline.stop()
+
+        pipeline = ETLPipeline(
+            _config(batch_size=10, max_pending_chunks=1),
+            extractor=lambda: _calls(0, 50),
+            loader=stop_after_two,
+            checkpoint_store=store,
+        )
+
+        stopped = await pipeline.execute()
+        checkpoint = await store.load(pipeline.checkpoint_key)
+
+        assert stopped.status == PipelineStatus.CANCELLED
+        assert checkpoint.in_progress is True
+        assert checkpoint.run_offset == 20
+
+        pipeline.loader = lambda batch: loaded.extend(r["id"] for r in batch)
+        resumed = await pipeline.execute()
+
+        assert resumed.status == PipelineStatus.COMPLETED
+        assert resumed.metrics.records_skipped == 20
+        assert resumed.metrics.records_extracted == 30
+        assert loaded == [f"CAD-{i}" for i in range(50)]
+        assert (await store.load(pipeline.checkpoint_key)).in_progress is False
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_holds_watermark(self, tmp_path):
+        """Test records in a chunk that failed to load are extracted again."""
+        requested = []
+        loaded = []
+        attempts = 0
+
+        def extract(since=None):
+            requested.append(since)
+            return [r for r in _calls(0, 9) if since is None or r["updated_at"] >= since]
+
+        def load(batch):
+            nonlocal attempts
+            if batch[0]["id"] == "CAD-3" and attempts == 0:
+                attempts += 1
+                raise ConnectionError("data lake unavailable")
+            loaded.extend(r["id"] for r in batch)
+
+        pipeline = ETLPipeline(
+            _config(batch_size=3),
+            extractor=extract,
+            loader=load,
+            checkpoint_store=FileCheckpointStore(tmp_path),
+        )
+
+        first = await pipeline.execute()
+        loaded.clear()
+        await pipeline.execute()
+
+        assert first.metrics.load_errors == 3
+        assert requested[1] == "2026-01-01T03:00:00"
+        assert loaded == ["CAD-3", "CAD-4", "CAD-5"]
+
+    @pytest.mark.asyncio
+    async def test_failed_transform_is_retried(self, tmp_path):
+        """Test a record whose transform raised is extracted and loaded by the next run."""
+        requested = []
+        loaded = []
+        broken = True
+
+        def extract(since=None):
+            requested.append(since)
+            return [r for r in _calls(0, 5) if since is None or r["updated_at"] >= since]
+
+        def transform(record):
+            if broken and record["id"] == "CAD-2":
+                raise ValueError("geocoder unavailable")
+            return record
+
+        pipeline = ETLPipeline(
+            _config(),
+            extractor=extract,
+            transformer=transform,
+            loader=lambda batch: loaded.extend(r["id"] for r in batch),
+            checkpoint_store=FileCheckpointStore(tmp_path),
+        )
+
+        first = await pipeline.execute()
+        assert first.metrics.transform_errors == 1
+        assert loaded == ["CAD-0", "CAD-1", "CAD-3", "CAD-4"]
+
+        broken = False
+        loaded.clear()
+        second = await pipeline.execute()
+
+        assert second.status == PipelineStatus.COMPLETED
+        assert requested[1] == "2026-01-01T02:00:00"
+        assert loaded == ["CAD-2"]
+        assert second.metrics.records_skipped == 2
+        assert pipeline.get_status()["checkpoint"]["watermark"] == "2026-01-01T04:00:00"
+
+    @pytest.mark.asyncio
+    async def test_scheduler_reports_skipped_records(self, tmp_path):
+        """Test hourly job executions report records skipped as already loaded."""
+        manager = PipelineManager()
+        manager.register_pipeline(ETLPipeline(
+            _config(),
+            extractor=lambda source_type: _calls(0, 5),
+            checkpoint_store=FileCheckpointStore(tmp_path),
+        ))
+        scheduler = ETLScheduler(manager.execute_pipeline)
+        job = create_hourly_ingestion_job("CAD", "cad_hourly")
+        scheduler.add_job(job)
+
+        first = await scheduler.run_job_now(job.id)
+        second = await scheduler.run_job_now(job.id)
+
+        assert (first.records_processed, first.records_skipped) == (5, 0)
+        assert (second.records_processed, second.records_skipped) == (0, 5)
+
+
+class TestCheckpointStores:
+    """Tests for checkpoint persistence."""
+
+    @pytest.mark.asyncio
+    async def test_redis_falls_back_to_files(self, tmp_path):
+        """Test checkpoints saved during an outage win over older Redis copies."""
+        redis = _FakeRedis()
+        store = RedisCheckpointStore(redis=redis, fallback=FileCheckpointStore(tmp_path))
+
+        await store.save(Checkpoint(key="CAD:cad_hourly", watermark="t1"))
+        redis.down = True
+        await store.save(Checkpoint(key="CAD:cad_hourly", watermark="t2"))
+
+        assert (await store.load("CAD:cad_hourly")).watermark == "t2"
+        redis.down = False
+        assert (await store.load("CAD:cad_hourly")).watermark == "t2"
+        assert json.loads(redis.data["etl:checkpoint:CAD:cad_hourly"])["watermark"] == "t1"
+
+        await store.delete("CAD:cad_hourly")
+        assert await store.load("CAD:cad_hourly") is None
@@ -0,0 +1,107 @@
+"""
+Tests for streaming ETL Pipeline execution.
+"""
+
+import pytest
+
+from app.etl.pipeline import ETLPipeline, PipelineConfig, PipelineStatus
+
+
+def _config(**overrides) -> PipelineConfig:
+    return PipelineConfig(name="stream_test", source_type="RMS", **overrides)
+
+
+class TestStreamingPipeline:
+    """Tests for ETLPipeline streaming mode."""
+
+    @pytest.mark.asyncio
+    async def test_memory_stays_bounded(self):
+        """Test records in flight never exceed the buffered chunks."""
+        produced = 0
+        in_flight = []
+
+        async def extract(count: int):
+            nonlocal produced
+            for i in range(count):
+                produced += 1
+                yield {"id": i, "value": i}
+
+        async def load(batch):
+            metrics = pipeline.current_run.metrics
+            in_flight.append(produced - metrics.records_loaded - metrics.validation_errors)
+            return {"successful": len(batch)}
+
+        pipeline = ETLPipeline(
+            _config(batch_size=100, max_pending_chunks=2),
+            extractor=extract,
+            transformer=lambda r: {**r, "value": r["value"] * 2},
+            validator=lambda r: r["id"] % 10 != 0,
+            loader=load,
+        )
+
+        run = await pipeline.execute(source_params={"count": 20000})
+
+        assert run.status == PipelineStatus.COMPLETED
+        assert run.metrics.records_extracted == 20000
+        assert run.metrics.records_validated == 18000
+        assert run.metrics.validation_errors == 2000
+        assert run.metrics.records_loaded == 18000
+        # Extractor, processor and loader each hold a chunk, plus two queues of two
+        assert max(in_flight) <= 7 * 100
+        assert pipeline.get_status()["streaming"] is True
+
+    @pytest.mark.asyncio
+    async def test_list_extractor_and_pages(self):
+        """Test list and paged extractors stream when enabled."""
+        loaded = []
+
+        def extract():
+            return [[{"id": i} for i in range(page, page + 25)] for page in range(0, 100, 25)]
+
+        pipeline = ETLPipeline(
+            _config(batch_size=40, streaming_enabled=True),
+            extractor=extract,
+            loader=lambda batch: loaded.append(len(batch)),
+        )
+
+        run = await pipeline.execute()
+
+        assert run.status == PipelineStatus.COMPLETED
+        assert loaded == [40, 40, 20]
+        assert run.metrics.records_transformed == 100
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_run(self):
+        """Test stop() ends an unbounded stream."""
+        async def extract():
+            i = 0
+            while True:
+                yield {"id": i}
+                i += 1
+
+        def load(batch):
+            if pipeline.current_run.metrics.records_loaded >= 500:
+                pipeline.stop()
+
+        pipeline = ETLPipeline(_config(batch_size=100), extractor=extract, loader=load)
+
+        run = await pipeline.execute()
+
+        assert run.status == PipelineStatus.CANCELLED
+        assert pipeline.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_extract_error_fails_run(self):
+        """Test a failing extractor fails the run after loading earlier chunks."""
+        async def extract():
+            for i in range(150):
+                yield {"id": i}
+            raise ConnectionError("RMS connection lost")
+
+        pipeline = ETLPipeline(_config(batch_size=100), extractor=extract)
+
+        run = await pipeline.execute()
+
+        assert run.status == PipelineStatus.FAILED
+        assert run.errors[0]["stage"] == "extract"
+        assert run.metrics.records_extracted == 100
@@ -0,0 +1,165 @@
+"""
+Tests for ETL Scheduler.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.etl.scheduler import (
+    ETLScheduler,
+    JobStatus,
+    MisfirePolicy,
+    ScheduledJob,
+    SchedulerConfig,
+    ScheduleType,
+)
+
+
+def _once(job_type: str = "default", delay: float = 0.05, **overrides) -> ScheduledJob:
+    return ScheduledJob(
+        id=str(uuid.uuid4()),
+        name=f"{job_type} job",
+        pipeline_name=job_type,
+        schedule_type=ScheduleType.ONCE,
+        job_type=job_type,
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+        **overrides,
+    )
+
+
+def _overdue_interval(policy: MisfirePolicy) -> ScheduledJob:
+    return ScheduledJob(
+        id=str(uuid.uuid4()),
+        name="hourly ingestion",
+        pipeline_name="cad_hourly",
+        schedule_type=ScheduleType.INTERVAL,
+        interval_seconds=3600,
+        last_run=datetime.utcnow() - timedelta(hours=2),
+        misfire_policy=policy,
+    )
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestETLScheduler:
+    """Tests for ETLScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_when_due(self):
+        """Test the loop wakes for a job due shortly after it was added."""
+        ran = []
+        scheduler = ETLScheduler(lambda name, source, target: ran.append(name))
+        await scheduler.start()
+
+        status = scheduler.get_scheduler_status()
+        assert status["next_due_in_seconds"] is None
+
+        scheduler.add_job(_once("hourly_ingestion", delay=0.1))
+        assert 0 < scheduler.get_scheduler_status()["next_due_in_seconds"] <= 0.1
+        await _wait_for(lambda: ran)
+        await scheduler.stop()
+
+        status = scheduler.get_scheduler_status()
+        assert ran == ["hourly_ingestion"]
+        assert status["lag_seconds"]["last"] >= 0
+        assert status["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limits(self):
+        """Test jobs that fire together respect global and per-type limits."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        peak_total = 0
+        depths = []
+
+        async def execute(name, source, target):
+            nonlocal peak_total
+            active[name] = active.get(name, 0) + 1
+            peak[name] = max(peak.get(name, 0), active[name])
+            peak_total = max(peak_total, sum(active.values()))
+            depths.append(scheduler.get_scheduler_status()["queue_depth"])
+            await asyncio.sleep(0.05)
+            active[name] -= 1
+
+        scheduler = ETLScheduler(
+            execute,
+            SchedulerConfig(max_concurrent_jobs=3, job_type_limits={"daily_aggregate": 2}),
+        )
+        jobs = [_once("daily_aggregate") for _ in range(5)] + [_once("quality_check")]
+        for job in jobs:
+            scheduler.add_job(job)
+
+        await scheduler.start()
+        await _wait_for(lambda: all(j.status == JobStatus.COMPLETED for j in jobs))
+        await _wait_for(lambda: not any(scheduler._active_by_type.values()))
+        await scheduler.stop()
+
+        assert peak["daily_aggregate"] == 2
+        assert peak_total == 3
+        assert max(depths) >= 1
+
+    @pytest.mark.asyncio
+    async def test_remove_and_readd_runs_once(self):
+        """Test a job removed and added again under the same ID runs once."""
+        ran = []
+        scheduler = ETLScheduler(lambda name, source, target: ran.append(name))
+        job = _once("hourly_ingestion")
+
+        scheduler.add_job(job)
+        scheduler.remove_job(job.id)
+        scheduler.add_job(job)
+
+        await scheduler.start()
+        await _wait_for(lambda: job.status == JobStatus.COMPLETED)
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert ran == ["hourly_ingestion"]
+        assert job.run_count == 1
+
+    @pytest.mark.asyncio
+    async def test_misfire_policies(self):
+        """Test overdue runs are coalesced into one run or skipped."""
+        ran = []
+        scheduler = ETLScheduler(lambda name, source, target: ran.append(name))
+        run_once = _overdue_interval(MisfirePolicy.RUN_ONCE)
+        skip = _overdue_interval(MisfirePolicy.SKIP)
+        skip.pipeline_name = "skipped"
+        scheduler.add_job(run_once)
+        scheduler.add_job(skip)
+
+        await scheduler.start()
+        await _wait_for(lambda: run_once.status == JobStatus.COMPLETED)
+        await scheduler.stop()
+
+        assert ran == ["cad_hourly"]
+        assert skip.run_count == 0
+        assert skip.next_run > datetime.utcnow() + timedelta(minutes=59)
+        assert run_once.next_run > datetime.utcnow() + timedelta(minutes=59)
+        assert scheduler.get_scheduler_status()["misfires"] == 2
+
+    @pytest.mark.asyncio
+    async def test_jitter_and_pause(self):
+        """Test jitter spreads runs due together and paused jobs are dropped."""
+        scheduler = ETLScheduler(config=SchedulerConfig(jitter_seconds=30))
+        jobs = [_once("daily_aggregate", delay=60) for _ in range(20)]
+        for job in jobs:
+            scheduler.add_job(job)
+        scheduler.pause_job(jobs[0].id)
+
+        dues = {job_id: due for due, _, job_id, version in scheduler._heap
+                if scheduler._is_current(job_id, version)}
+
+        assert jobs[0].id not in dues
+        assert len(set(dues.values())) == 19
+        for job in jobs[1:]:
+            offset = (dues[job.id] - job.next_run).total_seconds()
+            assert 0 <= offset <= 30
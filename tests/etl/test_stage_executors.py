@@ -0,0 +1,139 @@
+"""
+Tests for ETL stage executors.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.etl.executors import ExecutionMode, StageExecutor
+from app.etl.pipeline import ETLPipeline, PipelineConfig, PipelineStatus
+from app.etl.processors import CADProcessor, ProcessorConfig
+
+
+def _double(record: dict) -> dict:
+    if record["id"] == 7:
+        raise ValueError("bad record")
+    return {**record, "value": record["id"] * 2}
+
+
+def _cad_records(count: int) -> list[dict]:
+    return [
+        {
+            "cad_number": f"CAD-{i}",
+            "event_type": "SHOTS FIRED" if i % 3 else "",
+            "priority": "1",
+            "timestamp": "2026-01-01T00:00:00Z",
+            "latitude": 26.78,
+            "longitude": -80.07,
+        }
+        for i in range(count)
+    ]
+
+
+class TestStageExecutor:
+    """Tests for StageExecutor class."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(ExecutionMode))
+    async def test_modes_return_same_outcomes(self, mode):
+        """Test every mode returns ordered results and per-record errors."""
+        executor = StageExecutor(mode=mode, max_workers=2, chunk_size=4)
+        records = [{"id": i} for i in range(20)]
+
+        try:
+            outcomes = await executor.map(_double, records)
+        finally:
+            executor.shutdown()
+
+        assert [index for index, _, _ in outcomes] == list(range(20))
+        assert outcomes[7] == (7, False, "bad record")
+        assert outcomes[8] == (8, True, {"id": 8, "value": 16})
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_function_falls_back_to_threads(self):
+        """Test process mode runs lambdas in a thread pool."""
+        executor = StageExecutor(mode=ExecutionMode.PROCESS, chunk_size=5)
+        records = list(range(12))
+
+        try:
+            outcomes = await executor.map(lambda r: r + 1, records)
+        finally:
+            executor.shutdown()
+
+        assert sorted(result for _, _, result in outcomes) == list(range(1, 13))
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_keeps_event_loop_responsive(self):
+        """Test a slow stage in threads does not block other coroutines."""
+        executor = StageExecutor(mode=ExecutionMode.THREAD, max_workers=2, chunk_size=10)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        def slow(record):
+            time.sleep(0.002)
+            return record
+
+        ticker = asyncio.create_task(heartbeat())
+        try:
+            await executor.map(slow, list(range(100)))
+        finally:
+            ticker.cancel()
+            executor.shutdown()
+
+        assert ticks >= 5
+
+
+class TestParallelStages:
+    """Tests for pipelines and processors using stage executors."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_thread_mode(self):
+        """Test pipeline transform errors keep record ids and order holds."""
+        loaded = []
+        pipeline = ETLPipeline(
+            PipelineConfig(
+                name="parallel",
+                source_type="CAD",
+                execution_mode=ExecutionMode.THREAD,
+                executor_chunk_size=3,
+            ),
+            extractor=lambda: [{"id": i} for i in range(20)],
+            transformer=_double,
+            validator=lambda r: r["value"] % 4 == 0,
+            loader=lambda batch: loaded.extend(r["id"] for r in batch),
+        )
+
+        run = await pipeline.execute()
+        pipeline.close()
+
+        assert run.status == PipelineStatus.COMPLETED
+        assert run.metrics.transform_errors == 1
+        assert run.errors[0]["record_id"] == 7
+        assert loaded == [0, 2, 4, 6, 8, 10, 12, 14, 16, 18]
+
+    @pytest.mark.asyncio
+    async def test_processor_process_mode(self):
+        """Test a processor runs transform and validate in worker processes."""
+        processor = CADProcessor(ProcessorConfig(
+            source_name="CAD", batch_size=50, execution_mode=ExecutionMode.PROCESS, max_workers=2,
+        ))
+        records = _cad_records(200)
+        records[5]["cad_number"] = ""
+
+        try:
+            result = await processor.process({"records": records})
+            used_processes = ExecutionMode.PROCESS in processor._executor._pools
+        finally:
+            processor.close()
+
+        assert result.success is True
+        assert result.records_processed == 199
+        assert result.records_failed == 1
+        assert used_processes is True
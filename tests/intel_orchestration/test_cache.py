@@ -0,0 +1,202 @@
+"""Tests for the bounded intel orchestration caches."""
+
+import sys
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.intel_orchestration.cache import TTLCache, approximate_size
+from app.intel_orchestration.correlator import (
+    CorrelationConfig,
+    CorrelationEngine,
+    EntityReference,
+    EntityType,
+)
+from app.intel_orchestration.rules_engine import (
+    RuleCategory,
+    RulesEngine,
+    ScoringRule,
+)
+
+BASE_TIME = datetime(2024, 6, 1, 12, tzinfo=UTC)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _vehicle(idx: int, plate: str, hours: float = 0.0, **attributes) -> EntityReference:
+    return EntityReference(
+        id=f"v-{idx}",
+        entity_type=EntityType.VEHICLE,
+        source="lpr",
+        jurisdiction="ATL",
+        attributes={"plate": plate, **attributes},
+        timestamp=BASE_TIME + timedelta(hours=hours),
+    )
+
+
+class TestTTLCache:
+    """Tests for the LRU/TTL cache."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        evicted = []
+        cache = TTLCache(max_entries=2, on_evict=lambda k, v: evicted.append(k))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.keys() == ["a", "c"]
+        assert evicted == ["b"]
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL."""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 5
+        cache.set("b", 2)
+
+        clock.now = 12
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_peek_does_not_refresh_recency(self):
+        """Test peek and values leave LRU order and metrics untouched."""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.peek("a")
+        cache.values()
+        cache.set("c", 3)
+
+        assert "a" not in cache
+        assert cache.stats()["hits"] == 0
+
+    def test_memory_cap(self):
+        """Test entries are evicted to stay under the byte budget."""
+        cache = TTLCache(max_entries=None, max_bytes=3 * approximate_size("x" * 100))
+        for i in range(10):
+            cache.set(i, "x" * 100)
+
+        assert len(cache) == 3
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_tag_invalidation(self):
+        """Test invalidating a tag removes only tagged entries."""
+        cache = TTLCache()
+        cache.set("a", 1, tags=["t1"])
+        cache.set("b", 2, tags=["t1", "t2"])
+        cache.set("c", 3, tags=["t3"])
+
+        assert cache.invalidate_tags(["t1"]) == 2
+        assert cache.keys() == ["c"]
+        assert cache.stats()["invalidations"] == 2
+
+    def test_hit_miss_metrics(self):
+        """Test hit rate accounting."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestCorrelationCacheInvalidation:
+    """Tests for correlation cache invalidation in the correlation engine."""
+
+    @pytest.mark.asyncio
+    async def test_related_entity_invalidates_cached_correlations(self):
+        """Test a new matching entity is seen instead of a stale cached result."""
+        engine = CorrelationEngine()
+        query = _vehicle(1, "ABC123")
+        await engine.add_entity(query)
+
+        first = await engine.find_correlations(query)
+        await engine.add_entity(_vehicle(2, "ABC123"))
+        second = await engine.find_correlations(query)
+
+        assert first.entity_correlations == []
+        assert "v-2" in {c.entity2_id for c in second.entity_correlations}
+
+    @pytest.mark.asyncio
+    async def test_unrelated_entity_keeps_cached_correlations(self):
+        """Test unrelated entities do not invalidate cached results."""
+        engine = CorrelationEngine()
+        query = _vehicle(1, "ABC123", latitude=33.75, longitude=-84.39)
+        await engine.add_entity(query)
+        await engine.find_correlations(query)
+
+        await engine.add_entity(_vehicle(2, "XYZ789", hours=240, latitude=40.7, longitude=-74.0))
+        await engine.find_correlations(query)
+
+        assert engine.get_stats()["correlation_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_removed_entity_invalidates_correlations(self):
+        """Test removing an entity drops correlations that referenced it."""
+        engine = CorrelationEngine()
+        query = _vehicle(1, "ABC123")
+        await engine.add_entity(query)
+        await engine.add_entity(_vehicle(2, "ABC123"))
+        await engine.find_correlations(query)
+
+        await engine.remove_entity("v-2")
+        result = await engine.find_correlations(query)
+
+        assert "v-2" not in {c.entity2_id for c in result.entity_correlations}
+
+    @pytest.mark.asyncio
+    async def test_entity_cache_eviction_updates_index(self):
+        """Test entities evicted for capacity are no longer correlated."""
+        engine = CorrelationEngine(CorrelationConfig(entity_cache_max_entries=2))
+        await engine.add_entity(_vehicle(1, "ABC123"))
+        await engine.add_entity(_vehicle(2, "XYZ789", hours=100))
+        await engine.add_entity(_vehicle(3, "QRS555", hours=200))
+
+        result = await engine.find_correlations(_vehicle(4, "ABC123"))
+
+        assert "v-1" not in {c.entity2_id for c in result.entity_correlations}
+        assert engine.get_stats()["entity_cache"]["evictions"] == 1
+
+
+class TestScoreCacheInvalidation:
+    """Tests for rules engine score cache invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_rule_changes_invalidate_scores(self):
+        """Test adding or disabling a rule invalidates cached scores."""
+        engine = RulesEngine()
+        signal = {"source": "lpr", "category": "vehicle", "armed": True}
+        before = await engine.calculate_priority(signal)
+
+        rule = ScoringRule(
+            name="armed",
+            category=RuleCategory.OFFICER_SAFETY,
+            conditions=[{"field": "armed", "operator": "equals", "value": True}],
+            score_modifier=20.0,
+        )
+        engine.add_rule(rule)
+        with_rule = await engine.calculate_priority(signal)
+        engine.disable_rule(rule.id)
+        without_rule = await engine.calculate_priority(signal)
+
+        assert with_rule == pytest.approx(min(100.0, before + 20.0))
+        assert without_rule == before
+        assert engine.get_stats()["score_cache"]["invalidations"] >= 2
@@ -0,0 +1,171 @@
+"""Tests for concurrent signal batch processing and correlator locking."""
+
+import asyncio
+import sys
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.intel_orchestration.locks import AsyncReadWriteLock
+from app.intel_orchestration.orchestrator import (
+    IntelCategory,
+    IntelOrchestrator,
+    IntelSignal,
+    IntelSource,
+    OrchestrationConfig,
+)
+
+
+def _signal(**data) -> IntelSignal:
+    return IntelSignal(
+        source=IntelSource.TACTICAL_ENGINE,
+        category=IntelCategory.VEHICLE,
+        jurisdiction="Metro PD",
+        confidence=0.8,
+        data=data,
+    )
+
+
+class RecordingCorrelator:
+    """Correlator stand-in that records concurrency and call order."""
+
+    def __init__(self, delays: dict[str, float] | None = None):
+        self.delays = delays or {}
+        self.active = 0
+        self.max_active = 0
+        self.order: list[str] = []
+
+    async def correlate(self, signal: IntelSignal) -> list:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(signal.data.get("tag"), 0.01))
+            self.order.append(signal.data.get("tag"))
+        finally:
+            self.active -= 1
+        return []
+
+
+class TestAsyncReadWriteLock:
+    """Tests for the readers-writer lock."""
+
+    @pytest.mark.asyncio
+    async def test_readers_share_writer_excludes(self):
+        """Test readers overlap while a writer waits for them to finish."""
+        lock = AsyncReadWriteLock()
+        events = []
+
+        async def reader(name: str):
+            async with lock.read():
+                events.append(f"{name}-start")
+                await asyncio.sleep(0.02)
+                events.append(f"{name}-end")
+
+        async def writer():
+            await asyncio.sleep(0.005)
+            async with lock.write():
+                events.append("writer")
+                assert lock.readers == 0
+
+        await asyncio.gather(reader("r1"), reader("r2"), writer())
+
+        assert events[:2] == ["r1-start", "r2-start"]
+        assert events[-1] == "writer"
+
+    @pytest.mark.asyncio
+    async def test_waiting_writer_blocks_new_readers(self):
+        """Test a queued writer runs before readers that arrive after it."""
+        lock = AsyncReadWriteLock()
+        events = []
+
+        async def first_reader():
+            async with lock.read():
+                await asyncio.sleep(0.02)
+
+        async def writer():
+            await asyncio.sleep(0.005)
+            async with lock.write():
+                events.append("writer")
+
+        async def late_reader():
+            await asyncio.sleep(0.01)
+            async with lock.read():
+                events.append("late-reader")
+
+        await asyncio.gather(first_reader(), writer(), late_reader())
+
+        assert events == ["writer", "late-reader"]
+
+
+class TestConcurrentBatchProcessing:
+    """Tests for bounded, per-entity ordered batch processing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_config(self):
+        """Test no more than max_concurrent_pipelines signals run at once."""
+        orchestrator = IntelOrchestrator(OrchestrationConfig(max_concurrent_pipelines=3))
+        correlator = RecordingCorrelator()
+        orchestrator._correlator = correlator
+
+        signals = [_signal(tag=str(i), vehicle={"plate": f"P{i}"}) for i in range(12)]
+        await orchestrator._process_signal_batch(signals)
+
+        assert correlator.max_active == 3
+        assert orchestrator.metrics.signals_processed == 12
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_per_entity(self):
+        """Test signals for the same entity are processed in arrival order."""
+        orchestrator = IntelOrchestrator()
+        correlator = RecordingCorrelator(delays={"a1": 0.03, "b1": 0.0})
+        orchestrator._correlator = correlator
+
+        signals = [
+            _signal(tag="a1", vehicle={"plate": "abc123"}),
+            _signal(tag="b1", person={"id": "p-1"}),
+            _signal(tag="a2", vehicle={"plate": "ABC123"}),
+            _signal(tag="a3", entity_id="v-9", vehicle={"plate": "ABC123"}),
+            _signal(tag="a4", entity_id="v-9"),
+        ]
+        await orchestrator._process_signal_batch(signals)
+
+        a_order = [tag for tag in correlator.order if tag.startswith("a")]
+        assert a_order == ["a1", "a2", "a3", "a4"]
+        assert correlator.order[0] == "b1"
+
+    @pytest.mark.asyncio
+    async def test_slow_signal_does_not_stall_others(self):
+        """Test a slow signal only delays signals for its own entity."""
+        orchestrator = IntelOrchestrator()
+        correlator = RecordingCorrelator(delays={"slow": 0.2})
+        orchestrator._correlator = correlator
+
+        signals = [_signal(tag="slow", vehicle={"plate": "SLOW1"})]
+        signals += [_signal(tag=f"fast{i}", vehicle={"plate": f"F{i}"}) for i in range(5)]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await orchestrator._process_signal_batch(signals)
+        elapsed = loop.time() - start
+
+        assert correlator.order[-1] == "slow"
+        assert elapsed < 0.2 + 5 * 0.01
+
+    @pytest.mark.asyncio
+    async def test_errors_isolated_per_signal(self):
+        """Test a failing signal is counted without aborting the batch."""
+        orchestrator = IntelOrchestrator()
+
+        class FailingCorrelator(RecordingCorrelator):
+            async def correlate(self, signal):
+                if signal.data.get("tag") == "bad":
+                    raise ValueError("boom")
+                return await super().correlate(signal)
+
+        orchestrator._correlator = FailingCorrelator()
+        signals = [_signal(tag="bad"), _signal(tag="good")]
+        await orchestrator._process_signal_batch(signals)
+
+        assert orchestrator.metrics.pipeline_errors == 1
+        assert orchestrator.metrics.signals_processed == 1
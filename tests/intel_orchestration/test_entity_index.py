@@ -0,0 +1,152 @@
+"""Tests for the correlation entity candidate index."""
+
+import random
+import sys
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.intel_orchestration.correlator import (
+    FUZZY_ATTRIBUTES,
+    KEY_ATTRIBUTES,
+    CorrelationConfig,
+    CorrelationEngine,
+    EntityReference,
+    EntityType,
+)
+from app.intel_orchestration.entity_index import EntityIndex
+
+BASE_TIME = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+def _entity(idx: int, entity_type: EntityType, **attributes) -> EntityReference:
+    return EntityReference(
+        id=f"e-{idx}",
+        entity_type=entity_type,
+        source="test",
+        jurisdiction="ATL",
+        attributes=attributes,
+        timestamp=attributes.pop("timestamp", BASE_TIME),
+    )
+
+
+def _random_entities(count: int, seed: int = 7) -> list[EntityReference]:
+    rng = random.Random(seed)
+    plates = ["ABC123", "ABC124", "XYZ789", "A8C123", "QRS555"]
+    names = ["john smith", "jon smith", "jane doe", "john smyth", "bob jones"]
+    entities = []
+    for i in range(count):
+        ts = BASE_TIME + timedelta(hours=rng.uniform(-72, 72))
+        lat = 33.75 + rng.uniform(-0.05, 0.05)
+        lon = -84.39 + rng.uniform(-0.05, 0.05)
+        kind = rng.choice([EntityType.PERSON, EntityType.VEHICLE, EntityType.INCIDENT])
+        if kind == EntityType.PERSON:
+            attrs = {"name": rng.choice(names), "dob": rng.choice(["1990-01-01", "1985-05-05"])}
+        elif kind == EntityType.VEHICLE:
+            attrs = {"plate": rng.choice(plates), "vin": rng.choice(["V1", "V2", "V3"])}
+        else:
+            attrs = {"code": rng.choice(["459", "211"]), "tags": ["a", "b"]}
+        if rng.random() < 0.8:
+            attrs.update(latitude=lat, longitude=lon)
+        entities.append(_entity(i, kind, timestamp=ts, **attrs))
+    return entities
+
+
+def _index() -> EntityIndex:
+    return EntityIndex(KEY_ATTRIBUTES, FUZZY_ATTRIBUTES, time_bucket_seconds=3600, geo_cell_meters=500)
+
+
+class TestEntityIndex:
+    """Tests for EntityIndex candidate lookups."""
+
+    def test_exact_candidates_share_key_attribute(self):
+        """Test exact candidates come from the key attribute hash index."""
+        index = _index()
+        index.add(_entity(1, EntityType.VEHICLE, plate="ABC123"))
+        index.add(_entity(2, EntityType.VEHICLE, plate="XYZ789"))
+        index.add(_entity(3, EntityType.PERSON, name="ABC123"))
+
+        query = _entity(9, EntityType.VEHICLE, plate="ABC123")
+
+        assert [e.id for e in index.exact_candidates(query)] == ["e-1"]
+
+    def test_remove_and_update_reindex(self):
+        """Test removed and replaced entities leave no stale index entries."""
+        index = _index()
+        index.add(_entity(1, EntityType.VEHICLE, plate="ABC123", latitude=33.0, longitude=-84.0))
+        index.add(_entity(1, EntityType.VEHICLE, plate="XYZ789"))
+
+        assert index.exact_candidates(_entity(9, EntityType.VEHICLE, plate="ABC123")) == []
+        assert index.geographic_candidates(33.0, -84.0, 1000) == []
+
+        index.remove("e-1")
+
+        assert len(index) == 0
+        assert index.exact_candidates(_entity(9, EntityType.VEHICLE, plate="XYZ789")) == []
+
+    def test_temporal_buckets_follow_query_window(self):
+        """Test temporal lookups span every bucket within the window."""
+        index = _index()
+        index.add(_entity(1, EntityType.INCIDENT, timestamp=BASE_TIME + timedelta(hours=5)))
+        index.add(_entity(2, EntityType.INCIDENT, timestamp=BASE_TIME + timedelta(hours=30)))
+
+        query = _entity(9, EntityType.INCIDENT, timestamp=BASE_TIME)
+
+        assert [e.id for e in index.temporal_candidates(query, 6 * 3600)] == ["e-1"]
+
+    def test_geographic_grid_wraps_antimeridian(self):
+        """Test grid lookups find neighbors across the 180th meridian."""
+        index = _index()
+        index.add(_entity(1, EntityType.LOCATION, latitude=0.0, longitude=179.999))
+        index.add(_entity(2, EntityType.LOCATION, latitude=0.0, longitude=170.0))
+
+        candidates = index.geographic_candidates(0.0, -179.999, 1000)
+
+        assert [e.id for e in candidates] == ["e-1"]
+
+
+class TestIndexedCorrelation:
+    """Tests that indexed correlation matches the full-scan path."""
+
+    @staticmethod
+    def _summary(result):
+        return [
+            (c.correlation_type, c.entity2_id, round(c.score, 12))
+            for c in result.entity_correlations
+        ]
+
+    @pytest.mark.asyncio
+    async def test_indexed_results_match_full_scan(self):
+        """Test indexed candidate lookup returns identical correlations."""
+        entities = _random_entities(300)
+        indexed = CorrelationEngine(CorrelationConfig(
+            geographic_radius_meters=800, max_correlations_per_entity=10000,
+        ))
+        scanned = CorrelationEngine(CorrelationConfig(
+            geographic_radius_meters=800, max_correlations_per_entity=10000,
+            enable_candidate_index=False,
+        ))
+        for entity in entities:
+            await indexed.add_entity(entity)
+            await scanned.add_entity(entity)
+        for entity in entities[::7]:
+            await indexed.remove_entity(entity.id)
+            await scanned.remove_entity(entity.id)
+
+        for query in entities[::5]:
+            expected = self._summary(await scanned.find_correlations(query))
+            actual = self._summary(await indexed.find_correlations(query))
+            assert actual == expected
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_clears_index(self):
+        """Test clearing the engine cache empties the index."""
+        engine = CorrelationEngine()
+        await engine.add_entity(_entity(1, EntityType.VEHICLE, plate="ABC123"))
+
+        await engine.clear_cache()
+
+        result = await engine.find_correlations(_entity(2, EntityType.VEHICLE, plate="ABC123"))
+        assert result.entity_correlations == []
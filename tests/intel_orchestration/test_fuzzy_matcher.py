@@ -0,0 +1,173 @@
+"""Tests for the fuzzy plate and name matcher."""
+
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, "/home/ubuntu/repos/g3ti-rtcc-platform/backend")
+
+from app.intel_orchestration.correlator import (
+    CorrelationConfig,
+    CorrelationEngine,
+    CorrelationType,
+    EntityReference,
+    EntityType,
+)
+from app.intel_orchestration.fuzzy_matcher import (
+    NameIndex,
+    PlateIndex,
+    build_plate_matrix,
+    jaro_winkler,
+    name_similarity,
+    plate_similarities,
+    plate_similarity,
+    soundex,
+)
+
+ALPHABET = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789OIB"
+
+
+def _random_plates(count: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(5, 8))) for _ in range(count)]
+
+
+class TestPlateSimilarity:
+    """Tests for OCR-aware plate similarity."""
+
+    def test_reversed_plate_is_not_a_match(self):
+        """Test character order matters, unlike set overlap."""
+        assert plate_similarity("ABC123", "321CBA") < 0.5
+
+    def test_ocr_confusions_score_high(self):
+        """Test look-alike characters cost less than other substitutions."""
+        ocr = plate_similarity("ABC123", "A8C1Z3")
+        other = plate_similarity("ABC123", "AXC1Y3")
+
+        assert ocr > 0.9
+        assert other < ocr
+
+    def test_normalization(self):
+        """Test case, spaces and punctuation are ignored."""
+        assert plate_similarity("abc-123", "ABC 123") == 1.0
+
+    def test_early_exit_below_threshold(self):
+        """Test scoring stops once the threshold is unreachable."""
+        assert plate_similarity("ABC123", "XYZ789", threshold=0.75) == 0.0
+
+    def test_vectorized_matches_scalar(self):
+        """Test bulk scoring equals pairwise scoring."""
+        plates = _random_plates(500)
+        matrix, lengths = build_plate_matrix(plates)
+
+        for query in plates[:10]:
+            bulk = plate_similarities(query, matrix, lengths, threshold=0.5)
+            expected = [plate_similarity(query, p, threshold=0.5) for p in plates]
+            assert bulk.tolist() == pytest.approx(expected)
+
+
+class TestNameSimilarity:
+    """Tests for Jaro-Winkler name similarity."""
+
+    def test_reference_values(self):
+        """Test Jaro-Winkler against published reference scores."""
+        assert jaro_winkler("martha", "marhta") == pytest.approx(0.9611, abs=1e-4)
+        assert jaro_winkler("dwayne", "duane") == pytest.approx(0.84, abs=1e-4)
+
+    def test_token_order_and_punctuation(self):
+        """Test reordered and punctuated names match exactly."""
+        assert name_similarity("John Smith", "Smith, John") == 1.0
+
+    @pytest.mark.parametrize("token,code", [
+        ("robert", "R163"), ("rupert", "R163"), ("ashcraft", "A261"),
+        ("tymczak", "T522"), ("pfister", "P236"),
+    ])
+    def test_soundex(self, token, code):
+        """Test Soundex codes for standard examples."""
+        assert soundex(token) == code
+
+
+class TestBlockingIndexes:
+    """Tests for fuzzy blocking indexes."""
+
+    def test_plate_index_is_lossless(self):
+        """Test q-gram blocking finds every plate a full scan finds."""
+        plates = _random_plates(2000)
+        index = PlateIndex(initial_capacity=16)
+        for i, plate in enumerate(plates):
+            index.add(f"p-{i}", plate)
+
+        for query in plates[:25] + ["A8C1Z3", "0O0O0"]:
+            expected = {
+                f"p-{i}": plate_similarity(query, p, 0.75)
+                for i, p in enumerate(plates)
+                if plate_similarity(query, p, 0.75) >= 0.75
+            }
+            assert index.search(query, 0.75) == pytest.approx(expected)
+
+    def test_plate_index_remove_and_compact(self):
+        """Test removed plates are not returned, including after compaction."""
+        index = PlateIndex()
+        for i in range(3000):
+            index.add(f"p-{i}", f"ABC{i:04d}")
+        for i in range(2500):
+            index.remove(f"p-{i}")
+
+        assert len(index) == 500
+        assert "p-1" not in index.search("ABC0001", 0.75)
+        assert index.search("ABC2999", 0.99) == {"p-2999": 1.0}
+
+    def test_name_index_blocks_on_soundex(self):
+        """Test spelling variants share a block and unrelated names do not."""
+        index = NameIndex()
+        index.add("n-1", "John Smith")
+        index.add("n-2", "Jane Doe")
+        index.add("n-3", "Smyth, Jon")
+
+        results = index.search("jon smith", 0.75)
+
+        assert set(results) == {"n-1", "n-3"}
+
+    @pytest.mark.parametrize("stored,query", [
+        ("Katherine", "Catherine"),
+        ("Filip Jones", "Philip Jones"),
+        ("Filip", "Philip"),
+    ])
+    def test_name_index_finds_first_letter_variants(self, stored, query):
+        """Test variants spelling the first sound differently are candidates."""
+        index = NameIndex()
+        index.add("n-1", stored)
+        index.add("n-2", "Jane Doe")
+
+        expected = name_similarity(query, stored, 0.75)
+        assert expected >= 0.75
+        assert index.search(query, 0.75) == {"n-1": pytest.approx(expected)}
+
+
+class TestFuzzyCorrelation:
+    """Tests for fuzzy matching through the correlation engine."""
+
+    @pytest.mark.asyncio
+    async def test_ocr_variant_plates_correlate(self):
+        """Test OCR-confused plate reads produce a fuzzy correlation."""
+        engine = CorrelationEngine(CorrelationConfig(enable_temporal_fusion=False))
+        await engine.add_entity(EntityReference(
+            id="v-1", entity_type=EntityType.VEHICLE, source="lpr",
+            jurisdiction="ATL", attributes={"plate": "ABC123"},
+        ))
+        await engine.add_entity(EntityReference(
+            id="v-2", entity_type=EntityType.VEHICLE, source="lpr",
+            jurisdiction="ATL", attributes={"plate": "321CBA"},
+        ))
+
+        result = await engine.find_correlations(EntityReference(
+            id="v-3", entity_type=EntityType.VEHICLE, source="lpr",
+            jurisdiction="ATL", attributes={"plate": "A8C1Z3"},
+        ))
+
+        fuzzy = [
+            c for c in result.entity_correlations
+            if c.correlation_type == CorrelationType.FUZZY_MATCH
+        ]
+        assert [c.entity2_id for c in fuzzy] == ["v-1"]
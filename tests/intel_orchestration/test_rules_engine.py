@@ -21,6 +21,49 @@ from app.intel_orchestration.rules_engine import (
 )
 
 
+def _get_nested_value(data, field):
+    """Reference dotted-path lookup the compiled accessors must match."""
+    value = data
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _evaluate_condition(condition, data):
+    """Reference interpreter for one rule condition."""
+    operator = condition.get("operator", "equals")
+    expected = condition.get("value")
+    actual = _get_nested_value(data, condition.get("field", ""))
+
+    if operator == "equals":
+        return actual == expected
+    elif operator == "not_equals":
+        return actual != expected
+    elif operator == "greater_than":
+        return actual is not None and actual > expected
+    elif operator == "less_than":
+        return actual is not None and actual < expected
+    elif operator == "greater_or_equal":
+        return actual is not None and actual >= expected
+    elif operator == "less_or_equal":
+        return actual is not None and actual <= expected
+    elif operator == "contains":
+        return expected in actual if actual else False
+    elif operator == "not_contains":
+        return expected not in actual if actual else True
+    elif operator == "in":
+        return actual in expected if expected else False
+    elif operator == "not_in":
+        return actual not in expected if expected else True
+    elif operator == "exists":
+        return actual is not None
+    elif operator == "not_exists":
+        return actual is None
+    return False
+
+
 class TestRuleCategory:
     """Tests for RuleCategory enum."""
 
@@ -435,3 +478,141 @@ class TestRulesEngine:
         assert "rules_count" in stats
         assert "rules_by_category" in stats
         assert "config" in stats
+
+
+class TestCompiledRules:
+    """Tests for compiled rule evaluation."""
+
+    SIGNALS = [
+        {"source": "ai_engine", "confidence": 0.95},
+        {"source": "tactical_engine", "category": "officer_safety", "weapon_involved": True},
+        {"entity": {"id": "p-1", "risk_score": 85, "is_repeat_offender": True}},
+        {"location": {"crime_index": 0.9, "near_school": True}},
+        {"location": "downtown", "temporal": None},
+        {"federal_matches": {"ncic": {"record": 1}}, "temporal": {"recent_incidents": 2}},
+        {"historical": {"trend": "escalating"}, "confidence": None},
+        {},
+    ]
+
+    def _interpreted_rules(self, engine, data):
+        """Rule names matched by the uncompiled evaluator, in priority order."""
+        rules = sorted(engine.get_rules(), key=lambda r: r.priority, reverse=True)
+        return [
+            r.name for r in rules
+            if r.enabled and all(_evaluate_condition(c, data) for c in r.conditions)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_compiled_matches_interpreted(self):
+        """Test the compiled plan applies the same rules in the same order."""
+        engine = RulesEngine(RulesEngineConfig(enable_caching=False))
+        engine.add_rule(ScoringRule(
+            name="not_in_rule",
+            category=RuleCategory.CUSTOM,
+            conditions=[{"field": "jurisdiction", "operator": "not_in", "value": ["ATL"]}],
+            score_modifier=5.0,
+        ))
+
+        for data in self.SIGNALS:
+            score = await engine._evaluate_rules(data)
+            assert score.rules_applied == self._interpreted_rules(engine, data)
+
+    @pytest.mark.asyncio
+    async def test_gated_rules_skipped(self):
+        """Test rules requiring absent fields are not evaluated."""
+        engine = RulesEngine()
+        plan = engine._plan
+
+        candidates = {c.rule.name for c in plan.candidates({"source": "ai_engine"})}
+
+        assert "high_ai_confidence" in candidates
+        assert "tactical_engine_signal" in candidates
+        assert "known_offender" not in candidates
+        assert "ncic_hit" not in candidates
+
+    @pytest.mark.asyncio
+    async def test_plan_recompiled_on_rule_changes(self):
+        """Test enable, disable and add rebuild the plan."""
+        engine = RulesEngine(RulesEngineConfig(enable_caching=False))
+        signal = {"weapon_involved": True}
+        rule_id = next(r.id for r in engine.get_rules() if r.name == "weapon_involved")
+
+        engine.disable_rule(rule_id)
+        disabled = await engine.calculate_priority(signal)
+        engine.enable_rule(rule_id)
+        enabled = await engine.calculate_priority(signal)
+
+        assert enabled == disabled + 25.0
+        assert engine.get_stats()["compiled_rules"] == len(engine.get_rules())
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single(self):
+        """Test batch scoring returns the same scores in signal order."""
+        engine = RulesEngine(RulesEngineConfig(enable_caching=False))
+
+        batch = await engine.calculate_priorities(self.SIGNALS)
+        single = [await engine.calculate_priority(s) for s in self.SIGNALS]
+
+        assert batch == single
+
+
+class TestScoreCacheKey:
+    """Tests for the rules engine score cache key."""
+
+    @pytest.mark.asyncio
+    async def test_different_payloads_not_conflated(self):
+        """Test signals differing only in rule-read fields get their own scores."""
+        engine = RulesEngine()
+        base = {"source": "dispatch_comms", "category": "incident", "entity": {"id": "p-1"}}
+
+        plain = await engine.calculate_priority(dict(base))
+        armed = await engine.calculate_priority({**base, "weapon_involved": True})
+        risky = await engine.calculate_priority(
+            {**base, "entity": {"id": "p-1", "risk_score": 90}}
+        )
+
+        assert armed == plain + 25.0
+        assert risky == plain + 25.0
+
+    @pytest.mark.asyncio
+    async def test_unread_fields_share_cache_entry(self):
+        """Test fields no rule reads do not split cache entries."""
+        engine = RulesEngine()
+        await engine.calculate_priority({"source": "ai_engine", "notes": "first"})
+        await engine.calculate_priority({"source": "ai_engine", "notes": "second"})
+
+        assert engine.get_stats()["score_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_presence_only_fields(self):
+        """Test exists conditions key on presence, not the matched payload."""
+        engine = RulesEngine()
+        await engine.calculate_priority({"federal_matches": {"ncic": {"record": 1}}})
+        await engine.calculate_priority({"federal_matches": {"ncic": {"record": 2}}})
+
+        assert engine.get_stats()["score_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_custom_evaluator_keys_whole_payload(self):
+        """Test custom evaluators see every field, so the whole payload is keyed."""
+        engine = RulesEngine()
+
+        async def bonus(data):
+            return 5.0 if data.get("bonus") else 0.0
+
+        engine.register_custom_evaluator("bonus", bonus)
+        without = await engine.calculate_priority({"source": "ai_engine"})
+        with_bonus = await engine.calculate_priority({"source": "ai_engine", "bonus": True})
+
+        assert with_bonus == without + 5.0
+
+    @pytest.mark.asyncio
+    async def test_cache_bounded_and_expiring(self):
+        """Test the score cache honors size and TTL limits."""
+        engine = RulesEngine(RulesEngineConfig(cache_max_entries=2, cache_ttl_seconds=30))
+        for i in range(5):
+            await engine.calculate_priority({"entity": {"id": f"p-{i}"}})
+
+        stats = engine.get_stats()["score_cache"]
+        assert stats["size"] == 2
+        assert stats["ttl_seconds"] == 30
@@ -0,0 +1,99 @@
+"""Tests for the Time Travel snapshot store"""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.digital_twin.time_travel import (
+    EntitySnapshot,
+    IncidentSnapshot,
+    TimeTravelConfig,
+    TimeTravelEngine,
+)
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _entity(entity_id: str, latitude: float = 26.78) -> EntitySnapshot:
+    return EntitySnapshot(
+        entity_id=entity_id,
+        entity_type="officer",
+        latitude=latitude,
+        longitude=-80.07,
+    )
+
+
+class TestSnapshotStore:
+    """Test suite for delta-encoded snapshot storage"""
+
+    @pytest.fixture
+    def time_travel(self):
+        """Create a time travel engine with short keyframe intervals"""
+        return TimeTravelEngine(TimeTravelConfig(max_snapshots=50, keyframe_interval=4))
+
+    def test_matches_full_snapshots(self, time_travel):
+        """Test rebuilt snapshots equal the captured ones, including after eviction"""
+        rng = random.Random(5)
+        entities = {f"unit-{i}": _entity(f"unit-{i}") for i in range(8)}
+        captured = []
+        for n in range(80):
+            for key in rng.sample(sorted(entities), 2):
+                entities[key] = _entity(key, rng.random())
+            if n % 9 == 0:
+                entities.pop(rng.choice(sorted(entities)))
+                entities[f"new-{n}"] = _entity(f"new-{n}")
+            items = list(entities.values())
+            if n % 13 == 0:
+                items.reverse()
+            captured.append(time_travel.capture_snapshot(
+                items, timestamp=BASE_TIME + timedelta(seconds=n)
+            ))
+
+        kept = captured[-50:]
+        stored = time_travel.get_snapshots_in_range(BASE_TIME, BASE_TIME + timedelta(hours=1))
+
+        assert [s.snapshot_id for s in stored] == [s.snapshot_id for s in kept]
+        assert all(a.entities == b.entities for a, b in zip(stored, kept, strict=True))
+        assert time_travel.get_snapshot(captured[0].snapshot_id) is None
+        assert time_travel.get_snapshot(kept[7].snapshot_id).entities == kept[7].entities
+        assert time_travel.get_time_range() == (kept[0].timestamp, kept[-1].timestamp)
+        assert time_travel.get_metrics().keyframes < len(kept)
+
+    def test_snapshot_at_time_and_entity_track(self, time_travel):
+        """Test time lookup picks the closest snapshot and tracks follow changes"""
+        for n in range(10):
+            time_travel.capture_snapshot(
+                [_entity("unit-1", 26.0 + n // 3), _entity("unit-2")] if n != 5 else [_entity("unit-2")],
+                incidents=[IncidentSnapshot(
+                    incident_id="inc-1", incident_type="shots_fired", status=str(n // 4),
+                    latitude=26.78, longitude=-80.07, severity="high",
+                )],
+                timestamp=BASE_TIME + timedelta(seconds=10 * n),
+            )
+
+        closest = time_travel.get_snapshot_at_time(BASE_TIME + timedelta(seconds=34))
+        track = time_travel.get_entity_track(
+            "unit-1", BASE_TIME + timedelta(seconds=20), BASE_TIME + timedelta(seconds=70)
+        )
+
+        assert closest.timestamp == BASE_TIME + timedelta(seconds=30)
+        assert [e.latitude for e in track] == [26.0, 27.0, 27.0, 28.0, 28.0]
+        assert [i.status for i in time_travel.get_incident_timeline("inc-1")] == [
+            "0", "0", "0", "0", "1", "1", "1", "1", "2", "2",
+        ]
+
+    def test_out_of_order_capture(self, time_travel):
+        """Test a late snapshot is stored in time order"""
+        for n in (0, 10, 20):
+            time_travel.capture_snapshot(
+                [_entity("unit-1", n)], timestamp=BASE_TIME + timedelta(seconds=n)
+            )
+        late = time_travel.capture_snapshot(
+            [_entity("unit-1", 5)], timestamp=BASE_TIME + timedelta(seconds=5)
+        )
+
+        track = time_travel.get_entity_track("unit-1", BASE_TIME, BASE_TIME + timedelta(minutes=1))
+
+        assert [e.latitude for e in track] == [0, 5, 10, 20]
+        assert time_travel.get_snapshot_at_time(BASE_TIME + timedelta(seconds=6)).snapshot_id == late.snapshot_id
@@ -0,0 +1,163 @@
+"""
+Phase 38: Workflow DAG Execution Tests
+Tests for dependency-ordered step execution, step timeouts, cancellation
+and critical-path timing.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend'))
+
+from app.orchestration.workflow_engine import (  # noqa: E402
+    StepExecutionMode,
+    Workflow,
+    WorkflowEngine,
+    WorkflowStatus,
+    WorkflowStep,
+    resolve_step_dependencies,
+)
+
+SEQUENTIAL = StepExecutionMode.SEQUENTIAL
+PARALLEL = StepExecutionMode.PARALLEL
+
+
+def _step(name: str, action: str, mode=SEQUENTIAL, timeout: int = 5, **kwargs) -> WorkflowStep:
+    return WorkflowStep(name=name, action_type=action, execution_mode=mode, timeout_seconds=timeout, **kwargs)
+
+
+def _sleeping_handler(delay: float, log: list, success: bool = True):
+    async def handler(step, context):
+        log.append(("start", step.name))
+        await asyncio.sleep(delay)
+        log.append(("end", step.name))
+        return {"success": success, "error": None if success else f"{step.name} failed"}
+    return handler
+
+
+class TestWorkflowDependencies:
+    """Test suite for building the step dependency graph."""
+
+    def test_inferred_from_execution_mode(self):
+        """Test parallel steps hang off the preceding sequential step."""
+        workflow = Workflow(name="inferred", steps=[
+            _step("a", "x"), _step("b", "x", PARALLEL), _step("c", "x"),
+            _step("d", "x", PARALLEL), _step("e", "x"),
+        ])
+        ids = {s.name: s.step_id for s in workflow.steps}
+
+        deps = resolve_step_dependencies(workflow)
+
+        assert deps[ids["a"]] == []
+        assert deps[ids["b"]] == [ids["a"]]
+        assert deps[ids["c"]] == [ids["a"]]
+        assert deps[ids["d"]] == [ids["c"]]
+        assert deps[ids["e"]] == [ids["c"]]
+
+    def test_cycles_and_unknown_steps_rejected(self):
+        """Test invalid dependencies raise ValueError."""
+        cycle = Workflow(name="cycle", steps=[
+            _step("a", "x", depends_on=["b"]), _step("b", "x", depends_on=["a"]),
+        ])
+        unknown = Workflow(name="unknown", steps=[_step("a", "x", depends_on=["missing"])])
+
+        with pytest.raises(ValueError):
+            resolve_step_dependencies(cycle)
+        with pytest.raises(ValueError):
+            resolve_step_dependencies(unknown)
+
+    def test_builtin_workflows_resolve(self):
+        """Test all 20 library workflows form valid graphs."""
+        from app.orchestration.workflows import ALL_WORKFLOWS
+
+        assert len(ALL_WORKFLOWS) == 20
+        for workflow in ALL_WORKFLOWS:
+            deps = resolve_step_dependencies(workflow)
+            assert [s.step_id for s in workflow.steps if not deps[s.step_id]] != []
+
+
+class TestWorkflowDagExecution:
+    """Test suite for DAG workflow execution."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_start_early(self):
+        """Test a parallel step is not held behind later sequential steps."""
+        engine = WorkflowEngine()
+        log = []
+        engine.register_step_handler("dag_fast", _sleeping_handler(0.01, log))
+        engine.register_step_handler("dag_slow", _sleeping_handler(0.1, log))
+        workflow = Workflow(name="dag_early_start", steps=[
+            _step("verify", "dag_fast"),
+            _step("drone", "dag_fast", PARALLEL),
+            _step("tactical", "dag_slow"),
+            _step("audit", "dag_fast"),
+        ])
+
+        result = await engine.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert log.index(("end", "drone")) < log.index(("end", "tactical"))
+        assert result.timing["critical_path"] == ["verify", "tactical", "audit"]
+        assert result.timing["time_to_first_action_ms"] < result.timing["critical_path_ms"]
+        assert set(result.timing["step_latency_ms"]) == {"verify", "drone", "tactical", "audit"}
+        assert engine.get_timing_statistics("dag_early_start")["executions"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_enforced(self):
+        """Test a hung step times out and its dependents are skipped."""
+        engine = WorkflowEngine()
+        log = []
+        engine.register_step_handler("dag_hang", _sleeping_handler(30, log))
+        engine.register_step_handler("dag_ok", _sleeping_handler(0, log))
+        workflow = Workflow(name="dag_timeout", steps=[
+            _step("hung", "dag_hang", PARALLEL, timeout=1, depends_on=[]),
+            _step("after_hung", "dag_ok", PARALLEL, depends_on=["hung"]),
+            _step("independent", "dag_ok"),
+        ])
+
+        result = await engine.execute_workflow(workflow)
+        steps = {s.name: s for s in result.steps}
+
+        assert steps["hung"].status == WorkflowStatus.TIMEOUT
+        assert steps["after_hung"].status == WorkflowStatus.CANCELLED
+        assert steps["independent"].status == WorkflowStatus.COMPLETED
+        # Parallel failures do not fail the workflow
+        assert result.status == WorkflowStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_sequential_failure_stops_workflow(self):
+        """Test a failed sequential step fails the workflow and cancels later steps."""
+        engine = WorkflowEngine()
+        log = []
+        engine.register_step_handler("dag_fail", _sleeping_handler(0, log, success=False))
+        engine.register_step_handler("dag_ok", _sleeping_handler(0, log))
+        workflow = Workflow(name="dag_failure", steps=[
+            _step("first", "dag_fail"), _step("second", "dag_ok"),
+        ])
+
+        result = await engine.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.FAILED
+        assert [s.status for s in result.steps] == [WorkflowStatus.FAILED, WorkflowStatus.CANCELLED]
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_workflow(self):
+        """Test cancel_workflow cancels steps in progress."""
+        engine = WorkflowEngine()
+        log = []
+        engine.register_step_handler("dag_hang", _sleeping_handler(30, log))
+        workflow = Workflow(name="dag_cancel", steps=[
+            _step("hung", "dag_hang", timeout=60), _step("never", "dag_hang"),
+        ])
+
+        execution = asyncio.create_task(engine.execute_workflow(workflow))
+        await asyncio.sleep(0.05)
+        assert engine.cancel_workflow(workflow.workflow_id) is True
+        result = await asyncio.wait_for(execution, timeout=2)
+
+        assert result.status == WorkflowStatus.CANCELLED
+        assert [s.status for s in result.steps] == [WorkflowStatus.CANCELLED, WorkflowStatus.CANCELLED]
+        assert workflow.workflow_id not in engine.active_executions